@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import importlib
+from typing import Optional
+
+from dtc_parser.memory import STRUCTURE_VALUES, memory_report, set_memory_budget
+from dtc_parser.parser import DTCParser
+
+# module and getter of each optional structure (the caches, i.e., parser results and OEM overlays, are filled by use)
+STRUCTURE_GETTERS = {
+    "fault_families": ("clustering", "get_fault_families"),
+    "related_codes": ("similarity", "get_related_codes"),
+    "term_completer": ("autocomplete", "get_term_completer"),
+    "code_completer": ("autocomplete", "get_code_completer"),
+    "perfect_hash": ("perfect_hash", "get_perfect_hash"),
+    "reverse_index": ("reverse_index", "get_reverse_index"),
+    "failure_mode_index": ("failure_index", "get_failure_mode_index"),
+    "description_search": ("search", "get_description_search"),
+    "code_suggester": ("suggest", "get_code_suggester"),
+    "fault_structures": ("decomposition", "get_fault_structures"),
+    "numeric_fields": ("numeric_fields", "get_numeric_field_table"),
+    "code_index": ("index", "get_code_index"),
+}
+
+
+def build_structures() -> None:
+    """
+    Builds all optional structures (most valuable first), skipping the ones whose dependencies are not installed.
+    """
+    for name in reversed(STRUCTURE_VALUES):
+        if name not in STRUCTURE_GETTERS:
+            continue
+        module, getter = STRUCTURE_GETTERS[name]
+        try:
+            getattr(importlib.import_module("dtc_parser." + module), getter)()
+        except ImportError as e:
+            print("... skipping", name, "(%s)" % e)
+
+
+def print_memory_report(budget: Optional[int] = None) -> None:
+    """
+    Builds the optional structures and prints the memory of each code table and structure.
+
+    :param budget: max. memory of the optional structures in bytes (None = unlimited)
+    """
+    parser = DTCParser()
+    parser.results()
+    if budget is not None:
+        set_memory_budget(budget)
+    build_structures()
+    tables, structures = memory_report()
+    print("%-22s %8s %10s %14s %10s %10s" % ("table", "entries", "keys", "descriptions", "dict", "total"))
+    for t in tables:
+        print("%-22s %8d %10d %14d %10d %10d" % (t.name, t.entries, t.keys, t.descriptions, t.overhead, t.total))
+    print("%-22s %8d %10d %14d %10d %10d" % (
+        "all tables", sum(t.entries for t in tables), sum(t.keys for t in tables),
+        sum(t.descriptions for t in tables), sum(t.overhead for t in tables), sum(t.total for t in tables)))
+    print()
+    print("%-22s %10s" % ("structure", "bytes"))
+    for s in structures:
+        print("%-22s %10s" % (s.name, s.size if s.built else "-"))
+    print("%-22s %10d" % ("all structures", sum(s.size for s in structures)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='dtc_parser', description='Tools of the DTC parser')
+    commands = parser.add_subparsers(dest='command', required=True)
+    report = commands.add_parser('memory-report', help='memory of the code tables and optional structures')
+    report.add_argument('--budget', action='store', type=int,
+                        help='max. memory of the optional structures in bytes (drops the least valuable ones)')
+    args = parser.parse_args()
+    if args.command == 'memory-report':
+        print_memory_report(args.budget)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import time
+from typing import Dict, Iterable, Iterator, Optional
+
+from dtc_parser.batch import DTCBatch
+from dtc_parser.parser import DTCParser
+from dtc_parser.responses import decode_response
+
+# 11-bit response IDs of the ECUs (ISO 15765-4)
+OBD_RESPONSE_IDS = tuple(range(0x7E8, 0x7F0))
+# 29-bit physical response IDs addressed to the external test equipment (0xF1)
+EXTENDED_RESPONSE_IDS = tuple(0x18DAF100 | src for src in range(0x100))
+DEFAULT_DIAGNOSTIC_IDS = OBD_RESPONSE_IDS + EXTENDED_RESPONSE_IDS
+
+
+class ISOTPReassembler:
+    """
+    Reassembles ISO-TP (ISO 15765-2) segmented payloads per arbitration ID.
+    """
+
+    def __init__(self):
+        # arbitration ID -> [expected length, next sequence number, collected data]
+        self.pending: Dict[int, list] = {}
+
+    def feed(self, can_id: int, data: bytes) -> Optional[bytes]:
+        """
+        Processes a single CAN frame.
+
+        :param can_id: arbitration ID of the frame
+        :param data: data bytes of the frame
+        :return: complete payload if the frame finishes one, None otherwise
+        """
+        if not data:
+            return None
+        frame_type = data[0] >> 4
+        if frame_type == 0:  # single frame
+            return data[1:1 + (data[0] & 0x0F)]
+        elif frame_type == 1:  # first frame
+            length = ((data[0] & 0x0F) << 8) | data[1]
+            self.pending[can_id] = [length, 1, bytearray(data[2:])]
+        elif frame_type == 2:  # consecutive frame
+            state = self.pending.get(can_id)
+            if state is None:
+                return None
+            if (data[0] & 0x0F) != state[1]:
+                # lost frame -> drop the incomplete payload
+                del self.pending[can_id]
+                return None
+            state[1] = (state[1] + 1) & 0x0F
+            state[2] += data[1:]
+            if len(state[2]) >= state[0]:
+                del self.pending[can_id]
+                return bytes(state[2][:state[0]])
+        # flow control frames are sent by the tester and do not carry payload
+        return None
+
+
+class ASCReader:
+    """
+    Streaming reader for Vector ASCII (.asc) CAN traces that extracts the DTCs from the diagnostic responses.
+
+    The trace is processed line by line, so files larger than the available memory are supported.
+    Lines are only split up to the arbitration ID before they are filtered against the set of diagnostic IDs,
+    i.e., the (vast majority of) non-diagnostic traffic is never fully tokenized.
+    """
+
+    def __init__(self, diagnostic_ids: Iterable[int] = DEFAULT_DIAGNOSTIC_IDS, batch_size: int = 4096):
+        """
+        :param diagnostic_ids: arbitration IDs of the diagnostic responses to be considered
+        :param batch_size: number of DTCs per yielded batch
+        """
+        self.diagnostic_ids = tuple(diagnostic_ids)
+        self.batch_size = batch_size
+        self.lines_read = 0
+        self.frames_matched = 0
+        self.elapsed = 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        """
+        Throughput of the last read.
+
+        :return: processed lines per second
+        """
+        return self.lines_read / self.elapsed if self.elapsed > 0 else 0.0
+
+    def id_tokens(self, base: int) -> Dict[bytes, int]:
+        """
+        Precomputes the textual representation of the diagnostic IDs as they appear in the trace.
+        Extended (29-bit) IDs are marked by a trailing 'x'.
+
+        :param base: number base of the trace (16 or 10)
+        :return: ID token -> arbitration ID
+        """
+        tokens = {}
+        for can_id in self.diagnostic_ids:
+            token = ("%X" % can_id) if base == 16 else str(can_id)
+            if can_id > 0x7FF:
+                token += "x"
+            tokens[token.encode("ascii")] = can_id
+        return tokens
+
+    def iter_batches(self, path: str) -> Iterator[DTCBatch]:
+        """
+        Streams the DTCs of the specified trace in batches.
+
+        :param path: path of the .asc trace
+        :return: iterator of DTC batches
+        """
+        tokens = self.id_tokens(16)
+        reassembler = ISOTPReassembler()
+        batch = DTCBatch()
+        self.lines_read = 0
+        self.frames_matched = 0
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            for line in f:
+                self.lines_read += 1
+                # timestamp, channel, ID, remainder -> only split what is needed for the ID filter
+                fields = line.split(None, 3)
+                if len(fields) < 4:
+                    continue
+                can_id = tokens.get(fields[2])
+                if can_id is None:
+                    if fields[0] == b"base":
+                        tokens = self.id_tokens(16 if fields[1] == b"hex" else 10)
+                    continue
+                # remainder: direction, frame type ('d' = data), DLC, data bytes
+                rest = fields[3].split()
+                if len(rest) < 3 or rest[1] != b"d":
+                    continue
+                self.frames_matched += 1
+                dlc = int(rest[2], 16)
+                data = bytes.fromhex(b" ".join(rest[3:3 + dlc]).decode("ascii"))
+                payload = reassembler.feed(can_id, data)
+                if payload is not None:
+                    decode_response(payload, batch, can_id, float(fields[0]))
+                    if len(batch) >= self.batch_size:
+                        self.elapsed = time.perf_counter() - start
+                        yield batch
+                        batch = DTCBatch()
+        self.elapsed = time.perf_counter() - start
+        if len(batch):
+            yield batch
+
+    def read(self, path: str) -> DTCBatch:
+        """
+        Reads all DTCs of the specified trace into a single batch.
+
+        :param path: path of the .asc trace
+        :return: batch of all DTCs in the trace
+        """
+        result = DTCBatch()
+        for batch in self.iter_batches(path):
+            result.extend(batch)
+        return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Extracts DTCs from Vector ASCII (.asc) CAN traces')
+    parser.add_argument('--file', action='store', type=str, help='.asc trace to be read', required=True)
+    args = parser.parse_args()
+    reader = ASCReader()
+    dtc_parser = DTCParser()
+    for dtc_batch in reader.iter_batches(args.file):
+        for (dtc, status, _, source, ts), description in zip(dtc_batch.rows(), dtc_batch.describe(dtc_parser)):
+            print("%.6f\t%X\t%s\t0x%02X\t%s" % (ts, source, dtc, status, description))
+    print("... read", reader.lines_read, "lines,", reader.frames_matched, "diagnostic frames in",
+          "%.3f s (%.0f lines/s)" % (reader.elapsed, reader.lines_per_second))
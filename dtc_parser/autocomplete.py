@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import heapq
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dtc_parser.codec import dtc_from_int
+from dtc_parser.memory import optional_structure
+from dtc_parser.normalize import SEPARATORS, TRANSLATION_TABLE
+from dtc_parser.search import DescriptionSearch, get_description_search
+from dtc_parser.tables import iter_entries
+
+
+class TrieNode:
+    """
+    Node of the code trie, holding the number of codes below it and their precomputed top completions.
+    """
+    __slots__ = ("children", "count", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "TrieNode"] = {}
+        self.count = 0
+        self.top: Tuple[Tuple[str, str], ...] = ()
+
+
+class CodeCompleter:
+    """
+    Prefix trie over the supported DTCs for autocompletion of partially typed codes.
+
+    The subtree counts and the top-N completions are precomputed at every node, so a keystroke costs at most
+    five child lookups, no matter how many codes match the prefix.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]], top_n: int = 10,
+                 weights: Optional[Dict[str, float]] = None):
+        """
+        :param entries: (DTC, fault description) tuples
+        :param top_n: number of completions stored per node
+        :param weights: optional DTC -> weight (e.g. frequency), completions are ranked by weight and then by code,
+                        without weights they are in code order
+        """
+        self.top_n = top_n
+        self.root = TrieNode()
+        weights = weights or {}
+        ranked = sorted(entries, key=lambda entry: (-weights.get(entry[0], 0.0), entry[0]))
+        for code, description in ranked:
+            node = self.root
+            self._add(node, code, description)
+            for char in code:
+                node = node.children.setdefault(char, TrieNode())
+                self._add(node, code, description)
+
+    def _add(self, node: TrieNode, code: str, description: str) -> None:
+        # entries arrive in rank order, so the first top_n ones are the top completions
+        node.count += 1
+        if len(node.top) < self.top_n:
+            node.top += ((code, description),)
+
+    def _find(self, prefix: str) -> Optional[TrieNode]:
+        prefix = prefix.encode("latin-1", "replace").translate(TRANSLATION_TABLE, SEPARATORS).decode("latin-1")
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def complete(self, prefix: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Returns the top completions of the specified (partially typed) DTC.
+
+        :param prefix: partially typed DTC, e.g. "p01"
+        :return: tuple of (DTC, fault description) tuples
+        """
+        node = self._find(prefix)
+        return node.top if node is not None else ()
+
+    def count(self, prefix: str) -> int:
+        """
+        Returns the number of supported DTCs that start with the specified prefix.
+
+        :param prefix: partially typed DTC, e.g. "p01"
+        :return: number of matching DTCs
+        """
+        node = self._find(prefix)
+        return node.count if node is not None else 0
+
+
+class TermCompleter:
+    """
+    Autocompletion of partially typed words over the vocabulary of the fault descriptions.
+
+    The vocabulary is kept as a single sorted tuple (with a parallel array of document frequencies), so the terms
+    of a prefix form a contiguous slice that is found by bisection. Only for the very short prefixes (with many
+    matching terms) the most frequent terms are precomputed. The codes are taken from the posting lists of the
+    description search, which are shared instead of copied.
+    """
+
+    def __init__(self, search: DescriptionSearch, top_n: int = 10, precomputed_prefix_length: int = 2):
+        """
+        :param search: description search whose vocabulary is completed
+        :param top_n: number of precomputed terms per short prefix
+        :param precomputed_prefix_length: max. length of the prefixes with precomputed terms
+        """
+        self.search = search
+        self.terms = tuple(sorted(search.postings))
+        self.frequencies = array("H", (len(search.postings[term][0]) for term in self.terms))
+        self.precomputed_prefix_length = precomputed_prefix_length
+        self.short_prefixes: Dict[str, Tuple[str, ...]] = {}
+        prefixes = {term[:n] for term in self.terms for n in range(1, precomputed_prefix_length + 1)}
+        for prefix in prefixes:
+            self.short_prefixes[prefix] = tuple(self._rank(prefix, top_n))
+
+    def _rank(self, prefix: str, limit: int) -> List[str]:
+        start = bisect_left(self.terms, prefix)
+        end = bisect_left(self.terms, prefix + "\uffff", start)
+        best = heapq.nlargest(limit, range(start, end), key=self.frequencies.__getitem__)
+        return [self.terms[i] for i in best]
+
+    def complete_terms(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Returns the terms starting with the specified prefix, most frequent first.
+
+        :param prefix: partially typed word, e.g. "camsh"
+        :param limit: max. number of terms
+        :return: list of terms
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        if len(prefix) <= self.precomputed_prefix_length and limit <= len(self.short_prefixes.get(prefix, ())):
+            return list(self.short_prefixes[prefix][:limit])
+        return self._rank(prefix, limit)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """
+        Returns the codes whose description contains one of the top terms starting with the specified prefix.
+
+        :param prefix: partially typed word, e.g. "misf"
+        :param limit: max. number of codes
+        :return: list of (DTC, fault description) tuples in code order
+        """
+        postings = [self.search.postings[term][0] for term in self.complete_terms(prefix)]
+        code_index = self.search.code_index
+        # the posting lists are sorted by document ID (= code order), so merging them yields the codes in order
+        docs = []
+        for doc_id in heapq.merge(*postings):
+            if not docs or docs[-1] != doc_id:
+                docs.append(doc_id)
+                if len(docs) == limit:
+                    break
+        return [(dtc_from_int(code_index.keys[doc_id]), code_index.descriptions[doc_id]) for doc_id in docs]
+
+
+@optional_structure("term_completer")
+def get_term_completer() -> TermCompleter:
+    """
+    Returns the term completer over the vocabulary of all fault descriptions (built on first use).
+
+    :return: term completer
+    """
+    return TermCompleter(get_description_search())
+
+
+@optional_structure("code_completer")
+def get_code_completer() -> CodeCompleter:
+    """
+    Returns the code trie over all supported DTCs (built on first use).
+
+    :return: code completer
+    """
+    return CodeCompleter(iter_entries())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from dtc_parser.codec import dtc_from_int
+from dtc_parser.subsystems import subsystem_ids
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from dtc_parser.parser import DTCParser
+
+# protocol front-ends that can contribute DTCs to a batch
+PROTOCOL_OBD = 0
+PROTOCOL_UDS = 1
+PROTOCOL_KWP = 2
+
+PROTOCOL_NAMES = {
+    PROTOCOL_OBD: "OBD-II",
+    PROTOCOL_UDS: "UDS",
+    PROTOCOL_KWP: "KWP2000",
+}
+
+
+class DTCBatch:
+    """
+    Column-oriented container for DTCs extracted by the protocol front-ends.
+
+    Each DTC is stored as one row spread over compact typed arrays, which keeps large batches
+    cheap to hold and lets the lookup resolve every distinct code only once.
+    """
+
+    def __init__(self):
+        self.codes = array("H")  # DTC as 16-bit integer (SAE J2012)
+        self.statuses = array("B")  # status byte reported with the DTC (0 if the protocol has none)
+        self.protocols = array("B")  # PROTOCOL_* constant of the front-end
+        self.sources = array("L")  # arbitration ID / source address of the reporting ECU
+        self.timestamps = array("d")  # timestamp of the message (0.0 if unknown)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, code: int, status: int, protocol: int, source: int, timestamp: float) -> None:
+        """
+        Appends a single DTC row to the batch.
+
+        :param code: DTC as 16-bit integer
+        :param status: status byte reported with the DTC
+        :param protocol: PROTOCOL_* constant of the front-end
+        :param source: arbitration ID / source address of the reporting ECU
+        :param timestamp: timestamp of the message
+        """
+        self.codes.append(code)
+        self.statuses.append(status)
+        self.protocols.append(protocol)
+        self.sources.append(source)
+        self.timestamps.append(timestamp)
+
+    def extend(self, other: "DTCBatch") -> None:
+        """
+        Appends all rows of another batch.
+
+        :param other: batch to be appended
+        """
+        self.codes.extend(other.codes)
+        self.statuses.extend(other.statuses)
+        self.protocols.extend(other.protocols)
+        self.sources.extend(other.sources)
+        self.timestamps.extend(other.timestamps)
+
+    def clear(self) -> None:
+        """
+        Removes all rows from the batch.
+        """
+        self.__init__()
+
+    def code_strings(self) -> List[str]:
+        """
+        Returns the DTCs of the batch in their string form.
+
+        :return: list of DTC strings
+        """
+        cache: Dict[int, str] = {}
+        return [cache[c] if c in cache else cache.setdefault(c, dtc_from_int(c)) for c in self.codes]
+
+    def describe(self, dtc_parser: Optional["DTCParser"] = None) -> List[str]:
+        """
+        Resolves the (lower-case) fault description of each DTC in the batch.
+        Every distinct code is looked up only once, regardless of how often it occurs.
+
+        :param dtc_parser: parser used for the lookup (a new one is created if not specified)
+        :return: list of fault descriptions (aligned with the rows of the batch)
+        """
+        if dtc_parser is None:
+            from dtc_parser.parser import DTCParser
+            dtc_parser = DTCParser()
+        descriptions: Dict[int, str] = {}
+        for c in set(self.codes):
+            code = dtc_from_int(c)
+            descriptions[c] = dtc_parser.parse_fault_description(code[:2], code[2:]).lower()
+        return [descriptions[c] for c in self.codes]
+
+    def subsystems(self) -> array:
+        """
+        Resolves the vehicle subsystem of each DTC in the batch as integer ID, e.g. as group-by key
+        (subsystems.SUBSYSTEM_TABLE maps the IDs to their names, all chassis / body codes share one ID each).
+
+        :return: array of subsystem IDs (aligned with the rows of the batch)
+        """
+        return subsystem_ids(self.codes)
+
+    def numeric_fields(self) -> Dict[str, "np.ndarray"]:
+        """
+        Resolves the bank / sensor / cylinder numbers of each DTC in the batch (requires NumPy).
+
+        :return: field name -> int8 array (aligned with the rows of the batch, -1 if not applicable)
+        """
+        from dtc_parser.numeric_fields import get_numeric_field_table
+        return get_numeric_field_table().columns(self.codes)
+
+    def rows(self) -> Iterator[Tuple[str, int, int, int, float]]:
+        """
+        Iterates over the rows of the batch.
+
+        :return: iterator of (DTC string, status, protocol, source, timestamp) tuples
+        """
+        return zip(self.code_strings(), self.statuses, self.protocols, self.sources, self.timestamps)
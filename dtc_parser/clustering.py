@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import os
+from collections import Counter
+from typing import List
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from dtc_parser.codec import CODE_SPACE_SIZE, dtc_from_int, dtc_to_int
+from dtc_parser.index import CodeIndex, content_hash, get_code_index
+from dtc_parser.memory import optional_structure
+from dtc_parser.normalize import normalize_dtc
+from dtc_parser.search import tokenize
+from dtc_parser.similarity import RelatedCodes, get_related_codes
+from dtc_parser.tables import DATA_DIR
+
+COMPILED_FAMILIES = os.path.join(DATA_DIR, "families.npz")
+# cluster ID of the codes that are not supported
+NO_FAMILY = -1
+
+
+def cluster_codes(code_index: CodeIndex, related: RelatedCodes, threshold: float = 0.6,
+                  prefix_length: int = 3) -> np.ndarray:
+    """
+    Clusters the supported codes into fault families. Two codes are linked if one is among the precomputed
+    neighbours of the other, their descriptions have a cosine similarity of at least the threshold and they share
+    the first prefix_length chars. The families are the connected components of the resulting graph.
+    The prefix constraint prevents single-linkage chains from merging unrelated families.
+
+    :param code_index: code index
+    :param related: related codes (aligned with the code index)
+    :param threshold: min. cosine similarity of linked codes
+    :param prefix_length: number of leading chars linked codes have to share
+    :return: cluster ID per row of the code index
+    """
+    n = len(code_index)
+    # the first char takes two bits of the integer representation, the second one two and the others four each
+    shift = 20 - 4 * prefix_length if prefix_length > 1 else 14
+    prefixes = related.keys.astype(np.int32) >> shift
+    rows = np.repeat(np.arange(n), related.neighbours.shape[1])
+    cols = related.neighbours.ravel()
+    linked = (related.scores.ravel() >= threshold) & (prefixes[rows] == prefixes[cols])
+    graph = sparse.coo_matrix((np.ones(int(linked.sum()), dtype=np.int8), (rows[linked], cols[linked])),
+                              shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    return labels.astype(np.int32)
+
+
+def label_families(descriptions: List[str], labels: np.ndarray, terms: int = 3) -> List[str]:
+    """
+    Names each family after the most common terms of its descriptions.
+
+    :param descriptions: descriptions (aligned with the labels)
+    :param labels: cluster ID per description
+    :param terms: number of terms per name
+    :return: name per cluster ID
+    """
+    counters = [Counter() for _ in range(int(labels.max()) + 1 if len(labels) else 0)]
+    for description, label in zip(descriptions, labels):
+        counters[label].update(set(tokenize(description)))
+    return [" ".join(term for term, _ in counter.most_common(terms)) for counter in counters]
+
+
+class FaultFamilies:
+    """
+    Compact mapping of the entire code space to fault families.
+
+    The family of every code is stored in a single int32 array indexed by the two-byte integer representation
+    of the code (NO_FAMILY for unsupported codes), so events can be aggregated by family with a single
+    vectorized lookup and an integer group-by.
+    """
+
+    def __init__(self, families: np.ndarray, names: np.ndarray, table_hash: str = ""):
+        """
+        :param families: cluster ID per code (CODE_SPACE_SIZE entries)
+        :param names: name per cluster ID
+        :param table_hash: content hash of the code tables the families were clustered from (see content_hash())
+        """
+        self.families = families
+        self.names = names
+        self.table_hash = table_hash
+
+    @classmethod
+    def build(cls, code_index: CodeIndex, related: RelatedCodes, threshold: float = 0.6,
+              prefix_length: int = 3) -> "FaultFamilies":
+        """
+        Clusters the codes of the specified index (see cluster_codes()).
+
+        :param code_index: code index
+        :param related: related codes (aligned with the code index)
+        :param threshold: min. cosine similarity of linked codes
+        :param prefix_length: number of leading chars linked codes have to share
+        :return: fault families
+        """
+        labels = cluster_codes(code_index, related, threshold, prefix_length)
+        families = np.full(CODE_SPACE_SIZE, NO_FAMILY, dtype=np.int32)
+        families[np.frombuffer(code_index.keys, dtype=np.uint16)] = labels
+        return cls(families, np.array(label_families(code_index.descriptions, labels)), content_hash(code_index))
+
+    def save(self, path: str = COMPILED_FAMILIES) -> None:
+        """
+        Persists the family arrays.
+
+        :param path: .npz file to be written
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez_compressed(path, families=self.families, names=self.names, table_hash=np.array(self.table_hash))
+
+    @classmethod
+    def load(cls, path: str = COMPILED_FAMILIES) -> "FaultFamilies":
+        """
+        Loads the persisted family arrays.
+
+        :param path: .npz file written by save()
+        :return: fault families
+        """
+        with np.load(path) as data:
+            table_hash = str(data["table_hash"]) if "table_hash" in data.files else ""
+            return cls(data["families"], data["names"], table_hash)
+
+    def family_of(self, code: str) -> int:
+        """
+        Returns the family of the specified code.
+
+        :param code: DTC
+        :return: cluster ID (NO_FAMILY for unsupported codes)
+        """
+        return int(self.families[dtc_to_int(normalize_dtc(code))])
+
+    def family_of_many(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Returns the families of the specified codes, e.g. the codes column of a DTCBatch.
+
+        :param codes: DTCs as integers
+        :return: cluster IDs (NO_FAMILY for unsupported codes)
+        """
+        return self.families[np.asarray(codes, dtype=np.uint16)]
+
+    def members(self, family: int) -> List[str]:
+        """
+        Returns the codes of the specified family.
+
+        :param family: cluster ID
+        :return: list of DTCs in code order
+        """
+        return [dtc_from_int(int(code)) for code in np.flatnonzero(self.families == family)]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def compile_families(path: str = COMPILED_FAMILIES, threshold: float = 0.6, prefix_length: int = 3) -> FaultFamilies:
+    """
+    Clusters the codes of all code tables and persists the result.
+
+    :param path: .npz file to be written
+    :param threshold: min. cosine similarity of linked codes
+    :param prefix_length: number of leading chars linked codes have to share
+    :return: fault families
+    """
+    families = FaultFamilies.build(get_code_index(), get_related_codes(), threshold, prefix_length)
+    families.save(path)
+    return families
+
+
+@optional_structure("fault_families")
+def get_fault_families() -> FaultFamilies:
+    """
+    Returns the fault families of all code tables. The compiled families are used if they are present and were
+    clustered from the current code tables, otherwise they are computed.
+
+    :return: fault families
+    """
+    code_index = get_code_index()
+    if os.path.exists(COMPILED_FAMILIES):
+        families = FaultFamilies.load(COMPILED_FAMILIES)
+        if families.table_hash == content_hash(code_index):
+            return families
+    return FaultFamilies.build(code_index, get_related_codes())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Clusters the DTCs into fault families')
+    parser.add_argument('--output', action='store', type=str, help='.npz file to be written',
+                        default=COMPILED_FAMILIES)
+    parser.add_argument('--threshold', action='store', type=float, help='min. similarity of linked codes',
+                        default=0.6)
+    parser.add_argument('--prefix-length', action='store', type=int, help='number of shared leading chars',
+                        default=3)
+    args = parser.parse_args()
+    result = compile_families(args.output, args.threshold, args.prefix_length)
+    print("... clustered", int((result.families != NO_FAMILY).sum()), "codes into", len(result), "fault families")
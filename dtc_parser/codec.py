@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+# SAE J2012 packs a DTC into two bytes:
+#   bits 15-14 -> category (P, C, B, U)
+#   bits 13-12 -> second char (0-3)
+#   bits 11-0  -> last three chars (hex digits)
+CATEGORIES = "PCBU"
+CODE_SPACE_SIZE = 1 << 16
+
+
+def dtc_from_int(value: int) -> str:
+    """
+    Converts the two-byte (SAE J2012) representation of a DTC into its string form.
+
+    :param value: DTC as 16-bit integer
+    :return: DTC string, e.g. "P0112"
+    """
+    return "%s%d%03X" % (CATEGORIES[(value >> 14) & 0x3], (value >> 12) & 0x3, value & 0xFFF)
+
+
+def dtc_from_bytes(high: int, low: int) -> str:
+    """
+    Converts the two bytes of a DTC as reported by the vehicle into its string form.
+
+    :param high: first (high) byte of the DTC
+    :param low: second (low) byte of the DTC
+    :return: DTC string, e.g. "P0112"
+    """
+    return dtc_from_int((high << 8) | low)
+
+
+def dtc_to_int(code: str) -> int:
+    """
+    Converts a (canonical, upper-case) DTC string into its two-byte (SAE J2012) representation.
+
+    :param code: DTC string, e.g. "P0112"
+    :return: DTC as 16-bit integer
+    """
+    code_type = int(code[1])
+    if code_type > 3:
+        raise ValueError("second char of DTC out of range: " + code)
+    return (CATEGORIES.index(code[0]) << 14) | (code_type << 12) | int(code[2:5], 16)
@@ -0,0 +1,382 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from dtc_parser.loader import source_hash
+from dtc_parser.memory import optional_structure
+from dtc_parser.tables import DATA_DIR, is_default_source, iter_entries
+
+COMPILED_FAULT_STRUCTURES = os.path.join(DATA_DIR, "fault_structures.json")
+
+# failure modes (index = enum value)
+FAILURE_MODES = (
+    "unknown",
+    "malfunction/failure",
+    "circuit open",
+    "circuit low",
+    "circuit high",
+    "range/performance",
+    "intermittent/erratic",
+    "short to battery",
+    "short to ground",
+    "stuck",
+    "performance",
+    "correlation",
+    "communication",
+    "invalid data",
+    "mixture lean/rich",
+    "misfire",
+    "leak",
+    "limit exceeded",
+    "no signal",
+    "internal failure",
+    "not learned/configured",
+)
+(FM_UNKNOWN, FM_CIRCUIT, FM_OPEN, FM_LOW, FM_HIGH, FM_RANGE, FM_INTERMITTENT, FM_SHORT_BATTERY, FM_SHORT_GROUND,
+ FM_STUCK, FM_PERFORMANCE, FM_CORRELATION, FM_COMMUNICATION, FM_INVALID_DATA, FM_MIXTURE, FM_MISFIRE, FM_LEAK,
+ FM_LIMIT, FM_NO_SIGNAL, FM_INTERNAL, FM_NOT_LEARNED) = range(len(FAILURE_MODES))
+
+# electrical conditions (index = enum value)
+ELECTRICAL_CONDITIONS = ("none", "open", "low", "high", "short to ground", "short to battery", "intermittent")
+EC_NONE, EC_OPEN, EC_LOW, EC_HIGH, EC_SHORT_GROUND, EC_SHORT_BATTERY, EC_INTERMITTENT = range(
+    len(ELECTRICAL_CONDITIONS))
+
+# (phrase, failure mode) - phrases that precede the component, e.g. "lost communication with <component>"
+LEADING_FAILURE_PHRASES = [
+    ("lost communication with", FM_COMMUNICATION),
+    ("invalid or missing data for", FM_INVALID_DATA),
+    ("invalid data received from", FM_INVALID_DATA),
+]
+# (phrase, failure mode, electrical condition) - the phrase that ends last in the normalized description determines
+# the failure mode (phrases that end at the same position are ranked in this order), everything before it (and the
+# phrases directly preceding it) describes the component; phrases marked with a trailing "$" only match at the end
+# of the description
+FAILURE_PHRASES = [
+    ("short to battery", FM_SHORT_BATTERY, EC_SHORT_BATTERY),
+    ("shorted to battery", FM_SHORT_BATTERY, EC_SHORT_BATTERY),
+    ("short to vbatt", FM_SHORT_BATTERY, EC_SHORT_BATTERY),
+    ("short to vbat", FM_SHORT_BATTERY, EC_SHORT_BATTERY),
+    ("short to b+", FM_SHORT_BATTERY, EC_SHORT_BATTERY),
+    ("short to ground", FM_SHORT_GROUND, EC_SHORT_GROUND),
+    ("shorted to ground", FM_SHORT_GROUND, EC_SHORT_GROUND),
+    ("short to gnd", FM_SHORT_GROUND, EC_SHORT_GROUND),
+    ("circuit open", FM_OPEN, EC_OPEN),
+    ("open circuit", FM_OPEN, EC_OPEN),
+    ("circuit/open", FM_OPEN, EC_OPEN),
+    ("circuit low", FM_LOW, EC_LOW),
+    ("low input", FM_LOW, EC_LOW),
+    ("low voltage", FM_LOW, EC_LOW),
+    ("voltage low", FM_LOW, EC_LOW),
+    ("current low", FM_LOW, EC_LOW),
+    ("circuit high", FM_HIGH, EC_HIGH),
+    ("high input", FM_HIGH, EC_HIGH),
+    ("high voltage", FM_HIGH, EC_HIGH),
+    ("voltage high", FM_HIGH, EC_HIGH),
+    ("current high", FM_HIGH, EC_HIGH),
+    ("intermittent/erratic", FM_INTERMITTENT, EC_INTERMITTENT),
+    ("circuit intermittent", FM_INTERMITTENT, EC_INTERMITTENT),
+    ("intermittent", FM_INTERMITTENT, EC_INTERMITTENT),
+    ("erratic", FM_INTERMITTENT, EC_INTERMITTENT),
+    ("range/performance", FM_RANGE, EC_NONE),
+    ("out of range", FM_RANGE, EC_NONE),
+    ("stuck open", FM_STUCK, EC_NONE),
+    ("stuck closed", FM_STUCK, EC_NONE),
+    ("stuck on", FM_STUCK, EC_NONE),
+    ("stuck off", FM_STUCK, EC_NONE),
+    ("stuck", FM_STUCK, EC_NONE),
+    ("stalled", FM_STUCK, EC_NONE),
+    ("lost communication", FM_COMMUNICATION, EC_NONE),
+    ("no communication", FM_COMMUNICATION, EC_NONE),
+    ("not responding", FM_COMMUNICATION, EC_NONE),
+    ("timeout", FM_COMMUNICATION, EC_NONE),
+    ("invalid data", FM_INVALID_DATA, EC_NONE),
+    ("correlation", FM_CORRELATION, EC_NONE),
+    ("too lean", FM_MIXTURE, EC_NONE),
+    ("too rich", FM_MIXTURE, EC_NONE),
+    ("to lean", FM_MIXTURE, EC_NONE),
+    ("to rich", FM_MIXTURE, EC_NONE),
+    ("misfire", FM_MISFIRE, EC_NONE),
+    ("leak", FM_LEAK, EC_NONE),
+    ("leaking", FM_LEAK, EC_NONE),
+    ("max limit", FM_LIMIT, EC_NONE),
+    ("min limit", FM_LIMIT, EC_NONE),
+    ("learning limit", FM_LIMIT, EC_NONE),
+    ("over temperature", FM_LIMIT, EC_NONE),
+    ("too high", FM_LIMIT, EC_NONE),
+    ("too low", FM_LIMIT, EC_NONE),
+    ("no signal", FM_NO_SIGNAL, EC_NONE),
+    ("no activity", FM_NO_SIGNAL, EC_NONE),
+    ("not learned", FM_NOT_LEARNED, EC_NONE),
+    ("not configured", FM_NOT_LEARNED, EC_NONE),
+    ("internal failure", FM_INTERNAL, EC_NONE),
+    ("internal fault", FM_INTERNAL, EC_NONE),
+    ("internal error", FM_INTERNAL, EC_NONE),
+    ("slow response", FM_PERFORMANCE, EC_NONE),
+    ("below threshold", FM_PERFORMANCE, EC_NONE),
+    ("performance", FM_PERFORMANCE, EC_NONE),
+    ("restricted", FM_PERFORMANCE, EC_NONE),
+    ("incorrect", FM_PERFORMANCE, EC_NONE),
+    ("over advanced", FM_PERFORMANCE, EC_NONE),
+    ("over retarded", FM_PERFORMANCE, EC_NONE),
+    ("circuit malfunction", FM_CIRCUIT, EC_NONE),
+    ("circuit failure", FM_CIRCUIT, EC_NONE),
+    ("circuit fault", FM_CIRCUIT, EC_NONE),
+    ("malfunction", FM_CIRCUIT, EC_NONE),
+    ("failure", FM_CIRCUIT, EC_NONE),
+    ("fault", FM_CIRCUIT, EC_NONE),
+    ("faulted", FM_CIRCUIT, EC_NONE),
+    ("failed", FM_CIRCUIT, EC_NONE),
+    ("error", FM_CIRCUIT, EC_NONE),
+    ("electrical", FM_CIRCUIT, EC_NONE),
+    ("low$", FM_LOW, EC_LOW),
+    ("high$", FM_HIGH, EC_HIGH),
+    ("open$", FM_OPEN, EC_OPEN),
+    ("circuit", FM_CIRCUIT, EC_NONE),
+]
+
+# segments that only describe the location
+LOCATION_WORDS = frozenset([
+    "bank", "cylinder", "sensor", "left", "right", "front", "rear", "intake", "exhaust", "upper", "lower", "inner",
+    "outer", "side", "driver", "passenger", "lh", "rh", "lf", "rf", "lr", "rr", "center", "middle",
+])
+# trailing words of a component that denote a sub-component
+SUB_COMPONENT_WORDS = (
+    "heater control", "heater", "actuator", "relay", "solenoid", "switch", "motor", "valve", "control",
+    "feedback", "supply voltage", "reference voltage", "ground", "signal", "output", "input", "lamp", "module",
+)
+
+
+class FaultStructure(NamedTuple):
+    """
+    Structured decomposition of a fault description into integer enums.
+    Component and sub-component refer to the vocabulary of the FaultStructures instance (0 = none).
+    """
+    component: int
+    sub_component: int
+    failure_mode: int
+    electrical_condition: int
+
+
+def _strip_designators(segment: str) -> str:
+    # drops numbers and letter designators ('a', #2, ...) that enumerate identical components
+    words = [w for w in segment.split() if not (w.isdigit() or w.startswith("#") or (len(w) == 3 and w[0] == "'"))]
+    return " ".join(words)
+
+
+def _is_location(segment: str) -> bool:
+    words = segment.replace("/", " ").split()
+    return bool(words) and all(w in LOCATION_WORDS or w.isdigit() for w in words)
+
+
+def _phrase_matches(text: str) -> List[Tuple[int, int, int, int, int]]:
+    # (start, end, failure mode, electrical condition, rank) of all occurrences of the failure phrases in the
+    # normalized text (padded with spaces), start / end are the positions of the surrounding spaces
+    matches = []
+    for rank, (phrase, mode, ec) in enumerate(FAILURE_PHRASES):
+        if phrase[-1] == "$":
+            if text.endswith(" " + phrase[:-1] + " "):
+                matches.append((len(text) - len(phrase) - 1, len(text) - 1, mode, ec, rank))
+            continue
+        pos = text.find(" " + phrase + " ")
+        while pos >= 0:
+            matches.append((pos, pos + len(phrase) + 1, mode, ec, rank))
+            pos = text.find(" " + phrase + " ", pos + 1)
+    return matches
+
+
+def decompose(description: str) -> Tuple[str, str, int, int]:
+    """
+    Decomposes a fault description into component, sub-component, failure mode and electrical condition,
+    e.g. "Heated oxygen sensor (HO2S) 1, bank 1, heater control -circuit low"
+    -> ("heated oxygen sensor (ho2s)", "heater control", FM_LOW, EC_LOW).
+
+    :param description: fault description
+    :return: (component, sub-component, failure mode, electrical condition)
+    """
+    text = " " + " ".join(description.lower().replace(" -", " ").replace("-", " ").split()) + " "
+    failure_mode, condition, component_text = FM_UNKNOWN, EC_NONE, text
+    for phrase, mode in LEADING_FAILURE_PHRASES:
+        pos = text.find(" " + phrase + " ")
+        if pos >= 0:
+            failure_mode, component_text = mode, text[pos + len(phrase) + 1:]
+            break
+    else:
+        matches = _phrase_matches(text)
+        if matches:
+            # the phrase that ends last describes the failure, ties are broken by the order of FAILURE_PHRASES
+            start, end, mode, ec = min(matches, key=lambda m: (-m[1], m[4]))[:4]
+            failure_mode, condition = mode, ec
+            # phrases directly preceding it qualify the failure (e.g. "performance circuit low"),
+            # they are not part of the component
+            starts_by_end: Dict[int, int] = {}
+            for m in matches:
+                starts_by_end[m[1]] = min(m[0], starts_by_end.get(m[1], m[0]))
+            while start in starts_by_end:
+                start = starts_by_end[start]
+            component_text = text[:start]
+    segments = [s for s in (_strip_designators(s) for s in component_text.split(",")) if s]
+    # a component that only consists of location words (e.g. "right front sensor") is kept as it is
+    segments = [s for s in segments if not _is_location(s)] or segments[:1]
+    if not segments:
+        return "", "", failure_mode, condition
+    component, sub_component = segments[0], segments[-1] if len(segments) > 1 else ""
+    if component.endswith(" circuit"):
+        component = component[:-len(" circuit")]
+    if not sub_component:
+        for word in SUB_COMPONENT_WORDS:
+            if component.endswith(" " + word):
+                component, sub_component = component[:-len(word) - 1], word
+                break
+    return component.strip(), sub_component.strip(), failure_mode, condition
+
+
+class FaultStructures:
+    """
+    Precomputed structured records (see FaultStructure) of all supported codes.
+    The component and sub-component strings are interned into a shared vocabulary, so each record only consists
+    of four small integers. The records are compiled ahead of time (see compile_fault_structures()), which keeps
+    the vocabulary IDs stable across processes.
+    """
+
+    def __init__(self, vocabulary: List[str], records: Dict[str, FaultStructure]):
+        """
+        :param vocabulary: component and sub-component strings (index = ID, 0 = none)
+        :param records: DTC -> structured record
+        """
+        self.vocabulary = vocabulary
+        self.ids: Dict[str, int] = {text: text_id for text_id, text in enumerate(vocabulary)}
+        self.records = records
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, str]]) -> "FaultStructures":
+        """
+        Decomposes the fault descriptions of the specified codes.
+
+        :param entries: (DTC, fault description) tuples
+        :return: fault structures
+        """
+        vocabulary = [""]
+        ids = {"": 0}
+
+        def intern(text: str) -> int:
+            if text not in ids:
+                ids[text] = len(vocabulary)
+                vocabulary.append(text)
+            return ids[text]
+
+        records = {}
+        for code, description in entries:
+            component, sub_component, failure_mode, condition = decompose(description)
+            records[code] = FaultStructure(intern(component), intern(sub_component), failure_mode, condition)
+        return cls(vocabulary, records)
+
+    def save(self, path: str = COMPILED_FAULT_STRUCTURES, data_hash: str = "") -> None:
+        """
+        Persists the structured records.
+
+        :param path: .json file to be written
+        :param data_hash: hash of the data files the records were built from (see loader.source_hash())
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"source_hash": data_hash, "vocabulary": self.vocabulary, "codes": "".join(self.records),
+                       "records": [value for record in self.records.values() for value in record]},
+                      f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str = COMPILED_FAULT_STRUCTURES) -> Tuple["FaultStructures", str]:
+        """
+        Loads persisted structured records.
+
+        :param path: .json file written by save()
+        :return: (fault structures, hash of the data files they were built from)
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        codes, values = data["codes"], data["records"]
+        records = {codes[i:i + 5]: FaultStructure(*values[4 * j:4 * j + 4])
+                   for j, i in enumerate(range(0, len(codes), 5))}
+        return cls(data["vocabulary"], records), data.get("source_hash", "")
+
+    def structure(self, description: str) -> FaultStructure:
+        """
+        Decomposes a fault description that is not part of the precomputed records, e.g. the manufacturer-specific
+        description of an OEM overlay. Components that are not part of the vocabulary are mapped to 0 (none),
+        the vocabulary is never modified.
+
+        :param description: fault description
+        :return: structured record
+        """
+        component, sub_component, failure_mode, condition = decompose(description)
+        return FaultStructure(self.ids.get(component, 0), self.ids.get(sub_component, 0), failure_mode, condition)
+
+    def get(self, code: str) -> FaultStructure:
+        """
+        Returns the structured record of the specified (canonical) code.
+
+        :param code: DTC
+        :return: structured record (all zero for unsupported codes)
+        """
+        return self.records.get(code, UNKNOWN_STRUCTURE)
+
+    def describe(self, structure: FaultStructure) -> Dict[str, str]:
+        """
+        Resolves the enums of a structured record to their names.
+
+        :param structure: structured record
+        :return: field name -> value
+        """
+        return {
+            "component": self.vocabulary[structure.component],
+            "sub_component": self.vocabulary[structure.sub_component],
+            "failure_mode": FAILURE_MODES[structure.failure_mode],
+            "electrical_condition": ELECTRICAL_CONDITIONS[structure.electrical_condition],
+        }
+
+
+UNKNOWN_STRUCTURE = FaultStructure(0, 0, FM_UNKNOWN, EC_NONE)
+
+
+def compile_fault_structures(path: str = COMPILED_FAULT_STRUCTURES) -> FaultStructures:
+    """
+    Builds the structured records of all supported codes and persists them.
+
+    :param path: .json file to be written
+    :return: fault structures
+    """
+    structures = FaultStructures.build(iter_entries())
+    structures.save(path, source_hash())
+    return structures
+
+
+@optional_structure("fault_structures")
+def get_fault_structures() -> FaultStructures:
+    """
+    Returns the structured records of all supported codes. The compiled records are used if they are present,
+    no other table source is set (see tables.set_table_source()) and they were built from the current data files
+    (checked via their hash, so the code tables are not loaded), otherwise they are built from the code tables.
+
+    :return: fault structures
+    """
+    if is_default_source() and os.path.exists(COMPILED_FAULT_STRUCTURES):
+        structures, data_hash = FaultStructures.load(COMPILED_FAULT_STRUCTURES)
+        if data_hash == source_hash():
+            return structures
+    return FaultStructures.build(iter_entries())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compiles the structured records of the supported DTCs')
+    parser.add_argument('--output', action='store', type=str, help='.json file to be written',
+                        default=COMPILED_FAULT_STRUCTURES)
+    args = parser.parse_args()
+    start = time.perf_counter()
+    fault_structures = compile_fault_structures(args.output)
+    print("... compiled", len(fault_structures.records), "records (%d vocabulary entries) in %.2f s"
+          % (len(fault_structures.vocabulary), time.perf_counter() - start))
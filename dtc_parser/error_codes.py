@@ -2,5169 +2,17 @@
 # -*- coding: utf-8 -*-
 # @author Tim Bohne
 
-P00_ERRORS = {
-    "P0000": "No fault",
-    "P0001": "Fuel volume regulator control -circuit open",
-    "P0002": "Fuel volume regulator control -circuit range/performance",
-    "P0003": "Fuel volume regulator control -circuit low",
-    "P0004": "Fuel volume regulator control -circuit high",
-    "P0005": "Fuel shut -off valve -circuit open",
-    "P0006": "Fuel shut -off valve -circuit low",
-    "P0007": "Fuel shut -off valve -circuit high",
-    "P0008": "Engine position system, bank 1 -engine performance",
-    "P0009": "Engine position system, bank 2 -engine performance",
-    "P000A": "A Camshaft Position Slow Response",
-    "P000B": "B Camshaft Position Slow Response",
-    "P000C": "A Camshaft Position Slow Response",
-    "P000D": "B Camshaft Position Slow Response",
-    "P000E": "Fuel Volume Regulator Control Exceeded Learning Limit",
-    "P000F": "Fuel System Over Pressure Relief Valve Activated",
-    "P0010": "Camshaft position (CMP) actuator, intake/left/front, bank 1 circuit malfunction",
-    "P0011": "Camshaft position (CMP), intake/left/front, bank 1 timing over advanced/system performance",
-    "P0012": "Camshaft position (CMP), intake/left/front, bank 1 timing over -retarded",
-    "P0013": "Camshaft position (CMP) actuator, exhaust/right/rear, bank 1 -circuit malfunction",
-    "P0014": "Camshaft position (CMP) actuator, exhaust/right/rear, bank 1 -timing over -advanced/system performance",
-    "P0015": "Camshaft position (CMP) actuator, exhaust/right/rear, bank 1 -timing over -retarded",
-    "P0016": "Crankshaft position/camshaft position, bank 1 sensor A -correlation",
-    "P0017": "Crankshaft position/camshaft position, bank 1 sensor B -correlation",
-    "P0018": "Crankshaft position/camshaft position, bank 2 sensor A -correlation",
-    "P0019": "Crankshaft position/camshaft position, bank 2 sensor B -correlation",
-    "P001A": "A Camshaft Profile Control Circuit/Open",
-    "P001B": "A Camshaft Profile Control Circuit Low",
-    "P001C": "A Camshaft Profile Control Circuit High",
-    "P001D": "A Camshaft Profile Control Circuit/Open",
-    "P001E": "A Camshaft Profile Control Circuit Low",
-    "P001F": "A Camshaft Profile Control Circuit High",
-    "P0020": "Camshaft position (CMP) ·actuator, intake/left/front, bank 2 -circuit malfunction",
-    "P0021": "Camshaft position (CMP); intake/left/front, bank 2 timing over -advanced/system performance",
-    "P0022": "Camshaft position (CMP), intake/left/front, bank 2. timing over -retarded",
-    "P0023": "Camshaft position (CMP) actuator, exhaust/right/rear, bank 2 -circuit malfunction",
-    "P0024": "Camshaft position (CMP), exhaust/right/rear, bank 2 -timing over -advanced/system performance",
-    "P0025": "Camshaft position (CMP), exhaust/right/rear, bank 2 -timing over -retarded",
-    "P0026": "Intake valve control solenoid circuit, bank 1 range/performance",
-    "P0027": "Exhaust valve control solenoid circuit, bank 1 range/performance",
-    "P0028": "Intake valve control solenoid circuit, bank 2 range/performance",
-    "P0029": "Exhaust valve control solenoid circuit, bank 2 range/performance",
-    "P002A": "B Camshaft Profile Control Circuit/Open",
-    "P002B": "B Camshaft Profile Control Circuit Low",
-    "P002C": "B Camshaft Profile Control Circuit High",
-    "P002D": "B Camshaft Profile Control Circuit/Open",
-    "P002E": "B Camshaft Profile Control Circuit Low",
-    "P002F": "B Camshaft Profile Control Circuit High",
-    "P0030": "Heated oxygen sensor (HO2S) 1, bank 1, heater control -circuit malfunction",
-    "P0031": "Heated oxygen sensor (HO2S) 1, bank 1, heater control -circuit low",
-    "P0032": "Heated oxygen sensor (HO2S) 1, bank 1, heater control -circuit high",
-    "P0033": "Turbocharger (TC) wastegate regulating valve -circuit malfunction",
-    "P0034": "Turbocharger (TC) wastegate regulating valve -circuit low",
-    "P0035": "Turbocharger (TC) wastegate regulating valve -circuit high",
-    "P0036": "Heated oxygen sensor (HO2S) 2, bank 1, heater control -circuit malfunction",
-    "P0037": "Heated oxygen sensor (HO2S) 2, bank 1, heater control -circuit low",
-    "P0038": "Heated oxygen sensor (HO2S) 2, bank 1, heater control -circuit high",
-    "P0039": "Turbo/super charger bypass valve, control circuit range/performance",
-    "P003A": "Turbocharger/Supercharger Boost Control 'A' Position Exceeded Learning Limit",
-    "P003B": "Turbocharger/Supercharger Boost Control 'B' Position Exceeded Learning Limit",
-    "P003C": "A Camshaft Profile Control Performance/Stuck Off",
-    "P003D": "A Camshaft Profile Control Stuck On",
-    "P003E": "A Camshaft Profile Control Performance/Stuck Off",
-    "P003F": "A Camshaft Profile Control Stuck On",
-    "P0040": "Oxygen sensor signals swapped, bank 1 sensor 1 /bank 2 sensor 1",
-    "P0041": "Oxygen sensor signals swapped, bank 1 sensor 2/bank 2 sensor 2",
-    "P0042": "Heated oxygen sensor (HO2S) 3, bank 1, heater control -circuit malfunction",
-    "P0043": "Heated oxygen sensor (HO2S) 3, bank 1, heater control circuit low",
-    "P0044": "Heated oxygen sensor (HO2S) 3, bank 1, heater control -circuit high",
-    "P0045": "Turbo/super charger boost control solenoid -circuit open",
-    "P0046": "Turbo/super charger boost control solenoid circuit range/performance",
-    "P0047": "Turbo/super charger boost control solenoid -circuit low",
-    "P0048": "Turbo/super charger boost control solenoid -circuit high",
-    "P0049": "Turbo/super charger turbine -over -speed",
-    "P004A": "Turbocharger/Supercharger Boost Control 'B' Circuit/Open",
-    "P004B": "Turbocharger/Supercharger Boost Control 'B' Circuit Range/Performance",
-    "P004C": "Turbocharger/Supercharger Boost Control 'B' Circuit Low",
-    "P004D": "Turbocharger/Supercharger Boost Control 'B' Circuit High",
-    "P004E": "Turbocharger/Supercharger Boost Control 'A' Circuit Intermittent/Erratic",
-    "P004F": "Turbocharger/Supercharger Boost Control 'B' Circuit Intermittent/Erratic",
-    "P0050": "Heated oxygen sensor (HO2S) 1, bank 2, heater control circuit malfunction",
-    "P0051": "Heated oxygen sensor (HO2S) 1, bank 2, heater control -circuit low",
-    "P0052": "Heated oxygen sensor (HO2S) 1, bank 2, heater control -circuit high",
-    "P0053": "Heated oxygen sensor (HO2S), bank 1, sensor 1 -heater resistance",
-    "P0054": "Heated oxygen sensor (HO2S), bank 1, sensor 2 -heater resistance",
-    "P0055": "Heated oxygen sensor (HO2S), bank 1, sensor 3 -heater resistance",
-    "P0056": "Heated oxygen sensor (HO2S) 2, bank 2, heater control -circuit malfunction",
-    "P0057": "Heated oxygen sensor (HO2S) 2, bank 2, heater control heater circuit low",
-    "P0058": "Heated oxygen sensor (HO2S) 2, bank 2, heater control circuit high",
-    "P0059": "Heated oxygen sensor (HO2S), bank 2, sensor 1 -heater resistance",
-    "P005A": "B Camshaft Profile Control Performance/Stuck Off",
-    "P005B": "B Camshaft Profile Control Stuck On",
-    "P005C": "B Camshaft Profile Control Performance/Stuck Off",
-    "P005D": "B Camshaft Profile Control Stuck On",
-    "P005E": "Turbocharger/Supercharger Boost Control 'B' Supply Voltage Circuit Low",
-    "P005F": "Turbocharger/Supercharger Boost Control 'B' Supply Voltage Circuit High",
-    "P0060": "Heated oxygen sensor (HO2S), bank 2, sensor 2 -heater resistance",
-    "P0061": "Heated oxygen sensor (HO2S), bank 2, sensor 3 -heater resistance",
-    "P0062": "Heated oxygen sensor (HO2S) 3, bank 2, heater control circuit malfunction",
-    "P0063": "Heated oxygen sensor (HO2S) 3, bank 2, heater control circuit low",
-    "P0064": "Heated oxygen sensor (HO2S) 3, bank 2, heater control circuit high",
-    "P0065": "Air assisted injector -range/performance problem",
-    "P0066": "Air assisted injector -circuit malfunction/circuit low",
-    "P0067": "Air assisted injector -circuit high",
-    "P0068": "Manifold absolute pressure (MAP) sensor/mass air flow (MAF) sensor/ throttle position correlation",
-    "P0069": "Manifold absolute pressure (MAP) sensor/barometric pressure (BARO) sensor correlation",
-    "P006A": "MAP - Mass or Volume Air Flow Correlation",
-    "P006B": "MAP - Exhaust Pressure Correlation",
-    "P006C": "MAP - Turbocharger/Supercharger Inlet Pressure Correlation",
-    "P006D": "Barometric Pressure - Turbocharger/Supercharger Inlet Pressure Correlation",
-    "P006E": "Turbocharger/Supercharger Boost Control 'A' Supply Voltage Circuit Low",
-    "P006F": "Turbocharger/Supercharger Boost Control 'A' Supply Voltage Circuit High",
-    "P0070": "Outside air temperature sensor -circuit malfunction",
-    "P0071": "Outside air temperature sensor -range/performance problem",
-    "P0072": "Outside air temperature sensor -low input",
-    "P0073": "Outside air temperature sensor -high input",
-    "P0074": "Outside air temperature sensor -circuit intermittent",
-    "P0075": "Intake valve control solenoid, bank 1 -circuit malfunction",
-    "P0076": "Intake valve control solenoid, bank 1 -circuit low",
-    "P0077": "Intake valve control solenoid, bank 1 -circuit high",
-    "P0078": "Exhaust valve control solenoid, bank 1 -circuit malfunction",
-    "P0079": "Exhaust valve control solenoid, bank 1 -circuit low",
-    "P007A": "Charge Air Cooler Temperature Sensor Circuit",
-    "P007B": "Charge Air Cooler Temperature Sensor Circuit Range/Performance",
-    "P007C": "Charge Air Cooler Temperature Sensor Circuit Low",
-    "P007D": "Charge Air Cooler Temperature Sensor Circuit High",
-    "P007E": "Charge Air Cooler Temperature Sensor Circuit Intermittent/Erratic",
-    "P007F": "Charge Air Cooler Temperature Sensor Bank1/Bank2 Correlation",
-    "P0080": "Exhaust valve control solenoid, bank 1 -circuit high",
-    "P0081": "Intake valve control solenoid, bank 2 -circuit malfunction",
-    "P0082": "Intake valve control solenoid, bank 2 -circuit low",
-    "P0083": "Intake valve control solenoid, bank 2 -circuit high",
-    "P0084": "Exhaust valve control solenoid, bank 2 -circuit malfunction",
-    "P0085": "Exhaust valve control solenoid, bank 2 -circuit low",
-    "P0086": "Exhaust valve control solenoid, bank 2 -circuit high",
-    "P0087": "Fuel rail/system pressure too low",
-    "P0088": "Fuel rail/system pressure too high",
-    "P0089": "Fuel pressure regulator -performance problem",
-    "P008A": "Low Pressure Fuel System Pressure - Too Low",
-    "P008B": "Low Pressure Fuel System Pressure - Too High",
-    "P008C": "Fuel Cooler Pump Control Circuit/Open",
-    "P008D": "Fuel Cooler Pump Control Circuit Low",
-    "P008E": "Fuel Cooler Pump Control Circuit High",
-    "P008F": "Engine Coolant Temperature/Fuel Temperature Correlation",
-    "P0090": "Fuel metering solenoid -open circuit",
-    "P0091": "Fuel metering solenoid - -short to earth",
-    "P0092": "Fuel metering solenoid -short to positive",
-    "P0093": "Fuel system leak -large leak detected",
-    "P0094": "Fuel system leak -small leak detected",
-    "P0095": "Intake air temperature (IAT) sensor 2 -circuit malfunction",
-    "P0096": "Intake air temperature (IAT) sensor 2 -circuit range/performance",
-    "P0097": "Intake air temperature (IAT) sensor 2 -circuit low input",
-    "P0098": "Intake air temperature (IAT) sensor 2 -circuit high input",
-    "P0099": "Intake air temperature (IAT) sensor 2 -circuit intermittent/erratic",
-    "P009A": "Intake Air Temperature/Ambient Air Temperature Correlation",
-    "P009B": "Fuel Pressure Relief Control Circuit/Open",
-    "P009C": "Fuel Pressure Relief Control Circuit Low",
-    "P009D": "Fuel Pressure Relief Control Circuit High",
-    "P009E": "Fuel Pressure Relief Control Performance/Stuck Off",
-    "P009F": "Fuel Pressure Relief Control Stuck On",
-    "P00A0": "Charge Air Cooler Temperature Sensor Circuit",
-    "P00A1": "Charge Air Cooler Temperature Sensor Circuit Range/Performance",
-    "P00A2": "Charge Air Cooler Temperature Sensor Circuit Low",
-    "P00A3": "Charge Air Cooler Temperature Sensor Circuit High",
-    "P00A4": "Charge Air Cooler Temperature Sensor Circuit Intermittent/Erratic",
-    "P00A5": "Intake Air Temperature Sensor 2 Circuit",
-    "P00A6": "Intake Air Temperature Sensor 2 Circuit Range/Performance",
-    "P00A7": "Intake Air Temperature Sensor 2 Circuit Low",
-    "P00A8": "Intake Air Temperature Sensor 2 Circuit High",
-    "P00A9": "Intake Air Temperature Sensor 2 Circuit Intermittent/Erratic",
-    "P00AA": "Intake Air Temperature Sensor 1 Circuit",
-    "P00AB": "Intake Air Temperature Sensor 1 Circuit Range/Performance",
-    "P00AC": "Intake Air Temperature Sensor 1 Circuit Low",
-    "P00AD": "Intake Air Temperature Sensor 1 Circuit High",
-    "P00AE": "Intake Air Temperature Sensor 1 Circuit Intermittent",
-    "P00AF": "Turbocharger/Supercharger Boost Control 'A' Module Performance",
-    "P00B0": "Turbocharger/Supercharger Boost Control 'B' Module Performance",
-    "P00B1": "Radiator Coolant Temperature Sensor Circuit",
-    "P00B2": "Radiator Coolant Temperature Sensor Circuit Range/Performance",
-    "P00B3": "Radiator Coolant Temperature Sensor Circuit Low",
-    "P00B4": "Radiator Coolant Temperature Sensor Circuit High",
-    "P00B5": "Radiator Coolant Temperature Sensor Circuit Intermittent/Erratic",
-    "P00B6": "Radiator Coolant Temperature/Engine Coolant Temperature Correlation",
-    "P00B7": "Engine Coolant Flow Low/Performance",
-    "P00B8": "MAP - Mass or Volume Air Flow Correlation",
-    "P00B9": "Low Pressure Fuel System Pressure - Too Low",
-    "P00BA": "Low Fuel Pressure - Forced Limited Power",
-    "P00BB": "Fuel Injector Insufficient Flow - Forced Limited Power",
-    "P00BC": "Mass or Volume Air Flow 'A' Circuit Range/Performance - Air Flow Too Low",
-    "P00BD": "Mass or Volume Air Flow 'A' Circuit Range/Performance - Air Flow Too High",
-    "P00BE": "Mass or Volume Air Flow 'B' Circuit Range/Performance - Air Flow Too Low",
-    "P00BF": "Mass or Volume Air Flow 'B' Circuit Range/Performance - Air Flow Too High",
-    "P00C6": "Fuel Rail Pressure Low During Cranking",
-    "P00FF": "Fuel / Air auxillary system",
-}
+# The code tables are kept in data/error_codes.csv (plus optional user-supplied files, see loader.py);
+# this module exposes them under their established names (P00_ERRORS, ..., U2_ERRORS).
+# They are loaded on first access, so parsers backed by another storage (see sqlite_backend.py) never hold them.
 
-P01_ERRORS = {
-    "P0100": "Mass or Volume Air Flow 'A' Circuit",
-    "P0101": "Mass or Volume Air Flow 'A' Circuit Range/Performance",
-    "P0102": "Mass or Volume Air Flow 'A' Circuit Low",
-    "P0103": "Mass or Volume Air Flow 'A' Circuit High",
-    "P0104": "Mass or Volume Air Flow 'A' Circuit Intermittent",
-    "P0105": "Manifold Absolute Pressure/Barometric Pressure Circuit",
-    "P0106": "Manifold Absolute Pressure/Barometric Pressure Circuit",
-    "P0107": "Manifold Absolute Pressure/Barometric Pressure Circuit Low",
-    "P0108": "Manifold Absolute Pressure/Barometric Pressure Circuit High",
-    "P0109": "Manifold Absolute Pressure/Barometric Pressure Circuit Intermittent",
-    "P010A": "Mass or Volume Air Flow 'B' Circuit",
-    "P010B": "Mass or Volume Air Flow 'B' Circuit Range/Performance",
-    "P010C": "Mass or Volume Air Flow 'B' Circuit Low",
-    "P010D": "Mass or Volume Air Flow 'B' Circuit High",
-    "P010E": "Mass or Volume Air Flow 'B' Circuit Intermittent/Erratic",
-    "P010F": "Mass or Volume Air Flow Sensor A/B Correlation",
-    "P0110": "Intake Air Temperature Sensor 1 Circuit",
-    "P0111": "Intake Air Temperature Sensor 1 Circuit Range/Performance",
-    "P0112": "Intake Air Temperature Sensor 1 Circuit Low",
-    "P0113": "Intake Air Temperature Sensor 1 Circuit High",
-    "P0114": "Intake Air Temperature Sensor 1 Circuit Intermittent",
-    "P0115": "Engine Coolant Temperature Sensor 1 Circuit",
-    "P0116": "Engine Coolant Temperature Sensor 1 Circuit Range/Performance",
-    "P0117": "Engine Coolant Temperature Sensor 1 Circuit Low",
-    "P0118": "Engine Coolant Temperature Sensor 1 Circuit High",
-    "P0119": "Engine Coolant Temperature Sensor 1 Circuit Intermittent",
-    "P011A": "Engine Coolant Temperature Sensor 1/2 Correlation",
-    "P011B": "Engine Coolant Temperature/Intake Air Temperature Correlation",
-    "P011C": "Charge Air Temperature/Intake Air Temperature Correlation",
-    "P011D": "Charge Air Temperature/Intake Air Temperature Correlation",
-    "P0120": "Throttle/Pedal Position Sensor/Switch 'A' Circuit",
-    "P0121": "Throttle/Pedal Position Sensor/Switch 'A' Circuit",
-    "P0122": "Throttle/Pedal Position Sensor/Switch 'A' Circuit Low",
-    "P0123": "Throttle/Pedal Position Sensor/Switch 'A' Circuit High",
-    "P0124": "Throttle/Pedal Position Sensor/Switch 'A' Circuit Intermittent",
-    "P0125": "Insufficient Coolant Temperature for Closed Loop Fuel Control",
-    "P0126": "Insufficient Coolant Temperature for Stable Operation",
-    "P0127": "Intake Air Temperature Too High",
-    "P0128": "Coolant Thermostat (Coolant Temperature Below Thermostat",
-    "P0129": "Barometric Pressure Too Low",
-    "P012A": "Turbocharger/Supercharger Inlet Pressure Sensor Circuit",
-    "P012B": "Turbocharger/Supercharger Inlet Pressure Sensor Circuit",
-    "P012C": "Turbocharger/Supercharger Inlet Pressure Sensor Circuit Low",
-    "P012D": "Turbocharger/Supercharger Inlet Pressure Sensor Circuit High",
-    "P012E": "Turbocharger/Supercharger Inlet Pressure Sensor Circuit",
-    "P0130": "O2 Sensor Circuit",
-    "P0131": "O2 Sensor Circuit Low Voltage",
-    "P0132": "O2 Sensor Circuit High Voltage",
-    "P0133": "O2 Sensor Circuit Slow Response",
-    "P0134": "O2 Sensor Circuit no Activity Detected",
-    "P0135": "O2 Sensor Heater Circuit",
-    "P0136": "O2 Sensor Circuit",
-    "P0137": "O2 Sensor Circuit Low Voltage",
-    "P0138": "O2 Sensor Circuit High Voltage",
-    "P0139": "O2 Sensor Circuit Slow Response",
-    "P013A": "O2 Sensor Slow Response - Rich to Lean",
-    "P013B": "O2 Sensor Slow Response - Lean to Rich",
-    "P013C": "O2 Sensor Slow Response - Rich to Lean",
-    "P013D": "O2 Sensor Slow Response - Lean to Rich",
-    "P013E": "O2 Sensor Delayed Response - Rich to Lean",
-    "P013F": "O2 Sensor Delayed Response - Lean to Rich",
-    "P0140": "O2 Sensor Circuit no Activity Detected",
-    "P0141": "O2 Sensor Heater Circuit",
-    "P0142": "O2 Sensor Circuit",
-    "P0143": "O2 Sensor Circuit Low Voltage",
-    "P0144": "O2 Sensor Circuit High Voltage",
-    "P0145": "O2 Sensor Circuit Slow Response",
-    "P0146": "O2 Sensor Circuit no Activity Detected",
-    "P0147": "O2 Sensor Heater Circuit",
-    "P0148": "Fuel Delivery Error",
-    "P0149": "Fuel Timing Error",
-    "P014A": "O2 Sensor Delayed Response - Rich to Lean",
-    "P014B": "O2 Sensor Delayed Response - Lean to Rich",
-    "P014C": "O2 Sensor Slow Response - Rich to Lean",
-    "P014D": "O2 Sensor Slow Response - Lean to Rich",
-    "P014E": "O2 Sensor Slow Response - Rich to Lean",
-    "P014F": "O2 Sensor Slow Response - Lean to Rich",
-    "P0150": "O2 Sensor Circuit",
-    "P0151": "O2 Sensor Circuit Low Voltage",
-    "P0152": "O2 Sensor Circuit High Voltage",
-    "P0153": "O2 Sensor Circuit Slow Response",
-    "P0154": "O2 Sensor Circuit no Activity Detected",
-    "P0155": "O2 Sensor Heater Circuit",
-    "P0156": "O2 Sensor Circuit",
-    "P0157": "O2 Sensor Circuit Low Voltage",
-    "P0158": "O2 Sensor Circuit High Voltage",
-    "P0159": "O2 Sensor Circuit Slow Response",
-    "P015A": "O2 Sensor Delayed Response - Rich to Lean",
-    "P015B": "O2 Sensor Delayed Response - Lean to Rich",
-    "P015C": "O2 Sensor Delayed Response - Rich to Lean",
-    "P015D": "O2 Sensor Delayed Response - Lean to Rich",
-    "P0160": "O2 Sensor Circuit no Activity Detected",
-    "P0161": "O2 Sensor Heater Circuit",
-    "P0162": "O2 Sensor Circuit",
-    "P0163": "O2 Sensor Circuit Low Voltage",
-    "P0164": "O2 Sensor Circuit High Voltage",
-    "P0165": "O2 Sensor Circuit Slow Response",
-    "P0166": "O2 Sensor Circuit no Activity Detected",
-    "P0167": "O2 Sensor Heater Circuit",
-    "P0168": "Fuel Temperature Too High",
-    "P0169": "Incorrect Fuel Composition",
-    "P0170": "Fuel Trim",
-    "P0171": "System Too Lean",
-    "P0172": "System Too Rich",
-    "P0173": "Fuel Trim",
-    "P0174": "System Too Lean",
-    "P0175": "System Too Rich",
-    "P0176": "Fuel Composition Sensor Circuit",
-    "P0177": "Fuel Composition Sensor Circuit Range/Performance",
-    "P0178": "Fuel Composition Sensor Circuit Low",
-    "P0179": "Fuel Composition Sensor Circuit High",
-    "P0180": "Fuel Temperature Sensor 'A' Circuit",
-    "P0181": "Fuel Temperature Sensor 'A' Circuit Range/Performance",
-    "P0182": "Fuel Temperature Sensor 'A' Circuit Low",
-    "P0183": "Fuel Temperature Sensor 'A' Circuit High",
-    "P0184": "Fuel Temperature Sensor 'A' Circuit Intermittent",
-    "P0185": "Fuel Temperature Sensor 'B' Circuit",
-    "P0186": "Fuel Temperature Sensor 'B' Circuit Range/Performance",
-    "P0187": "Fuel Temperature Sensor 'B' Circuit Low",
-    "P0188": "Fuel Temperature Sensor 'B' Circuit High",
-    "P0189": "Fuel Temperature Sensor 'B' Circuit Intermittent",
-    "P018A": "Fuel Pressure Sensor 'B' Circuit",
-    "P018B": "Fuel Pressure Sensor 'B' Circuit Range/Performance",
-    "P018C": "Fuel Pressure Sensor 'B' Circuit Low",
-    "P018D": "Fuel Pressure Sensor 'B' Circuit High",
-    "P018E": "Fuel Pressure Sensor 'B' Circuit Intermittent/Erratic",
-    "P018F": "Fuel System Over Pressure Relief Valve Frequent Activation",
-    "P0190": "Fuel Rail Pressure Sensor 'A' Circuit",
-    "P0191": "Fuel Rail Pressure Sensor 'A' Circuit Range/Performance",
-    "P0192": "Fuel Rail Pressure Sensor 'A' Circuit Low",
-    "P0193": "Fuel Rail Pressure Sensor 'A' Circuit High",
-    "P0194": "Fuel Rail Pressure Sensor 'A' Circuit Intermittent/Erratic",
-    "P0195": "Engine Oil Temperature Sensor Circuit",
-    "P0196": "Engine Oil Temperature Sensor Range/Performance",
-    "P0197": "Engine Oil Temperature Sensor Circuit Low",
-    "P0198": "Engine Oil Temperature Sensor Circuit High",
-    "P0199": "Engine Oil Temperature Sensor Circuit Intermittent/Erratic",
-}
+from typing import Dict
 
-P02_ERRORS = {
-    "P0200": "Injector Circuit/Open",
-    "P0201": "Injector Circuit/Open - Cylinder 1",
-    "P0202": "Injector Circuit/Open - Cylinder 2",
-    "P0203": "Injector Circuit/Open - Cylinder 3",
-    "P0204": "Injector Circuit/Open - Cylinder 4",
-    "P0205": "Injector Circuit/Open - Cylinder 5",
-    "P0206": "Injector Circuit/Open - Cylinder 6",
-    "P0207": "Injector Circuit/Open - Cylinder 7",
-    "P0208": "Injector Circuit/Open - Cylinder 8",
-    "P0209": "Injector Circuit/Open - Cylinder 9",
-    "P020A": "Cylinder 1 Injection Timing",
-    "P020B": "Cylinder 2 Injection Timing",
-    "P020C": "Cylinder 3 Injection Timing",
-    "P020D": "Cylinder 4 Injection Timing",
-    "P020E": "Cylinder 5 Injection Timing",
-    "P020F": "Cylinder 6 Injection Timing",
-    "P0210": "Injector Circuit/Open - Cylinder 10",
-    "P0211": "Injector Circuit/Open - Cylinder 11",
-    "P0212": "Injector Circuit/Open - Cylinder 12",
-    "P0213": "Cold Start Injector 1",
-    "P0214": "Cold Start Injector 2",
-    "P0215": "Engine Shutoff Solenoid",
-    "P0216": "Injector/Injection Timing Control Circuit",
-    "P0217": "Engine Coolant Over Temperature Condition",
-    "P0218": "Transmission Fluid Over Temperature Condition",
-    "P0219": "Engine Overspeed Condition",
-    "P021A": "Cylinder 7 Injection Timing",
-    "P021B": "Cylinder 8 Injection Timing",
-    "P021C": "Cylinder 9 Injection Timing",
-    "P021D": "Cylinder 10 Injection Timing",
-    "P021E": "Cylinder 11 Injection Timing",
-    "P021F": "Cylinder 12 Injection Timing",
-    "P0220": "Throttle/Pedal Position Sensor/Switch 'B' Circuit",
-    "P0221": "Throttle/Pedal Position Sensor/Switch 'B' Circuit",
-    "P0222": "Throttle/Pedal Position Sensor/Switch 'B' Circuit Low",
-    "P0223": "Throttle/Pedal Position Sensor/Switch 'B' Circuit High",
-    "P0224": "Throttle/Pedal Position Sensor/Switch 'B' Circuit Intermittent",
-    "P0225": "Throttle/Pedal Position Sensor/Switch 'C' Circuit",
-    "P0226": "Throttle/Pedal Position Sensor/Switch 'C' Circuit",
-    "P0227": "Throttle/Pedal Position Sensor/Switch 'C' Circuit Low",
-    "P0228": "Throttle/Pedal Position Sensor/Switch 'C' Circuit High",
-    "P0229": "Throttle/Pedal Position Sensor/Switch 'C' Circuit Intermittent",
-    "P022A": "Charge Air Cooler Bypass Control 'A' Circuit /Open",
-    "P022B": "Charge Air Cooler Bypass Control 'A' Circuit Low",
-    "P022C": "Charge Air Cooler Bypass Control 'A' Circuit High",
-    "P022D": "Charge Air Cooler Bypass Control 'B' Circuit /Open",
-    "P022E": "Charge Air Cooler Bypass Control 'B' Circuit Low",
-    "P022F": "Charge Air Cooler Bypass Control 'B' Circuit High",
-    "P0230": "Fuel Pump Primary Circuit",
-    "P0231": "Fuel Pump Secondary Circuit Low",
-    "P0232": "Fuel Pump Secondary Circuit High",
-    "P0233": "Fuel Pump Secondary Circuit Intermittent",
-    "P0234": "Turbocharger/Supercharger 'A' Overboost Condition",
-    "P0235": "Turbocharger/Supercharger Boost Sensor 'A' Circuit",
-    "P0236": "Turbocharger/Supercharger Boost Sensor 'A' Circuit",
-    "P0237": "Turbocharger/Supercharger Boost Sensor 'A' Circuit Low",
-    "P0238": "Turbocharger/Supercharger Boost Sensor 'A' Circuit High",
-    "P0239": "Turbocharger/Supercharger Boost Sensor 'B' Circuit",
-    "P023A": "Charge Air Cooler Coolant Pump Control Circuit/Open",
-    "P023B": "Charge Air Cooler Coolant Pump Control Circuit Low",
-    "P023C": "Charge Air Cooler Coolant Pump Control Circuit High",
-    "P023D": "Manifold Absolute Pressure - Turbocharger/Supercharger Boost",
-    "P023E": "Manifold Absolute Pressure - Turbocharger/Supercharger Boost",
-    "P023F": "Fuel Pump Secondary Circuit/Open",
-    "P0240": "Turbocharger/Supercharger Boost Sensor 'B' Circuit",
-    "P0241": "Turbocharger/Supercharger Boost Sensor 'B' Circuit Low",
-    "P0242": "Turbocharger/Supercharger Boost Sensor 'B' Circuit High",
-    "P0243": "Turbocharger/Supercharger Wastegate Solenoid 'A'",
-    "P0244": "Turbocharger/Supercharger Wastegate Solenoid 'A'",
-    "P0245": "Turbocharger/Supercharger Wastegate Solenoid 'A' Low",
-    "P0246": "Turbocharger/Supercharger Wastegate Solenoid 'A' High",
-    "P0247": "Turbocharger/Supercharger Wastegate Solenoid 'B'",
-    "P0248": "Turbocharger/Supercharger Wastegate Solenoid 'B'",
-    "P0249": "rbocharger/Supercharger Wastegate Solenoid 'B' Low",
-    "P024A": "Charge Air Cooler Bypass Control 'A' Range/Performance",
-    "P024B": "Charge Air Cooler Bypass Control 'A' Stuck",
-    "P024C": "Charge Air Cooler Bypass Position Sensor 'A' Circuit",
-    "P024D": "Charge Air Cooler Bypass Position Sensor 'A' Circuit",
-    "P024E": "Charge Air Cooler Bypass Position Sensor 'A' Circuit Low",
-    "P024F": "Charge Air Cooler Bypass Position Sensor 'A' Circuit High",
-    "P0250": "Turbocharger/Supercharger Wastegate Solenoid 'B' High",
-    "P0251": "Injection Pump Fuel Metering Control 'A' (Cam/Rotor/Injector)",
-    "P0252": "Injection Pump Fuel Metering Control 'A' Range/Performance",
-    "P0253": "Injection Pump Fuel Metering Control 'A' Low (Cam/Rotor/Injector)",
-    "P0254": "Injection Pump Fuel Metering Control 'A' High (Cam/Rotor/Injector)",
-    "P0255": "Injection Pump Fuel Metering Control 'A' Intermittent",
-    "P0256": "Injection Pump Fuel Metering Control 'B' (Cam/Rotor/Injector)",
-    "P0257": "Injection Pump Fuel Metering Control 'B' Range/Performance",
-    "P0258": "Injection Pump Fuel Metering Control 'B' Low (Cam/Rotor/Injector)",
-    "P0259": "Injection Pump Fuel Metering Control 'B' High (Cam/Rotor/Injector)",
-    "P025A": "Fuel Pump Module Control Circuit/Open",
-    "P025B": "Fuel Pump Module Control Circuit Range/Performance",
-    "P025C": "Fuel Pump Module Control Circuit Low",
-    "P025D": "Fuel Pump Module Control Circuit High",
-    "P0260": "Injection Pump Fuel Metering Control 'B' Intermittent",
-    "P0261": "Cylinder 1 Injector Circuit Low",
-    "P0262": "Cylinder 1 Injector Circuit High",
-    "P0263": "Cylinder 1 Contribution/Balance",
-    "P0264": "Cylinder 2 Injector Circuit Low",
-    "P0265": "Cylinder 2 Injector Circuit High",
-    "P0266": "Cylinder 2 Contribution/Balance",
-    "P0267": "Cylinder 3 Injector Circuit Low",
-    "P0268": "Cylinder 3 Injector Circuit High",
-    "P0269": "Cylinder 3 Contribution/Balance",
-    "P0270": "Cylinder 4 Injector Circuit Low",
-    "P0271": "Cylinder 4 Injector Circuit High",
-    "P0272": "Cylinder 4 Contribution/Balance",
-    "P0273": "Cylinder 5 Injector Circuit Low",
-    "P0274": "Cylinder 5 Injector Circuit High",
-    "P0275": "Cylinder 5 Contribution/Balance",
-    "P0276": "Cylinder 6 Injector Circuit Low",
-    "P0277": "Cylinder 6 Injector Circuit High",
-    "P0278": "Cylinder 6 Contribution/Balance",
-    "P0279": "Cylinder 7 Injector Circuit Low",
-    "P0280": "Cylinder 7 Injector Circuit High",
-    "P0281": "Cylinder 7 Contribution/Balance",
-    "P0282": "Cylinder 8 Injector Circuit Low",
-    "P0283": "Cylinder 8 Injector Circuit High",
-    "P0284": "Cylinder 8 Contribution/Balance",
-    "P0285": "Cylinder 9 Injector Circuit Low",
-    "P0286": "Cylinder 9 Injector Circuit High",
-    "P0287": "Cylinder 9 Contribution/Balance",
-    "P0288": "Cylinder 10 Injector Circuit Low",
-    "P0289": "Cylinder 10 Injector Circuit High",
-    "P0290": "Cylinder 10 Contribution/Balance",
-    "P0291": "Cylinder 11 Injector Circuit Low",
-    "P0292": "Cylinder 11 Injector Circuit High",
-    "P0293": "Cylinder 11 Contribution/Balance",
-    "P0294": "Cylinder 12 Injector Circuit Low",
-    "P0295": "Cylinder 12 Injector Circuit High",
-    "P0296": "Cylinder 12 Contribution/Balance",
-    "P0297": "Vehicle Overspeed Condition",
-    "P0298": "Engine Oil Over Temperature",
-    "P0299": "Turbocharger/Supercharger 'A' Underboost Condition",
-    "P029A": "Cylinder 1 - Fuel Trim at Max Limit",
-    "P029B": "Cylinder 1 - Fuel Trim at Min Limit",
-    "P029C": "Cylinder 1 - Injector Restricted",
-    "P029D": "Cylinder 1 - Injector Leaking",
-    "P029E": "Cylinder 2 - Fuel Trim at Max Limit",
-    "P029F": "Cylinder 2 - Fuel Trim at Min Limit",
-    "P02A0": "Cylinder 2 - Injector Restricted",
-    "P02A1": "Cylinder 2 - Injector Leaking",
-    "P02A2": "Cylinder 3 - Fuel Trim at Max Limit",
-    "P02A3": "Cylinder 3 - Fuel Trim at Min Limit",
-    "P02A4": "Cylinder 3 - Injector Restricted",
-    "P02A5": "Cylinder 3 - Injector Leaking",
-    "P02A6": "Cylinder 4 - Fuel Trim at Max Limit",
-    "P02A7": "Cylinder 4 - Fuel Trim at Min Limit",
-    "P02A8": "Cylinder 4 - Injector Restricted",
-    "P02A9": "Cylinder 4 - Injector Leaking",
-    "P02AA": "Cylinder 5 - Fuel Trim at Max Limit",
-    "P02AB": "Cylinder 5 - Fuel Trim at Min Limit",
-    "P02AC": "Cylinder 5 - Injector Restricted",
-    "P02AD": "Cylinder 5 - Injector Leaking",
-    "P02AE": "Cylinder 6 - Fuel Trim at Max Limit",
-    "P02AF": "Cylinder 6 - Fuel Trim at Min Limit",
-    "P02B0": "Cylinder 6 - Injector Restricted",
-    "P02B1": "Cylinder 6 - Injector Leaking",
-    "P02B2": "Cylinder 7 - Fuel Trim at Max Limit",
-    "P02B3": "Cylinder 7 - Fuel Trim at Min Limit",
-    "P02B4": "Cylinder 7 - Injector Restricted",
-    "P02B5": "Cylinder 7 - Injector Leaking",
-    "P02B6": "Cylinder 8 - Fuel Trim at Max Limit",
-    "P02B7": "Cylinder 8 - Fuel Trim at Min Limit",
-    "P02B8": "Cylinder 8 - Injector Restricted",
-    "P02B9": "Cylinder 8 - Injector Leaking",
-    "P02BA": "Cylinder 9 - Fuel Trim at Max Limit",
-    "P02BB": "Cylinder 9 - Fuel Trim at Min Limit",
-    "P02BC": "Cylinder 9 - Injector Restricted",
-    "P02BD": "Cylinder 9 - Injector Leaking",
-    "P02BE": "Cylinder 10 - Fuel Trim at Max Limit",
-    "P02BF": "Cylinder 10 - Fuel Trim at Min Limit",
-    "P02C0": "Cylinder 10 - Injector Restricted",
-    "P02C1": "Cylinder 10 - Injector Leaking",
-    "P02C2": "Cylinder 11 - Fuel Trim at Max Limit",
-    "P02C3": "Cylinder 11 - Fuel Trim at Min Limit",
-    "P02C4": "Cylinder 11 - Injector Restricted",
-    "P02C5": "Cylinder 11 - Injector Leaking",
-    "P02C6": "Cylinder 12 - Fuel Trim at Max Limit",
-    "P02C7": "Cylinder 12 - Fuel Trim at Min Limit",
-    "P02C8": "Cylinder 12 - Injector Restricted",
-    "P02C9": "Cylinder 12 - Injector Leaking",
-    "P02CA": "Turbocharger/Supercharger 'B' Overboost Condition",
-    "P02CB": "Turbocharger/Supercharger 'B' Underboost Condition",
-    "P02CC": "Cylinder 1 Fuel Injector Offset Learning At Min Limit",
-    "P02CD": "Cylinder 1 Fuel Injector Offset Learning At Max Limit",
-    "P02CE": "Cylinder 2 Fuel Injector Offset Learning At Min Limit",
-    "P02CF": "Cylinder 2 Fuel Injector Offset Learning At Max Limit",
-    "P02D0": "Cylinder 3 Fuel Injector Offset Learning At Min Limit",
-    "P02D1": "Cylinder 3 Fuel Injector Offset Learning At Max Limit",
-    "P02D2": "Cylinder 4 Fuel Injector Offset Learning At Min Limit",
-    "P02D3": "Cylinder 4 Fuel Injector Offset Learning At Max Limit",
-    "P02D4": "Cylinder 5 Fuel Injector Offset Learning At Min Limit",
-    "P02D5": "Cylinder 5 Fuel Injector Offset Learning At Max Limit",
-    "P02D6": "Cylinder 6 Fuel Injector Offset Learning At Min Limit",
-    "P02D7": "Cylinder 6 Fuel Injector Offset Learning At Max Limit",
-    "P02D8": "Cylinder 7 Fuel Injector Offset Learning At Min Limit",
-    "P02D9": "Cylinder 7 Fuel Injector Offset Learning At Max Limit",
-    "P02DA": "Cylinder 8 Fuel Injector Offset Learning At Min Limit",
-    "P02DB": "Cylinder 8 Fuel Injector Offset Learning At Max Limit",
-    "P02DC": "Cylinder 9 Fuel Injector Offset Learning At Min Limit",
-    "P02DD": "Cylinder 9 Fuel Injector Offset Learning At Max Limit",
-    "P02DE": "Cylinder 10 Fuel Injector Offset Learning At Min Limit",
-    "P02DF": "Cylinder 10 Fuel Injector Offset Learning At Max Limit",
-    "P02E0": "Diesel Intake Air Flow Control Circuit/Open",
-    "P02E1": "Diesel Intake Air Flow Control Performance",
-    "P02E2": "Diesel Intake Air Flow Control Circuit Low",
-    "P02E3": "Diesel Intake Air Flow Control Circuit High",
-    "P02E4": "Diesel Intake Air Flow Control Stuck Open",
-    "P02E5": "Diesel Intake Air Flow Control Stuck Closed",
-    "P02E6": "Diesel Intake Air Flow Position Sensor Circuit",
-    "P02E7": "Diesel Intake Air Flow Position Sensor Circuit Range/Performance",
-    "P02E8": "Diesel Intake Air Flow Position Sensor Circuit Low",
-    "P02E9": "Diesel Intake Air Flow Position Sensor Circuit High",
-    "P02EA": "Diesel Intake Air Flow Position Sensor Circuit Intermittent/Erratic",
-    "P02EB": "Diesel Intake Air Flow Control Motor Current Range/Performance",
-    "P02EC": "Diesel Intake Air Flow Control System - High Air Flow Detected",
-    "P02ED": "Diesel Intake Air Flow Control System - Low Air Flow Detected",
-    "P02EE": "Cylinder 1 Injector Circuit Range/Performance",
-    "P02EF": "Cylinder 2 Injector Circuit Range/Performance",
-    "P02F0": "Cylinder 3 Injector Circuit Range/Performance",
-    "P02F1": "Cylinder 4 Injector Circuit Range/Performance",
-    "P02F2": "Cylinder 5 Injector Circuit Range/Performance",
-    "P02F3": "Cylinder 6 Injector Circuit Range/Performance",
-    "P02F4": "Cylinder 7 Injector Circuit Range/Performance",
-    "P02F5": "Cylinder 8 Injector Circuit Range/Performance",
-    "P02F6": "Cylinder 9 Injector Circuit Range/Performance",
-    "P02F7": "Cylinder 10 Injector Circuit Range/Performance",
-    "P02F8": "Cylinder 11 Injector Circuit Range/Performance",
-    "P02F9": "Cylinder 12 Injector Circuit Range/Performance",
-    "P02FA": "Diesel Intake Air Flow Position Sensor Minimum/Maximum Stop",
-}
+from dtc_parser.loader import TABLE_NAMES, load_tables
 
-P03_ERRORS = {
-    "P0300": "Random/Multiple Cylinder Misfire Detected",
-    "P0301": "Cylinder 1 Misfire Detected",
-    "P0302": "Cylinder 2 Misfire Detected",
-    "P0303": "Cylinder 3 Misfire Detected",
-    "P0304": "Cylinder 4 Misfire Detected",
-    "P0305": "Cylinder 5 Misfire Detected",
-    "P0306": "Cylinder 6 Misfire Detected",
-    "P0307": "Cylinder 7 Misfire Detected",
-    "P0308": "Cylinder 8 Misfire Detected",
-    "P0309": "Cylinder 9 Misfire Detected",
-    "P0310": "Cylinder 10 Misfire Detected",
-    "P0311": "Cylinder 11 Misfire Detected",
-    "P0312": "Cylinder 12 Misfire Detected",
-    "P0313": "Misfire Detected With Low Fuel",
-    "P0314": "Single Cylinder Misfire (Cylinder not Specified)",
-    "P0315": "Crankshaft Position System Variation not Learned",
-    "P0316": "Engine Misfire Detected on Startup (First 1000 Revolutions)",
-    "P0317": "Rough Road Hardware not Present",
-    "P0318": "Rough Road Sensor 'A' Signal Circuit",
-    "P0319": "Rough Road Sensor 'B' Signal Circuit",
-    "P0320": "Ignition/Distributor Engine Speed Input Circuit",
-    "P0321": "Ignition/Distributor Engine Speed Input Circuit Range/Performance",
-    "P0322": "Ignition/Distributor Engine Speed Input Circuit no Signal",
-    "P0323": "Ignition/Distributor Engine Speed Input Circuit Intermittent",
-    "P0324": "Knock Control System Error",
-    "P0325": "Knock Sensor 1 Circuit",
-    "P0326": "Knock Sensor 1 Circuit Range/Performance",
-    "P0327": "Knock Sensor 1 Circuit Low",
-    "P0328": "Knock Sensor 1 Circuit High",
-    "P0329": "Knock Sensor 1 Circuit Intermittent",
-    "P032A": "Knock Sensor 3 Circuit",
-    "P032B": "Knock Sensor 3 Circuit Range/Performance",
-    "P032C": "Knock Sensor 3 Circuit Low",
-    "P032D": "Knock Sensor 3 Circuit High",
-    "P032E": "Knock Sensor 3 Circuit Intermittent",
-    "P0330": "Knock Sensor 2 Circuit",
-    "P0331": "Knock Sensor 2 Circuit Range/Performance",
-    "P0332": "Knock Sensor 2 Circuit Low",
-    "P0333": "Knock Sensor 2 Circuit High",
-    "P0334": "Knock Sensor 2 Circuit Intermittent",
-    "P0335": "Crankshaft Position Sensor 'A' Circuit",
-    "P0336": "Crankshaft Position Sensor 'A' Circuit Range/Performance",
-    "P0337": "Crankshaft Position Sensor 'A' Circuit Low",
-    "P0338": "Crankshaft Position Sensor 'A' Circuit High",
-    "P0339": "Crankshaft Position Sensor 'A' Circuit Intermittent",
-    "P033A": "Knock Sensor 4 Circuit",
-    "P033B": "Knock Sensor 4 Circuit Range/Performance",
-    "P033C": "Knock Sensor 4 Circuit Low",
-    "P033D": "Knock Sensor 4 Circuit High",
-    "P033E": "Knock Sensor 4 Circuit Intermittent",
-    "P0340": "Camshaft Position Sensor 'A' Circuit",
-    "P0341": "Camshaft Position Sensor 'A' Circuit Range/Performance",
-    "P0342": "Camshaft Position Sensor 'A' Circuit Low",
-    "P0343": "Camshaft Position Sensor 'A' Circuit High",
-    "P0344": "Camshaft Position Sensor 'A' Circuit Intermittent",
-    "P0345": "Camshaft Position Sensor 'A' Circuit",
-    "P0346": "Camshaft Position Sensor 'A' Circuit Range/Performance",
-    "P0347": "Camshaft Position Sensor 'A' Circuit Low",
-    "P0348": "Camshaft Position Sensor 'A' Circuit High",
-    "P0349": "Camshaft Position Sensor 'A' Circuit Intermittent",
-    "P0350": "Ignition Coil Primary/Secondary Circuit",
-    "P0351": "Ignition Coil 'A' Primary/Secondary Circuit",
-    "P0352": "Ignition Coil 'B' Primary/Secondary Circuit",
-    "P0353": "Ignition Coil 'C' Primary/Secondary Circuit",
-    "P0354": "Ignition Coil 'D' Primary/Secondary Circuit",
-    "P0355": "Ignition Coil 'E' Primary/Secondary Circuit",
-    "P0356": "Ignition Coil 'F' Primary/Secondary Circuit",
-    "P0357": "Ignition Coil 'G' Primary/Secondary Circuit",
-    "P0358": "Ignition Coil 'H' Primary/Secondary Circuit",
-    "P0359": "Ignition Coil 'I' Primary/Secondary Circuit",
-    "P0360": "Ignition Coil 'J' Primary/Secondary Circuit",
-    "P0361": "Ignition Coil 'K' Primary/Secondary Circuit",
-    "P0362": "Ignition Coil 'L' Primary/Secondary Circuit",
-    "P0363": "Misfire Detected - Fueling Disabled",
-    "P0365": "Camshaft Position Sensor 'B' Circuit",
-    "P0366": "Camshaft Position Sensor 'B' Circuit Range/Performance",
-    "P0367": "Camshaft Position Sensor 'B' Circuit Low",
-    "P0368": "Camshaft Position Sensor 'B' Circuit High",
-    "P0369": "mshaft Position Sensor 'B' Circuit Intermittent",
-    "P0370": "Timing Reference High Resolution Signal 'A'",
-    "P0371": "Timing Reference High Resolution Signal 'A' Too Many Pulses",
-    "P0372": "Timing Reference High Resolution Signal 'A' Too Few Pulses",
-    "P0373": "Timing Reference High Resolution Signal 'A' Intermittent/Erratic",
-    "P0374": "Timing Reference High Resolution Signal 'A' no Pulses",
-    "P0375": "Timing Reference High Resolution Signal 'B'",
-    "P0376": "Timing Reference High Resolution Signal 'B' Too Many Pulses",
-    "P0377": "Timing Reference High Resolution Signal 'B' Too Few Pulses",
-    "P0378": "Timing Reference High Resolution Signal 'B' Intermittent/Erratic",
-    "P0379": "Timing Reference High Resolution Signal 'B' no Pulses",
-    "P037D": "Glow Plug Sense Circuit",
-    "P037E": "Glow Plug Sense Circuit Low",
-    "P037F": "Glow Plug Sense Circuit High",
-    "P0380": "Glow Plug/Heater Circuit 'A'",
-    "P0381": "Glow Plug/Heater Indicator Circuit",
-    "P0382": "Glow Plug/Heater Circuit 'B'",
-    "P0383": "Glow Plug Control Module Control Circuit Low",
-    "P0384": "Glow Plug Control Module Control Circuit High",
-    "P0385": "Crankshaft Position Sensor 'B' Circuit",
-    "P0386": "Crankshaft Position Sensor 'B' Circuit Range/Performance",
-    "P0387": "Crankshaft Position Sensor 'B' Circuit Low",
-    "P0388": "Crankshaft Position Sensor 'B' Circuit High",
-    "P0389": "Crankshaft Position Sensor 'B' Circuit Intermittent",
-    "P0390": "Camshaft Position Sensor 'B' Circuit",
-    "P0391": "Camshaft Position Sensor 'B' Circuit Range/Performance",
-    "P0392": "Camshaft Position Sensor 'B' Circuit Low",
-    "P0393": "Camshaft Position Sensor 'B' Circuit High",
-    "P0394": "Camshaft Position Sensor 'B' Circuit Intermittent",
-}
 
-P04_ERRORS = {
-    "p0400": "Exhaust Gas Recirculation 'A' Flow",
-    "p0401": "Exhaust Gas Recirculation 'A' Flow Insufficient Detected",
-    "p0402": "Exhaust Gas Recirculation 'A' Flow Excessive Detected",
-    "p0403": "Exhaust Gas Recirculation 'A' Control Circuit",
-    "p0404": "Exhaust Gas Recirculation 'A' Control Circuit Range/Performance",
-    "p0405": "Exhaust Gas Recirculation Sensor 'A' Circuit Low",
-    "p0406": "Exhaust Gas Recirculation Sensor 'A' Circuit High",
-    "p0407": "Exhaust Gas Recirculation Sensor 'B' Circuit Low",
-    "p0408": "Exhaust Gas Recirculation Sensor 'B' Circuit High",
-    "p0409": "Exhaust Gas Recirculation Sensor 'A' Circuit",
-    "P040A": "Exhaust Gas Recirculation Temperature Sensor 'A' Circuit",
-    "P040B": "Exhaust Gas Recirculation Temperature Sensor 'A' Circuit",
-    "P040C": "Exhaust Gas Recirculation Temperature Sensor 'A' Circuit Low",
-    "P040D": "Exhaust Gas Recirculation Temperature Sensor 'A' Circuit High",
-    "P040E": "Exhaust Gas Recirculation Temperature Sensor 'A' Circuit",
-    "P040F": "Exhaust Gas Recirculation Temperature Sensor 'A'/'B' Correlation",
-    "p0410": "Secondary Air Injection System",
-    "p0411": "Secondary Air Injection System Incorrect Flow Detected",
-    "p0412": "Secondary Air Injection System Switching Valve 'A' Circuit",
-    "p0413": "Secondary Air Injection System Switching Valve 'A' Circuit Open",
-    "p0414": "Secondary Air Injection System Switching Valve 'A' Circuit Shorted",
-    "p0415": "Secondary Air Injection System Switching Valve 'B' Circuit",
-    "p0416": "Secondary Air Injection System Switching Valve 'B' Circuit Open",
-    "p0417": "Secondary Air Injection System Switching Valve 'B' Circuit Shorted",
-    "p0418": "Secondary Air Injection System Control 'A' Circuit",
-    "p0419": "Secondary Air Injection System Control 'B' Circuit",
-    "P041A": "Exhaust Gas Recirculation Temperature Sensor 'B' Circuit",
-    "P041B": "Exhaust Gas Recirculation Temperature Sensor 'B' Circuit",
-    "P041C": "Exhaust Gas Recirculation Temperature Sensor 'B' Circuit Low",
-    "P041D": "Exhaust Gas Recirculation Temperature Sensor 'B' Circuit High",
-    "P041E": "Exhaust Gas Recirculation Temperature Sensor 'B' Circuit",
-    "P041F": "Secondary Air Injection System Switching Valve 'A' Circuit Low",
-    "p0420": "Catalyst System Efficiency Below Threshold",
-    "p0421": "Warm Up Catalyst Efficiency Below Threshold",
-    "p0422": "Main Catalyst Efficiency Below Threshold",
-    "p0423": "Heated Catalyst Efficiency Below Threshold",
-    "p0424": "Heated Catalyst Temperature Below Threshold",
-    "p0425": "Catalyst Temperature Sensor Circuit",
-    "p0426": "Catalyst Temperature Sensor Circuit Range/Performance",
-    "p0427": "Catalyst Temperature Sensor Circuit Low",
-    "p0428": "Catalyst Temperature Sensor Circuit High",
-    "p0429": "Catalyst Heater Control Circuit",
-    "P042A": "Catalyst Temperature Sensor Circuit",
-    "P042B": "Catalyst Temperature Sensor Circuit Range/Performance",
-    "P042C": "Catalyst Temperature Sensor Circuit Low",
-    "P042D": "Catalyst Temperature Sensor Circuit High",
-    "P042E": "Exhaust Gas Recirculation 'A' Control Stuck Open",
-    "P042F": "Exhaust Gas Recirculation 'A' Control Stuck Closed",
-    "p0430": "Catalyst System Efficiency Below Threshold",
-    "p0431": "Warm Up Catalyst Efficiency Below Threshold",
-    "p0432": "Main Catalyst Efficiency Below Threshold",
-    "p0433": "Heated Catalyst Efficiency Below Threshold",
-    "p0434": "Heated Catalyst Temperature Below Threshold",
-    "p0435": "Catalyst Temperature Sensor Circuit",
-    "p0436": "Catalyst Temperature Sensor Circuit Range/Performance",
-    "p0437": "Catalyst Temperature Sensor Circuit Low",
-    "p0438": "Catalyst Temperature Sensor Circuit High",
-    "p0439": "Catalyst Heater Control Circuit",
-    "P043A": "Catalyst Temperature Sensor Circuit",
-    "P043B": "Catalyst Temperature Sensor Circuit Range/Performance",
-    "P043C": "Catalyst Temperature Sensor Circuit Low",
-    "P043D": "Catalyst Temperature Sensor Circuit High",
-    "P043E": "Evaporative Emission System Leak Detection Reference Orifice",
-    "P043F": "Evaporative Emission System Leak Detection Reference Orifice",
-    "p0440": "Evaporative Emission System",
-    "p0441": "Evaporative Emission System Incorrect Purge Flow",
-    "p0442": "Evaporative Emission System Leak Detected (small leak)",
-    "p0443": "Evaporative Emission System Purge Control Valve Circuit",
-    "p0444": "Evaporative Emission System Purge Control Valve Circuit Open",
-    "p0445": "Evaporative Emission System Purge Control Valve Circuit Shorted",
-    "p0446": "Evaporative Emission System Vent Control Circuit",
-    "p0447": "Evaporative Emission System Vent Control Circuit Open",
-    "p0448": "Evaporative Emission System Vent Control Circuit Shorted",
-    "p0449": "Evaporative Emission System Vent Valve/Solenoid Circuit",
-    "P044A": "Exhaust Gas Recirculation Sensor 'C' Circuit",
-    "P044B": "Exhaust Gas Recirculation Sensor 'C' Circuit Range/Performance",
-    "P044C": "Exhaust Gas Recirculation Sensor 'C' Circuit Low",
-    "P044D": "Exhaust Gas Recirculation Sensor 'C' Circuit High",
-    "P044E": "Exhaust Gas Recirculation Sensor 'C' Circuit Intermittent/Erratic",
-    "P044F": "Secondary Air Injection System Switching Valve 'A' Circuit High",
-    "p0450": "Evaporative Emission System Pressure Sensor/Switch",
-    "p0451": "Evaporative Emission System Pressure Sensor/Switch",
-    "p0452": "Evaporative Emission System Pressure Sensor/Switch Low",
-    "p0453": "Evaporative Emission System Pressure Sensor/Switch High",
-    "p0454": "Evaporative Emission System Pressure Sensor/Switch Intermittent",
-    "p0455": "Evaporative Emission System Leak Detected (large leak)",
-    "p0456": "Evaporative Emission System Leak Detected (very small leak)",
-    "p0457": "Evaporative Emission System Leak Detected (fuel cap loose/off)",
-    "p0458": "Evaporative Emission System Purge Control Valve Circuit Low",
-    "p0459": "Evaporative Emission System Purge Control Valve Circuit High",
-    "P045A": "Exhaust Gas Recirculation 'B' Control Circuit",
-    "P045B": "Exhaust Gas Recirculation 'B' Control Circuit Range/Performance",
-    "P045C": "Exhaust Gas Recirculation 'B' Control Circuit Low",
-    "P045D": "Exhaust Gas Recirculation 'B' Control Circuit High",
-    "P045E": "Exhaust Gas Recirculation 'B' Control Stuck Open",
-    "P045F": "Exhaust Gas Recirculation 'B' Control Stuck Closed",
-    "p0460": "Fuel Level Sensor 'A' Circuit",
-    "p0461": "Fuel Level Sensor 'A' Circuit Range/Performance",
-    "p0462": "Fuel Level Sensor 'A' Circuit Low",
-    "p0463": "Fuel Level Sensor 'A' Circuit High",
-    "p0464": "Fuel Level Sensor 'A' Circuit Intermittent",
-    "p0465": "EVAP Purge Flow Sensor Circuit",
-    "p0466": "EVAP Purge Flow Sensor Circuit Range/Performance",
-    "p0467": "EVAP Purge Flow Sensor Circuit Low",
-    "p0468": "EVAP Purge Flow Sensor Circuit High",
-    "p0469": "EVAP Purge Flow Sensor Circuit Intermittent",
-    "P046A": "Catalyst Temperature Sensor 1/2 Correlation",
-    "P046B": "Catalyst Temperature Sensor 1/2 Correlation",
-    "P046C": "Exhaust Gas Recirculation Sensor 'A' Circuit Range/Performance",
-    "P046D": "Exhaust Gas Recirculation Sensor 'A' Circuit Intermittent/Erratic",
-    "P046E": "Exhaust Gas Recirculation Sensor 'B' Circuit Range/Performance",
-    "P046F": "Exhaust Gas Recirculation Sensor 'B' Circuit Intermittent/Erratic",
-    "p0470": "Exhaust Pressure Sensor 'A' Circuit",
-    "p0471": "Exhaust Pressure Sensor 'A' Circuit Range/Performance",
-    "p0472": "Exhaust Pressure Sensor 'A' Circuit Low",
-    "p0473": "Exhaust Pressure Sensor 'A' Circuit High",
-    "p0474": "Exhaust Pressure Sensor 'A' Circuit Intermittent/Erratic",
-    "p0475": "Exhaust Pressure Control Valve 'A'",
-    "p0476": "Exhaust Pressure Control Valve 'A' Range/Performance",
-    "p0477": "Exhaust Pressure Control Valve 'A' Low",
-    "p0478": "Exhaust Pressure Control Valve 'A' High",
-    "p0479": "Exhaust Pressure Control Valve 'A' Intermittent",
-    "P047A": "Exhaust Pressure Sensor 'B' Circuit",
-    "P047B": "Exhaust Pressure Sensor 'B' Circuit Range/Performance",
-    "P047C": "Exhaust Pressure Sensor 'B' Circuit Low",
-    "P047D": "Exhaust Pressure Sensor 'B' Circuit High",
-    "P047E": "Exhaust Pressure Sensor 'B' Circuit Intermittent/Erratic",
-    "P047F": "Exhaust Pressure Control Valve 'A' Stuck Open",
-    "p0480": "Fan 1 Control Circuit",
-    "p0481": "Fan 2 Control Circuit",
-    "p0482": "Fan 3 Control Circuit",
-    "p0483": "Fan Rationality Check",
-    "p0484": "Fan Circuit Over Current",
-    "p0485": "Fan Power/Ground Circuit",
-    "p0486": "Exhaust Gas Recirculation Sensor 'B' Circuit",
-    "p0487": "Exhaust Gas Recirculation Throttle Control Circuit 'A' /Open",
-    "p0488": "Exhaust Gas Recirculation Throttle Control Circuit 'A'",
-    "p0489": "Exhaust Gas Recirculation 'A' Control Circuit Low",
-    "P048A": "Exhaust Pressure Control Valve 'A' Stuck Closed",
-    "P048B": "Exhaust Pressure Control Valve Position Sensor/Switch Circuit",
-    "P048C": "Exhaust Pressure Control Valve Position Sensor/Switch Circuit",
-    "P048D": "Exhaust Pressure Control Valve Position Sensor/Switch Circuit Low",
-    "P048E": "Exhaust Pressure Control Valve Position Sensor/Switch Circuit",
-    "P048F": "Exhaust Pressure Control Valve Position Sensor/Switch Circuit",
-    "p0490": "Exhaust Gas Recirculation 'A' Control Circuit High",
-    "p0491": "Secondary Air Injection System Insufficient Flow",
-    "p0492": "Secondary Air Injection System Insufficient Flow",
-    "p0493": "Fan Overspeed",
-    "p0494": "Fan Speed Low",
-    "p0495": "Fan Speed High",
-    "p0496": "Evaporative Emission System High Purge Flow",
-    "p0497": "Evaporative Emission System Low Purge Flow",
-    "p0498": "Evaporative Emission System Vent Valve Control Circuit Low",
-    "p0499": "Evaporative Emission System Vent Valve Control Circuit High",
-    "P049A": "Exhaust Gas Recirculation 'B' Flow",
-    "P049B": "Exhaust Gas Recirculation 'B' Flow Insufficient Detected",
-    "P049C": "Exhaust Gas Recirculation 'B' Flow Excessive Detected",
-    "P049D": "Exhaust Gas Recirculation 'A' Control Position Exceeded Learning",
-    "P049E": "Exhaust Gas Recirculation 'B' Control Position Exceeded Learning",
-    "P049F": "Exhaust Pressure Control Valve 'B'",
-    "P04A0": "Exhaust Pressure Control Valve 'B' Range/Performance",
-    "P04A1": "Exhaust Pressure Control Valve 'B' Low",
-    "P04A2": "Exhaust Pressure Control Valve 'B' High",
-    "P04A3": "Exhaust Pressure Control Valve ' B' Intermittent",
-    "P04A4": "Exhaust Pressure Control Valve 'B' Stuck Open",
-    "P04A5": "Exhaust Pressure Control Valve 'B' Stuck Closed",
-    "P04A6": "Exhaust Pressure Control Valve 'B' Position Sensor/Switch Circuit",
-    "P04A7": "Exhaust Pressure Control Valve 'B' Position Sensor/Switch Circuit",
-    "P04A8": "Exhaust Pressure Control Valve 'B' Position Sensor/Switch Circuit",
-    "P04A9": "Exhaust Pressure Control Valve 'B' Position Sensor/Switch Circuit",
-    "P04AA": "Exhaust Pressure Control Valve 'B' Position Sensor/Switch Circuit",
-}
-
-P05_ERRORS = {
-    "P0500": "Vehicle Speed Sensor 'A'",
-    "P0501": "Vehicle Speed Sensor 'A' Range/Performance",
-    "P0502": "Vehicle Speed Sensor 'A' Circuit Low",
-    "P0503": "Vehicle Speed Sensor 'A' Intermittent/Erratic/High",
-    "P0504": "Brake Switch 'A'/'B' Correlation",
-    "P0505": "Idle Air Control System",
-    "P0506": "Idle Air Control System RPM Lower Than Expected",
-    "P0507": "Idle Air Control System RPM Higher Than Expected",
-    "P0508": "Idle Air Control System Circuit Low",
-    "P0509": "Idle Air Control System Circuit High",
-    "P050A": "Cold Start Idle Air Control System Performance",
-    "P050B": "Cold Start Ignition Timing Performance",
-    "P050C": "Cold Start Engine Coolant Temperature Performance",
-    "P050D": "Cold Start Rough Idle",
-    "P050E": "Cold Start Engine Exhaust Temperature Too Low",
-    "P050F": "Brake Assist Vacuum Too Low",
-    "P0510": "Closed Throttle Position Switch",
-    "P0511": "Idle Air Control Circuit",
-    "P0512": "Starter Request Circuit",
-    "P0513": "Incorrect Immobilizer Key",
-    "P0514": "Battery Temperature Sensor Circuit Range/Performance",
-    "P0515": "Battery Temperature Sensor Circuit",
-    "P0516": "Battery Temperature Sensor Circuit Low",
-    "P0517": "Battery Temperature Sensor Circuit High",
-    "P0518": "Idle Air Control Circuit Intermittent",
-    "P0519": "Idle Air Control System Performance",
-    "P051A": "Crankcase Pressure Sensor Circuit",
-    "P051B": "Crankcase Pressure Sensor Circuit Range/Performance",
-    "P051C": "Crankcase Pressure Sensor Circuit Low",
-    "P051D": "Crankcase Pressure Sensor Circuit High",
-    "P051E": "Crankcase Pressure Sensor Circuit Intermittent/Erratic",
-    "P051F": "Positive Crankcase Ventilation Filter Restriction",
-    "P0520": "Engine Oil Pressure Sensor/Switch Circuit",
-    "P0521": "Engine Oil Pressure Sensor/Switch Range/Performance",
-    "P0522": "Engine Oil Pressure Sensor/Switch Low",
-    "P0523": "Engine Oil Pressure Sensor/Switch High",
-    "P0524": "Engine Oil Pressure Too Low",
-    "P0525": "Cruise Control Servo Control Circuit Range/Performance",
-    "P0526": "Fan Speed Sensor Circuit",
-    "P0527": "Fan Speed Sensor Circuit Range/Performance",
-    "P0528": "Fan Speed Sensor Circuit no Signal",
-    "P0529": "Fan Speed Sensor Circuit Intermittent",
-    "P052A": "Cold Start 'A' Camshaft Position Timing Over-Advanced",
-    "P052B": "Cold Start 'A' Camshaft Position Timing Over-Retarded",
-    "P052C": "Cold Start 'A' Camshaft Position Timing Over-Advanced",
-    "P052D": "Cold Start 'A' Camshaft Position Timing Over-Retarded",
-    "P052E": "Positive Crankcase Ventilation Regulator Valve Performance",
-    "P0530": "A/C Refrigerant Pressure Sensor 'A' Circuit",
-    "P0531": "A/C Refrigerant Pressure Sensor 'A' Circuit Range/Performance",
-    "P0532": "A/C Refrigerant Pressure Sensor 'A' Circuit Low",
-    "P0533": "A/C Refrigerant Pressure Sensor 'A' Circuit High",
-    "P0534": "A/C Refrigerant Charge Loss",
-    "P0535": "A/C Evaporator Temperature Sensor Circuit",
-    "P0536": "A/C Evaporator Temperature Sensor Circuit Range/Performance",
-    "P0537": "A/C Evaporator Temperature Sensor Circuit Low",
-    "P0538": "A/C Evaporator Temperature Sensor Circuit High",
-    "P0539": "A/C Evaporator Temperature Sensor Circuit Intermittent",
-    "P053A": "Positive Crankcase Ventilation Heater Control Circuit /Open",
-    "P053B": "Positive Crankcase Ventilation Heater Control Circuit Low",
-    "P053C": "Positive Crankcase Ventilation Heater Control Circuit High",
-    "P0540": "Intake Air Heater 'A' Circuit",
-    "P0541": "Intake Air Heater 'A' Circuit Low",
-    "P0542": "Intake Air Heater 'A' Circuit High",
-    "P0543": "Intake Air Heater 'A' Circuit Open",
-    "P0544": "Exhaust Gas Temperature Sensor Circuit",
-    "P0545": "Exhaust Gas Temperature Sensor Circuit Low",
-    "P0546": "Exhaust Gas Temperature Sensor Circuit High",
-    "P0547": "Exhaust Gas Temperature Sensor Circuit",
-    "P0548": "Exhaust Gas Temperature Sensor Circuit Low",
-    "P0549": "Exhaust Gas Temperature Sensor Circuit High",
-    "P054A": "Cold Start 'B' Camshaft Position Timing Over-Advanced",
-    "P054B": "Cold Start 'B' Camshaft Position Timing Over-Retarded",
-    "P054C": "Cold Start 'B' Camshaft Position Timing Over-Advanced",
-    "P054D": "Cold Start 'B' Camshaft Position Timing Over-Retarded",
-    "P0550": "Power Steering Pressure Sensor/Switch Circuit",
-    "P0551": "Power Steering Pressure Sensor/Switch Circuit",
-    "P0552": "Power Steering Pressure Sensor/Switch Circuit Low",
-    "P0553": "Power Steering Pressure Sensor/Switch Circuit High",
-    "P0554": "Power Steering Pressure Sensor/Switch Circuit Intermittent",
-    "P0555": "Brake Booster Pressure Sensor Circuit",
-    "P0556": "Brake Booster Pressure Sensor Circuit Range/Performance",
-    "P0557": "Brake Booster Pressure Sensor Circuit Low",
-    "P0558": "Brake Booster Pressure Sensor Circuit High",
-    "P0559": "Brake Booster Pressure Sensor Circuit Intermittent",
-    "P0560": "System Voltage",
-    "P0561": "System Voltage Unstable",
-    "P0562": "System Voltage Low",
-    "P0563": "System Voltage High",
-    "P0564": "Cruise Control Multi-Function Input 'A' Circuit",
-    "P0565": "Cruise Control 'On' Signal",
-    "P0566": "Cruise Control 'Off' Signal",
-    "P0567": "Cruise Control 'Resume' Signal",
-    "P0568": "Cruise Control 'Set' Signal",
-    "P0569": "Cruise Control 'Coast' Signal",
-    "P056A": "Cruise Control 'Increase Distance' Signal",
-    "P056B": "Cruise Control 'Decrease Distance' Signal",
-    "P0570": "Cruise Control 'Accelerate' Signal",
-    "P0571": "Brake Switch 'A' Circuit",
-    "P0572": "Brake Switch 'A' Circuit Low",
-    "P0573": "Brake Switch 'A' Circuit High",
-    "P0574": "Cruise Control System - Vehicle Speed Too High",
-    "P0575": "Cruise Control Input Circuit",
-    "P0576": "Cruise Control Input Circuit Low",
-    "P0577": "Cruise Control Input Circuit High",
-    "P0578": "Cruise Control Multi-Function Input 'A' Circuit Stuck",
-    "P0579": "Cruise Control Multi-Function Input 'A' Circuit Range/Performance",
-    "P0580": "Cruise Control Multi-Function Input 'A' Circuit Low",
-    "P0581": "Cruise Control Multi-Function Input 'A' Circuit High",
-    "P0582": "Cruise Control Vacuum Control Circuit/Open",
-    "P0583": "Cruise Control Vacuum Control Circuit Low",
-    "P0584": "Cruise Control Vacuum Control Circuit High",
-    "P0585": "Cruise Control Multi-Function Input 'A'/'B' Correlation",
-    "P0586": "Cruise Control Vent Control Circuit/Open",
-    "P0587": "Cruise Control Vent Control Circuit Low",
-    "P0588": "Cruise Control Vent Control Circuit High",
-    "P0589": "Cruise Control Multi-Function Input 'B' Circuit",
-    "P0590": "Cruise Control Multi-Function Input 'B' Circuit Stuck",
-    "P0591": "Cruise Control Multi-Function Input 'B' Circuit Range/Performance",
-    "P0592": "Cruise Control Multi-Function Input 'B' Circuit Low",
-    "P0593": "Cruise Control Multi-Function Input 'B' Circuit High",
-    "P0594": "Cruise Control Servo Control Circuit/Open",
-    "P0595": "Cruise Control Servo Control Circuit Low",
-    "P0596": "Cruise Control Servo Control Circuit High",
-    "P0597": "Thermostat Heater Control Circuit/Open",
-    "P0598": "Thermostat Heater Control Circuit Low",
-    "P0599": "Thermostat Heater Control Circuit High",
-}
-
-P06_ERRORS = {
-    "P0600": "Serial Communication Link",
-    "P0601": "Internal Control Module Memory Check Sum Error",
-    "P0602": "Control Module Programming Error",
-    "P0603": "Internal Control Module Keep Alive Memory (KAM) Error",
-    "P0604": "Internal Control Module Random Access Memory (RAM) Error",
-    "P0605": "Internal Control Module Read Only Memory (ROM) Error",
-    "P0606": "Control Module Processor",
-    "P0607": "Control Module Performance",
-    "P0608": "Control Module VSS Output 'A'",
-    "P0609": "Control Module VSS Output 'B'",
-    "P060A": "Internal Control Module Monitoring Processor Performance",
-    "P060B": "Internal Control Module A/D Processing Performance",
-    "P060C": "Internal Control Module Main Processor Performance",
-    "P060D": "Internal Control Module Accelerator Pedal Position Performance",
-    "P060E": "Internal Control Module Throttle Position Performance",
-    "P0610": "Control Module Vehicle Options Error",
-    "P0611": "Fuel Injector Control Module Performance",
-    "P0612": "Fuel Injector Control Module Relay Control",
-    "P0613": "TCM Processor",
-    "P0614": "ECM/TCM Incompatible",
-    "P0615": "Starter Relay Circuit",
-    "P0616": "Starter Relay Circuit Low",
-    "P0617": "Starter Relay Circuit High",
-    "P0618": "Alternative Fuel Control Module KAM Error",
-    "P0619": "Alternative Fuel Control Module RAM/ROM Error",
-    "P061A": "Internal Control Module Torque Performance",
-    "P061B": "Internal Control Module Torque Calculation Performance",
-    "P061C": "Internal Control Module Engine RPM Performance",
-    "P061D": "Internal Control Module Engine Air Mass Performance",
-    "P061E": "Internal Control Module Brake Signal Performance",
-    "P061F": "Internal Control Module Throttle Actuator Controller Performance",
-    "P0620": "Generator Control Circuit",
-    "P0621": "Generator Lamp/L Terminal Circuit",
-    "P0622": "Generator Field/F Terminal Circuit",
-    "P0623": "Generator Lamp Control Circuit",
-    "P0624": "Fuel Cap Lamp Control Circuit",
-    "P0625": "Generator Field/F Terminal Circuit Low",
-    "P0626": "Generator Field/F Terminal Circuit High",
-    "P0627": "Fuel Pump 'A' Control Circuit/Open",
-    "P0628": "Fuel Pump 'A' Control Circuit Low",
-    "P0629": "Fuel Pump 'A' Control Circuit High",
-    "P062A": "Fuel Pump 'A' Control Circuit Range/Performance",
-    "P062B": "Internal Control Module Fuel Injector Control Performance",
-    "P062C": "Internal Control Module Vehicle Speed Performance",
-    "P062D": "Fuel Injector Driver Circuit Performance",
-    "P062E": "Fuel Injector Driver Circuit Performance",
-    "P062F": "Internal Control Module EEPROM Error",
-    "P0630": "VIN not Programmed or Incompatible - ECM/PCM",
-    "P0631": "VIN not Programmed or Incompatible - TCM",
-    "P0632": "Odometer not Programmed - ECM/PCM",
-    "P0633": "Immobilizer Key not Programmed - ECM/PCM",
-    "P0634": "PCM/ECM/TCM Internal Temperature 'A' Too High",
-    "P0635": "Power Steering Control Circuit",
-    "P0636": "Power Steering Control Circuit Low",
-    "P0637": "Power Steering Control Circuit High",
-    "P0638": "Throttle Actuator Control Range/Performance",
-    "P0639": "Throttle Actuator Control Range/Performance",
-    "P063A": "Generator Voltage Sense Circuit",
-    "P063B": "Generator Voltage Sense Circuit Range/Performance",
-    "P063C": "Generator Voltage Sense Circuit Low",
-    "P063D": "Generator Voltage Sense Circuit High",
-    "P063E": "Auto Configuration Throttle Input not Present",
-    "P063F": "Auto Configuration Engine Coolant Temperature Input not Present",
-    "P0640": "Intake Air Heater Control Circuit",
-    "P0641": "Sensor Reference Voltage 'A' Circuit/Open",
-    "P0642": "Sensor Reference Voltage 'A' Circuit Low",
-    "P0643": "Sensor Reference Voltage 'A' Circuit High",
-    "P0644": "Driver Display Serial Communication Circuit",
-    "P0645": "A/C Clutch Relay Control Circuit",
-    "P0646": "A/C Clutch Relay Control Circuit Low",
-    "P0647": "A/C Clutch Relay Control Circuit High",
-    "P0648": "Immobilizer Lamp Control Circuit",
-    "P0649": "Speed Control Lamp Control Circuit",
-    "P064A": "Fuel Pump Control Module",
-    "P064B": "PTO Control Module",
-    "P064C": "Glow Plug Control Module",
-    "P064D": "Internal Control Module O2 Sensor Processor Performance",
-    "P064E": "Internal Control Module O2 Sensor Processor Performance",
-    "P064F": "Unauthorized Software/Calibration Detected",
-    "P0650": "Malfunction Indicator Lamp (MIL) Control Circuit",
-    "P0651": "Sensor Reference Voltage 'B' Circuit/Open",
-    "P0652": "Sensor Reference Voltage 'B' Circuit Low",
-    "P0653": "Sensor Reference Voltage 'B' Circuit High",
-    "P0654": "Engine RPM Output Circuit",
-    "P0655": "Engine Hot Lamp Output Control Circuit",
-    "P0656": "Fuel Level Output Circuit",
-    "P0657": "Actuator Supply Voltage 'A' Circuit/Open",
-    "P0658": "Actuator Supply Voltage 'A' Circuit Low",
-    "P0659": "Actuator Supply Voltage 'A' Circuit High",
-    "P065A": "Generator System Performance",
-    "P065B": "Generator Control Circuit Range/Performance",
-    "P065C": "Generator Mechanical Performance",
-    "P065D": "Reductant System Malfunction Lamp Control Circuit",
-    "P065E": "Intake Manifold Tuning Valve Performance",
-    "P065F": "Intake Manifold Tuning Valve Performance",
-    "P0660": "Intake Manifold Tuning Valve Control Circuit/Open",
-    "P0661": "Intake Manifold Tuning Valve Control Circuit Low",
-    "P0662": "Intake Manifold Tuning Valve Control Circuit High",
-    "P0663": "Intake Manifold Tuning Valve Control Circuit/Open",
-    "P0664": "Intake Manifold Tuning Valve Control Circuit Low",
-    "P0665": "Intake Manifold Tuning Valve Control Circuit High",
-    "P0666": "PCM/ECM/TCM Internal Temperature Sensor 'A' Circuit",
-    "P0667": "PCM/ECM/TCM Internal Temperature Sensor 'A'",
-    "P0668": "PCM/ECM/TCM Internal Temperature Sensor 'A' Circuit Low",
-    "P0669": "PCM/ECM/TCM Internal Temperature Sensor 'A' Circuit High",
-    "P066A": "Cylinder 1 Glow Plug Control Circuit Low",
-    "P066B": "Cylinder 1 Glow Plug Control Circuit High",
-    "P066C": "Cylinder 2 Glow Plug Control Circuit Low",
-    "P066D": "Cylinder 2 Glow Plug Control Circuit High",
-    "P066E": "Cylinder 3 Glow Plug Control Circuit Low",
-    "P066F": "Cylinder 3 Glow Plug Control Circuit High",
-    "P0670": "Glow Plug Control Module Control Circuit/Open",
-    "P0671": "Cylinder 1 Glow Plug Circuit/Open",
-    "P0672": "Cylinder 2 Glow Plug Circuit/Open",
-    "P0673": "Cylinder 3 Glow Plug Circuit/Open",
-    "P0674": "Cylinder 4 Glow Plug Circuit/Open",
-    "P0675": "Cylinder 5 Glow Plug Circuit/Open",
-    "P0676": "Cylinder 6 Glow Plug Circuit/Open",
-    "P0677": "Cylinder 7 Glow Plug Circuit/Open",
-    "P0678": "Cylinder 8 Glow Plug Circuit/Open",
-    "P0679": "Cylinder 9 Glow Plug Circuit/Open",
-    "P067A": "Cylinder 4 Glow Plug Control Circuit Low",
-    "P067B": "Cylinder 4 Glow Plug Control Circuit High",
-    "P067C": "Cylinder 5 Glow Plug Control Circuit Low",
-    "P067D": "Cylinder 5 Glow Plug Control Circuit High",
-    "P067E": "Cylinder 6 Glow Plug Control Circuit Low",
-    "P067F": "Cylinder 6 Glow Plug Control Circuit High",
-    "P0680": "Cylinder 10 Glow Plug Circuit/Open",
-    "P0681": "Cylinder 11 Glow Plug Circuit/Open",
-    "P0682": "Cylinder 12 Glow Plug Circuit/Open",
-    "P0683": "Glow Plug Control Module to PCM Communication Circuit",
-    "P0684": "Glow Plug Control Module to PCM Communication Circuit",
-    "P0685": "ECM/PCM Power Relay Control Circuit/Open",
-    "P0686": "ECM/PCM Power Relay Control Circuit Low",
-    "P0687": "ECM/PCM Power Relay Control Circuit High",
-    "P0688": "ECM/PCM Power Relay Sense Circuit/Open",
-    "P0689": "ECM/PCM Power Relay Sense Circuit Low",
-    "P068A": "ECM/PCM Power Relay De-Energized Performance - Too Early",
-    "P068B": "ECM/PCM Power Relay De-Energized Performance - Too Late",
-    "P068C": "Cylinder 7 Glow Plug Control Circuit Low",
-    "P068D": "Cylinder 7 Glow Plug Control Circuit High",
-    "P068E": "Cylinder 8 Glow Plug Control Circuit Low",
-    "P068F": "Cylinder 8 Glow Plug Control Circuit High",
-    "P0690": "ECM/PCM Power Relay Sense Circuit High",
-    "P0691": "Fan 1 Control Circuit Low",
-    "P0692": "Fan 1 Control Circuit High",
-    "P0693": "Fan 2 Control Circuit Low",
-    "P0694": "Fan 2 Control Circuit High",
-    "P0695": "Fan 3 Control Circuit Low",
-    "P0696": "Fan 3 Control Circuit High",
-    "P0697": "Sensor Reference Voltage 'C' Circuit/Open",
-    "P0698": "Sensor Reference Voltage 'C' Circuit Low",
-    "P0699": "Sensor Reference Voltage 'C' Circuit High",
-    "P069A": "Cylinder 9 Glow Plug Control Circuit Low",
-    "P069B": "Cylinder 9 Glow Plug Control Circuit High",
-    "P069C": "Cylinder 10 Glow Plug Control Circuit Low",
-    "P069D": "Cylinder 10 Glow Plug Control Circuit High",
-    "P069E": "Fuel Pump Control Module Requested MIL Illumination",
-    "P069F": "Throttle Actuator Control Lamp Control Circuit",
-    "P06A0": "Variable A/C Compressor Control Circuit",
-    "P06A1": "Variable A/C Compressor Control Circuit Low",
-    "P06A2": "Variable A/C Compressor Control Circuit High",
-    "P06A3": "Sensor Reference Voltage 'D' Circuit/Open",
-    "P06A4": "Sensor Reference Voltage 'D' Circuit Low",
-    "P06A5": "Sensor Reference Voltage 'D' Circuit High",
-    "P06A6": "Sensor Reference Voltage 'A' Circuit Range/Performance",
-    "P06A7": "Sensor Reference Voltage 'B' Circuit Range/Performance",
-    "P06A8": "Sensor Reference Voltage 'C' Circuit Range/Performance",
-    "P06A9": "Sensor Reference Voltage 'D' Circuit Range/Performance",
-    "P06AA": "PCM/ECM/TCM Internal Temperature 'B' Too High",
-    "P06AB": "PCM/ECM/TCM Internal Temperature Sensor 'B' Circuit",
-    "P06AC": "PCM/ECM/TCM Internal Temperature Sensor 'B'",
-    "P06AD": "PCM/ECM/TCM Internal Temperature Sensor 'B' Circuit Low",
-    "P06AE": "PCM/ECM/TCM Internal Temperature Sensor 'B' Circuit High",
-    "P06AF": "Torque Management System - Forced Engine Shutdown",
-    "P06B0": "Sensor Power Supply 'A' Circuit/Open",
-    "P06B1": "Sensor Power Supply 'A' Circuit Low",
-    "P06B2": "Sensor Power Supply 'A' Circuit High",
-    "P06B3": "Sensor Power Supply 'B' Circuit/Open",
-    "P06B4": "Sensor Power Supply 'B' Circuit Low",
-    "P06B5": "Sensor Power Supply 'B' Circuit High",
-    "P06B6": "Internal Control Module Knock Sensor Processor 1 Performance",
-    "P06B7": "Internal Control Module Knock Sensor Processor 2 Performance",
-    "P06B8": "Internal Control Module non-Volatile Random Access Memory",
-    "P06B9": "Cylinder 1 Glow Plug Circuit Range/Performance",
-    "P06BA": "Cylinder 2 Glow Plug Circuit Range/Performance",
-    "P06BB": "Cylinder 3 Glow Plug Circuit Range/Performance",
-    "P06BC": "Cylinder 4 Glow Plug Circuit Range/Performance",
-    "P06BD": "Cylinder 5 Glow Plug Circuit Range/Performance",
-    "P06BE": "Cylinder 6 Glow Plug Circuit Range/Performance",
-    "P06BF": "Cylinder 7 Glow Plug Circuit Range/Performance",
-    "P06C0": "Cylinder 8 Glow Plug Circuit Range/Performance",
-    "P06C1": "Cylinder 9 Glow Plug Circuit Range/Performance",
-    "P06C2": "Cylinder 10 Glow Plug Circuit Range/Performance",
-    "P06C3": "Cylinder 11 Glow Plug Circuit Range/Performance",
-    "P06C4": "Cylinder 12 Glow Plug Circuit Range/Performance",
-    "P06C5": "Cylinder 1 Glow Plug Incorrect",
-    "P06C6": "Cylinder 2 Glow Plug Incorrect",
-    "P06C7": "Cylinder 3 Glow Plug Incorrect",
-    "P06C8": "Cylinder 4 Glow Plug Incorrect",
-    "P06C9": "Cylinder 5 Glow Plug Incorrect",
-    "P06CA": "Cylinder 6 Glow Plug Incorrect",
-    "P06CB": "Cylinder 7 Glow Plug Incorrect",
-    "P06CC": "Cylinder 8 Glow Plug Incorrect",
-    "P06CD": "Cylinder 9 Glow Plug Incorrect",
-    "P06CE": "Cylinder 10 Glow Plug Incorrect",
-    "P06CF": "Cylinder 11 Glow Plug Incorrect",
-    "P06D0": "Cylinder 12 Glow Plug Incorrect",
-    "P06D1": "Internal Control Module Ignition Coil Control Performance",
-}
-
-P07_ERRORS = {
-    "P0700": "Transmission Control System (MIL Request)",
-    "P0701": "Transmission Control System Range/Performance",
-    "P0702": "Transmission Control System Electrical",
-    "P0703": "Brake Switch 'B' Circuit",
-    "P0704": "Clutch Switch Input Circuit",
-    "P0705": "Transmission Range Sensor 'A' Circuit (PRNDL Input)",
-    "P0706": "Transmission Range Sensor 'A' Circuit Range/Performance",
-    "P0707": "Transmission Range Sensor 'A' Circuit Low",
-    "P0708": "Transmission Range Sensor 'A' Circuit High",
-    "P0709": "Transmission Range Sensor 'A' Circuit Intermittent",
-    "P070A": "Transmission Fluid Level Sensor Circuit",
-    "P070B": "Transmission Fluid Level Sensor Circuit Range/Performance",
-    "P070C": "Transmission Fluid Level Sensor Circuit Low",
-    "P070D": "Transmission Fluid Level Sensor Circuit High",
-    "P070E": "Transmission Fluid Level Sensor Circuit intermittent/Erratic",
-    "P070F": "Transmission Fluid Level Too Low",
-    "P0710": "Transmission Fluid Temperature Sensor 'A' Circuit",
-    "P0711": "Transmission Fluid Temperature Sensor 'A' Circuit",
-    "P0712": "Transmission Fluid Temperature Sensor 'A' Circuit Low",
-    "P0713": "Transmission Fluid Temperature Sensor 'A' Circuit High",
-    "P0714": "Transmission Fluid Temperature Sensor 'A' Circuit Intermittent",
-    "P0715": "Input/Turbine Speed Sensor 'A' Circuit",
-    "P0716": "Input/Turbine Speed Sensor 'A' Circuit Range/Performance",
-    "P0717": "Input/Turbine Speed Sensor 'A' Circuit no Signal",
-    "P0718": "Input/Turbine Speed Sensor 'A' Circuit Intermittent",
-    "P0719": "Brake Switch 'B' Circuit Low",
-    "P071A": "Transmission Mode Switch 'A' Circuit",
-    "P071B": "Transmission Mode Switch 'A' Circuit Low",
-    "P071C": "Transmission Mode Switch 'A' Circuit High",
-    "P071D": "Transmission Mode Switch 'B' Circuit",
-    "P071E": "Transmission Mode Switch 'B' Circuit Low",
-    "P071F": "Transmission Mode Switch 'B' Circuit High",
-    "P0720": "Output Speed Sensor Circuit",
-    "P0721": "Output Speed Sensor Circuit Range/Performance",
-    "P0722": "Output Speed Sensor Circuit no Signal",
-    "P0723": "Output Speed Sensor Circuit Intermittent",
-    "P0724": "Brake Switch 'B' Circuit High",
-    "P0725": "Engine Speed Input Circuit",
-    "P0726": "Engine Speed Input Circuit Range/Performance",
-    "P0727": "Engine Speed Input Circuit no Signal",
-    "P0728": "Engine Speed Input Circuit Intermittent",
-    "P0729": "Gear 6 Incorrect Ratio",
-    "P072A": "Stuck in Neutral",
-    "P072B": "Stuck In Reverse",
-    "P072C": "Stuck in Gear 1",
-    "P072D": "Stuck in Gear 2",
-    "P072E": "Stuck in Gear 3",
-    "P072F": "Stuck in Gear 4",
-    "P0730": "Incorrect Gear Ratio",
-    "P0731": "Gear 1 Incorrect Ratio",
-    "P0732": "Gear 2 Incorrect Ratio",
-    "P0733": "Gear 3 Incorrect Ratio",
-    "P0734": "Gear 4 Incorrect Ratio",
-    "P0735": "Gear 5 Incorrect Ratio",
-    "P0736": "Reverse Incorrect Ratio",
-    "P0737": "TCM Engine Speed Output Circuit",
-    "P0738": "TCM Engine Speed Output Circuit Low",
-    "P0739": "TCM Engine Speed Output Circuit High",
-    "P073A": "Stuck in Gear 5",
-    "P073B": "Stuck in Gear 6",
-    "P073C": "Stuck in Gear 7",
-    "P073D": "Unable to Engage Neutral",
-    "P073E": "Unable to Engage Reverse",
-    "P073F": "Unable to Engage Gear 1",
-    "P0740": "Torque Converter Clutch Circuit/Open",
-    "P0741": "Torque Converter Clutch Circuit Performance/Stuck Off",
-    "P0742": "Torque Converter Clutch Circuit Stuck On",
-    "P0743": "Torque Converter Clutch Circuit Electrical",
-    "P0744": "Torque Converter Clutch Circuit Intermittent",
-    "P0745": "Pressure Control Solenoid 'A'",
-    "P0746": "Pressure Control Solenoid 'A' Performance/Stuck Off",
-    "P0747": "Pressure Control Solenoid 'A' Stuck On",
-    "P0748": "Pressure Control Solenoid 'A' Electrical",
-    "P0749": "Pressure Control Solenoid 'A' Intermittent",
-    "P074A": "Unable To Engage Gear 2",
-    "P074B": "Unable To Engage Gear 3",
-    "P074C": "Unable To Engage Gear 4",
-    "P074D": "Unable To Engage Gear 5",
-    "P074E": "Unable To Engage Gear 6",
-    "P074F": "Unable To Engage Gear 7",
-    "P0750": "Shift Solenoid 'A'",
-    "P0751": "Shift Solenoid 'A' Performance/Stuck Off",
-    "P0752": "Shift Solenoid 'A' Stuck On",
-    "P0753": "Shift Solenoid 'A' Electrical",
-    "P0754": "Shift Solenoid 'A' Intermittent",
-    "P0755": "Shift Solenoid 'B'",
-    "P0756": "Shift Solenoid 'B' Performance/Stuck Off",
-    "P0757": "Shift Solenoid 'B' Stuck On",
-    "P0758": "Shift Solenoid 'B' Electrical",
-    "P0759": "Shift Solenoid 'B' Intermittent",
-    "P075A": "Shift Solenoid 'G'",
-    "P075B": "Shift Solenoid 'G' Performance/Stuck Off",
-    "P075C": "Shift Solenoid 'G' Stuck On",
-    "P075D": "Shift Solenoid 'G' Electrical",
-    "P075E": "Shift Solenoid 'G' Intermittent",
-    "P075F": "Transmission Fluid Level Too High",
-    "P0760": "Shift Solenoid 'C'",
-    "P0761": "Shift Solenoid 'C' Performance/Stuck Off",
-    "P0762": "Shift Solenoid 'C' Stuck On",
-    "P0763": "Shift Solenoid 'C' Electrical",
-    "P0764": "Shift Solenoid 'C' Intermittent",
-    "P0765": "Shift Solenoid 'D'",
-    "P0766": "Shift Solenoid 'D' Performance/Stuck Off",
-    "P0767": "Shift Solenoid 'D' Stuck On",
-    "P0768": "Shift Solenoid 'D' Electrical",
-    "P0769": "Shift Solenoid 'D' Intermittent",
-    "P076A": "Shift Solenoid 'H'",
-    "P076B": "Shift Solenoid 'H' Performance/Stuck Off",
-    "P076C": "Shift Solenoid 'H' Stuck On",
-    "P076D": "Shift Solenoid 'H' Electrical",
-    "P076E": "Shift Solenoid 'H' Intermittent",
-    "P076F": "Gear 7 Incorrect Ratio",
-    "P0770": "Shift Solenoid 'E'",
-    "P0771": "Shift Solenoid 'E' Performance/Stuck Off",
-    "P0772": "Shift Solenoid 'E' Stuck On",
-    "P0773": "Shift Solenoid 'E' Electrical",
-    "P0774": "Shift Solenoid 'E' Intermittent",
-    "P0775": "Pressure Control Solenoid 'B'",
-    "P0776": "Pressure Control Solenoid 'B' Performance/Stuck Off",
-    "P0777": "Pressure Control Solenoid 'B' Stuck On",
-    "P0778": "Pressure Control Solenoid 'B' Electrical",
-    "P0779": "Pressure Control Solenoid 'B' Intermittent",
-    "P077A": "Output Speed Sensor Circuit - Loss of Direction Signal",
-    "P077B": "Output Speed Sensor Circuit - Direction Error",
-    "P0780": "Shift Error",
-    "P0781": "1-2 Shift",
-    "P0782": "2-3 Shift",
-    "P0783": "3-4 Shift",
-    "P0784": "4-5 Shift",
-    "P0785": "Shift Timing Solenoid 'A'",
-    "P0786": "Shift Timing Solenoid 'A' Range/Performance",
-    "P0787": "Shift Timing Solenoid 'A' Low",
-    "P0788": "Shift Timing Solenoid 'A' High",
-    "P0789": "Shift Timing Solenoid 'A' Intermittent",
-    "P078A": "Shift Timing Solenoid 'B'",
-    "P078B": "Shift Timing Solenoid 'B' Range/Performance",
-    "P078C": "Shift Timing Solenoid 'B' Low",
-    "P078D": "Shift Timing Solenoid 'B' High",
-    "P078E": "Shift Timing Solenoid 'B' Intermittent",
-    "P0790": "normal/Performance Switch Circuit",
-    "P0791": "Intermediate Shaft Speed Sensor 'A' Circuit",
-    "P0792": "Intermediate Shaft Speed Sensor 'A' Circuit Range/Performance",
-    "P0793": "Intermediate Shaft Speed Sensor 'A' Circuit no Signal",
-    "P0794": "Intermediate Shaft Speed Sensor 'A' Circuit Intermittent",
-    "P0795": "Pressure Control Solenoid 'C'",
-    "P0796": "Pressure Control Solenoid 'C' Performance/Stuck Off",
-    "P0797": "Pressure Control Solenoid 'C' Stuck On",
-    "P0798": "Pressure Control Solenoid 'C' Electrical",
-    "P0799": "Pressure Control Solenoid 'C' Intermittent",
-    "P079A": "Transmission Friction Element 'A' Slip Detected",
-    "P079B": "Transmission Friction Element 'B' Slip Detected",
-    "P079C": "Transmission Friction Element 'C' Slip Detected",
-    "P079D": "Transmission Friction Element 'D' Slip Detected",
-    "P079E": "Transmission Friction Element 'E' Slip Detected",
-    "P079F": "Transmission Friction Element 'F' Slip Detected",
-    "P07A0": "Transmission Friction Element 'G' Slip Detected",
-    "P07A1": "Transmission Friction Element 'H' Slip Detected",
-    "P07A2": "Transmission Friction Element 'A' Performance/Stuck Off",
-    "P07A3": "Transmission Friction Element 'A' Stuck On",
-    "P07A4": "Transmission Friction Element 'B' Performance/Stuck Off",
-    "P07A5": "Transmission Friction Element 'B' Stuck On",
-    "P07A6": "Transmission Friction Element 'C' Performance/Stuck Off",
-    "P07A7": "Transmission Friction Element 'C' Stuck On",
-    "P07A8": "Transmission Friction Element 'D' Performance/Stuck Off",
-    "P07A9": "Transmission Friction Element 'D' Stuck On",
-    "P07AA": "Transmission Friction Element 'E' Performance/Stuck Off",
-    "P07AB": "Transmission Friction Element 'E' Stuck On",
-    "P07AC": "Transmission Friction Element 'F' Performance/Stuck Off",
-    "P07AD": "Transmission Friction Element 'F' Stuck On",
-    "P07AE": "Transmission Friction Element 'G' Performance/Stuck Off",
-    "P07AF": "Transmission Friction Element 'G' Stuck On",
-    "P07B0": "Transmission Friction Element 'H' Performance/Stuck Off",
-    "P07B1": "Transmission Friction Element 'H' Stuck On",
-    "P07B2": "Transmission Park Position Sensor/Switch 'A' Circuit/Open",
-    "P07B3": "Transmission Park Position Sensor/Switch 'A' Circuit Low",
-    "P07B4": "Transmission Park Position Sensor/Switch 'A' Circuit High",
-    "P07B5": "Transmission Park Position Sensor/Switch 'A' Circuit",
-    "P07B6": "Transmission Park Position Sensor/Switch 'A' Circuit Performance",
-    "P07B7": "Transmission Park Position Sensor/Switch 'A' Circuit",
-    "P07B8": "Transmission Park Position Sensor/Switch 'B' Circuit/Open",
-    "P07B9": "Transmission Park Position Sensor/Switch 'B' Circuit Low",
-    "P07BA": "Transmission Park Position Sensor/Switch 'B' Circuit High",
-    "P07BB": "Transmission Park Position Sensor/Switch 'B' Circuit",
-    "P07BC": "Transmission Park Position Sensor/Switch 'B' Circuit Performance",
-    "P07BD": "Transmission Park Position Sensor/Switch 'B' Circuit",
-    "P07BE": "Transmission Park Position Sensor/Switch 'A'/'B' Correlation",
-}
-
-P08_ERRORS = {
-    "P0800": "Transfer Case Control System (MIL Request)",
-    "P0801": "Reverse Inhibit Control Circuit",
-    "P0802": "Transmission Control System MIL Request Circuit/Open",
-    "P0803": "Upshift/Skip Shift Solenoid Control Circuit",
-    "P0804": "Upshift/Skip Shift Lamp Control Circuit",
-    "P0805": "Clutch Position Sensor Circuit",
-    "P0806": "Clutch Position Sensor Circuit Range/Performance",
-    "P0807": "Clutch Position Sensor Circuit Low",
-    "P0808": "Clutch Position Sensor Circuit High",
-    "P0809": "Clutch Position Sensor Circuit Intermittent",
-    "P080A": "Clutch Position not Learned",
-    "P080B": "Upshift/Skip Shift Solenoid Control Circuit Range/Performance",
-    "P080C": "Upshift/Skip Shift Solenoid Control Circuit Low",
-    "P080D": "Upshift/Skip Shift Solenoid Control Circuit High",
-    "P0810": "Clutch Position Control Error",
-    "P0811": "Excessive Clutch 'A' Slippage",
-    "P0812": "Reverse Input Circuit",
-    "P0813": "Reverse Output Circuit",
-    "P0814": "Transmission Range Display Circuit",
-    "P0815": "Upshift Switch Circuit",
-    "P0816": "Downshift Switch Circuit",
-    "P0817": "Starter Disable Circuit/Open",
-    "P0818": "Driveline Disconnect Switch Input Circuit",
-    "P0819": "Up and Down Shift Switch to Transmission Range Correlation",
-    "P081A": "Starter Disable Circuit Low",
-    "P081B": "Starter Disable Circuit High",
-    "P081C": "Park Input Circuit",
-    "P081D": "Neutral Input Circuit",
-    "P081E": "Excessive Clutch 'B' Slippage",
-    "P0820": "Gear Lever X-Y Position Sensor Circuit",
-    "P0821": "Gear Lever X Position Circuit",
-    "P0822": "Gear Lever Y Position Circuit",
-    "P0823": "Gear Lever X Position Circuit Intermittent",
-    "P0824": "Gear Lever Y Position Circuit Intermittent",
-    "P0825": "Gear Lever Push-Pull Switch (Shift Anticipate)",
-    "P0826": "Up and Down Shift Switch Circuit",
-    "P0827": "Up and Down Shift Switch Circuit Low",
-    "P0828": "Up and Down Shift Switch Circuit High",
-    "P0829": "5-6 Shift",
-    "P082A": "Gear Lever X Position Circuit Range/Performance",
-    "P082B": "Gear Lever X Position Circuit Low",
-    "P082C": "Gear Lever X Position Circuit High",
-    "P082D": "Gear Lever Y Position Circuit Range/Performance",
-    "P082E": "Gear Lever Y Position Circuit Low",
-    "P082F": "Gear Lever Y Position Circuit High",
-    "P0830": "Clutch Pedal Switch 'A' Circuit",
-    "P0831": "Clutch Pedal Switch 'A' Circuit Low",
-    "P0832": "Clutch Pedal Switch 'A' Circuit High",
-    "P0833": "Clutch Pedal Switch 'B' Circuit",
-    "P0834": "Clutch Pedal Switch 'B' Circuit Low",
-    "P0835": "Clutch Pedal Switch 'B' Circuit High",
-    "P0836": "Four Wheel Drive (4WD) Switch Circuit",
-    "P0837": "Four Wheel Drive (4WD) Switch Circuit Range/Performance",
-    "P0838": "Four Wheel Drive (4WD) Switch Circuit Low",
-    "P0839": "Four Wheel Drive (4WD) Switch Circuit High",
-    "P083A": "Transmission Fluid Pressure Sensor/Switch 'G' Circuit",
-    "P083B": "Transmission Fluid Pressure Sensor/Switch 'G' Circuit",
-    "P083C": "Transmission Fluid Pressure Sensor/Switch 'G' Circuit Low",
-    "P083D": "Transmission Fluid Pressure Sensor/Switch 'G' Circuit High",
-    "P083E": "Transmission Fluid Pressure Sensor/Switch 'G' Circuit Intermittent",
-    "P083F": "Clutch Pedal Switch 'A'/'B' Correlation",
-    "P0840": "Transmission Fluid Pressure Sensor/Switch 'A' Circuit",
-    "P0841": "Transmission Fluid Pressure Sensor/Switch 'A' Circuit",
-    "P0842": "Transmission Fluid Pressure Sensor/Switch 'A' Circuit Low",
-    "P0843": "Transmission Fluid Pressure Sensor/Switch 'A' Circuit High",
-    "P0844": "Transmission Fluid Pressure Sensor/Switch 'A' Circuit Intermittent",
-    "P0845": "Transmission Fluid Pressure Sensor/Switch 'B' Circuit",
-    "P0846": "Transmission Fluid Pressure Sensor/Switch 'B' Circuit",
-    "P0847": "Transmission Fluid Pressure Sensor/Switch 'B' Circuit Low",
-    "P0848": "Transmission Fluid Pressure Sensor/Switch 'B' Circuit High",
-    "P0849": "Transmission Fluid Pressure Sensor/Switch 'B' Circuit Intermittent",
-    "P084A": "Transmission Fluid Pressure Sensor/Switch 'H' Circuit",
-    "P084B": "Transmission Fluid Pressure Sensor/Switch 'H' Circuit",
-    "P084C": "Transmission Fluid Pressure Sensor/Switch 'H' Circuit Low",
-    "P084D": "Transmission Fluid Pressure Sensor/Switch 'H' Circuit High",
-    "P084E": "Transmission Fluid Pressure Sensor/Switch 'H' Circuit Intermittent",
-    "P084F": "Park/Neutral Switch Output Circuit",
-    "P0850": "Park/Neutral Switch Input Circuit",
-    "P0851": "Park/Neutral Switch Input Circuit Low",
-    "P0852": "Park/Neutral Switch Input Circuit High",
-    "P0853": "Drive Switch Input Circuit",
-    "P0854": "Drive Switch Input Circuit Low",
-    "P0855": "Drive Switch Input Circuit High",
-    "P0856": "Traction Control Input Signal",
-    "P0857": "Traction Control Input Signal Range/Performance",
-    "P0858": "Traction Control Input Signal Low",
-    "P0859": "Traction Control Input Signal High",
-    "P085A": "Gear Shift Control Module 'B' Communication Circuit",
-    "P085B": "Gear Shift Control Module 'B' Communication Circuit Low",
-    "P085C": "Gear Shift Control Module 'B' Communication Circuit High",
-    "P085D": "Gear Shift Control Module 'A' Performance",
-    "P085E": "Gear Shift Control Module 'B' Performance",
-    "P0860": "Gear Shift Control Module 'A' Communication Circuit",
-    "P0861": "Gear Shift Control Module 'A' Communication Circuit Low",
-    "P0862": "Gear Shift Control Module 'A' Communication Circuit High",
-    "P0863": "TCM Communication Circuit",
-    "P0864": "TCM Communication Circuit Range/Performance",
-    "P0865": "TCM Communication Circuit Low",
-    "P0866": "TCM Communication Circuit High",
-    "P0867": "Transmission Fluid Pressure",
-    "P0868": "Transmission Fluid Pressure Low",
-    "P0869": "Transmission Fluid Pressure High",
-    "P0870": "Transmission Fluid Pressure Sensor/Switch 'C' Circuit",
-    "P0871": "Transmission Fluid Pressure Sensor/Switch 'C' Circuit",
-    "P0872": "Transmission Fluid Pressure Sensor/Switch 'C' Circuit Low",
-    "P0873": "Transmission Fluid Pressure Sensor/Switch 'C' Circuit High",
-    "P0874": "Transmission Fluid Pressure Sensor/Switch 'C' Circuit Intermittent",
-    "P0875": "Transmission Fluid Pressure Sensor/Switch 'D' Circuit",
-    "P0876": "Transmission Fluid Pressure Sensor/Switch 'D' Circuit",
-    "P0877": "Transmission Fluid Pressure Sensor/Switch 'D' Circuit Low",
-    "P0878": "Transmission Fluid Pressure Sensor/Switch 'D' Circuit High",
-    "P0879": "Transmission Fluid Pressure Sensor/Switch 'D' Circuit Intermittent",
-    "P0880": "TCM Power Input Signal",
-    "P0881": "TCM Power Input Signal Range/Performance",
-    "P0882": "TCM Power Input Signal Low",
-    "P0883": "TCM Power Input Signal High",
-    "P0884": "TCM Power Input Signal Intermittent",
-    "P0885": "TCM Power Relay Control Circuit/Open",
-    "P0886": "TCM Power Relay Control Circuit Low",
-    "P0887": "TCM Power Relay Control Circuit High",
-    "P0888": "TCM Power Relay Sense Circuit",
-    "P0889": "TCM Power Relay Sense Circuit Range/Performance",
-    "P088A": "Transmission Fluid Filter Deteriorated",
-    "P088B": "Transmission Fluid Filter Very Deteriorated",
-    "P0890": "TCM Power Relay Sense Circuit Low",
-    "P0891": "TCM Power Relay Sense Circuit High",
-    "P0892": "TCM Power Relay Sense Circuit Intermittent",
-    "P0893": "Multiple Gears Engaged",
-    "P0894": "Transmission Component Slipping",
-    "P0895": "Shift Time Too Short",
-    "P0896": "Shift Time Too Long",
-    "P0897": "Transmission Fluid Deteriorated",
-    "P0898": "Transmission Control System MIL Request Circuit Low",
-    "P0899": "Transmission Control System MIL Request Circuit High",
-}
-
-P09_ERRORS = {
-    "P0900": "Clutch Actuator Circuit/Open",
-    "P0901": "Clutch Actuator Circuit Range/Performance",
-    "P0902": "Clutch Actuator Circuit Low",
-    "P0903": "Clutch Actuator Circuit High",
-    "P0904": "Gate Select Position Circuit",
-    "P0905": "Gate Select Position Circuit Range/Performance",
-    "P0906": "Gate Select Position Circuit Low",
-    "P0907": "Gate Select Position Circuit High",
-    "P0908": "Gate Select Position Circuit Intermittent",
-    "P0909": "Gate Select Control Error",
-    "P0910": "Gate Select Actuator Circuit/Open",
-    "P0911": "Gate Select Actuator Circuit Range/Performance",
-    "P0912": "Gate Select Actuator Circuit Low",
-    "P0913": "Gate Select Actuator Circuit High",
-    "P0914": "Gear Shift Position Circuit",
-    "P0915": "Gear Shift Position Circuit Range/Performance",
-    "P0916": "Gear Shift Position Circuit Low",
-    "P0917": "Gear Shift Position Circuit High",
-    "P0918": "Gear Shift Position Circuit Intermittent",
-    "P0919": "Gear Shift Position Control Error",
-    "P0920": "Gear Shift Forward Actuator Circuit/Open",
-    "P0921": "Gear Shift Forward Actuator Circuit Range/Performance",
-    "P0922": "Gear Shift Forward Actuator Circuit Low",
-    "P0923": "Gear Shift Forward Actuator Circuit High",
-    "P0924": "Gear Shift Reverse Actuator Circuit/Open",
-    "P0925": "Gear Shift Reverse Actuator Circuit Range/Performance",
-    "P0926": "Gear Shift Reverse Actuator Circuit Low",
-    "P0927": "Gear Shift Reverse Actuator Circuit High",
-    "P0928": "Gear Shift Lock Solenoid/Actuator Control Circuit 'A'/Open",
-    "P0929": "Gear Shift Lock Solenoid/Actuator Control Circuit 'A'",
-    "P092A": "Gear Shift Lock Solenoid/Actuator Control Circuit 'B'/Open",
-    "P092B": "Gear Shift Lock Solenoid/Actuator Control Circuit 'B'",
-    "P092C": "Gear Shift Lock Solenoid/Actuator Control Circuit 'B' Low",
-    "P092D": "Gear Shift Lock Solenoid/Actuator Control Circuit 'B' High",
-    "P0930": "Gear Shift Lock Solenoid/Actuator Control Circuit 'A' Low",
-    "P0931": "Gear Shift Lock Solenoid/Actuator Control Circuit 'A' High",
-    "P0932": "Hydraulic Pressure Sensor Circuit",
-    "P0933": "Hydraulic Pressure Sensor Range/Performance",
-    "P0934": "Hydraulic Pressure Sensor Circuit Low",
-    "P0935": "Hydraulic Pressure Sensor Circuit High",
-    "P0936": "Hydraulic Pressure Sensor Circuit Intermittent",
-    "P0937": "Hydraulic Oil Temperature Sensor Circuit",
-    "P0938": "Hydraulic Oil Temperature Sensor Range/Performance",
-    "P0939": "Hydraulic Oil Temperature Sensor Circuit Low",
-    "P0940": "Hydraulic Oil Temperature Sensor Circuit High",
-    "P0941": "Hydraulic Oil Temperature Sensor Circuit Intermittent",
-    "P0942": "Hydraulic Pressure Unit",
-    "P0943": "Hydraulic Pressure Unit Cycling Period Too Short",
-    "P0944": "Hydraulic Pressure Unit Loss of Pressure",
-    "P0945": "Hydraulic Pump Relay Circuit/Open",
-    "P0946": "Hydraulic Pump Relay Circuit Range/Performance",
-    "P0947": "Hydraulic Pump Relay Circuit Low",
-    "P0948": "Hydraulic Pump Relay Circuit High",
-    "P0949": "Auto Shift Manual Adaptive Learning not Complete",
-    "P0950": "Auto Shift Manual Control Circuit",
-    "P0951": "Auto Shift Manual Control Circuit Range/Performance",
-    "P0952": "Auto Shift Manual Control Circuit Low",
-    "P0953": "Auto Shift Manual Control Circuit High",
-    "P0954": "Auto Shift Manual Control Circuit Intermittent",
-    "P0955": "Auto Shift Manual Mode Circuit",
-    "P0956": "Auto Shift Manual Mode Circuit Range/Performance",
-    "P0957": "Auto Shift Manual Mode Circuit Low",
-    "P0958": "Auto Shift Manual Mode Circuit High",
-    "P0959": "Auto Shift Manual Mode Circuit Intermittent",
-    "P0960": "Pressure Control Solenoid 'A' Control Circuit/Open",
-    "P0961": "Pressure Control Solenoid 'A' Control Circuit Range/Performance",
-    "P0962": "Pressure Control Solenoid 'A' Control Circuit Low",
-    "P0963": "Pressure Control Solenoid 'A' Control Circuit High",
-    "P0964": "Pressure Control Solenoid 'B' Control Circuit/Open",
-    "P0965": "Pressure Control Solenoid 'B' Control Circuit Range/Performance",
-    "P0966": "Pressure Control Solenoid 'B' Control Circuit Low",
-    "P0967": "Pressure Control Solenoid 'B' Control Circuit High",
-    "P0968": "Pressure Control Solenoid 'C' Control Circuit/Open",
-    "P0969": "Pressure Control Solenoid 'C' Control Circuit Range/Performance",
-    "P0970": "Pressure Control Solenoid 'C' Control Circuit Low",
-    "P0971": "Pressure Control Solenoid 'C' Control Circuit High",
-    "P0972": "Shift Solenoid 'A' Control Circuit Range/Performance",
-    "P0973": "Shift Solenoid 'A' Control Circuit Low",
-    "P0974": "Shift Solenoid 'A' Control Circuit High",
-    "P0975": "Shift Solenoid 'B' Control Circuit Range/Performance",
-    "P0976": "Shift Solenoid 'B' Control Circuit Low",
-    "P0977": "Shift Solenoid 'B' Control Circuit High",
-    "P0978": "Shift Solenoid 'C' Control Circuit Range/Performance",
-    "P0979": "Shift Solenoid 'C' Control Circuit Low",
-    "P0980": "Shift Solenoid 'C' Control Circuit High",
-    "P0981": "Shift Solenoid 'D' Control Circuit Range/Performance",
-    "P0982": "Shift Solenoid 'D' Control Circuit Low",
-    "P0983": "Shift Solenoid 'D' Control Circuit High",
-    "P0984": "Shift Solenoid 'E' Control Circuit Range/Performance",
-    "P0985": "Shift Solenoid 'E' Control Circuit Low",
-    "P0986": "Shift Solenoid 'E' Control Circuit High",
-    "P0987": "Transmission Fluid Pressure Sensor/Switch 'E' Circuit",
-    "P0988": "Transmission Fluid Pressure Sensor/Switch 'E' Circuit",
-    "P0989": "Transmission Fluid Pressure Sensor/Switch 'E' Circuit Low",
-    "P0990": "Transmission Fluid Pressure Sensor/Switch 'E' Circuit High",
-    "P0991": "Transmission Fluid Pressure Sensor/Switch 'E' Circuit Intermittent",
-    "P0992": "Transmission Fluid Pressure Sensor/Switch 'F' Circuit",
-    "P0993": "Transmission Fluid Pressure Sensor/Switch 'F' Circuit",
-    "P0994": "Transmission Fluid Pressure Sensor/Switch 'F' Circuit Low",
-    "P0995": "Transmission Fluid Pressure Sensor/Switch 'F' Circuit High",
-    "P0996": "Transmission Fluid Pressure Sensor/Switch 'F' Circuit Intermittent",
-    "P0997": "Shift Solenoid 'F' Control Circuit Range/Performance",
-    "P0998": "Shift Solenoid 'F' Control Circuit Low",
-    "P0999": "Shift Solenoid 'F' Control Circuit High",
-    "P099A": "Shift Solenoid 'G' Control Circuit Range/Performance",
-    "P099B": "Shift Solenoid 'G' Control Circuit Low",
-    "P099C": "Shift Solenoid 'G' Control Circuit High",
-    "P099D": "Shift Solenoid 'H' Control Circuit Range/Performance",
-    "P099E": "Shift Solenoid 'H' Control Circuit Low",
-    "P099F": "Shift Solenoid 'H' Control Circuit High",
-}
-
-P0A_ERRORS = {
-    "P0A00": "Motor Electronics Coolant Temperature Sensor Circuit",
-    "P0A01": "Range/Performance",
-    "P0A02": "Motor Electronics Coolant Temperature Sensor Circuit Low",
-    "P0A03": "Motor Electronics Coolant Temperature Sensor Circuit High",
-    "P0A04": "Motor Electronics Coolant Temperature Sensor Circuit Intermittent",
-    "P0A05": "Motor Electronics Coolant Pump 'A' Control Circuit/Open",
-    "P0A06": "Motor Electronics Coolant Pump 'A' Control Circuit Low",
-    "P0A07": "Motor Electronics Coolant Pump 'A' Control Circuit High",
-    "P0A08": "DC/DC Converter Status Circuit",
-    "P0A09": "DC/DC Converter Status Circuit Low",
-    "P0A0A": "High Voltage System Interlock Circuit",
-    "P0A0B": "High Voltage System Interlock Circuit Performance",
-    "P0A0C": "High Voltage System Interlock Circuit Low",
-    "P0A0D": "High Voltage System Interlock Circuit High",
-    "P0A0E": "High Voltage System Interlock Circuit Intermittent",
-    "P0A0F": "Engine Failed to Start",
-    "P0A10": "DC/DC Converter Status Circuit High",
-    "P0A11": "DC/DC Converter Enable Circuit/Open",
-    "P0A12": "DC/DC Converter Enable Circuit Low",
-    "P0A13": "DC/DC Converter Enable Circuit High",
-    "P0A14": "Engine Mount 'A' Control Circuit/Open",
-    "P0A15": "Engine Mount 'A' Control Circuit Low",
-    "P0A16": "Engine Mount 'A' Control Circuit High",
-    "P0A17": "Motor Torque Sensor Circuit",
-    "P0A18": "Motor Torque Sensor Circuit Range/Performance",
-    "P0A19": "Motor Torque Sensor Circuit Low",
-    "P0A1A": "Generator Control Module",
-    "P0A1B": "Drive Motor 'A' Control Module",
-    "P0A1C": "Drive Motor 'B' Control Module",
-    "P0A1D": "Hybrid Powertrain Control Module",
-    "P0A1E": "Starter/Generator Control Module",
-    "P0A1F": "Battery Energy Control Module",
-    "P0A20": "Motor Torque Sensor Circuit High",
-    "P0A21": "Motor Torque Sensor Circuit Intermittent",
-    "P0A22": "Generator Torque Sensor Circuit",
-    "P0A23": "Generator Torque Sensor Circuit Range/Performance",
-    "P0A24": "Generator Torque Sensor Circuit Low",
-    "P0A25": "Generator Torque Sensor Circuit High",
-    "P0A26": "Generator Torque Sensor Circuit Intermittent",
-    "P0A27": "Hybrid Battery Power Off Circuit",
-    "P0A28": "Hybrid Battery Power Off Circuit Low",
-    "P0A29": "Hybrid Battery Power Off Circuit High",
-    "P0A2A": "Drive Motor 'A' Temperature Sensor Circuit",
-    "P0A2B": "Drive Motor 'A' Temperature Sensor Circuit Range/Performance",
-    "P0A2C": "Drive Motor 'A' Temperature Sensor Circuit Low",
-    "P0A2D": "Drive Motor 'A' Temperature Sensor Circuit High",
-    "P0A2E": "Drive Motor 'A' Temperature Sensor Circuit Intermittent",
-    "P0A2F": "Drive Motor 'A' Over Temperature",
-    "P0A30": "Drive Motor 'B' Temperature Sensor Circuit",
-    "P0A31": "Drive Motor 'B' Temperature Sensor Circuit Range/Performance",
-    "P0A32": "Drive Motor 'B' Temperature Sensor Circuit Low",
-    "P0A33": "Drive Motor 'B' Temperature Sensor Circuit High",
-    "P0A34": "Drive Motor 'B' Temperature Sensor Circuit Intermittent",
-    "P0A35": "Drive Motor 'B' Over Temperature",
-    "P0A36": "Generator Temperature Sensor Circuit",
-    "P0A37": "Generator Temperature Sensor Circuit Range/Performance",
-    "P0A38": "Generator Temperature Sensor Circuit Low",
-    "P0A39": "Generator Temperature Sensor Circuit High",
-    "P0A3A": "Generator Temperature Sensor Circuit Intermittent",
-    "P0A3B": "Generator Over Temperature",
-    "P0A3C": "Drive Motor 'A' Inverter Over Temperature",
-    "P0A3D": "Drive Motor 'B' Inverter Over Temperature",
-    "P0A3E": "Generator Inverter Over Temperature",
-    "P0A3F": "Drive Motor 'A' Position Sensor Circuit",
-    "P0A40": "Drive Motor 'A' Position Sensor Circuit Range/Performance",
-    "P0A41": "Drive Motor 'A' Position Sensor Circuit Low",
-    "P0A42": "Drive Motor 'A' Position Sensor Circuit High",
-    "P0A43": "Drive Motor 'A' Position Sensor Circuit Intermittent",
-    "P0A44": "Drive Motor 'A' Position Sensor Circuit Overspeed",
-    "P0A45": "Drive Motor 'B' Position Sensor Circuit",
-    "P0A46": "Drive Motor 'B' Position Sensor Circuit Range/Performance",
-    "P0A47": "Drive Motor 'B' Position Sensor Circuit Low",
-    "P0A48": "Drive Motor 'B' Position Sensor Circuit High",
-    "P0A49": "Drive Motor 'B' Position Sensor Circuit Intermittent",
-    "P0A4A": "Drive Motor 'B' Position Sensor Circuit Overspeed",
-    "P0A4B": "Generator Position Sensor Circuit",
-    "P0A4C": "Generator Position Sensor Circuit Range/Performance",
-    "P0A4D": "Generator Position Sensor Circuit Low",
-    "P0A4E": "Generator Position Sensor Circuit High",
-    "P0A4F": "Generator Position Sensor Circuit Intermittent",
-    "P0A50": "Generator Position Sensor Circuit Overspeed",
-    "P0A51": "Drive Motor 'A' Current Sensor Circuit",
-    "P0A52": "Drive Motor 'A' Current Sensor Circuit Range/Performance",
-    "P0A53": "Drive Motor 'A' Current Sensor Circuit Low",
-    "P0A54": "Drive Motor 'A' Current Sensor Circuit High",
-    "P0A55": "Drive Motor 'B' Current Sensor Circuit",
-    "P0A56": "Drive Motor 'B' Current Sensor Circuit Range/Performance",
-    "P0A57": "Drive Motor 'B' Current Sensor Circuit Low",
-    "P0A58": "Drive Motor 'B' Current Sensor Circuit High",
-    "P0A59": "Generator Current Sensor Circuit",
-    "P0A5A": "Generator Current Sensor Circuit Range/Performance",
-    "P0A5B": "Generator Current Sensor Circuit Low",
-    "P0A5C": "Generator Current Sensor Circuit High",
-    "P0A5D": "Drive Motor 'A' Phase U Current",
-    "P0A5E": "Drive Motor 'A' Phase U Current Low",
-    "P0A5F": "Drive Motor 'A' Phase U Current High",
-    "P0A60": "Drive Motor 'A' Phase V Current",
-    "P0A61": "Drive Motor 'A' Phase V Current Low",
-    "P0A62": "Drive Motor 'A' Phase V Current High",
-    "P0A63": "Drive Motor 'A' Phase W Current",
-    "P0A64": "Drive Motor 'A' Phase W Current Low",
-    "P0A65": "Drive Motor 'A' Phase W Current High",
-    "P0A66": "Drive Motor 'B' Phase U Current",
-    "P0A67": "Drive Motor 'B' Phase U Current Low",
-    "P0A68": "Drive Motor 'B' Phase U Current High",
-    "P0A69": "Drive Motor 'B' Phase V Current",
-    "P0A6A": "Drive Motor 'B' Phase V Current Low",
-    "P0A6B": "Drive Motor 'B' Phase V Current High",
-    "P0A6C": "Drive Motor 'B' Phase W Current",
-    "P0A6D": "Drive Motor 'B' Phase W Current Low",
-    "P0A6E": "Drive Motor 'B' Phase W Current High",
-    "P0A6F": "Generator Phase U Current",
-    "P0A70": "Generator Phase U Current Low",
-    "P0A71": "Generator Phase U Current High",
-    "P0A72": "Generator Phase V Current",
-    "P0A73": "Generator Phase V Current Low",
-    "P0A74": "Generator Phase V Current High",
-    "P0A75": "Generator Phase W Current",
-    "P0A76": "Generator Phase W Current Low",
-    "P0A77": "Generator Phase W Current High",
-    "P0A78": "Drive Motor 'A' Inverter Performance",
-    "P0A79": "Drive Motor 'B' Inverter Performance",
-    "P0A7A": "Generator Inverter Performance",
-    "P0A7B": "Battery Energy Control Module Requested MIL Illumination",
-    "P0A7C": "Motor Electronics Over Temperature",
-    "P0A7D": "Hybrid Battery Pack State of Charge Low",
-    "P0A7E": "Hybrid Battery Pack Over Temperature",
-    "P0A7F": "Hybrid Battery Pack Deterioration",
-    "P0A80": "Replace Hybrid Battery Pack",
-    "P0A81": "Hybrid Battery Pack Cooling Fan 1 Control Circuit/Open",
-    "P0A82": "Hybrid Battery Pack Cooling Fan 1 Performance/Stuck Off",
-    "P0A83": "Hybrid Battery Pack Cooling Fan 1 Stuck On",
-    "P0A84": "Hybrid Battery Pack Cooling Fan 1 Control Circuit Low",
-    "P0A85": "Hybrid Battery Pack Cooling Fan 1 Control Circuit High",
-    "P0A86": "14 Volt Power Module Current Sensor Circuit",
-    "P0A87": "14 Volt Power Module Current Sensor Circuit Range/Performance",
-    "P0A88": "14 Volt Power Module Current Sensor Circuit Low",
-    "P0A89": "14 Volt Power Module Current Sensor Circuit High",
-    "P0A8A": "14 Volt Power Module Current Sensor Circuit Intermittent",
-    "P0A8B": "14 Volt Power Module System Voltage",
-    "P0A8C": "14 Volt Power Module System Voltage Unstable",
-    "P0A8D": "14 Volt Power Module System Voltage Low",
-    "P0A8E": "14 Volt Power Module System Voltage High",
-    "P0A8F": "14 Volt Power Module System Performance",
-    "P0A90": "Drive Motor 'A' Performance",
-    "P0A91": "Drive Motor 'B' Performance",
-    "P0A92": "Hybrid Generator Performance",
-    "P0A93": "Inverter 'A' Cooling System Performance",
-    "P0A94": "DC/DC Converter Performance",
-    "P0A95": "High Voltage Fuse",
-    "P0A96": "Hybrid Battery Pack Cooling Fan 2 Control Circuit/Open",
-    "P0A97": "Hybrid Battery Pack Cooling Fan 2 Performance/Stuck Off",
-    "P0A98": "Hybrid Battery Pack Cooling Fan 2 Stuck On",
-    "P0A99": "Hybrid Battery Pack Cooling Fan 2 Control Circuit Low",
-    "P0A9A": "Hybrid Battery Pack Cooling Fan 2 Control Circuit High",
-    "P0A9B": "Hybrid Battery Temperature Sensor 'A' Circuit",
-    "P0A9C": "Hybrid Battery Temperature Sensor 'A' Range/Performance",
-    "P0A9D": "Hybrid Battery Temperature Sensor 'A' Circuit Low",
-    "P0A9E": "Hybrid Battery Temperature Sensor 'A' Circuit High",
-    "P0A9F": "Hybrid Battery Temperature Sensor 'A' Circuit Intermittent/Erratic",
-    "P0AA0": "Hybrid Battery Positive Contactor Circuit",
-    "P0AA1": "Hybrid Battery Positive Contactor Circuit Stuck Closed",
-    "P0AA2": "Hybrid Battery Positive Contactor Circuit Stuck Open",
-    "P0AA3": "Hybrid Battery Negative Contactor Circuit",
-    "P0AA4": "Hybrid Battery Negative Contactor Circuit Stuck Closed",
-    "P0AA5": "Hybrid Battery Negative Contactor Circuit Stuck Open",
-    "P0AA6": "Hybrid Battery Voltage System Isolation Fault",
-    "P0AA7": "Hybrid Battery Voltage Isolation Sensor Circuit",
-    "P0AA8": "Hybrid Battery Voltage Isolation Sensor Circuit Range/Performance",
-    "P0AA9": "Hybrid Battery Voltage Isolation Sensor Circuit Low",
-    "P0AAA": "Hybrid Battery Voltage Isolation Sensor Circuit High",
-    "P0AAB": "Hybrid Battery Voltage Isolation Sensor Circuit Intermittent/Erratic",
-    "P0AAC": "Hybrid Battery Pack Air Temperature Sensor 'A' Circuit",
-    "P0AAD": "Range/Performance",
-    "P0AAE": "Hybrid Battery Pack Air Temperature Sensor 'A' Circuit Low",
-    "P0AAF": "Hybrid Battery Pack Air Temperature Sensor 'A' Circuit High",
-    "P0AB0": "Intermittent/Erratic",
-    "P0AB1": "Hybrid Battery Pack Air Temperature Sensor 'B' Circuit",
-    "P0AB2": "Hybrid Battery Pack Air Temperature Sensor 'B' Circuit",
-    "P0AB3": "Hybrid Battery Pack Air Temperature Sensor 'B' Circuit Low",
-    "P0AB4": "Hybrid Battery Pack Air Temperature Sensor 'B' Circuit High",
-    "P0AB5": "Intermittent/Erratic",
-    "P0AB6": "Engine Mount 'B' Control Circuit/Open",
-    "P0AB7": "Engine Mount 'B' Control Circuit Low",
-    "P0AB8": "Engine Mount 'B' Control Circuit High",
-    "P0AB9": "Hybrid System Performance",
-    "P0ABA": "Hybrid Battery Pack Voltage Sense 'A' Circuit",
-    "P0ABB": "Hybrid Battery Pack Voltage Sense 'A' Circuit Range/Performance",
-    "P0ABC": "Hybrid Battery Pack Voltage Sense 'A' Circuit Low",
-    "P0ABD": "Hybrid Battery Pack Voltage Sense 'A' Circuit High",
-    "P0ABE": "Hybrid Battery Pack Voltage Sense 'A' Circuit Intermittent/Erratic",
-    "P0ABF": "Hybrid Battery Pack Current Sensor 'A' Circuit",
-    "P0AC0": "Hybrid Battery Pack Current Sensor 'A' Circuit Range/Performance",
-    "P0AC1": "Hybrid Battery Pack Current Sensor 'A' Circuit Low",
-    "P0AC2": "Hybrid Battery Pack Current Sensor 'A' Circuit High",
-    "P0AC3": "Hybrid Battery Pack Current Sensor 'A' Circuit Intermittent/Erratic",
-    "P0AC4": "Hybrid Powertrain Control Module Requested MIL Illumination",
-    "P0AC5": "Hybrid Battery Temperature Sensor 'B' Circuit",
-    "P0AC6": "Hybrid Battery Temperature Sensor 'B' Range/Performance",
-    "P0AC7": "Hybrid Battery Temperature Sensor 'B' Circuit Low",
-    "P0AC8": "Hybrid Battery Temperature Sensor 'B' Circuit High",
-    "P0AC9": "Hybrid Battery Temperature Sensor 'B' Circuit Intermittent/Erratic",
-    "P0ACA": "Hybrid Battery Temperature Sensor 'C' Circuit",
-    "P0ACB": "Hybrid Battery Temperature Sensor 'C' Range/Performance",
-    "P0ACC": "Hybrid Battery Temperature Sensor 'C' Circuit Low",
-    "P0ACD": "Hybrid Battery Temperature Sensor 'C' Circuit High",
-    "P0ACE": "Hybrid Battery Temperature Sensor 'C' Circuit Intermittent/Erratic",
-    "P0ACF": "Hybrid Battery Pack Cooling Fan 3 Control Circuit/Open",
-    "P0AD0": "Hybrid Battery Pack Cooling Fan 3 Performance/Stuck Off",
-    "P0AD1": "Hybrid Battery Pack Cooling Fan 3 Stuck On",
-    "P0AD2": "Hybrid Battery Pack Cooling Fan 3 Control Circuit Low",
-    "P0AD3": "Hybrid Battery Pack Cooling Fan 3 Control Circuit High",
-    "P0AD4": "Hybrid Battery Pack Air Flow System Insufficient Air Flow",
-    "P0AD5": "Hybrid Battery Pack Air Flow Valve 'A' Control Circuit/Open",
-    "P0AD6": "Range/Performance",
-    "P0AD7": "Hybrid Battery Pack Air Flow Valve 'A' Control Circuit Low",
-    "P0AD8": "Hybrid Battery Pack Air Flow Valve 'A' Control Circuit High",
-    "P0AD9": "Hybrid Battery Positive Contactor Control Circuit/Open",
-    "P0ADA": "Range/Performance",
-    "P0ADB": "Hybrid Battery Positive Contactor Control Circuit Low",
-    "P0ADC": "Hybrid Battery Positive Contactor Control Circuit High",
-    "P0ADD": "Hybrid Battery Negative Contactor Control Circuit/Open",
-    "P0ADE": "Range/Performance",
-    "P0ADF": "Hybrid Battery Negative Contactor Control Circuit Low",
-    "P0AE0": "Hybrid Battery Negative Contactor Control Circuit High",
-    "P0AE1": "Hybrid Battery Precharge Contactor Circuit",
-    "P0AE2": "Hybrid Battery Precharge Contactor Circuit Stuck Closed",
-    "P0AE3": "Hybrid Battery Precharge Contactor Circuit Stuck Open",
-    "P0AE4": "Hybrid Battery Precharge Contactor Control Circuit",
-    "P0AE5": "Range/Performance",
-    "P0AE6": "Hybrid Battery Precharge Contactor Control Circuit Low",
-    "P0AE7": "Hybrid Battery Precharge Contactor Control Circuit High",
-    "P0AE8": "Hybrid Battery Temperature Sensor 'D' Circuit",
-    "P0AE9": "Hybrid Battery Temperature Sensor 'D' Range/Performance",
-    "P0AEA": "Hybrid Battery Temperature Sensor 'D' Circuit Low",
-    "P0AEB": "Hybrid Battery Temperature Sensor 'D' Circuit High",
-    "P0AEC": "Hybrid Battery Temperature Sensor 'D' Circuit Intermittent/Erratic",
-    "P0AED": "Drive Motor Inverter Temperature Sensor 'A' Circuit",
-    "P0AEE": "Range/Performance",
-    "P0AEF": "Drive Motor Inverter Temperature Sensor 'A' Circuit Low",
-    "P0AF0": "Drive Motor Inverter Temperature Sensor 'A' Circuit High",
-    "P0AF1": "Intermittent/Erratic",
-    "P0AF2": "Drive Motor Inverter Temperature Sensor 'B' Circuit",
-    "P0AF3": "Range/Performance",
-    "P0AF4": "Drive Motor Inverter Temperature Sensor 'B' Circuit Low",
-    "P0AF5": "Drive Motor Inverter Temperature Sensor 'B' Circuit High",
-    "P0AF6": "Intermittent/Erratic",
-    "P0AF7": "14 Volt Power Module Internal Temperature Too High",
-    "P0AF8": "Hybrid Battery System Voltage",
-    "P0AF9": "Hybrid Battery System Voltage Unstable",
-    "P0AFA": "Hybrid Battery System Voltage Low",
-    "P0AFB": "Hybrid Battery System Voltage High",
-    "P0AFC": "Hybrid Battery Pack Sensor Module",
-    "P0AFD": "Hybrid Battery Pack Temperature Too Low",
-    "P0AFE": "Conversion",
-    "P0AFF": "System Voltage Too Low for Voltage Step Down Conversion",
-}
-
-P0B_ERRORS = {
-    "P0B00": "AUXILIARY Transmission Fluid Pump Motor Phase U Current",
-    "P0B01": "AUXILIARY Transmission Fluid Pump Motor Phase U Current Low",
-    "P0B02": "AUXILIARY Transmission Fluid Pump Motor Phase U Current High",
-    "P0B03": "AUXILIARY Transmission Fluid Pump Motor Phase V Current",
-    "P0B04": "AUXILIARY Transmission Fluid Pump Motor Phase V Current Low",
-    "P0B05": "AUXILIARY Transmission Fluid Pump Motor Phase V Current High",
-    "P0B06": "AUXILIARY Transmission Fluid Pump Motor Phase W Current",
-    "P0B07": "AUXILIARY Transmission Fluid Pump Motor Phase W Current Low",
-    "P0B08": "AUXILIARY Transmission Fluid Pump Motor Phase W Current High",
-    "P0B09": "AUXILIARY Transmission Fluid Pump Motor Supply Voltage",
-    "P0B0A": "AUXILIARY Transmission Fluid Pump Motor Supply Voltage Circuit",
-    "P0B0B": "AUXILIARY Transmission Fluid Pump Motor Supply Voltage Circuit",
-    "P0B0C": "AUXILIARY Transmission Fluid Pump Hydraulic Leakage",
-    "P0B0D": "AUXILIARY Transmission Fluid Pump Motor Control Module",
-    "P0B0E": "Hybrid Battery Pack Current Sensor 'B' Circuit",
-    "P0B0F": "Hybrid Battery Pack Current Sensor 'B' Circuit Range/Performance",
-    "P0B10": "Hybrid Battery Pack Current Sensor 'B' Circuit Low",
-    "P0B11": "Hybrid Battery Pack Current Sensor 'B' Circuit High",
-    "P0B12": "Hybrid Battery Pack Current Sensor 'B' Circuit Intermittent/Erratic",
-    "P0B13": "Hybrid Battery Pack Current Sensor 'A'/'B' Correlation",
-    "P0B14": "Hybrid Battery Pack Voltage Sense 'B' Circuit",
-    "P0B15": "Hybrid Battery Pack Voltage Sense 'B' Circuit Range/Performance",
-    "P0B16": "Hybrid Battery Pack Voltage Sense 'B' Circuit Low",
-    "P0B17": "Hybrid Battery Pack Voltage Sense 'B' Circuit High",
-    "P0B18": "Hybrid Battery Pack Voltage Sense 'B' Circuit Intermittent/Erratic",
-    "P0B19": "Hybrid Battery Pack Voltage Sense 'C' Circuit",
-    "P0B1A": "Hybrid Battery Pack Voltage Sense 'C' Circuit Range/Performance",
-    "P0B1B": "Hybrid Battery Pack Voltage Sense 'C' Circuit Low",
-    "P0B1C": "Hybrid Battery Pack Voltage Sense 'C' Circuit High",
-    "P0B1D": "Hybrid Battery Pack Voltage Sense 'C' Circuit Intermittent/Erratic",
-    "P0B1E": "Hybrid Battery Pack Voltage Sense 'D' Circuit",
-    "P0B1F": "Hybrid Battery Pack Voltage Sense 'D' Circuit Range/Performance",
-    "P0B20": "Hybrid Battery Pack Voltage Sense 'D' Circuit Low",
-    "P0B21": "Hybrid Battery Pack Voltage Sense 'D' Circuit High",
-    "P0B22": "Hybrid Battery Pack Voltage Sense 'D' Circuit Intermittent/Erratic",
-    "P0B23": "Hybrid Battery 'A' Voltage",
-    "P0B24": "Hybrid Battery 'A' Voltage Unstable",
-    "P0B25": "Hybrid Battery 'A' Voltage Low",
-    "P0B26": "Hybrid Battery 'A' Voltage High",
-    "P0B27": "Hybrid Battery 'B' Voltage",
-    "P0B28": "Hybrid Battery 'B' Voltage Unstable",
-    "P0B29": "Hybrid Battery 'B' Voltage Low",
-    "P0B2A": "Hybrid Battery 'B' Voltage High",
-    "P0B2B": "Hybrid Battery 'C' Voltage",
-    "P0B2C": "Hybrid Battery 'C' Voltage Unstable",
-    "P0B2D": "Hybrid Battery 'C' Voltage Low",
-    "P0B2E": "Hybrid Battery 'C' Voltage High",
-    "P0B2F": "Hybrid Battery 'D' Voltage",
-    "P0B30": "Hybrid Battery 'D' Voltage Unstable",
-    "P0B31": "Hybrid Battery 'D' Voltage Low",
-    "P0B32": "Hybrid Battery 'D' Voltage High",
-    "P0B33": "High Voltage Service Disconnect Circuit",
-    "P0B34": "High Voltage Service Disconnect Circuit Performance",
-    "P0B35": "High Voltage Service Disconnect Circuit Low",
-    "P0B36": "High Voltage Service Disconnect Circuit High",
-    "P0B37": "High Voltage Service Disconnect Open",
-    "P0B38": "Motor Electronics Coolant Pump 'B' Control Circuit/Open",
-    "P0B39": "Motor Electronics Coolant Pump 'B' Control Circuit Low",
-    "P0B3A": "Motor Electronics Coolant Pump 'B' Control Circuit High",
-    "P0B3B": "Hybrid Battery Voltage Sense 'A' Circuit",
-    "P0B3C": "Hybrid Battery Voltage Sense 'A' Circuit Range/Performance",
-    "P0B3D": "Hybrid Battery Voltage Sense 'A' Circuit Low",
-    "P0B3E": "Hybrid Battery Voltage Sense 'A' Circuit High",
-    "P0B3F": "Hybrid Battery Voltage Sense 'A' Circuit Intermittent/Erratic",
-    "P0B40": "Hybrid Battery Voltage Sense 'B' Circuit",
-    "P0B41": "Hybrid Battery Voltage Sense 'B' Circuit Range/Performance",
-    "P0B42": "Hybrid Battery Voltage Sense 'B' Circuit Low",
-    "P0B43": "Hybrid Battery Voltage Sense 'B' Circuit High",
-    "P0B44": "Hybrid Battery Voltage Sense 'B' Circuit Intermittent/Erratic",
-    "P0B45": "Hybrid Battery Voltage Sense 'C' Circuit",
-    "P0B46": "Hybrid Battery Voltage Sense 'C' Circuit Range/Performance",
-    "P0B47": "Hybrid Battery Voltage Sense 'C' Circuit Low",
-    "P0B48": "Hybrid Battery Voltage Sense 'C' Circuit High",
-    "P0B49": "Hybrid Battery Voltage Sense 'C' Circuit Intermittent/Erratic",
-    "P0B4A": "Hybrid Battery Voltage Sense 'D' Circuit",
-    "P0B4B": "Hybrid Battery Voltage Sense 'D' Circuit Range/Performance",
-    "P0B4C": "Hybrid Battery Voltage Sense 'D' Circuit Low",
-    "P0B4D": "Hybrid Battery Voltage Sense 'D' Circuit High",
-    "P0B4E": "Hybrid Battery Voltage Sense 'D' Circuit Intermittent/Erratic",
-    "P0B4F": "Hybrid Battery Voltage Sense 'E' Circuit",
-    "P0B50": "Hybrid Battery Voltage Sense 'E' Circuit Range/Performance",
-    "P0B51": "Hybrid Battery Voltage Sense 'E' Circuit Low",
-    "P0B52": "Hybrid Battery Voltage Sense 'E' Circuit High",
-    "P0B53": "Hybrid Battery Voltage Sense 'E' Circuit Intermittent/Erratic",
-    "P0B54": "Hybrid Battery Voltage Sense 'F' Circuit",
-    "P0B55": "Hybrid Battery Voltage Sense 'F' Circuit Range/Performance",
-    "P0B56": "Hybrid Battery Voltage Sense 'F' Circuit Low",
-    "P0B57": "Hybrid Battery Voltage Sense 'F' Circuit High",
-    "P0B58": "Hybrid Battery Voltage Sense 'F' Circuit Intermittent/Erratic",
-    "P0B59": "Hybrid Battery Voltage Sense 'G' Circuit",
-    "P0B5A": "Hybrid Battery Voltage Sense 'G' Circuit Range/Performance",
-    "P0B5B": "Hybrid Battery Voltage Sense 'G' Circuit Low",
-    "P0B5C": "Hybrid Battery Voltage Sense 'G' Circuit High",
-    "P0B5D": "Hybrid Battery Voltage Sense 'G' Circuit Intermittent/Erratic",
-    "P0B5E": "Hybrid Battery Voltage Sense 'H' Circuit",
-    "P0B5F": "Hybrid Battery Voltage Sense 'H' Circuit Range/Performance",
-    "P0B60": "Hybrid Battery Voltage Sense 'H' Circuit Low",
-    "P0B61": "Hybrid Battery Voltage Sense 'H' Circuit High",
-    "P0B62": "Hybrid Battery Voltage Sense 'H' Circuit Intermittent/Erratic",
-    "P0B63": "Hybrid Battery Voltage Sense 'I' Circuit",
-    "P0B64": "Hybrid Battery Voltage Sense 'I' Circuit Range/Performance",
-    "P0B65": "Hybrid Battery Voltage Sense 'I' Circuit Low",
-    "P0B66": "Hybrid Battery Voltage Sense 'I' Circuit High",
-    "P0B67": "Hybrid Battery Voltage Sense 'I' Circuit Intermittent/Erratic",
-    "P0B68": "Hybrid Battery Voltage Sense 'J' Circuit",
-    "P0B69": "Hybrid Battery Voltage Sense 'J' Circuit Range/Performance",
-    "P0B6A": "Hybrid Battery Voltage Sense 'J' Circuit Low",
-    "P0B6B": "Hybrid Battery Voltage Sense 'J' Circuit High",
-    "P0B6C": "Hybrid Battery Voltage Sense 'J' Circuit Intermittent/Erratic",
-    "P0B6D": "Hybrid Battery Voltage Sense 'K' Circuit",
-    "P0B6E": "Hybrid Battery Voltage Sense 'K' Circuit Range/Performance",
-    "P0B6F": "Hybrid Battery Voltage Sense 'K' Circuit Low",
-    "P0B70": "Hybrid Battery Voltage Sense 'K' Circuit High",
-    "P0B71": "Hybrid Battery Voltage Sense 'K' Circuit Intermittent/Erratic",
-    "P0B72": "Hybrid Battery Voltage Sense 'L' Circuit",
-    "P0B73": "Hybrid Battery Voltage Sense 'L' Circuit Range/Performance",
-    "P0B74": "Hybrid Battery Voltage Sense 'L' Circuit Low",
-    "P0B75": "Hybrid Battery Voltage Sense 'L' Circuit High",
-    "P0B76": "Hybrid Battery Voltage Sense 'L' Circuit Intermittent/Erratic",
-    "P0B77": "Hybrid Battery Voltage Sense 'M' Circuit",
-    "P0B78": "Hybrid Battery Voltage Sense 'M' Circuit Range/Performance",
-    "P0B79": "Hybrid Battery Voltage Sense 'M' Circuit Low",
-    "P0B7A": "Hybrid Battery Voltage Sense 'M' Circuit High",
-    "P0B7B": "Hybrid Battery Voltage Sense 'M' Circuit Intermittent/Erratic",
-    "P0B7C": "Hybrid Battery Voltage Sense 'N' Circuit",
-    "P0B7D": "Hybrid Battery Voltage Sense 'N' Circuit Range/Performance",
-    "P0B7E": "Hybrid Battery Voltage Sense 'N' Circuit Low",
-    "P0B7F": "Hybrid Battery Voltage Sense 'N' Circuit High",
-    "P0B80": "Hybrid Battery Voltage Sense 'N' Circuit Intermittent/Erratic",
-    "P0B81": "Hybrid Battery Voltage Sense 'O' Circuit",
-    "P0B82": "Hybrid Battery Voltage Sense 'O' Circuit Range/Performance",
-    "P0B83": "Hybrid Battery Voltage Sense 'O' Circuit Low",
-    "P0B84": "Hybrid Battery Voltage Sense 'O' Circuit High",
-    "P0B85": "Hybrid Battery Voltage Sense 'O' Circuit Intermittent/Erratic",
-    "P0B86": "Hybrid Battery Voltage Sense 'P' Circuit",
-    "P0B87": "Hybrid Battery Voltage Sense 'P' Circuit Range/Performance",
-    "P0B88": "Hybrid Battery Voltage Sense 'P' Circuit Low",
-    "P0B89": "Hybrid Battery Voltage Sense 'P' Circuit High",
-    "P0B8A": "Hybrid Battery Voltage Sense 'P' Circuit Intermittent/Erratic",
-    "P0B8B": "Hybrid Battery Voltage Sense 'Q' Circuit",
-    "P0B8C": "Hybrid Battery Voltage Sense 'Q' Circuit Range/Performance",
-    "P0B8D": "Hybrid Battery Voltage Sense 'Q' Circuit Low",
-    "P0B8E": "Hybrid Battery Voltage Sense 'Q' Circuit High",
-    "P0B8F": "Hybrid Battery Voltage Sense 'Q' Circuit Intermittent/Erratic",
-    "P0B90": "Hybrid Battery Voltage Sense 'R' Circuit",
-    "P0B91": "Hybrid Battery Voltage Sense 'R' Circuit Range/Performance",
-    "P0B92": "Hybrid Battery Voltage Sense 'R' Circuit Low",
-    "P0B93": "Hybrid Battery Voltage Sense 'R' Circuit High",
-    "P0B94": "Hybrid Battery Voltage Sense 'R' Circuit Intermittent/Erratic",
-    "P0B95": "Hybrid Battery Voltage Sense 'S' Circuit",
-    "P0B96": "Hybrid Battery Voltage Sense 'S' Circuit Range/Performance",
-    "P0B97": "Hybrid Battery Voltage Sense 'S' Circuit Low",
-    "P0B98": "Hybrid Battery Voltage Sense 'S' Circuit High",
-    "P0B99": "Hybrid Battery Voltage Sense 'S' Circuit Intermittent/Erratic",
-    "P0B9A": "Hybrid Battery Voltage Sense 'T' Circuit",
-    "P0B9B": "Hybrid Battery Voltage Sense 'T' Circuit Range/Performance",
-    "P0B9C": "Hybrid Battery Voltage Sense 'T' Circuit Low",
-    "P0B9D": "Hybrid Battery Voltage Sense 'T' Circuit High",
-    "P0B9E": "Hybrid Battery Voltage Sense 'T' Circuit Intermittent/Erratic",
-    "P0B9F": "Hybrid Battery Voltage Sense 'U' Circuit",
-    "P0BA0": "Hybrid Battery Voltage Sense 'U' Circuit Range/Performance",
-    "P0BA1": "Hybrid Battery Voltage Sense 'U' Circuit Low",
-    "P0BA2": "Hybrid Battery Voltage Sense 'U' Circuit High",
-    "P0BA3": "Hybrid Battery Voltage Sense 'U' Circuit Intermittent/Erratic",
-    "P0BA4": "Hybrid Battery Voltage Sense 'V' Circuit",
-    "P0BA5": "Hybrid Battery Voltage Sense 'V' Circuit Range/Performance",
-    "P0BA6": "Hybrid Battery Voltage Sense 'V' Circuit Low",
-    "P0BA7": "Hybrid Battery Voltage Sense 'V' Circuit High",
-    "P0BA8": "Hybrid Battery Voltage Sense 'V' Circuit Intermittent/Erratic",
-    "P0BA9": "Hybrid Battery Voltage Sense 'W' Circuit",
-    "P0BAA": "Hybrid Battery Voltage Sense 'W' Circuit Range/Performance",
-    "P0BAB": "Hybrid Battery Voltage Sense 'W' Circuit Low",
-    "P0BAC": "Hybrid Battery Voltage Sense 'W' Circuit High",
-    "P0BAD": "Hybrid Battery Voltage Sense 'W' Circuit Intermittent/Erratic",
-    "P0BAE": "Hybrid Battery Voltage Sense 'X' Circuit",
-    "P0BAF": "Hybrid Battery Voltage Sense 'X' Circuit Range/Performance",
-    "P0BB0": "Hybrid Battery Voltage Sense 'X' Circuit Low",
-    "P0BB1": "Hybrid Battery Voltage Sense 'X' Circuit High",
-    "P0BB2": "Hybrid Battery Voltage Sense 'X' Circuit Intermittent/Erratic",
-    "P0BB3": "Hybrid Battery Voltage Sense 'Y' Circuit",
-    "P0BB4": "Hybrid Battery Voltage Sense 'Y' Circuit Range/Performance",
-    "P0BB5": "Hybrid Battery Voltage Sense 'Y' Circuit Low",
-    "P0BB6": "Hybrid Battery Voltage Sense 'Y' Circuit High",
-    "P0BB7": "Hybrid Battery Voltage Sense 'Y' Circuit Intermittent/Erratic",
-    "P0BB8": "Hybrid Battery Voltage Sense 'Z' Circuit",
-    "P0BB9": "Hybrid Battery Voltage Sense 'Z' Circuit Range/Performance",
-    "P0BBA": "Hybrid Battery Voltage Sense 'Z' Circuit Low",
-    "P0BBB": "Hybrid Battery Voltage Sense 'Z' Circuit High",
-    "P0BBC": "Hybrid Battery Voltage Sense 'Z' Circuit Intermittent/Erratic",
-    "P0BBD": "Hybrid Battery Pack Voltage Variation Exceeded Limit",
-    "P0BBE": "Hybrid Battery Pack Voltage Variation",
-    "P0BBF": "Hybrid Battery Pack Cooling Fan Supply Voltage Circuit/Open",
-    "P0BC0": "Hybrid Battery Pack Cooling Fan Supply Voltage Circuit Low",
-    "P0BC1": "Hybrid Battery Pack Cooling Fan Supply Voltage Circuit High",
-    "P0BC2": "Hybrid Battery Temperature Sensor 'E' Circuit",
-    "P0BC3": "Hybrid Battery Temperature Sensor 'E' Range/Performance",
-    "P0BC4": "Hybrid Battery Temperature Sensor 'E' Circuit Low",
-    "P0BC5": "Hybrid Battery Temperature Sensor 'E' Circuit High",
-    "P0BC6": "Hybrid Battery Temperature Sensor 'E' Circuit Intermittent/Erratic",
-    "P0BC7": "Hybrid Battery Pack Cooling Fan Sense Circuit/Open",
-    "P0BC8": "Hybrid Battery Pack Cooling Fan Sense Range/Performance",
-    "P0BC9": "Hybrid Battery Pack Cooling Fan Sense Circuit Low",
-    "P0BCA": "Hybrid Battery Pack Cooling Fan Sense Circuit High",
-    "P0BCB": "Hybrid Battery Pack Cooling Fan Sense Circuit Intermittent/Erratic",
-    "P0BCC": "Generator Inverter Temperature Sensor Circuit",
-    "P0BCD": "Generator Inverter Temperature Sensor Circuit Range/Performance",
-    "P0BCE": "Generator Inverter Temperature Sensor Circuit Low",
-    "P0BCF": "Generator Inverter Temperature Sensor Circuit High",
-    "P0BD0": "Generator Inverter Temperature Sensor Circuit Intermittent/Erratic",
-    "P0BD1": "Drive Motor Inverter Temperature Sensor 'C' Circuit",
-    "P0BD2": "Drive Motor Inverter Temperature Sensor 'C' Circuit",
-    "P0BD3": "Drive Motor Inverter Temperature Sensor 'C' Circuit Low",
-    "P0BD4": "Drive Motor Inverter Temperature Sensor 'C' Circuit High",
-    "P0BD5": "Drive Motor Inverter Temperature Sensor 'C' Circuit",
-    "P0BD6": "Drive Motor Inverter Temperature Sensor 'D' Circuit",
-    "P0BD7": "Drive Motor Inverter Temperature Sensor 'D' Circuit",
-    "P0BD8": "Drive Motor Inverter Temperature Sensor 'D' Circuit Low",
-    "P0BD9": "Drive Motor Inverter Temperature Sensor 'D' Circuit High",
-    "P0BDA": "Drive Motor Inverter Temperature Sensor 'D' Circuit",
-    "P0BDB": "Drive Motor Inverter Temperature Sensor 'E' Circuit",
-    "P0BDC": "Drive Motor Inverter Temperature Sensor 'E' Circuit",
-    "P0BDD": "Drive Motor Inverter Temperature Sensor 'E' Circuit Low",
-    "P0BDE": "Drive Motor Inverter Temperature Sensor 'E' Circuit High",
-    "P0BDF": "Drive Motor Inverter Temperature Sensor 'E' Circuit",
-    "P0BE0": "Drive Motor Inverter Temperature Sensor 'F' Circuit",
-    "P0BE1": "Drive Motor Inverter Temperature Sensor 'F' Circuit",
-    "P0BE2": "Drive Motor Inverter Temperature Sensor 'F' Circuit Low",
-    "P0BE3": "Drive Motor Inverter Temperature Sensor 'F' Circuit High",
-    "P0BE4": "Drive Motor Inverter Temperature Sensor 'F' Circuit",
-    "P0BE5": "Drive Motor 'A' Phase U Current Sensor Circuit",
-    "P0BE6": "Drive Motor 'A' Phase U Current Sensor Circuit",
-    "P0BE7": "Drive Motor 'A' Phase U Current Sensor Circuit Low",
-    "P0BE8": "Drive Motor 'A' Phase U Current Sensor Circuit High",
-    "P0BE9": "Drive Motor 'A' Phase V Current Sensor Circuit",
-    "P0BEA": "Drive Motor 'A' Phase V Current Sensor Circuit",
-    "P0BEB": "Drive Motor 'A' Phase V Current Sensor Circuit Low",
-    "P0BEC": "Drive Motor 'A' Phase V Current Sensor Circuit High",
-    "P0BED": "Drive Motor 'A' Phase W Current Sensor Circuit",
-    "P0BEE": "Drive Motor 'A' Phase W Current Sensor Circuit",
-    "P0BEF": "Drive Motor 'A' Phase W Current Sensor Circuit Low",
-    "P0BF0": "Drive Motor 'A' Phase W Current Sensor Circuit High",
-    "P0BF1": "Drive Motor 'B' Phase U Current Sensor Circuit",
-    "P0BF2": "Drive Motor 'B' Phase U Current Sensor Circuit",
-    "P0BF3": "Drive Motor 'B' Phase U Current Sensor Circuit Low",
-    "P0BF4": "Drive Motor 'B' Phase U Current Sensor Circuit High",
-    "P0BF5": "Drive Motor 'B' Phase V Current Sensor Circuit",
-    "P0BF6": "Drive Motor 'B' Phase V Current Sensor Circuit",
-    "P0BF7": "Drive Motor 'B' Phase V Current Sensor Circuit Low",
-    "P0BF8": "Drive Motor 'B' Phase V Current Sensor Circuit High",
-    "P0BF9": "Drive Motor 'B' Phase W Current Sensor Circuit",
-    "P0BFA": "Drive Motor 'B' Phase W Current Sensor Circuit",
-    "P0BFB": "Drive Motor 'B' Phase W Current Sensor Circuit Low",
-    "P0BFC": "Drive Motor 'B' Phase W Current Sensor Circuit High",
-    "P0BFD": "Drive Motor 'A' Phase U-V-W Current Sensor Correlation",
-    "P0BFE": "Drive Motor 'B' Phase U-V-W Current Sensor Correlation",
-    "P0BFF": "Drive Motor 'A' Current",
-}
-
-P0C_ERRORS = {
-    "P0C00": "Drive Motor 'A' Current Low",
-    "P0C01": "Drive Motor 'A' Current High",
-    "P0C02": "Drive Motor 'B' Current",
-    "P0C03": "Drive Motor 'B' Current Low",
-    "P0C04": "Drive Motor 'B' Current High",
-    "P0C05": "Drive Motor 'A' Phase U-V-W Circuit/Open",
-    "P0C06": "Drive Motor 'A' Phase U-V-W Circuit Low",
-    "P0C07": "Drive Motor 'A' Phase U-V-W Circuit High",
-    "P0C08": "Drive Motor 'B' Phase U-V-W Circuit/Open",
-    "P0C09": "Drive Motor 'B' Phase U-V-W Circuit Low",
-    "P0C0A": "Drive Motor 'B' Phase U-V-W Circuit High",
-    "P0C0B": "Drive Motor 'A' Inverter Power Supply Circuit/Open",
-    "P0C0C": "Drive Motor 'A' Inverter Power Supply Circuit Low",
-    "P0C0D": "Drive Motor 'A' Inverter Power Supply Circuit High",
-    "P0C0E": "Drive Motor 'B' Inverter Power Supply Circuit/Open",
-    "P0C0F": "Drive Motor 'B' Inverter Power Supply Circuit Low",
-    "P0C10": "Drive Motor 'B' Inverter Power Supply Circuit High",
-    "P0C11": "Drive Motor 'A' Inverter Phase U Over Temperature",
-    "P0C12": "Drive Motor 'A' Inverter Phase V Over Temperature",
-    "P0C13": "Drive Motor 'A' Inverter Phase W Over Temperature",
-    "P0C14": "Drive Motor 'B' Inverter Phase U Over Temperature",
-    "P0C15": "Drive Motor 'B' Inverter Phase V Over Temperature",
-    "P0C16": "Drive Motor 'B' Inverter Phase W Over Temperature",
-    "P0C17": "Drive Motor 'A' Position Sensor not Learned",
-    "P0C18": "Drive Motor 'B' Position Sensor not Learned",
-    "P0C19": "Drive Motor 'A' Torque Delivered Performance",
-    "P0C1A": "Drive Motor 'B' Torque Delivered Performance",
-    "P0C1B": "AUXILIARY Transmission Fluid Pump Control Module Internal",
-    "P0C1C": "AUXILIARY Transmission Fluid Pump Control Module Internal",
-    "P0C1D": "AUXILIARY Transmission Fluid Pump Control Module Internal",
-    "P0C1E": "AUXILIARY Transmission Fluid Pump Control Module Internal",
-    "P0C1F": "AUXILIARY Transmission Fluid Pump Control Module Internal",
-    "P0C20": "AUXILIARY Transmission Fluid Pump Phase U-V-W Circuit/Open",
-    "P0C21": "AUXILIARY Transmission Fluid Pump Phase U-V-W Circuit Low",
-    "P0C22": "AUXILIARY Transmission Fluid Pump Phase U-V-W Circuit High",
-    "P0C23": "AUXILIARY Transmission Fluid Pump Control Module Circuit/Open",
-    "P0C24": "AUXILIARY Transmission Fluid Pump Control Module Circuit Low",
-    "P0C25": "AUXILIARY Transmission Fluid Pump Control Module Circuit High",
-    "P0C26": "AUXILIARY Transmission Fluid Pump Motor Current",
-    "P0C27": "AUXILIARY Transmission Fluid Pump Motor Current Low",
-    "P0C28": "AUXILIARY Transmission Fluid Pump Motor Current High",
-    "P0C29": "AUXILIARY Transmission Fluid Pump Driver Circuit Performance",
-    "P0C2A": "AUXILIARY Transmission Fluid Pump Motor Stalled",
-    "P0C2B": "AUXILIARY Transmission Fluid Pump Control Module Feedback",
-    "P0C2C": "AUXILIARY Transmission Fluid Pump Control Module Feedback",
-    "P0C2D": "AUXILIARY Transmission Fluid Pump Control Module Feedback",
-    "P0C2E": "AUXILIARY Transmission Fluid Pump Control Module Feedback",
-    "P0C2F": "Internal Control Module Drive Motor/Generator - Engine Speed",
-    "P0C30": "Hybrid Battery Pack State of Charge High",
-    "P0C31": "Inverter 'B' Cooling System Performance",
-    "P0C32": "Hybrid Battery Cooling System Performance",
-    "P0C33": "Hybrid Battery Temperature Sensor 'F' Circuit",
-    "P0C34": "Hybrid Battery Temperature Sensor 'F' Circuit Range/Performance",
-    "P0C35": "Hybrid Battery Temperature Sensor 'F' Circuit Low",
-    "P0C36": "Hybrid Battery Temperature Sensor 'F' Circuit High",
-    "P0C37": "Hybrid Battery Temperature Sensor 'F' Circuit Intermittent/Erratic",
-    "P0C38": "DC/DC Converter Temperature Sensor 'A' Circuit",
-    "P0C39": "DC/DC Converter Temperature Sensor 'A' Range/Performance",
-    "P0C3A": "DC/DC Converter Temperature Sensor 'A' Low",
-    "P0C3B": "DC/DC Converter Temperature Sensor 'A' High",
-    "P0C3C": "DC/DC Converter Temperature Sensor 'A' Intermittent/Erratic",
-    "P0C3D": "DC/DC Converter Temperature Sensor 'B' Circuit",
-    "P0C3E": "DC/DC Converter Temperature Sensor 'B' Range/Performance",
-    "P0C40": "DC/DC Converter Temperature Sensor 'B' High",
-    "P0C41": "DC/DC Converter Temperature Sensor 'B' Intermittent/Erratic",
-    "P0C42": "Hybrid Battery Pack Coolant Temperature Sensor Circuit",
-    "P0C43": "Hybrid Battery Pack Coolant Temperature Sensor Circuit",
-    "P0C44": "Hybrid Battery Pack Coolant Temperature Sensor Circuit Low",
-    "P0C45": "Hybrid Battery Pack Coolant Temperature Sensor Circuit High",
-    "P0C46": "Hybrid Battery Pack Coolant Temperature Sensor Circuit",
-    "P0C47": "Hybrid Battery Pack Coolant Pump Control Circuit/Open",
-    "P0C48": "Hybrid Battery Pack Coolant Pump Control Circuit Low",
-    "P0C49": "Hybrid Battery Pack Coolant Pump Control Circuit High",
-    "P0C4A": "Hybrid Battery Pack Coolant Pump Control Performance",
-    "P0C4B": "Hybrid Battery Pack Coolant Pump Supply Voltage Circuit/Open",
-    "P0C4C": "Hybrid Battery Pack Coolant Pump Supply Voltage Circuit Low",
-    "P0C4D": "Hybrid Battery Pack Coolant Pump Supply Voltage Circuit High",
-    "P0C4E": "Drive Motor 'A' Position Exceeded Learning Limit",
-    "P0C4F": "Drive Motor 'B' Position Exceeded Learning Limit",
-    "P0C50": "Drive Motor 'A' Position Sensor Circuit 'A'",
-    "P0C51": "Drive Motor 'A' Position Sensor Circuit 'A' Range/Performance",
-    "P0C52": "Drive Motor 'A' Position Sensor Circuit 'A' Low",
-    "P0C53": "Drive Motor 'A' Position Sensor Circuit 'A' High",
-    "P0C54": "Drive Motor 'A' Position Sensor Circuit 'A' Intermittent/Erratic",
-    "P0C55": "Drive Motor 'B' Position Sensor Circuit 'A'",
-    "P0C56": "Drive Motor 'B' Position Sensor Circuit 'A' Range/Performance",
-    "P0C57": "Drive Motor 'B' Position Sensor Circuit 'A' Low",
-    "P0C58": "Drive Motor 'B' Position Sensor Circuit 'A' High",
-    "P0C59": "Drive Motor 'B' Position Sensor Circuit 'A' Intermittent/Erratic",
-    "P0C5A": "Drive Motor 'A' Position Sensor Circuit 'B'",
-    "P0C5B": "Drive Motor 'A' Position Sensor Circuit 'B' Range/Performance",
-    "P0C5C": "Drive Motor 'A' Position Sensor Circuit 'B' Low",
-    "P0C5D": "Drive Motor 'A' Position Sensor Circuit 'B' High",
-    "P0C5E": "Drive Motor 'A' Position Sensor Circuit 'B' Intermittent/Erratic",
-    "P0C5F": "Drive Motor 'B' Position Sensor Circuit 'B'",
-    "P0C60": "Drive Motor 'B' Position Sensor Circuit 'B' Range/Performance",
-    "P0C61": "Drive Motor 'B' Position Sensor Circuit 'B' Low",
-    "P0C62": "Drive Motor 'B' Position Sensor Circuit 'B' High",
-    "P0C63": "Drive Motor 'B' Position Sensor Circuit 'B' Intermittent/Erratic",
-    "P0C64": "Generator Position Sensor Circuit 'A'",
-    "P0C65": "Generator Position Sensor Circuit 'A' Range/Performance",
-    "P0C66": "Generator Position Sensor Circuit 'A' Low",
-    "P0C67": "Generator Position Sensor Circuit 'A' High",
-    "P0C68": "Generator Position Sensor Circuit 'A' Intermittent/Erratic",
-    "P0C69": "Generator Position Sensor Circuit 'B'",
-    "P0C6A": "Generator Position Sensor Circuit 'B' Range/Performance",
-    "P0C6B": "Generator Position Sensor Circuit 'B' Low",
-    "P0C6C": "Generator Position Sensor Circuit 'B' High",
-    "P0C6D": "Generator Position Sensor Circuit 'B' Intermittent/Erratic",
-    "P0C6E": "Hybrid Battery Temperature Sensor 'A'/'B' Correlation",
-    "P0C6F": "Hybrid Battery Temperature Sensor 'B'/'C' Correlation",
-    "P0C70": "Hybrid Battery Temperature Sensor 'C'/'D' Correlation",
-    "P0C71": "Hybrid Battery Temperature Sensor 'D'/'E' Correlation",
-    "P0C72": "Hybrid Battery Temperature Sensor 'E'/'F' Correlation",
-    "P0C73": "Motor Electronics Coolant Pump 'A' Control Performance",
-    "P0C74": "Motor Electronics Coolant Pump 'B' Control Performance",
-    "P0C75": "Hybrid Battery System Discharge Time Too Short",
-    "P0C76": "Hybrid Battery System Discharge Time Too Long",
-    "P0C77": "Hybrid Battery System Precharge Time Too Short",
-    "P0C78": "Hybrid Battery System Precharge Time Too Long",
-    "P0C79": "Drive Motor 'A' Inverter Voltage Too High",
-    "P0C7A": "Drive Motor 'B' Inverter Voltage Too High",
-    "P0C7B": "Generator Inverter Voltage Too High",
-    "P0C7C": "Hybrid Battery Temperature Sensor 'G' Circuit",
-    "P0C7D": "Hybrid Battery Temperature Sensor 'G' Range/Performance",
-    "P0C7E": "Hybrid Battery Temperature Sensor 'G' Circuit Low",
-    "P0C7F": "Hybrid Battery Temperature Sensor 'G' Circuit High",
-    "P0C80": "Hybrid Battery Temperature Sensor 'G' Circuit Intermittent/Erratic",
-    "P0C81": "Hybrid Battery Temperature Sensor 'H' Circuit",
-    "P0C82": "Hybrid Battery Temperature Sensor 'H' Range/Performance",
-    "P0C83": "Hybrid Battery Temperature Sensor 'H' Circuit Low",
-    "P0C84": "Hybrid Battery Temperature Sensor 'H' Circuit High",
-    "P0C85": "Hybrid Battery Temperature Sensor 'H' Circuit Intermittent/Erratic",
-    "P0C86": "Hybrid Battery Temperature Sensor 'F'/'G' Correlation",
-    "P0C87": "Hybrid Battery Temperature Sensor 'G'/'H' Correlation",
-}
-
-P1_ERRORS = {
-    "P1000": "On Board Diagnostic System Readiness Test Not Complete",
-    "P1022": "Throttle Pedal Position Sensor/Switch (TPS) A Circuit Low Input",
-    "P1100": "MAF Sensor Intermittent/ Check of all OBDII Systems Not Complete",
-    "P1101": "MAF Sensor Out Of Self Test Range./KOER Not Able To Complete KOER Aborted",
-    "P1102": "MAF Sensor In Range But Lower Than Expected",
-    "P1103": "MAF Sensor In Range But Higher Than Expected",
-    "P1104": "MAF Ground Malfunction",
-    "P1105": "Dual Alternator Upper Fault",
-    "P1106": "Dual Alternator Lower Fault/ Manifold Absolute Pressure (MAP) Sensor Circuit Intermittent High Voltage",
-    "P1107": "Dual Alternator Lower Circuit Malfunction/ Manifold Absolute Pressure (MAP) Sensor Circuit Intermittent "
-             "Low Voltage",
-    "P1108": "Dual Alternator Battery Lamp Circuit Malfunction",
-    "P1109": "IAT - B Sensor Intermittent",
-    "P1110": "IAT Sensor (D/C) Open/Short",
-    "P1111": "Intake Air Temperature (IAT) Sensor Circuit Intermittent High Voltage",
-    "P1112": "Intake Air Temperature (IAT) Sensor Circuit Intermittent Low Voltage",
-    "P1113": "IAT Sensor Open/Short",
-    "P1114": "Engine Coolant Temperature (ECT) Sensor Circuit Intermittent Low Voltage/IAT - B Circuit Low Input",
-    "P1115": "Engine Coolant Temperature (ECT) Sensor Circuit Intermittent High Voltage/IAT - B Circuit High Input",
-    "P1116": "Engine Coolant sensor out of range/ECT Sensor Out Of Self Test Range",
-    "P1117": "Engine Coolant Sensor intermittent/ECT Sensor Intermittent",
-    "P1118": "Manifold Absolute Temperature Circuit Low Input",
-    "P1119": "Manifold Absolute Temperature Circuit High Input",
-    "P1120": "Throttle Position Sensor Out Of Range",
-    "P1121": "Electric Throttle Control Actuator",
-    "P1122": "Throttle Position (TP) Sensor Circuit Intermittent Low Voltage",
-    "P1123": "Throttle Position Sensor In Range But Higher Than Expected",
-    "P1124": "Throttle Position Sensor Out Of Self Test Range",
-    "P1125": "Accelerator/Throttle Pedal Position Sensor Fault",
-    "P1126": "Throttle Position (Narrow Range) Sensor Circuit Malfunction",
-    "P1127": "Exhaust Not Warm, Downstream O2 Sensor",
-    "P1128": "Upstream Heated O2 Sensors Swapped",
-    "P1129": "Downstream Heated O2 Sensors Swapped",
-    "P1130": "Air/Fuel Ratio Sensor Circuit Range/Performance Malfunction Bank 1 Sensor 1",
-    "P1131": "Lack Of HO2S Switch - Sensor Indicates Lean",
-    "P1132": "Lack Of HO2S Switch - Sensor Indicates Rich",
-    "P1133": "HO2S Insufficient Switching Sensor 1",
-    "P1134": "HO2S Transition Time Ratio Sensor 1",
-    "P1135": "Pedal Position Sensor A Circuit Intermittent",
-    "P1136": "Fan Control Circuit Malfunction",
-    "P1137": "Lack Of HO2S Switch - Sensor Indicates Lean",
-    "P1138": "Lack Of HO2S12 Switch - Sensor Indicates Rich",
-    "P1139": "Water In Fuel Indicator Circuit Malfunction",
-    "P1140": "Water In Fuel Condition",
-    "P1141": "Fuel Restriction Indicator Circuit Malfunction",
-    "P1142": "Fuel Restriction Condition",
-    "P1143": "Air Assist Control Valve Range/Performance",
-    "P1144": "Air Assist Control Valve Circuit Malfunction",
-    "P1148": "Closed Loop Control Function Bank 1",
-    "P1150": "Lack Of HO2S21 Switch - Adaptive Fuel At Limit",
-    "P1151": "Lack Of HO2S21 Switch - Sensor Indicates Lean",
-    "P1152": "Lack Of HO2S21 Switch - Sensor Indicates Rich",
-    "P1153": "HO2S Insufficient Switching Bank 2 Sensor 1",
-    "P1154": "Bank 2 Fuel Control Shifted Rich",
-    "P1155": "Alternative Fuel Controller",
-    "P1156": "Fuel Select Switch Malfunction",
-    "P1157": "Lack Of HO2S22 Switch - Sensor Indicates Lean",
-    "P1158": "Lack Of HO2S22 Switch - Sensor Indicates Rich",
-    "P1159": "Fuel Stepper Motor Malfunction",
-    "P1167": "Invalid Test,throttle not depressed",
-    "P1168": "Fuel Rail Sensor In-Range Low Failure",
-    "P1169": "Fuel Rail Sensor In-Range High Failure",
-    "P1170": "ESO - Engine Shut Off Solenoid Fault",
-    "P1171": "Rotor Sensor Fault",
-    "P1172": "Rotor Control Fault",
-    "P1173": "Rotor Calibration Fault",
-    "P1174": "Fuel Pump A Low Flow/Performance",
-    "P1175": "Cam Control Fault",
-    "P1176": "Cam Calibration Fault",
-    "P1177": "Synchronization Fault",
-    "P1178": "( open )",
-    "P1180": "Fuel Delivery System Malfunction - Low",
-    "P1181": "Fuel Delivery System Malfunction - High",
-    "P1182": "Fuel Shut Off Solenoid Malfunction",
-    "P1183": "Engine Oil Temperature Circuit Malfunction",
-    "P1184": "Engine Oil Temperature Out Of Self Test Range",
-    "P1185": "FTS High - Fuel Pump Temperature Sensor High",
-    "P1186": "FTS Low - Fuel Pump Temperature Sensor Low",
-    "P1187": "Variant Selection",
-    "P1188": "Calibration Memory Fault",
-    "P1189": "Pump Speed Signal Fault",
-    "P1190": "Calibration Resistor Out Of Range",
-    "P1191": "Key Line Voltage",
-    "P1192": "Voltage External",
-    "P1193": "EGR Drive Overcurrent",
-    "P1194": "ECU A/D Converter",
-    "P1195": "SCP HBCC Failed To Initialize",
-    "P1196": "Key Off Voltage High",
-    "P1197": "Key Off Voltage Low",
-    "P1198": "Pump Rotor Control Underfueling",
-    "P1199": "Fuel Level Input Circuit Low",
-    "P1200": "Injector Control Circuit",
-    "P1201": "Injector Circuit Open / Shorted - Cylinder #1",
-    "P1202": "Injector Circuit Open / Shorted - Cylinder #2",
-    "P1203": "Injector Circuit Open / Shorted - Cylinder #3",
-    "P1204": "Injector Circuit Open / Shorted - Cylinder #4",
-    "P1205": "Injector Circuit Open / Shorted - Cylinder #5",
-    "P1206": "Injector Circuit Open / Shorted - Cylinder #6",
-    "P1209": "Injector Control Pressure System Fault",
-    "P1210": "Injector Control Pressure Above Expected Level",
-    "P1211": "Injector Control Pressure Sensor Above / Below Desired",
-    "P1212": "Injector Control Pressure Not Detected During Crank",
-    "P1213": "Start Injector Circuit Malfunction",
-    "P1214": "Pedal Position Sensor B Circuit Intermittent",
-    "P1215": "Pedal Position Sensor C Circuit Low Input",
-    "P1216": "Pedal Position Sensor C Circuit High Input",
-    "P1217": "Pedal Position Sensor C Circuit Intermittent",
-    "P1218": "CID High",
-    "P1219": "CID Low",
-    "P1220": "Series Throttle Control System Malfunction",
-    "P1221": "Traction Control System Malfunction",
-    "P1222": "Traction Control Output Circuit Malfunction",
-    "P1223": "Pedal Demand Sensor B Circuit High Input",
-    "P1224": "Throttle Position Sensor B Out Of Self Test Range",
-    "P1225": "Needle Lift Sensor Malfunction",
-    "P1226": "Control Sleeve Sensor Malfunction",
-    "P1227": "Wastegate Failed Closed (Over Pressure)",
-    "P1228": "Wastegate Failed Open (Under Pressure)",
-    "P1229": "Intercooler Pump Driver Fault",
-    "P1230": "Fuel Pump Low Speed Malfunction",
-    "P1231": "Fuel Pump Secondary Circuit Low, High Speed",
-    "P1232": "Fuel Pump Speed Primary Circuit Malfunction",
-    "P1233": "Fuel Pump Driver Module Off Line",
-    "P1234": "Fuel Pump Driver Module Off Line",
-    "P1235": "Fuel Pump Control Out Of Range",
-    "P1236": "Fuel Pump Control Out Of Range",
-    "P1237": "Fuel Pump Secondary Circuit Malfunction",
-    "P1238": "Fuel Pump Secondary Circuit Malfunction",
-    "P1239": "Speed Fuel Pump Positive Feed Fault",
-    "P1240": "Sensor Power Supply Malfunction",
-    "P1241": "Sensor Power Supply Low Input",
-    "P1242": "Sensor Power Supply High Input",
-    "P1243": "Second Fuel Pump Faulty or Ground Fault",
-    "P1244": "Alternator Load Input Failed High",
-    "P1245": "Alternator Load Input Failed Low",
-    "P1246": "Alternator Load Input Failed",
-    "P1247": "Turbo Boost Pressure Low",
-    "P1248": "Turbo Boost Pressure Not Detected",
-    "P1249": "Wastegate Control Valve Performance",
-    "P1250": "PRC Solenoid Circuit Malfunction",
-    "P1251": "Air Mixture Solenoid Circuit Malfunction",
-    "P1252": "Pedal Correlation PDS1 and LPDS High",
-    "P1253": "Pedal Correlation PDS1 and LPDS Low",
-    "P1254": "Pedal Correlation PDS2 and LPDS High",
-    "P1255": "Pedal Correlation PDS2 and LPDS Low",
-    "P1256": "Pedal Correlation PDS1 and HPDS",
-    "P1257": "Pedal Correlation PDS2 and HPDS",
-    "P1258": "Pedal Correlation PDS1 and PDS2",
-    "P1259": "Immobilizer to PCM Signal Error",
-    "P1260": "THEFT Detected, Vehicle Immobilzed",
-    "P1261": "Cylinder #1 High To Low Side Short",
-    "P1262": "Cylinder #2 High To Low Side Short",
-    "P1263": "Cylinder #3 High To Low Side Short",
-    "P1264": "Cylinder #4 High To Low Side Short",
-    "P1265": "Cylinder #5 High To Low Side Short",
-    "P1266": "Cylinder #6 High To Low Side Short",
-    "P1267": "Cylinder #7 High To Low Side Short",
-    "P1268": "Cylinder #8 High To Low Side Short",
-    "P1269": "Immobilizer Code Not Programmed",
-    "P1270": "Engine RPM Or Speed Limiter Reached",
-    "P1271": "Cylinder #1 High To Low Side Open",
-    "P1272": "Cylinder #2 High To Low Side Open",
-    "P1273": "Cylinder #3 High To Low Side Open",
-    "P1274": "Cylinder #4 High To Low Side Open",
-    "P1275": "Cylinder #5 High To Low Side Open",
-    "P1276": "Cylinder #6 High To Low Side Open",
-    "P1277": "Cylinder #7 High To Low Side Open",
-    "P1278": "Cylinder #8 High To Low Side Open",
-    "P1280": "Injection Control Pressure Out Of Range Low",
-    "P1281": "Injection Control Pressure Out Of Range High",
-    "P1282": "Excessive Injection Control Pressure",
-    "P1283": "IPR Circuit Failure",
-    "P1284": "Aborted KOER - ICP Failure",
-    "P1285": "Cylinder Head Over Temperature Condition",
-    "P1286": "Fuel Pulse In Range But Lower Than Expected",
-    "P1287": "Fuel Pulse In Range But Higher Than Expected",
-    "P1288": "Cylinder Head Temp Sensor Out Of Self Test Range",
-    "P1289": "Cylinder Head Temp Sensor High Input",
-    "P1290": "Cylinder Head Temp Sensor Low Input",
-    "P1291": "Injector High Side Short To GND Or VBATT - Bank 1",
-    "P1292": "Injector High Side Short To GND Or VBATT - Bank 2",
-    "P1293": "Injector High Side Open - Bank 1",
-    "P1294": "Target Idle Speed Not Reached Conditions (Chrysler)",
-    "P1295": "Multi-faults - Bank 1 - With Low Side Shorts",
-    "P1296": "Multi-faults - Bank 2 - With Low Side Shorts",
-    "P1297": "Injector High Sides Shorted Together",
-    "P1298": "Injector Circuit Malfunction - Cylinder 3",
-    "P1299": "Cylinder Head Overtemperature Protection Active",
-    "P1300": "Igniter Circuit Malfunction No. 1 (Toyota, Lexus)",
-    "P1301": "Boost Calibration High",
-    "P1302": "Boost Calibration Low",
-    "P1303": "EGR Calibration Fault",
-    "P1304": "EGR Calibration High",
-    "P1305": "EGR Calibration Low",
-    "P1306": "Kickdown Relay Pull - In Circuit Fault",
-    "P1307": "Kickdown Relay Hold Circuit Fault",
-    "P1308": "A/C Clutch Circuit Fault",
-    "P1309": "Misfire Monitor AICE Chip Fault",
-    "P1313": "Misfire Rate Catalyst Damage Fault - Bank 1",
-    "P1314": "Misfire Rate Catalyst Damage Fault - Bank 2",
-    "P1315": "Persistent Misfire",
-    "P1316": "Injector Driver Module Codes Detected",
-    "P1317": "Injector Circuit / IDM Codes Not Updated",
-    "P1326": "KIA Code - Knock Sensor Detection System",
-    "P1336": "Crank / Cam Sensor Range / Performance",
-    "P1340": "Camshaft Position Sensor B Circuit Malfunction",
-    "P1341": "Camshaft Position Sensor B Range / Performance",
-    "P1345": "SGC (Cam Position) Sensor Circuit Malfunction/ Crankshaft Position - Camshaft Position Correlation",
-    "P1346": "Fuel Level Sensor B Circuit Malfunction",
-    "P1347": "Fuel Level Sensor B Range / Performance",
-    "P1348": "Fuel Level Sensor B Circuit Low",
-    "P1349": "Fuel Level Sensor B Circuit High",
-    "P1350": "Fuel Level Sensor B Intermittent/Bypass Line Monitor",
-    "P1351": "IDM Input Circuit Malfunction/ Ignition Coil Control Circuit High Voltage",
-    "P1352": "Ignition Coil A Primary Circuit Malfunction",
-    "P1353": "Ignition Coil B Primary Circuit Malfunction",
-    "P1354": "Ignition Coil C Primary Circuit Malfunction",
-    "P1355": "Ignition Coil D Primary Circuit Malfunction",
-    "P1360": "Ignition Coil A Secondary Circuit Malfunction",
-    "P1361": "Top Dead Center Sensor 1 Intermittent Interruption (Honda, Acura)",
-    "P1362": "Ignition Coil C Secondary Circuit Malfunction",
-    "P1363": "Ignition Coil D Secondary Circuit Malfunction",
-    "P1364": "Ignition Coil Primary Circuit Failure",
-    "P1365": "Ignition Coil Secondary Circuit Failure",
-    "P1366": "Ignition Spare",
-    "P1367": "Ignition Spare",
-    "P1368": "Ignition Spare",
-    "P1369": "Engine Temperature Light Monitor Failure",
-    "P1370": "Insufficient RMP Increase During Spark Test",
-    "P1371": "Ignition Coil - Cylinder 1 - Early Activation Fault",
-    "P1372": "Ignition Coil - Cylinder 2 - Early Activation Fault",
-    "P1373": "Ignition Coil - Cylinder 3 - Early Activation Fault",
-    "P1374": "Crankshaft Position (CKP)/Ignition Coil - Cylinder 4 - Early Activation Fault",
-    "P1375": "Ignition Coil - Cylinder 5 - Early Activation Fault",
-    "P1376": "Ignition Coil - Cylinder 6 - Early Activation Fault",
-    "P1380": "Misfire Detected - Rough Road Data Not Available",
-    "P1381": "Variable Cam Timing Overadvanced (Bank #1)/ Misfire Detected - No Communication with BCM",
-    "P1382": "Variable Cam Timing Solenoid #1 Circuit Malfunction",
-    "P1383": "Variable Cam Timing Overretarded (Bank #1)",
-    "P1384": "VVT Solenoid A Malfunction",
-    "P1385": "Variable Cam Timing Solenoid B Malfunction",
-    "P1386": "Variable Cam Timing Overadvanced (Bank #2)",
-    "P1387": "Variable Cam Timing Solenoid #2 Circuit Malfunction",
-    "P1388": "Variable Cam Timing Overretarded (Bank #2)",
-    "P1389": "Glow Plug Circuit High Side Low Input",
-    "P1390": "Octane Adjust Pin Out Of Self Test Range",
-    "P1391": "Transmission Component Slipping",
-    "P1392": "Glow Plug Circuit High Input (Bank #1)",
-    "P1393": "Glow Plug Circuit Low Input (Bank #2)",
-    "P1394": "Glow Plug Circuit High Input (Bank #2)",
-    "P1395": "Glow Plug Monitor Fault (Bank #1)",
-    "P1396": "Glow Plug Monitor Fault (Bank #2)",
-    "P1397": "System Voltage Out Of Self Test Range",
-    "P1398": "VVT Solenoid B Circuit High Input",
-    "P1399": "Glow Plug Circuit High Side, High Input",
-    "P1400": "DPFE Circuit Low Input",
-    "P1401": "DPFE Circuit High Input",
-    "P1402": "EGR Metering Orifice Restricted",
-    "P1403": "DPFE Sensor Hoses Reversed",
-    "P1404": "IAT - B Circuit Malfunction/ Exhaust Gas Recirculation Closed Position Performance",
-    "P1405": "DPFE Sensor Upstream Hose Off Or Plugged",
-    "P1406": "DPFE Sensor Circuit Downstream Hose",
-    "P1407": "EGR No Flow Detected",
-    "P1408": "EGR Flow Out Of Self Test Range",
-    "P1409": "EVR Control Circuit Malfunction",
-    "P1411": "SAI System Incorrect Downstream Flow Detected",
-    "P1413": "SAI System Monitor Circuit Low Input",
-    "P1414": "SAI System Monitor Circuit High Input",
-    "P1415": "Air Pump Circuit Malfunction/ (AIR) System Bank 1",
-    "P1416": "Port Air Circuit Malfunction/ (AIR) System Bank 2",
-    "P1417": "Port Air Relief Circuit Malfunction",
-    "P1418": "Split Air #1 Circuit Malfunction",
-    "P1419": "Split Air #2 Circuit Malfunction",
-    "P1420": "Catalyst Temperature Sensor Failure",
-    "P1421": "Cold Start Control",
-    "P1422": "EGI Temperature Sensor Failure",
-    "P1423": "EGI Functionality Test Failed",
-    "P1424": "EGI Glow Plug Primary Failure",
-    "P1425": "EGI Glow Plug Secondary Failure",
-    "P1426": "EGI Mini - MAF Failed Out Of Range",
-    "P1427": "EGI Mini - MAF Failed Short Circuit",
-    "P1428": "EGI Mini - MAF Failed Open Circuit",
-    "P1429": "Electric Air Pump Primary Failure",
-    "P1430": "Electric Air Pump Secondary Failure",
-    "P1433": "A/C Refrigerant Temperature Circuit Low",
-    "P1434": "A/C Refrigerant Temperature Circuit High",
-    "P1435": "A/C Refrigerant Temperature Circuit Range/Performance",
-    "P1436": "A/C Evaporator Air Temperature Circuit Low",
-    "P1437": "A/C Evaporator Air Temperature Circuit High",
-    "P1438": "A/C Evaporator Air Temperature Circuit Range/Performance",
-    "P1439": "Floor Temperature Switch Circuit Malfunction",
-    "P1440": "Purge Valve Stuck Open",
-    "P1441": "Evaporative Emission Control (EVAP) System Leak",
-    "P1442": "Evaporative Emission Control System Leak Detected",
-    "P1443": "Evaporative Emission System Control Valve Low/No Flow",
-    "P1444": "Purge Flow Sensor Circuit Low Input",
-    "P1445": "Purge Flow Sensor Circuit High Input",
-    "P1446": "Evaporative Vac Solenoid Circuit Malfunction",
-    "P1447": "ELC System Closure Valve Flow Fault",
-    "P1448": "ELC System 2 Fault",
-    "P1449": "Evaporative Check Solenoid Circuit Malfunction",
-    "P1450": "Unable To Bleed Up Fuel Tank Vacuum",
-    "P1451": "Evap Emission Control Sys Vent Control Valve Circuit",
-    "P1452": "Unable To Bleed - Up Vacuum in Tank",
-    "P1453": "Fuel Tank Pressure Relief Valve Malfunction",
-    "P1454": "Evaporative System Vacuum Test Malfunction",
-    "P1455": "Evap Emission Control Sys Leak Detected (Gross Leak/No Flow)",
-    "P1456": "Fuel Tank Temperature Sensor Circuit Malfunction",
-    "P1457": "Unable To Pull Vacuum In Tank",
-    "P1460": "Wide open throttle A/C cutoff relay circuit",
-    "P1461": "A/C pressure sensor circuit voltage low",
-    "P1462": "A/C pressure sensor circuit voltage high",
-    "P1463": "A/C Pressure Sensor Insufficient Pressure Change",
-    "P1464": "A/C Demand Out of Self Test Range",
-    "P1465": "A/C Relay Circuit Malfunction",
-    "P1466": "A/C Refrigerant Temperature Sensor/Circuit Malfunction",
-    "P1467": "A/C Compressor Temperature Sensor Malfunction",
-    "P1468": "SSPOD Open Circuit or Closed Circuit Fault",
-    "P1469": "Low A/C Cycling Period",
-    "P1470": "A/C Cycling Period Too Short",
-    "P1471": "Electrodrive Fan 1 Operational Failure (Driver Side)",
-    "P1472": "Electrodrive Fan 2 Operational Failure (Passenger Side)",
-    "P1473": "Fan Secondary High With Fan(s) Off",
-    "P1474": "Low Fan Control Primary Circuit Malfunction",
-    "P1475": "Fan Relay (Low) Circuit Malfunction",
-    "P1476": "Fan Relay (High) Circuit Malfunction",
-    "P1477": "Additional Fan Relay Circuit Malfunction",
-    "P1478": "Cooling Fan Driver Fault",
-    "P1479": "High Fan Control Primary Circuit Malfunction",
-    "P1480": "Fan Secondary Low with Low Fan On",
-    "P1481": "Fan Secondary Low With High Fan On",
-    "P1482": "SCP",
-    "P1483": "Power To Fan Circuit Overcurrent",
-    "P1484": "Open Power To Ground VCRM",
-    "P1485": "EGRV Circuit Malfunction",
-    "P1486": "EGRA Circuit Malfunction",
-    "P1487": "EGRCHK Solenoid Circuit Malfunction",
-    "P1490": "Secondary Air Relief Solenoid Circuit Malfunction",
-    "P1491": "Exhaust Gas Recirculation Valve Insufficient Lift",
-    "P1492": "APLSOL Solenoid Circuit Malfunction",
-    "P1493": "RCNT Solenoid Circuit Malfunction",
-    "P1494": "SPCUT Solenoid Circuit Malfunction",
-    "P1495": "TCSPL Solenoid Circuit Malfunction",
-    "P1500": "Vehicle Speed Sensor Intermittent",
-    "P1501": "Vehicle Speed Sensor Out Of Self Test Range",
-    "P1502": "Vehicle Speed Sensor Intermittent Malfunction",
-    "P1503": "Auxillary Speed Sensor Fault",
-    "P1504": "Idle Air Control Circuit Malfunction",
-    "P1505": "Idle Speed Control Actuator Signal Low",
-    "P1506": "Idle Air Control Overspeed Error",
-    "P1507": "Idle Air Control Underspeed Error",
-    "P1508": "Idle Control System Circuit Open",
-    "P1509": "Idle Control System Circuit Shorted",
-    "P1510": "Idle Signal Circuit Malfunction",
-    "P1511": "Idle Switch (Electric Control Throttle) Circuit Malfunction",
-    "P1512": "Intake Manifold Runner Control (Bank 1) Stuck Closed",
-    "P1513": "Intake Manifold Runner Control (Bank 2) Stuck Closed",
-    "P1514": "High Load Neutral/Drive Fault",
-    "P1515": "Electric Current Circuit Malfunction",
-    "P1516": "IMRC Input Error (Bank 1)",
-    "P1517": "IMRC Input Error (Bank 2)",
-    "P1518": "Intake Manifold Runner Control (Stuck Open)",
-    "P1519": "Intake Manifold Runner Control (Stuck Closed)",
-    "P1520": "Intake Manifold Runner Control Circuit Malfunction",
-    "P1521": "Variable Intake Solenoid #1 Circuit Malfunction",
-    "P1522": "Variable Intake Solenoid #2 Circuit Malfunction",
-    "P1523": "IVC Solenoid Circuit Malfunction",
-    "P1524": "Variable Intake Solenoid System",
-    "P1525": "Air Bypass Valve System",
-    "P1526": "Air Bypass System",
-    "P1527": "Accelerate Warmup Solenoid Circuit Malfunction",
-    "P1528": "Subsidiary Throttle Valve Solenoid Circuit Malfunction",
-    "P1529": "SCAIR Solenoid Circuit Malfunction",
-    "P1530": "A/C Clutch Circuit Malfunction",
-    "P1531": "Invalid Test - Accelerator Pedal Movement",
-    "P1532": "IMCC Circuit Malfunction, Bank B",
-    "P1533": "AAI Circuit Malfunction",
-    "P1534": "Inertia Switch Activated",
-    "P1535": "Blower Fan Speed Circuit Range/Performance",
-    "P1536": "Parking Brake Switch Circuit Failure",
-    "P1537": "Intake Manifold Runner Control (Bank 1) Stuck Open",
-    "P1538": "Intake Manifold Runner Control (Bank 2) Stuck Open",
-    "P1539": "Power To A/C Clutch Circuit Overcurrent",
-    "P1540": "Air Bypass Valve Circuit Malfunction",
-    "P1549": "IMCC Circuit Malfunction, Bank B",
-    "P1550": "PSPS Out Of Self Test Range",
-    "P1565": "Speed Control Command Switch Out of Range High",
-    "P1566": "Speed Control Command Switch Out of Range Low",
-    "P1567": "Speed Control Output Circuit Continuity",
-    "P1568": "Speed Control Unable to Hold Speed",
-    "P1571": "Brake Switch Malfunction",
-    "P1572": "Brake Pedal Switch Circuit Malfunction",
-    "P1573": "Throttle Position Not Available",
-    "P1574": "Throttle Position Sensor Disagreement btwn Sensors",
-    "P1575": "Pedal Position Out of Self Test Range",
-    "P1576": "Pedal Position Not Available",
-    "P1577": "Pedal Position Sensor Disagreement btwn Sensors",
-    "P1578": "ETC Power Less Than Demand",
-    "P1579": "ETC In Power Limiting Mode",
-    "P1580": "Electronic Throttle Monitor PCM Override",
-    "P1581": "Electronic Throttle Monitor Malfunction",
-    "P1582": "Electronic Throttle Monitor Data Available",
-    "P1583": "Electronic Throttle Monitor Cruise Disable",
-    "P1584": "TCU Detected IPE Circuit Malfunction",
-    "P1585": "Throttle Control Unit Malfunction",
-    "P1586": "Throttle Control Unit Throttle Position Malfunction",
-    "P1587": "Throttle Control Unit Modulated Command Malfunction",
-    "P1588": "Throttle Control Unit Detected Loss of Return Spring",
-    "P1589": "TCU Unable To Control Desired Throttle Angle",
-    "P1600": "Loss of KAM Power; Open Circuit",
-    "P1601": "ECM/TCM Serial Communication Error",
-    "P1602": "Immobilizer/ECM Communication Error",
-    "P1603": "EEPROM Malfunction",
-    "P1604": "Code Word Unregestered",
-    "P1605": "Keep Alive Memory Test Failure",
-    "P1606": "ECM Control Relay O/P Circuit Malfunction",
-    "P1607": "MIL O/P Circuit Malfunction",
-    "P1608": "Internal ECM Malfunction",
-    "P1609": "Diagnostic Lamp Driver Fault",
-    "P1610": "SBDS Interactive Codes",
-    "P1611": "SBDS Interactive Codes",
-    "P1612": "SBDS Interactive Codes",
-    "P1613": "SBDS Interactive Codes",
-    "P1614": "SBDS Interactive Codes",
-    "P1615": "SBDS Interactive Codes",
-    "P1616": "SBDS Interactive Codes",
-    "P1617": "SBDS Interactive Codes",
-    "P1618": "SBDS Interactive Codes",
-    "P1619": "SBDS Interactive Codes",
-    "P1620": "SBDS Interactive Codes",
-    "P1621": "Control Module Long Term Memory Performance/ Immobilizer Code Words Do Not Match",
-    "P1622": "Immobilizer ID Does Not Match",
-    "P1623": "Immobilizer Code Word/ID Number Write Failure",
-    "P1624": "Anti Theft System",
-    "P1625": "B+ Supply To VCRM Fan Circuit Malfunction",
-    "P1626": "Theft Deterrent Fuel Enable Signal Not Received/ B+ Supply To VCRM A/C Circuit Malfunction",
-    "P1627": "Module Supply Voltage Out Of Range",
-    "P1628": "Module Ignition Supply Input Malfunction",
-    "P1629": "Internal Voltage Regulator Malfunction",
-    "P1630": "Internal Vref Malfunction",
-    "P1631": "Theft Deterrent Start Enable Signal Not Correct/ Main Relay Malfunction (Power Hold)",
-    "P1632": "Smart Alternator Faults Sensor/Circuit Malfunction",
-    "P1633": "Keep Alive Power Voltage Too Low",
-    "P1634": "Data Output Link Circuit Failure",
-    "P1635": "Tire / Axle Ratio Out of Acceptable Range",
-    "P1636": "Inductive Signature Chip Communication Error",
-    "P1637": "Can Link ECM/ABSCM Circuit / Network Malfunction",
-    "P1638": "Can Link ECM/INSTM Circuit / Network Malfunction",
-    "P1639": "Vehicle ID Block Corrupted or Not Programmed",
-    "P1640": "Powertrain DTCs Available in Another Module",
-    "P1641": "Fuel Pump Primary Circuit Failure",
-    "P1642": "Fuel Pump Monitor Circuit High Input",
-    "P1643": "Fuel Pump Monitor Circuit Low Input",
-    "P1644": "Fuel Pump Speed Control Circuit Malfunction",
-    "P1645": "Fuel Pump Resistor Switch Circuit Malfunction",
-    "P1650": "PSP Switch Out of Self Test Range",
-    "P1651": "PSP Switch Input Malfunction",
-    "P1652": "IAC Monitor Disabled by PSP Switch Failed On",
-    "P1653": "Power Steering Output Circuit Malfunction",
-    "P1654": "Recirculation Override Circuit Malfunction",
-    "P1655": "Starter Disable Circuit Malfunction",
-    "P1660": "Output Circuit Check Signal High",
-    "P1661": "Output Circuit Check Signal Low",
-    "P1662": "IDM_EN Circuit Failure",
-    "P1663": "Fuel Demand Command Signal Circuit Malfunction",
-    "P1667": "CI Circuit Malfunction",
-    "P1668": "PCM - IDM Communications Error",
-    "P1670": "Electronic Feedback Signal Not Detected",
-    "P1680": "Metering Oil Pump Malfunction",
-    "P1681": "Metering Oil Pump Malfunction",
-    "P1682": "Ignition 1 Switch Circuit 2",
-    "P1683": "Metering Oil Pump Temperature Sensor Circuit Malfunction",
-    "P1684": "Metering Oil Pump Position Sensor Circuit Malfunction",
-    "P1685": "Metering Oil Pump Stepping Motor Circuit Malfunction",
-    "P1686": "Metering Oil Pump Stepping Motor Circuit Malfunction",
-    "P1687": "Metering Oil Pump Stepping Motor Circuit Malfunction",
-    "P1688": "Metering Oil Pump Stepping Motor Circuit Malfunction",
-    "P1689": "Oil Pressure Control Solenoid Circuit Malfunction",
-    "P1690": "Wastegate Solenoid Circuit Malfunction",
-    "P1691": "Turbo Pressure Control Solenoid Circuit Malfunction",
-    "P1692": "Turbo Control Solenoid Circuit Malfunction",
-    "P1693": "Turbo Charge Control Circuit Malfunction",
-    "P1694": "Turbo Charge Relief Circuit Malfunction",
-    "P1700": "Transmission Indeterminate Failure (Failed to Neutral)",
-    "P1701": "Reverse Engagement Error",
-    "P1702": "TRS Circuit Intermittent Malfunction",
-    "P1703": "Brake Switch Out Of Self Test Range",
-    "P1704": "Digital TRS Failed to Transition States in KOEO / KOER",
-    "P1705": "Not in P or N During KOEO / KOER",
-    "P1706": "High Vehicle Speed Observed in Park",
-    "P1707": "Transfer Case Neutral Indicator Hard Fault Present",
-    "P1708": "Clutch Switch Circuit Malfunction",
-    "P1709": "PNP Switch Out Of Self Test Range",
-    "P1711": "TFT Sensor Out Of Self Test Range",
-    "P1712": "Trans Torque Reduction Request Signal Malfunction",
-    "P1713": "TFT Sensor In Range Failure Low Value",
-    "P1714": "SSA Inductive Signature Malfunction",
-    "P1715": "SSB Inductive Signature Malfunction",
-    "P1716": "SSC Inductive Signature Malfunction",
-    "P1717": "Transmission Range Switch Circuit Open",
-    "P1718": "TFT Sensor In Range Failure High",
-    "P1720": "Vehicle Speed (Meter) Circuit Malfunction",
-    "P1721": "Gear 1 Incorrect Ratio",
-    "P1722": "Gear 2 Incorrect Ratio",
-    "P1723": "Gear 3 incorrect Ratio",
-    "P1724": "Gear 4 Incorrect Ratio",
-    "P1725": "Insufficient Engine Speed Increase During Self Test",
-    "P1726": "Insufficient Engine Speed Decrease During Self Test",
-    "P1727": "Coast Clutch Solenoid Inductive Signature Malfunction",
-    "P1728": "Transmission Slip Error",
-    "P1729": "4x4 Low Switch Error",
-    "P1730": "Gear Control Malfunction 2,3,5",
-    "P1731": "1-2 Shift Malfunction",
-    "P1732": "2-3 Shift Malfunction",
-    "P1733": "3-4 Shift Malfunction",
-    "P1734": "Gear Control Malfunction",
-    "P1735": "First Gear Switch Circuit Malfunction",
-    "P1736": "Second Gear Switch Circuit Malfunction",
-    "P1737": "Lockup Solenoid System",
-    "P1738": "Shift Time Error",
-    "P1739": "Slip Solenoid System",
-    "P1740": "Torque Converter Clutch Inductive Signature Malfunction",
-    "P1741": "Torque Converter Clutch Control Error",
-    "P1742": "Torque Converter Clutch Solenoid Failed On",
-    "P1743": "Torque Converter Clutch Solenoid Failied On",
-    "P1744": "Torque Converter Clutch System Performance",
-    "P1745": "Line Pressure Solenoid System",
-    "P1746": "Pressure Control Solenoid 'A' Open Circuit",
-    "P1747": "Pressure Control Solenoid 'A' Short Circuit",
-    "P1748": "EPC Malfunction",
-    "P1749": "Pressure Control Solenoid Failed Low",
-    "P1751": "Shift Solenoid A Performance",
-    "P1754": "Coast Clutch Solenoid Circuit Malfunction",
-    "P1755": "Intermediate Speed Sensor (ISS) Malfunction",
-    "P1756": "Shift Solenoid B Performance",
-    "P1760": "Pressure Control Solenoid 'A' Short Circuit",
-    "P1761": "Shift Solenoid C Performance",
-    "P1762": "Overdrive Band Failed Off",
-    "P1765": "Timing Solenoid Circuit Malfunction",
-    "P1767": "Torque Converter Clutch Circuit Malfunction",
-    "P1768": "Performance / Normal / Winter Mode Input Malfunction",
-    "P1769": "AG4 Transmission Torque Modulation Fault",
-    "P1770": "Clutch Solenoid Circuit Malfunction",
-    "P1775": "Transmission System MIL Fault",
-    "P1776": "Ignition Retard Request Duration Fault",
-    "P1777": "Ignition Retard Request Circuit Fault",
-    "P1778": "Step Motor Function",
-    "P1779": "TCIL Circuit Malfunction",
-    "P1780": "Trans Control Switch (O/D Cancel) Out of Self Test Range",
-    "P1781": "4X4 Switch Out of Self Test Range",
-    "P1782": "P/ES Circuit Out Of Self Test Range",
-    "P1783": "Transmission Overtemperature Condition",
-    "P1784": "Transmission Mechanical Failure - First And Reverse",
-    "P1785": "Transmission Mechanical Failure - First And Second",
-    "P1786": "3-2 Downshift Error",
-    "P1787": "2-1 Downshift Error",
-    "P1788": "Pressure Control Solenoid 'B' Open Circuit",
-    "P1789": "Pressure Control Solenoid 'B' Short Circuit",
-    "P1790": "TP (Mechanical) Circuit Malfunction",
-    "P1791": "TP (Electric) Circuit Malfunction",
-    "P1792": "Barometer Pressure Circuit Malfunction",
-    "P1793": "Intake Air Volume Circuit Malfunction",
-    "P1794": "Battery Voltage Circuit Malfunction",
-    "P1795": "Idle Switch Circuit Malfunction",
-    "P1796": "Kick Down Switch Circuit Malfunction",
-    "P1797": "Neutral Switch Circuit Malfunction",
-    "P1798": "Coolant Temperature Circuit Malfunction",
-    "P1799": "Hold Switch Circuit Malfunction",
-    "P1800": "Variable Intake Air System Control Solenoid Valve Circuit",
-    "P1801": "Transmission Clutch Interlock Safety Switch Open Circuit",
-    "P1802": "Transmission Clutch Interlock Safety Switch Short Circuit To Battery",
-    "P1803": "Transmission Clutch Interlock Safety Switch Short Circuit To Ground",
-    "P1804": "Transmission 4-Wheel Drive High Indicator Circuit Failure",
-    "P1805": "Transmission 4-Wheel Drive High Indicator Open Circuit",
-    "P1806": "Transmission 4-Wheel Drive High Indicator Short Circuit To Battery",
-    "P1807": "Transmission 4-Wheel Drive High Indicator Short Circuit To Ground",
-    "P1808": "Transmission 4-Wheel Drive Low Indicator Circuit Failure",
-    "P1809": "Transmission 4-Wheel Drive Low Indicator Open Circuit",
-    "P1810": "Transmission Fluid Pressure Manual Valve Position Switch",
-    "P1811": "Maximum Adaptive & Long Term Shift",
-    "P1812": "Transmission 4-Wheel Drive Mode Select Circuit Failure",
-    "P1813": "Transmission 4-Wheel Drive Mode Select Open Circuit",
-    "P1814": "Transmission 4-Wheel Drive Mode Select Short Circuit To Battery",
-    "P1815": "Transmission 4-Wheel Drive Mode Select Short Circuit To Ground",
-    "P1816": "Transmission Neutral Safety Switch Circuit Failure",
-    "P1817": "Transmission Neutral Safety Switch Open Circuit",
-    "P1818": "Transmission Neutral Safety Switch Short Circuit To Battery",
-    "P1819": "Transmission Neutral Safety Switch Short Circuit To Ground",
-    "P1820": "Transmission Transfer Case Clockwise Shift Relay Coil Circuit Failure",
-    "P1821": "Transmission Transfer Case Clockwise Shift Relay Coil Open Circuit",
-    "P1822": "Transmission Transfer Case Clockwise Shift Relay Coil Short Circuit To Battery",
-    "P1823": "Transmission Transfer Case Clockwise Shift Relay Coil Short Circuit To Ground",
-    "P1824": "Transmission 4-Wheel Drive Clutch Relay Circuit Failure",
-    "P1825": "Transmission 4-Wheel Drive Clutch Relay Open Circuit",
-    "P1826": "Transmission 4-Wheel Drive Low Clutch Relay Circuit To Battery",
-    "P1827": "Transmission 4-Wheel Drive Low Clutch Relay Circuit To Ground",
-    "P1828": "Transmission Transfer Case Counter Clockwise Shift Relay Coil Circuit Failure",
-    "P1829": "Transmission Transfer Case Counter Clockwise Shift Relay Coil Open Circuit",
-    "P1830": "Transmission Transfer Case Counter Clockwise Shift Relay Coil Short Circuit To Battery",
-    "P1831": "Transmission Transfer Case Counter Clockwise Shift Relay Coil Short Circuit To Ground",
-    "P1832": "Transmission Transfer Case Differential Lock-Up Solenoid Circuit Failure",
-    "P1833": "Transmission Transfer Case Differential Lock-Up Solenoid Open Circuit",
-    "P1834": "Transmission Transfer Case Differential Lock-Up Solenoid Short Circuit To Battery",
-    "P1835": "Transmission Transfer Case Differential Lock-Up Solenoid Short Circuit To Ground",
-    "P1836": "Transmission Transfer Case Front Shaft Speed Sensor Circuit Failure",
-    "P1837": "Transmission Transfer Case Rear Shaft Speed Sensor Circuit Failure",
-    "P1838": "Transmission Transfer Case Shift Motor Circuit Failure",
-    "P1839": "Transmission Transfer Case Shift Motor Open Circuit",
-    "P1840": "Transmission Transfer Case Shift Motor Short Circuit To Battery",
-    "P1841": "Transmission Transfer Case Shift Motor Short Circuit To Ground",
-    "P1842": "Transmission Transfer Case Differential Lock-Up Feedback Switch Circuit Failure",
-    "P1843": "Transmission Transfer Case Differential Lock-Up Feedback Switch Open Circuit",
-    "P1844": "Transmission Transfer Case Differential Lock-Up Feedback Switch Short Circuit To Battery",
-    "P1845": "Transmission Transfer Case Differential Lock-Up Feedback Switch Short Circuit To Ground",
-    "P1846": "Transmission Transfer Case Contact Plate 'A' Circuit Failure",
-    "P1847": "Transmission Transfer Case Contact Plate 'A' Open Circuit",
-    "P1848": "Transmission Transfer Case Contact Plate 'A' Short Circuit To Battery",
-    "P1849": "Transmission Transfer Case Contact Plate 'A' Short Circuit To Ground",
-    "P1850": "Transmission Transfer Case Contact Plate 'B' Circuit Failure",
-    "P1851": "Transmission Transfer Case Contact Plate 'B' Open Circuit",
-    "P1852": "Transmission Transfer Case Contact Plate 'B' Short Circuit To Battery",
-    "P1853": "Transmission Transfer Case Contact Plate 'B' Short Circuit To Ground",
-    "P1854": "Transmission Transfer Case Contact Plate 'C' Circuit Failure",
-    "P1855": "Transmission Transfer Case Contact Plate 'C' Open Circuit",
-    "P1856": "Transmission Transfer Case Contact Plate 'C' Short Circuit To Battery",
-    "P1857": "Transmission Transfer Case Contact Plate 'C' Short Circuit To Ground",
-    "P1858": "Transmission Transfer Case Contact Plate 'D' Circuit Failure",
-    "P1859": "Transmission Transfer Case Contact Plate 'D' Open Circuit",
-    "P1860": "TCC PWM Solenoid Circuit Electrical/ Transmission Transfer Case Contact Plate 'D' Short Circuit To"
-             " Battery",
-    "P1861": "Transmission Transfer Case Contact Plate 'D' Short Circuit To Ground",
-    "P1862": "Transmission Transfer Case Contact Plate Power Circuit Failure",
-    "P1863": "Transmission Transfer Case Contact Plate Power Open Circuit",
-    "P1864": "Transmission Transfer Case Contact Plate Power Short To Battery",
-    "P1865": "Transmission Transfer Case Contact Plate Power Short To Ground",
-    "P1866": "Transmission Transfer Case System Concern - Servicing Required",
-    "P1867": "Transmission Transfer Case Contact Plate General Circuit Failure",
-    "P1868": "Transmission Automatic 4-Wheel Drive Indicator (Lamp) Circuit Failure",
-    "P1869": "Transmission Automatic 4-Wheel Drive Indicator (Lamp) Circuit Short To Battery",
-    "P1870": "Transmission Component Slipping/ Transmission Mechanical Transfer Case 4x4 Switch Circuit Failure",
-    "P1871": "Transmission Mechanical Transfer Case 4x4 Switch Circuit Short To Battery",
-    "P1872": "Transmission Mechanical 4-Wheel Drive Axle Lock Lamp Circuit Failure",
-    "P1873": "Transmission Mechanical 4-Wheel Drive Axle Lock Lamp Circuit Short To Battery",
-    "P1874": "Transmission Automatic Hall Effect Sensor Power Circuit Failure",
-    "P1875": "Transmission Automatic Hall Effect Sensor Power Circuit Short To Battery / 4WD Low Switch Circuit"
-             " Electrical",
-    "P1876": "Transmission Transfer Case 2-Wheel Drive Solenoid Circuit Failure",
-    "P1877": "Transmission Transfer Case 2-Wheel Drive Solenoid Circuit Short To Battery",
-    "P1878": "Transmission Transfer Case Disengaged Solenoid Circuit Failure",
-    "P1879": "Transmission Transfer Case Disengaged Solenoid Open Circuit",
-    "P1880": "Transmission Transfer Case Disengaged Solenoid Short to Battery",
-    "P1881": "Engine Coolant Level Switch Circuit Failure, GEM",
-    "P1882": "Engine Coolant Level Switch Circuit Short to Ground",
-    "P1883": "Engine Coolant Level Switch Circuit Failure, GEM",
-    "P1884": "Engine Coolant Level Lamp Circuit Short to Ground",
-    "P1885": "Transmission Transfer Case Disengaged Solenoid Short to Ground",
-    "P1886": "4X4 Initialization Failure",
-    "P1890": "Transmission 4WD Mode Select Return Input Circuit Failure",
-    "P1891": "Transmission Transfer Case Contact Plate Ground Return Open Circuit",
-    "P1900": "OSS Circuit Intermittent Malfunction",
-    "P1901": "TSS Circuit Intermittent Malfunction",
-    "P1902": "Pressure Control Solenoid 'B' Intermittent Short",
-    "P1903": "Pressure Control Solenoid 'C' Short Circuit",
-    "P1904": "Pressure Control Solenoid 'C' Open Circuit",
-    "P1905": "Pressure Control Solenoid 'C' Intermittent Short",
-    "P1906": "Kickdown Pull Relay Open or Short Circuit to Ground",
-    "P1907": "Kickdown Hold Relay Open or Short Circuit to Ground",
-    "P1908": "Transmission Pressure Circuit Solenoid Open or Short to Ground",
-    "P1909": "Trans Temp Sensor Circuit Open or Shorted to Pwr or Gnd",
-    "P1910": "VFS A Pressure Output Failed Low",
-    "P1911": "VFS B Pressure Output Failed Low",
-    "P1912": "VFS C Pressure Output Failed Low",
-    "P1913": "Pressure Switch A Circuit Malfunction",
-    "P1914": "Manually Shifted Automatic (MSA) Sw Circuit Malf",
-    "P1915": "Reverse Switch Circuit Malfunction",
-    "P1916": "High Clutch Drum Speed Sensor Malfunction",
-    "P1917": "High Clutch Drum Speed Sensor Intermittent",
-    "P1918": "Transmission Range Display Circuit Malfunction",
-}
-
-P2_ERRORS = {
-    "P200A": "Intake Manifold Runner Performance Bank 1",
-    "P228C": "Fuel Pressure Regulator 1 Exceeded Control Limits - Pressure Too Low",
-    "P2000": "NOx Adsorber Efficiency Below Threshold Bank 1",
-    "P2002": "Diesel Particulate Filter Efficiency Below Threshold Bank 1",
-    "P2004": "Intake Manifold Runner Control (IMRC)",
-    "P2006": "Intake Manifold Runner Control Stuck Closed Bank 1",
-    "P2015": "Intake Manifold Runner Position Sensor/Switch Circuit Range/Performance Bank 1",
-    "P2068": "Fuel Level Sensor B Circuit High Input",
-    "P2096": "Post Catalyst Fuel Trim System Too Lean Bank 1",
-    "P2097": "Post Catalyst Fuel Trim System Too Rich Bank 1",
-    "P2098": "Post Catalyst Fuel Trim System Too Lean Bank 2",
-    "P2099": "Post Catalyst Fuel Trim System Too Rich Bank 2",
-    "P20BA": "Reductant Heater A Control Circuit Performance",
-    "P20EE": "SCR NOx Catalyst Efficiency Below Threshold",
-    "P2101": "Engine Control Module (ECM)",
-    "P2106": "Throttle Actuator Control System Forced Limited Power",
-    "P2111": "Throttle Actuator Control System - Stuck Open",
-    "P2122": "Throttle Position Sensor (TPS) or Switch “D” Circuit Low",
-    "P2127": "Throttle Position Sensor E Circuit Low Input",
-    "P2135": "Throttle/Pedal Position Sensor/Switch A / B Voltage Correlation",
-    "P2138": "Throttle/Pedal Position Sensor/Switch D/E Voltage Correlation",
-    "P2175": "Throttle Actuator Control System Low Air Flow Detected",
-    "P2176": "Throttle Actuator Control System - Idle Position Not Learned",
-    "P2181": "Cooling System Performance",
-    "P2182": "Engine Coolant Temperature Sensor 2 Circuit",
-    "P2187": "System Too Lean at Idle DTC",
-    "P2188": "System Too Lean at Idle Bank 1",
-    "P2195": "O2 Sensor Signal Stuck Lean Bank 1 Sensor 1",
-    "P2196": "O2 Sensor Signal Stuck Rich",
-    "P2197": "O2 Sensor Signal Stuck Lean - Bank 2 Sensor 1",
-    "P2198": "O2 Sensor Signal Stuck Rich Bank 2 Sensor 1",
-    "P219A": "Bank 1 Air/Fuel Ratio Imbalance",
-    "P2200": "NOx Sensor Circuit Bank 1",
-    "P2228": "Barometric Pressure Circuit Low",
-    "P2270": "O2 Sensor Signal Stuck Lean Bank 1 Sensor 2",
-    "P2279": "Intake Air System Leak",
-    "P2610": "ECM/PCM Internal Engine Off Timer Performance",
-    "P2635": "Fuel Pump A Low Flow/Performance",
-    "P2646": "Rocker Arm Actuator System Performance",
-    "P2647": "Rocker Arm Actuator System Stuck on Bank 1",
-    "P2509": "PCM Power Input Signal Intermittent",
-    "P2A00": "O2 Sensor Circuit Range/Performance (Bank 1, Sensor 1)",
-}
-
-P3_ERRORS = {
-    "P3000": "Battery Control System Malfunction (Toyota, Lexus)",
-    "P305F": "Dual Battery Control Module Performance",
-    "P3400": "Cylinder Deactivation System Bank 1",
-}
-
-B0_ERRORS = {
-    "B0028": "Right Front Passenger Side Deployment Loop Resistance Low",
-}
-
-B1_ERRORS = {
-    "B1200": "Climate Control Pushbutton Circuit Failure",
-    "B1201": "Fuel Sender Circuit Failure",
-    "B1202": "Fuel Sender Circuit Open",
-    "B1203": "Fuel Sender Circuit Short To Battery",
-    "B1204": "Fuel Sender Circuit Short To Ground",
-    "B1205": "EIC Switch-1 Assembly Circuit Failure",
-    "B1206": "EIC Switch-1 Assembly Circuit Open",
-    "B1207": "EIC Switch-1 Assembly Circuit Short To Battery",
-    "B1208": "EIC Switch-1 Assembly Circuit Short To Ground",
-    "B1209": "EIC Switch-2 Assembly Circuit Failure",
-    "B1210": "EIC Switch-2 Assembly Circuit Open",
-    "B1211": "EIC Switch-2 Assembly Circuit Short To Battery",
-    "B1212": "EIC Switch-2 Assembly Circuit Short To Ground",
-    "B1213": "Anti-Theft Number of Programmed Keys Is Below Minimum",
-    "B1214": "Running Board Lamp Circuit Failure",
-    "B1215": "Running Board Lamp Circuit Short to Battery",
-    "B1216": "Emergency & Road Side Assistance Switch Circuit Short to Ground",
-    "B1217": "Horn Relay Coil Circuit Failure",
-    "B1218": "Horn Relay Coil Circuit Short to Vbatt",
-    "B1219": "Fuel Tank Pressure Sensor Circuit Failure",
-    "B1220": "Fuel Tank Pressure Sensor Circuit Open",
-    "B1222": "Fuel Temperature Sensor #1 Circuit Failure",
-    "B1223": "Fuel Temperature Sensor #1 Circuit Open",
-    "B1224": "Fuel Temperature Sensor #1 Circuit Short to Battery",
-    "B1225": "Fuel Temperature Sensor #1 Circuit Short to Ground",
-    "B1226": "Fuel Temperature Sensor #2 Circuit Failure",
-    "B1227": "Fuel Temperature Sensor #2 Circuit Open",
-    "B1228": "Fuel Temperature Sensor #2 Circuit Short to Battery",
-    "B1229": "Fuel Temperature Sensor #2 Circuit Short to Ground",
-    "B1231": "Longitudinal Acceleration Threshold Exceeded",
-    "B1232": "See Manufacturer",
-    "B1233": "Glass Break Sensor Failure",
-    "B1234": "Mirror Switch Invalid Code",
-    "B1235": "Window Feedback Failure",
-    "B1236": "Window Feedback Loss of Signal",
-    "B1237": "Window Feedback Out of Range",
-    "B1238": "Over Temperature Fault",
-    "B1239": "Air Flow Blend Door Driver Circuit Failure",
-    "B1240": "Wiper Washer Rear Pump Relay Circuit Failure",
-    "B1241": "Wiper Washer Rear Pump Relay Circuit Short to Battery",
-    "B1242": "Air Flow Recirculation Door Driver Circuit Failure",
-    "B1243": "Express Window Down Switch Circuit Short to Battery",
-    "B1244": "Wiper Rear Motor Run Relay Circuit Failure",
-    "B1245": "Wiper Rear Motor Run Relay Circuit Short to Battery",
-    "B1246": "Dim Panel Potentiometer Switch Circuit Failure",
-    "B1247": "Panel Dim Switch Circuit Open",
-    "B1248": "Passenger's Seatback Autoglide Rearward Switch Circuit Short to Ground",
-    "B1249": "Blend Door Failure",
-    "B1250": "Air Temperature Internal Sensor Circuit Failure",
-    "B1251": "Air Temperature Internal Sensor Circuit Open",
-    "B1252": "Air Temperature Internal Sensor Circuit Short To Battery",
-    "B1253": "Air Temperature Internal Sensor Circuit Short To Ground",
-    "B1254": "Air Temperature External Sensor Circuit Failure",
-    "B1255": "Air Temperature External Sensor Circuit Open",
-    "B1256": "Air Temperature External Sensor Circuit Short To Battery",
-    "B1257": "Air Temperature External Sensor Circuit Short To Ground",
-    "B1258": "Solar Radiation Sensor Circuit Failure",
-    "B1259": "Solar Radiation Sensor Circuit Open",
-    "B1260": "Solar Radiation Sensor Circuit Short To Battery",
-    "B1261": "Solar Radiation Sensor Circuit Short To Ground",
-    "B1262": "Servo Motor Defrost Circuit Failure",
-    "B1263": "Servo Motor Vent Circuit Failure",
-    "B1264": "Servo Motor Foot Circuit Failure",
-    "B1265": "Servo Motor Coolair Bypass Circuit Failure",
-    "B1266": "Servo Motor Airintake Left Circuit Failure",
-    "B1267": "Servo Motor Airintake Right Circuit Failure",
-    "B1268": "Servo Motor Potentiometer Defrost Circuit Failure",
-    "B1269": "Servo Motor Potentiometer Defrost Circuit Open",
-    "B1270": "Servo Motor Potentiometer Defrost Circuit Short To Battery",
-    "B1271": "Servo Motor Potentiometer Defrost Circuit Short To Ground",
-    "B1272": "Servo Motor Potentiometer Vent Circuit Failure",
-    "B1273": "Servo Motor Potentiometer Vent Circuit Open",
-    "B1274": "Servo Motor Potentiometer Vent Circuit Short To Battery",
-    "B1275": "Servo Motor Potentiometer Vent Circuit Short To Ground",
-    "B1276": "Servo Motor Potentiometer Foot Circuit Failure",
-    "B1277": "Servo Motor Potentiometer Foot Circuit Open",
-    "B1278": "Servo Motor Potentiometer Foot Circuit Short To Battery",
-    "B1279": "Servo Motor Potentiometer Foot Circuit Short To Ground",
-    "B1280": "Servo Motor Potentiometer Coolair Circuit Failure",
-    "B1281": "Servo Motor Potentiometer Coolair Circuit Open",
-    "B1282": "Servo Motor Potentiometer Coolair Circuit Short To Battery",
-    "B1283": "Servo Motor Potentiometer Coolair Circuit Short To Ground",
-    "B1284": "Servo Motor Potentiometer Airintake Left Circuit Failure",
-    "B1285": "Servo Motor Potentiometer Airintake Left Circuit Open",
-    "B1286": "Servo Motor Potentiometer Airintake Left Circuit Short To Battery",
-    "B1287": "Servo Motor Potentiometer Airintake Left Circuit Short To Ground",
-    "B1288": "Servo Motor Potentiometer Airintake Right Circuit Failure",
-    "B1289": "Servo Motor Potentiometer Airintake Right Circuit Open",
-    "B1290": "Servo Motor Potentiometer Airintake Right Circuit Short To Battery",
-    "B1291": "Servo Motor Potentiometer Airintake Right Circuit Short To Ground",
-    "B1292": "Battery Power Relay Circuit Failure",
-    "B1293": "Battery Power Relay Circuit Open",
-    "B1294": "Battery Power Relay Circuit Short To Battery",
-    "B1295": "Battery Power Relay Circuit Short To Ground",
-    "B1296": "Power Supply Sensor Circuit Failure",
-    "B1297": "Power Supply Sensor Circuit Open",
-    "B1298": "Power Supply Sensor Circuit Short To Battery",
-    "B1299": "Power Supply Sensor Circuit Short To Ground",
-    "B1300": "Power Door Lock Circuit Failure",
-    "B1301": "Power Door Lock Circuit Open",
-    "B1302": "Accessory Delay Relay Coil Circuit Failure",
-    "B1303": "Accessory Delay Relay Coil Circuit Open",
-    "B1304": "Accessory Delay Relay Coil Circuit Short To Battery",
-    "B1305": "Accessory Delay Relay Coil Circuit Short To Ground",
-    "B1306": "Oil Level Switch Circuit Open",
-    "B1307": "Oil Level Switch Circuit Short To Battery",
-    "B1308": "Oil Level Switch Circuit Short To Ground",
-    "B1309": "Power Door Lock Circuit Short To Ground",
-    "B1310": "Power Door Unlock Circuit Failure",
-    "B1311": "Power Door Unlock Circuit Open",
-    "B1312": "Lamp Headlamp Input Circuit Short To Battery",
-    "B1313": "Battery Saver Relay Coil Circuit Failure",
-    "B1314": "Battery Saver Relay Coil Circuit Open",
-    "B1315": "Battery Saver Relay Coil Circuit Short To Battery",
-    "B1316": "Battery Saver Relay Coil Circuit Short To Ground",
-    "B1317": "Battery Voltage High",
-    "B1318": "Battery Voltage Low",
-    "B1319": "Driver Door Ajar Circuit Failure",
-    "B1320": "Driver Door Ajar Circuit Open",
-    "B1321": "Driver Door Ajar Circuit Short To Battery",
-    "B1322": "Driver Door Ajar Circuit Short To Ground",
-    "B1323": "Door Ajar Lamp Circuit Failure",
-    "B1324": "Door Ajar Lamp Circuit Open",
-    "B1325": "Control Module Power Circuit Low/High Voltage",
-    "B1326": "Door Ajar Lamp Circuit Short To Ground",
-    "B1327": "Passenger Door Ajar Circuit Failure",
-    "B1328": "Passenger Door Ajar Circuit Open",
-    "B1329": "Passenger Door Ajar Circuit Short To Battery",
-    "B1330": "Passenger Door Ajar Circuit Short To Ground",
-    "B1331": "Decklid Ajar Rear Door Circuit Failure",
-    "B1332": "Decklid Ajar Rear Door Circuit Open",
-    "B1333": "Decklid Ajar Rear Door Circuit Short To Battery",
-    "B1334": "Decklid Ajar Rear Door Circuit Short To Ground",
-    "B1335": "Door Ajar RR Circuit Failure",
-    "B1336": "Door Ajar RR Circuit Open",
-    "B1337": "Door Ajar RR Circuit Short To Battery",
-    "B1338": "Door Ajar RR Circuit Short To Ground",
-    "B1339": "Chime Input Request Circuit Short To Battery",
-    "B1340": "Chime Input Request Circuit Short To Ground",
-    "B1341": "Power Door Unlock Circuit Short To Ground",
-    "B1342": "ECU Is Defective",
-    "B1343": "Heated Backlite Input Circuit Failure",
-    "B1344": "Heated Backlite Input Circuit Open",
-    "B1345": "Heated Backlite Input Circuit Short To Ground",
-    "B1346": "Heated Backlite Input Circuit Short To Battery",
-    "B1347": "Heated Backlite Relay Circuit Failure",
-    "B1348": "Heated Backlite Relay Circuit Open",
-    "B1349": "Heated Backlite Relay Short To Battery",
-    "B1350": "Heated Backlite Relay Short To Ground",
-    "B1351": "Ignition Key-In Circuit Short To Battery",
-    "B1352": "Ignition Key-In Circuit Failure",
-    "B1353": "Ignition Key-In Circuit Open",
-    "B1354": "Ignition Key-In Circuit Short To Ground",
-    "B1355": "Ignition Run Circuit Failure",
-    "B1356": "Ignition Run Circuit Open",
-    "B1357": "Ignition Run Circuit Short To Battery",
-    "B1358": "Ignition Run Circuit Short To Ground",
-    "B1359": "Ignition Run/Acc Circuit Failure",
-    "B1360": "Ignition Run/Acc Circuit Open",
-    "B1361": "Ignition Run/Acc Circuit Short To Battery",
-    "B1362": "Ignition Run/Acc Circuit Short To Ground",
-    "B1363": "Ignition Start Circuit Failure",
-    "B1364": "Ignition Start Circuit Open",
-    "B1365": "Ignition Start Circuit Short To Battery",
-    "B1366": "Ignition Start Circuit Short To Ground",
-    "B1367": "Ignition Tach Circuit Failure",
-    "B1368": "Ignition Tach Circuit Open",
-    "B1369": "Ignition Tach Circuit Short To Battery",
-    "B1370": "Ignition Tach Circuit Short To Ground",
-    "B1371": "Illuminated Entry Relay Circuit Failure",
-    "B1372": "Illuminated Entry Relay Circuit Open",
-    "B1373": "Illuminated Entry Relay Short To Battery",
-    "B1374": "Illuminated Entry Relay Short To Ground",
-    "B1375": "Oil Change Lamp Circuit Open",
-    "B1376": "Oil Change Lamp Circuit Short To Battery",
-    "B1377": "Oil Change Lamp Circuit Failure",
-    "B1378": "Oil Change Lamp Circuit Short To Ground",
-    "B1379": "Oil Change Reset Button Circuit Short To Ground",
-    "B1380": "Oil Change Reset Button Circuit Failure",
-    "B1381": "Oil Change Reset Button Circuit Open",
-    "B1382": "Oil Change Reset Button Circuit Short To Battery",
-    "B1383": "Oil Level Lamp Circuit Short To Battery",
-    "B1384": "Oil Level Lamp Circuit Failure",
-    "B1385": "Oil Level Lamp Circuit Open",
-    "B1386": "Oil Level Lamp Circuit Short To Ground",
-    "B1387": "Oil Temperature Sensor Circuit Open",
-    "B1388": "Oil Temperature Sensor Circuit Short To Battery",
-    "B1389": "Oil Temperature Sensor Circuit Failure",
-    "B1390": "Oil Temperature Sensor Circuit Short To Ground",
-    "B1391": "Oil Level Switch Circuit Failure",
-    "B1392": "Power Door Memory Lock Relay Circuit Failure",
-    "B1393": "Power Door Memory Lock Relay Circuit Open",
-    "B1394": "Power Door Memory Lock Relay Circuit Short To Battery",
-    "B1395": "Power Door Memory Lock Relay Circuit Short To Ground",
-    "B1396": "Power Door Lock Circuit Short To Battery",
-    "B1397": "Power Door Unlock Circuit Short To Battery",
-    "B1398": "Driver Power Window One Touch Window Relay Circuit Failure",
-    "B1399": "Driver Power Window One Touch Window Relay Circuit Open",
-    "B1400": "Driver Power Window One Touch Window Relay Circuit Short To Battery",
-    "B1401": "Driver Power Window One Touch Window Relay Circuit Short To Ground",
-    "B1402": "Driver Power Window Down Switch Circuit Failure",
-    "B1403": "Driver Power Window Up Switch Circuit Failure",
-    "B1404": "Driver Power Window Down Circuit Open",
-    "B1405": "Driver Power Window Down Circuit Short To Battery",
-    "B1406": "Driver Power Window Down Circuit Short To Ground",
-    "B1407": "Driver Power Window Up Circuit Open",
-    "B1408": "Driver Power Window Up Circuit Short To Battery",
-    "B1409": "Driver Power Window Up Circuit Short To Ground",
-    "B1410": "Driver Power Window Motor Circuit Failure",
-    "B1411": "Driver Power Window Motor Circuit Open",
-    "B1412": "Driver Power Window Motor Circuit Short To Battery",
-    "B1413": "Driver Power Window Motor Circuit Short To Ground",
-    "B1414": "Power Window LR Motor Circuit Failure",
-    "B1415": "Power Window LR Motor Circuit Open",
-    "B1416": "Power Window LR Motor Circuit Short To Battery",
-    "B1417": "Power Window LR Motor Circuit Short To Ground",
-    "B1418": "Passenger Power Window Motor Circuit Failure",
-    "B1419": "Passenger Power Window Motor Circuit Open",
-    "B1420": "Passenger Power Window Motor Circuit Short To Battery",
-    "B1421": "Passenger Power Window Motor Circuit Short To Ground",
-    "B1422": "Power Window RR Motor Circuit Failure",
-    "B1423": "Power Window RR Motor Circuit Open",
-    "B1424": "Power Window RR Motor Circuit Short To Battery",
-    "B1425": "Power Window RR Motor Circuit Short To Ground",
-    "B1426": "Lamp Seat Belt Circuit Short To Battery",
-    "B1427": "Lamp Seat Belt Circuit Open",
-    "B1428": "Lamp Seat Belt Circuit Failure",
-    "B1429": "Lamp Seat Belt Circuit Short To Ground",
-    "B1430": "Seat Belt Switch Circuit Short To Ground",
-    "B1431": "Wiper Brake/Run Relay Circuit Failure",
-    "B1432": "Wiper Brake/Run Relay Circuit Short To Battery",
-    "B1433": "Wiper Brake/Run Relay Circuit Short To Ground",
-    "B1434": "Wiper Hi/Low Speed Relay Coil Circuit Failure",
-    "B1435": "Wiper Hi/Low Speed Relay Coil Circuit Open",
-    "B1436": "Wiper Hi/Low Speed Relay Coil Circuit Short To Battery",
-    "B1437": "Wiper Hi/Low Speed Relay Coil Circuit Short To Ground",
-    "B1438": "Wiper Mode Select Switch Circuit Failure",
-    "B1439": "Wiper Mode Select Switch Circuit Open",
-    "B1440": "Wiper Mode Select Switch Circuit Short To Battery",
-    "B1441": "Wiper Mode Select Switch Circuit Short To Ground",
-    "B1442": "Door Handle Switch Circuit Failure",
-    "B1443": "Door Handle Switch Circuit Open",
-    "B1444": "Door Handle Switch Circuit Short To Battery",
-    "B1445": "Door Handle Switch Circuit Short To Ground",
-    "B1446": "Wiper Park Sense Circuit Failure",
-    "B1447": "Wiper Park Sense Circuit Open",
-    "B1448": "Wiper Park Sense Circuit Short To Battery",
-    "B1449": "Wiper Park Sense Circuit Short To Ground",
-    "B1450": "Wiper Wash/Delay Switch Circuit Failure",
-    "B1451": "Wiper Wash/Delay Switch Circuit Open",
-    "B1452": "Wiper Wash/Delay Switch Circuit Short To Battery",
-    "B1453": "Wiper Wash/Delay Switch Circuit Short To Ground",
-    "B1454": "Wiper Washer Fluid Lamp Circuit Failure",
-    "B1455": "Wiper Washer Fluid Lamp Circuit Open",
-    "B1456": "Wiper Washer Fluid Lamp Circuit Short To Battery",
-    "B1457": "Wiper Washer Fluid Lamp Circuit Short To Ground",
-    "B1458": "Wiper Washer Pump Motor Relay Circuit Failure",
-    "B1459": "Wiper Washer Pump Motor Relay Coil Circuit Open",
-    "B1460": "Wiper Washer Pump Motor Relay Coil Circuit Short To Battery",
-    "B1461": "Wiper Washer Pump Motor Relay Coil Circuit Short To Ground",
-    "B1462": "Seat Belt Switch Circuit Failure",
-    "B1463": "Seat Belt Switch Circuit Open",
-    "B1464": "Seat Belt Switch Circuit Short To Battery",
-    "B1465": "Wiper Brake/Run Relay Circuit Open",
-    "B1466": "Wiper Hi/Low Speed Not Switching",
-    "B1467": "Wiper Hi/Low Speed Circuit Motor Short To Battery",
-    "B1468": "Chime Input Request Circuit Failure",
-    "B1469": "Chime Input Request Circuit Open",
-    "B1470": "Lamp Headlamp Input Circuit Failure",
-    "B1471": "Lamp Headlamp Input Circuit Open",
-    "B1472": "Lamp Headlamp Input Circuit Short To Ground",
-    "B1473": "Wiper Low Speed Circuit Motor Failure",
-    "B1474": "Battery Saver Power Relay Circuit Short To Battery",
-    "B1475": "Accessory Delay Relay Contact Short To Battery",
-    "B1476": "Wiper High Speed Circuit Motor Failure",
-    "B1477": "Wiper Hi/Low Circuit Motor Short To Ground",
-    "B1478": "Power Window One Touch Up/Down Activated Simultaneously",
-    "B1479": "Wiper Washer Fluid Level Sensor Circuit Failure",
-    "B1480": "Wiper Washer Fluid Level Sensor Circuit Open",
-    "B1481": "Wiper Washer Fluid Level Sensor Circuit Short To Battery",
-    "B1482": "Wiper Washer Fluid Level Sensor Circuit Short To Ground",
-    "B1483": "Brake Pedal Input Circuit Failure",
-    "B1484": "Brake Pedal Input Open Circuit",
-    "B1485": "Brake Pedal Input Circuit Battery Short",
-    "B1486": "Brake Pedal Input Circuit Ground Short",
-    "B1487": "Door Handle Right Front Circuit Failure",
-    "B1488": "Door Handle Right Front Circuit Open",
-    "B1489": "Door Handle Right Front Short To Battery",
-    "B1490": "Door Handle Right Front Short To Ground",
-    "B1491": "Ignition Cylinder Sensor Circuit Failure",
-    "B1492": "Ignition Cylinder Sensor Open Circuit",
-    "B1493": "Ignition Cylinder Sensor Battery Short",
-    "B1494": "Ignition Cylinder Sensor Ground Short",
-    "B1495": "Decklid Punch-Out Sensor Circuit Failure",
-    "B1496": "Decklid Punch-Out Sensor Open Circuit",
-    "B1497": "Decklid Punch-Out Sensor Battery Short",
-    "B1498": "Decklid Punch-Out Sensor Ground Short",
-    "B1499": "Lamp Turn Signal Left Circuit Failure",
-    "B1500": "Lamp Turn Signal Left Circuit Open",
-    "B1501": "Lamp Turn Signal Left Circuit Short To Battery",
-    "B1502": "Lamp Turn Signal Left Circuit Short To Ground",
-    "B1503": "Lamp Turn Signal Right Circuit Failure",
-    "B1504": "Lamp Turn Signal Right Circuit Open",
-    "B1505": "Lamp Turn Signal Right Circuit Short To Battery",
-    "B1506": "Lamp Turn Signal Right Circuit Short To Ground",
-    "B1507": "Flash To Pass Switch Circuit Failure",
-    "B1508": "Flash To Pass Switch Circuit Open",
-    "B1509": "Flash To Pass Switch Circuit Short To Battery",
-    "B1510": "Flash To Pass Switch Circuit Short To Ground",
-    "B1511": "Driver Door Handle Circuit Failure",
-    "B1512": "Driver Door Handle Circuit Open",
-    "B1513": "Driver Door Handle Circuit Short To Battery",
-    "B1514": "Driver Door Handle Circuit Short To Ground",
-    "B1515": "Seat Driver Occupied Switch Circuit Failure",
-    "B1516": "Seat Driver Occupied Switch Circuit Open",
-    "B1517": "Seat Driver Occupied Switch Circuit Short To Battery",
-    "B1518": "Seat Driver Occupied Switch Circuit Short To Ground",
-    "B1519": "Hood Switch Circuit Failure",
-    "B1520": "Hood Switch Circuit Open",
-    "B1521": "Hood Switch Circuit Short To Battery",
-    "B1522": "Hood Switch Circuit Short To Ground",
-    "B1523": "Keyless Entry Circuit Failure",
-    "B1524": "Keyless Entry Circuit Open",
-    "B1525": "Keyless Entry Circuit Short To Battery",
-    "B1526": "Keyless Entry Circuit Short To Ground",
-    "B1527": "Memory Set Switch Circuit Failure",
-    "B1528": "Memory Set Switch Circuit Open",
-    "B1529": "Memory Set Switch Circuit Short To Battery",
-    "B1530": "Memory Set Switch Circuit Short To Ground",
-    "B1531": "Memory 1 Switch Circuit Failure",
-    "B1532": "Memory 1 Switch Circuit Open",
-    "B1533": "Memory 1 Switch Circuit Short To Battery",
-    "B1534": "Memory 1 Switch Circuit Short To Ground",
-    "B1535": "Memory 2 Switch Circuit Failure",
-    "B1536": "Memory 2 Switch Circuit Open",
-    "B1537": "Memory 2 Switch Circuit Short To Battery",
-    "B1538": "Memory 2 Switch Circuit Short To Ground",
-    "B1539": "Mirror Driver Switch Assembly Circuit Failure",
-    "B1540": "Mirror Driver Switch Assembly Circuit Open",
-    "B1541": "Mirror Driver Switch Assembly Circuit Short To Battery",
-    "B1542": "Mirror Driver Switch Assembly Circuit Short To Ground",
-    "B1543": "Seat Direction Switch Assembly Circuit Failure",
-    "B1544": "Seat Direction Switch Assembly Circuit Open",
-    "B1545": "Seat Direction Switch Assembly Circuit Short To Battery",
-    "B1546": "Seat Direction Switch Assembly Circuit Short To Ground",
-    "B1547": "Power Window Master Circuit Failure",
-    "B1548": "Power Window Master Circuit Open",
-    "B1549": "Power Window Master Circuit Short To Battery",
-    "B1550": "Power Window Master Circuit Short To Ground",
-    "B1551": "Decklid Release Circuit Failure",
-    "B1552": "Decklid Release Circuit Open",
-    "B1553": "Decklid Release Circuit Short To Battery",
-    "B1554": "Decklid Release Circuit Short To Ground",
-    "B1555": "Ignition Run/Start Circuit Failure",
-    "B1556": "Ignition Run/Start Circuit Open",
-    "B1557": "Ignition Run/Start Circuit Short To Battery",
-    "B1558": "Ignition Run/Start Circuit Short To Ground",
-    "B1559": "Door Lock Cylinder Circuit Failure",
-    "B1560": "Door Lock Cylinder Circuit Open",
-    "B1561": "Door Lock Cylinder Circuit Short To Battery",
-    "B1562": "Door Lock Cylinder Circuit Short To Ground",
-    "B1563": "Door Ajar Circuit Failure",
-    "B1564": "Door Ajar Circuit Open",
-    "B1565": "Door Ajar Circuit Short To Battery",
-    "B1566": "Door Ajar Circuit Short To Ground",
-    "B1567": "Lamp Headlamp High-Beam Circuit Failure",
-    "B1568": "Lamp Headlamp High-Beam Circuit Open",
-    "B1569": "Lamp Headlamp High-Beam Circuit Short To Battery",
-    "B1570": "Lamp Headlamp High-Beam Circuit Short To Ground",
-    "B1571": "Door Ajar LR Circuit Failure",
-    "B1572": "Door Ajar LR Circuit Open",
-    "B1573": "Door Ajar LR Circuit Short To Battery",
-    "B1574": "Door Ajar LR Circuit Short To Ground",
-    "B1575": "Lamp Park Input Circuit Failure",
-    "B1576": "Lamp Park Input Circuit Open",
-    "B1577": "Lamp Park Input Circuit Short To Battery",
-    "B1578": "Lamp Park Input Circuit Short To Ground",
-    "B1579": "Dim Panel Increase Input Circuit Failure",
-    "B1580": "Dim Panel Increase Input Circuit Open",
-    "B1581": "Dim Panel Increase Input Circuit Short To Battery",
-    "B1582": "Dim Panel Increase Input Circuit Short To Ground",
-    "B1583": "Dim Panel Decrease Input Circuit Failure",
-    "B1584": "Dim Panel Decrease Input Circuit Open",
-    "B1585": "Dim Panel Decrease Input Circuit Short To Battery",
-    "B1586": "Dim Panel Decrease Input Circuit Short To Ground",
-    "B1587": "Autolamp Delay Increase Circuit Failure",
-    "B1588": "Autolamp Delay Increase Circuit Open",
-    "B1589": "Autolamp Delay Increase Circuit Short To Battery",
-    "B1590": "Autolamp Delay Increase Circuit Short To Ground",
-    "B1591": "Autolamp Delay Decrease Circuit Failure",
-    "B1592": "Autolamp Delay Decrease Circuit Open",
-    "B1593": "Autolamp Delay Decrease Circuit Short To Battery",
-    "B1594": "Autolamp Delay Decrease Circuit Short To Ground",
-    "B1595": "Ignition Switch Illegal Input Code",
-    "B1596": "Service Continuous Codes",
-    "B1597": "Driver's Seat Seatback Autoglide Forward Switch Circuit Short to Ground",
-    "B1598": "Driver's Seat Seatback Autoglide Rearward Switch Circuit Short to Ground",
-    "B1599": "Passenger's Seatback Autoglide Forward Switch Circuit Short to Ground",
-    "B1600": "PATS Ignition Key Transponder Signal Is Not Received",
-    "B1601": "PATS Received Incorrect Key-Code From Ignition Key Transponder",
-    "B1602": "PATS Received Invalid Format Of Key-Code From Ignition Key Transponder",
-    "B1603": "Lamp Anti-Theft Indicator Circuit Failure",
-    "B1604": "Lamp Anti-Theft Indicator Circuit Open",
-    "B1605": "Lamp Anti-Theft Indicator Circuit Short To Battery",
-    "B1606": "Lamp Anti-Theft Indicator Circuit Short To Ground",
-    "B1607": "Illuminated Entry Input Circuit Failure",
-    "B1608": "Illuminated Entry Input Open Circuit",
-    "B1609": "Illuminated Entry Input Short Circuit To Battery",
-    "B1610": "Illuminated Entry Input Short Circuit To Ground",
-    "B1611": "Wiper Rear Mode Select Switch Circuit Failure",
-    "B1612": "Wiper Rear Mode Select Switch Circuit Open",
-    "B1613": "Wiper Rear Mode Select Switch Circuit Short To Battery",
-    "B1614": "Wiper Rear Mode Select Switch Circuit Short To Ground",
-    "B1615": "Wiper Rear Disable Switch Circuit Failure",
-    "B1616": "Wiper Rear Disable Switch Circuit Open",
-    "B1617": "Wiper Rear Disable Switch Circuit Short To Battery",
-    "B1618": "Wiper Rear Disable Switch Circuit Short To Ground",
-    "B1619": "Wiper Rear Low Limit Input Circuit Failure",
-    "B1620": "Wiper Rear Low Limit Input Circuit Open",
-    "B1621": "Wiper Rear Low Limit Input Circuit Short To Battery",
-    "B1622": "Wiper Rear Low Limit Input Circuit Short To Ground",
-    "B1623": "Lamp Keypad Output Circuit Failure",
-    "B1624": "Lamp Keypad Output Open Circuit",
-    "B1625": "Lamp Keypad Output Short Circuit To Battery",
-    "B1626": "Lamp Keypad Output Short Circuit To Ground",
-    "B1627": "PRNDL Reverse Input Circuit Failure",
-    "B1628": "PRNDL Reverse Input Open Circuit",
-    "B1629": "PRNDL Reverse Input Short To Battery",
-    "B1630": "PRNDL Reverse Input Short Circuit To Ground",
-    "B1631": "Mirror Driver Left Circuit Failure",
-    "B1632": "Mirror Driver Left Circuit Open",
-    "B1633": "Mirror Driver Left Circuit Short To Battery",
-    "B1634": "Mirror Driver Left Circuit Short To Ground",
-    "B1635": "Mirror Driver Right Circuit Failure",
-    "B1636": "Mirror Driver Right Circuit Open",
-    "B1637": "Mirror Driver Right Circuit Short To Battery",
-    "B1638": "Mirror Driver Right Short To Ground",
-    "B1639": "Mirror Passenger Left Circuit Failure",
-    "B1640": "Mirror Passenger Left Circuit Open",
-    "B1641": "Mirror Passenger Left Circuit Short To Battery",
-    "B1642": "Mirror Passenger Left Circuit Short To Ground",
-    "B1643": "Mirror Passenger Right Circuit Failure",
-    "B1644": "Mirror Passenger Right Circuit Open",
-    "B1645": "Mirror Passenger Right Circuit Short To Battery",
-    "B1646": "Mirror Passenger Right Circuit Short To Ground",
-    "B1647": "Seat Driver Recline Forward Circuit Failure",
-    "B1648": "Seat Driver Recline Forward Circuit Open",
-    "B1649": "Seat Driver Recline Forward Circuit Short To Battery",
-    "B1650": "Seat Driver Recline Forward Circuit Short To Ground",
-    "B1651": "Seat Driver Recline Backward Circuit Failure",
-    "B1652": "Seat Driver Recline Backward Circuit Open",
-    "B1653": "Seat Driver Recline Backward Circuit Short To Battery",
-    "B1654": "Seat Driver Recline Backward Circuit Short To Ground",
-    "B1655": "Seat Driver Rear Up Circuit Failure",
-    "B1656": "Seat Driver Rear Up Circuit Open",
-    "B1657": "Seat Driver Rear Up Circuit Short To Battery",
-    "B1658": "Seat Driver Rear Up Circuit Short To Ground",
-    "B1659": "Seat Driver Front Up Circuit Failure",
-    "B1660": "Seat Driver Front Up Circuit Open",
-    "B1661": "Seat Driver Front Up Circuit Short To Battery",
-    "B1662": "Seat Driver Front Up Circuit Short To Ground",
-    "B1663": "Seat Driver Front Up/Down Motor Stalled",
-    "B1664": "Seat Driver Rear Up/Down Motor Stalled",
-    "B1665": "Seat Driver Forward/Backward Motor Stalled",
-    "B1666": "Seat Driver Recline Motor Stalled",
-    "B1667": "Mirror Driver Up/Down Motor Stalled",
-    "B1668": "Mirror Driver Right/Left Motor Stalled",
-    "B1669": "Mirror Passenger Up/Down Motor Stalled",
-    "B1670": "Mirror Passenger Right/Left Motor Stalled",
-    "B1671": "Battery Module Voltage Out Of Range",
-    "B1672": "Seat Driver Occupied Input Circuit Failure",
-    "B1673": "Seat Driver Occupied Input Circuit Open",
-    "B1674": "Seat Driver Occupied Input Circuit Short To Battery",
-    "B1675": "Seat Driver Occupied Input Circuit Short To Ground",
-    "B1676": "Battery Pack Voltage Out Of Range",
-    "B1677": "Alarm Panic Input Circuit Failure",
-    "B1678": "Alarm Panic Input Circuit Open",
-    "B1679": "Alarm Panic Input Circuit Short To Battery",
-    "B1680": "Alarm Panic Input Circuit Short To Ground",
-    "B1681": "PATS Transceiver Module Signal Is Not Received",
-    "B1682": "PATS Is Disabled (Check Link Between PATS And Transponder)",
-    "B1683": "Mirror Driver/Passenger Switch Circuit Failure",
-    "B1684": "Mirror Driver/Passenger Switch Circuit Open",
-    "B1685": "Lamp Dome Input Circuit Failure",
-    "B1686": "Lamp Dome Input Circuit Open",
-    "B1687": "Lamp Dome Input Circuit Short To Battery",
-    "B1688": "Lamp Dome Input Circuit Short To Ground",
-    "B1689": "Autolamp Delay Circuit Failure",
-    "B1690": "Autolamp Delay Circuit Open",
-    "B1691": "Autolamp Delay Circuit Short To Battery",
-    "B1692": "Autolamp Delay Circuit Short To Ground",
-    "B1693": "Autolamp On Circuit Failure",
-    "B1694": "Autolamp On Circuit Open",
-    "B1695": "Autolamp On Circuit Short To Battery",
-    "B1696": "Autolamp On Circuit Short To Ground",
-    "B1697": "Mirror Driver/Passenger Switch Circuit Short To Battery",
-    "B1698": "Mirror Driver/Passenger Switch Circuit Short To Ground",
-    "B1699": "Passenger's Seat Occupied Switch Circuit Short to Ground",
-    "B1700": "Passenger's Seatbelt Tension Reducer Circuit Short to Ground",
-    "B1701": "Seat Driver Recline Forward Switch Circuit Failure",
-    "B1702": "Seat Driver Recline Forward Switch Circuit Open",
-    "B1703": "Seat Driver Recline Forward Switch Circuit Short To Battery",
-    "B1704": "Seat Driver Recline Forward Switch Circuit Short To Ground",
-    "B1705": "Seat Driver Recline Rearward Switch Circuit Failure",
-    "B1706": "Seat Driver Recline Rearward Switch Circuit Open",
-    "B1707": "Seat Driver Recline Rearward Switch Circuit Short To Battery",
-    "B1708": "Seat Driver Recline Rearward Switch Circuit Short To Ground",
-    "B1709": "Seat Driver Front Up Switch Circuit Failure",
-    "B1710": "Seat Driver Front Up Switch Circuit Open",
-    "B1711": "Seat Driver Front Up Switch Circuit Short To Battery",
-    "B1712": "Seat Driver Front Up Switch Circuit Short To Ground",
-    "B1713": "Seat Driver Front Down Switch Circuit Failure",
-    "B1714": "Seat Driver Front Down Switch Circuit Open",
-    "B1715": "Seat Driver Front Down Switch Circuit Short To Battery",
-    "B1716": "Seat Driver Front Down Switch Circuit Short To Ground",
-    "B1717": "Seat Driver Forward Switch Circuit Failure",
-    "B1718": "Seat Driver Forward Switch Circuit Open",
-    "B1719": "Seat Driver Forward Switch Circuit Short To Battery",
-    "B1720": "Seat Driver Forward Switch Circuit Short To Ground",
-    "B1721": "Seat Driver Rearward Switch Circuit Failure",
-    "B1722": "Seat Driver Rearward Switch Circuit Open",
-    "B1723": "Seat Driver Rearward Switch Circuit Short To Battery",
-    "B1724": "Seat Driver Rearward Switch Circuit Short To Ground",
-    "B1725": "Seat Driver Rear Up Switch Circuit Failure",
-    "B1726": "Seat Driver Rear Up Switch Circuit Open",
-    "B1727": "Seat Driver Rear Up Switch Circuit Short To Battery",
-    "B1728": "Seat Driver Rear Up Switch Circuit Short To Ground",
-    "B1729": "Seat Driver Rear Down Switch Circuit Failure",
-    "B1730": "Seat Driver Rear Down Switch Circuit Open",
-    "B1731": "Seat Driver Rear Down Switch Circuit Short To Battery",
-    "B1732": "Seat Driver Rear Down Switch Circuit Short To Ground",
-    "B1733": "Mirror Driver Vertical Switch Circuit Failure",
-    "B1734": "Mirror Driver Vertical Switch Circuit Open",
-    "B1735": "Mirror Driver Vertical Switch Circuit Short To Battery",
-    "B1736": "Mirror Driver Vertical Switch Circuit Short To Ground",
-    "B1737": "Mirror Driver Horizontal Switch Circuit Failure",
-    "B1738": "Mirror Driver Horizontal Switch Circuit Open",
-    "B1739": "Mirror Driver Horizontal Switch Circuit Short To Battery",
-    "B1740": "Mirror Driver Horizontal Switch Circuit Short To Ground",
-    "B1741": "Mirror Passenger Vertical Switch Circuit Failure",
-    "B1742": "Mirror Passenger Vertical Switch Circuit Open",
-    "B1743": "Mirror Passenger Vertical Switch Circuit Short To Battery",
-    "B1744": "Mirror Passenger Vertical Switch Circuit Short To Ground",
-    "B1745": "Mirror Passenger Horizontal Switch Circuit Failure",
-    "B1746": "Mirror Passenger Horizontal Switch Circuit Open",
-    "B1747": "Mirror Passenger Horizontal Switch Circuit Short To Battery",
-    "B1748": "Mirror Passenger Horizontal Switch Circuit Short To Ground",
-    "B1749": "Park/Neutral Switch Circuit Failure",
-    "B1750": "Park/Neutral Switch Circuit Open",
-    "B1751": "Park/Neutral Switch Circuit Short To Battery",
-    "B1752": "Park/Neutral Switch Circuit Short To Ground",
-    "B1753": "Hazard Flash Output Circuit Failure",
-    "B1754": "Hazard Flash Output Circuit Open",
-    "B1755": "Hazard Flash Output Circuit Short Battery",
-    "B1756": "Hazard Flash Output Circuit Short To Ground",
-    "B1757": "Seat Driver Rear Down Circuit Failure",
-    "B1758": "Seat Driver Rear Down Circuit Open",
-    "B1759": "Seat Driver Rear Down Circuit Short To Battery",
-    "B1760": "Seat Driver Rear Down Circuit Short To Ground",
-    "B1761": "Seat Driver Front Down Circuit Failure",
-    "B1762": "Seat Driver Front Down Circuit Open",
-    "B1763": "Seat Driver Front Down Circuit Short To Battery",
-    "B1764": "Seat Driver Front Down Circuit Short To Ground",
-    "B1765": "Seat Driver Forward Circuit Failure",
-    "B1766": "Seat Driver Forward Circuit Open",
-    "B1767": "Seat Driver Forward Circuit Short To Battery",
-    "B1768": "Seat Driver Forward Circuit Short To Ground",
-    "B1769": "Seat Driver Backward Circuit Failure",
-    "B1770": "Seat Driver Backward Circuit Open",
-    "B1771": "Seat Driver Backward Circuit Short To Battery",
-    "B1772": "Seat Driver Backward Circuit Short To Ground",
-    "B1773": "Mirror Driver Up Circuit Failure",
-    "B1774": "Mirror Driver Up Circuit Open",
-    "B1775": "Mirror Driver Up Circuit Short To Battery",
-    "B1776": "Mirror Driver Up Circuit Short To Ground",
-    "B1777": "Driver's Seatbelt Tension Reducer Circuit Short to Ground",
-    "B1778": "Mirror Driver Down Circuit Failure",
-    "B1779": "Mirror Driver Down Circuit Open",
-    "B1780": "Mirror Driver Down Circuit Short To Battery",
-    "B1781": "Mirror Driver Down Short To Ground",
-    "B1782": "Mirror Passenger Up Circuit Failure",
-    "B1783": "Mirror Passenger Up Circuit Open",
-    "B1784": "Mirror Passenger Up Circuit Short To Battery",
-    "B1785": "Mirror Passenger Up Circuit Short To Ground",
-    "B1786": "Mirror Passenger Down Circuit Failure",
-    "B1787": "Mirror Passenger Down Circuit Open",
-    "B1788": "Mirror Passenger Down Circuit Short To Battery",
-    "B1789": "Mirror Passenger Down Circuit Short To Ground",
-    "B1790": "Autolamp Sensor Input Circuit Failure",
-    "B1791": "Autolamp Sensor Input Circuit Open",
-    "B1792": "Autolamp Sensor Input Circuit Short To Battery",
-    "B1793": "Autolamp Sensor Input Circuit Short To Ground",
-    "B1794": "Lamp Headlamp Low-Beam Circuit Failure",
-    "B1795": "Lamp Headlamp Low-Beam Circuit Open",
-    "B1796": "Lamp Headlamp Low-Beam Circuit Short To Battery",
-    "B1797": "Lamp Headlamp Low-Beam Circuit Short To Ground",
-    "B1798": "Lamp Turn Signal Front Output Circuit Failure",
-    "B1799": "Lamp Turn Signal Front Output Circuit Open",
-    "B1800": "Lamp Turn Signal Front Output Circuit Short To Battery",
-    "B1801": "Lamp Turn Signal Front Output Circuit Short To Ground",
-    "B1802": "Lamp Turn Signal Rear Output Circuit Failure",
-    "B1803": "Lamp Turn Signal Rear Output Circuit Open",
-    "B1804": "Lamp Turn Signal Rear Output Circuit Short To Battery",
-    "B1805": "Lamp Turn Signal Rear Output Circuit Short To Ground",
-    "B1806": "Lamp Tail Output Circuit Failure",
-    "B1807": "Lamp Tail Output Circuit Open",
-    "B1808": "Lamp Tail Output Circuit Short To Battery",
-    "B1809": "Lamp Tail Output Circuit Short To Ground",
-    "B1810": "Lamp Backup Switch Input Circuit Failure",
-    "B1811": "Lamp Backup Switch Input Circuit Open",
-    "B1812": "Lamp Backup Switch Input Circuit Short To Battery",
-    "B1813": "Lamp Backup Switch Input Circuit Short To Ground",
-    "B1814": "Wiper Rear Motor Down Relay Coil Circuit Failure",
-    "B1815": "Wiper Rear Motor Down Relay Coil Circuit Open",
-    "B1816": "Wiper Rear Motor Down Relay Coil Circuit Short To Battery",
-    "B1817": "Wiper Rear Motor Down Relay Coil Circuit Short To Ground",
-    "B1818": "Wiper Rear Motor Up Relay Coil Circuit Failure",
-    "B1819": "Wiper Rear Motor Up Relay Coil Circuit Open",
-    "B1820": "Wiper Rear Motor Up Relay Coil Circuit Short To Battery",
-    "B1821": "Wiper Rear Motor Up Relay Coil Circuit Short To Ground",
-    "B1822": "Wiper Rear Park Sense Input Circuit Failure",
-    "B1823": "Wiper Rear Park Sense Input Circuit Open",
-    "B1824": "Wiper Rear Park Sense Input Circuit Short To Battery",
-    "B1825": "Wiper Rear Park Sense Input Circuit Short To Ground",
-    "B1826": "Wiper Rear High Limit Input Circuit Failure",
-    "B1827": "Wiper Rear High Limit Input Circuit Open",
-    "B1828": "Wiper Rear High Limit Input Circuit Short To Battery",
-    "B1829": "Wiper Rear High Limit Input Circuit Short To Ground",
-    "B1830": "Door Unlock Disarm Switch Circuit Failure",
-    "B1831": "Door Unlock Disarm Switch Circuit Open",
-    "B1832": "Door Unlock Disarm Switch Circuit Short To Battery",
-    "B1833": "Door Unlock Disarm Switch Circuit Short To Ground",
-    "B1834": "Door Unlock Disarm Output Circuit Failure",
-    "B1835": "Door Unlock Disarm Output Circuit Open",
-    "B1836": "Door Unlock Disarm Output Circuit Short To Battery",
-    "B1837": "Door Unlock Disarm Output Circuit Short To Ground",
-    "B1838": "Battery Saver Power Relay Circuit Failure",
-    "B1839": "Wiper Rear Motor Circuit Failure",
-    "B1840": "Wiper Front Power Circuit Failure",
-    "B1841": "Wiper Front Power Circuit Open",
-    "B1842": "Wiper Front Power Circuit Short To Battery",
-    "B1843": "Wiper Front Power Circuit Short To Ground",
-    "B1844": "Phone Handset Circuit Failure",
-    "B1845": "Ignition Tamper Circuit Failure",
-    "B1846": "Ignition Tamper Circuit Open",
-    "B1847": "Ignition Tamper Circuit Short To Battery",
-    "B1848": "Ignition Tamper Circuit Short To Ground",
-    "B1849": "Climate Control Temperature Differential Circuit Failure",
-    "B1850": "Climate Control Temperature Differential Circuit Open",
-    "B1851": "Climate Control Temperature Differential Circuit Short To Battery",
-    "B1852": "Climate Control Temperature Differential Circuit Short To Ground",
-    "B1853": "Climate Control Air Temperature Internal Sensor Motor Circuit Failure",
-    "B1854": "Climate Control Air Temperature Internal Sensor Motor Circuit Open",
-    "B1855": "Climate Control Air Temperature Internal Sensor Motor Circuit Short To Battery",
-    "B1856": "Climate Control Air Temperature Internal Sensor Motor Circuit Short To Ground",
-    "B1857": "Climate Control On/Off Switch Circuit Failure",
-    "B1858": "Climate Control A/C Pressure Switch Circuit Failure",
-    "B1859": "Climate Control A/C Pressure Switch Circuit Open",
-    "B1860": "Climate Control A/C Pressure Switch Circuit Short To Battery",
-    "B1861": "Climate Control A/C Pressure Switch Circuit Short To Ground",
-    "B1862": "Climate Control A/C Lock Sensor Failure",
-    "B1863": "Ground ECU Circuit Open",
-    "B1864": "Battery Power Supply ECU Circuit Failure",
-    "B1865": "Battery Power Supply ECU Circuit Open",
-    "B1866": "Battery Power Supply ECU Circuit Short To Battery",
-    "B1867": "Battery Power Supply ECU Circuit Short To Ground",
-    "B1868": "Lamp Air Bag Warning Indicator Circuit Failure",
-    "B1869": "Lamp Air Bag Warning Indicator Circuit Open",
-    "B1870": "Lamp Air Bag Warning Indicator Circuit Short To Battery",
-    "B1871": "Passenger Air Bag Disable Module Fault",
-    "B1872": "Turn Signal / Hazard Power Feed Circuit Short To Battery",
-    "B1873": "Turn Signal / Hazard Power Feed Circuit Short To Ground",
-    "B1874": "Cellular Phone Handset Not Present",
-    "B1875": "Turn Signal / Hazard Switch Signal Circuit Failure",
-    "B1876": "Seatbelt Driver Pretensioner Circuit Failure",
-    "B1877": "Seatbelt Driver Pretensioner Circuit Open",
-    "B1878": "Seatbelt Driver Pretensioner Circuit Short to Battery",
-    "B1879": "Seatbelt Driver Pretensioner Circuit Short to Ground",
-    "B1880": "Seatbelt Passenger Pretensioner Circuit Failure",
-    "B1881": "Seatbelt Passenger Pretensioner Circuit Open",
-    "B1882": "Seatbelt Passenger Pretensioner Circuit Short to Battery",
-    "B1883": "Seatbelt Passenger Pretensioner Circuit Short to Ground",
-    "B1884": "PAD Warning Lamp Inoperative",
-    "B1885": "Seatbelt Driver Pretensioner Circuit Resistance Low on Squib",
-    "B1886": "Seatbelt Passenger Pretensioner Circuit Resistance Low on Squib",
-    "B1887": "Air Bag Driver Circuit Resistance Low or Shorted Together",
-    "B1888": "Air Bag Passenger Circuit Resistance Low or Shorted Together",
-    "B1889": "Passenger Airbag Disable Module Sensor Obstructed",
-    "B1890": "PAD Warning Lamp Circuit Short to Battery",
-    "B1891": "Air Bag Tone Warning Indicator Circuit Short to Battery",
-    "B1892": "Air Bag Tone Warning Indicator Circuit Failure",
-    "B1893": "GPS Antenna Open Circuit",
-    "B1894": "Wiper Rear Motor Speed Sense Circuit Failure",
-    "B1895": "Driver's / Passenger's Door Ajar Output Circuit Failure",
-    "B1896": "Driver's / Passenger's Door Ajar Output Circuit Short to Battery",
-    "B1897": "Horn Switch Circuit Failure",
-    "B1898": "Chime Input #2 Circuit Short to Ground",
-    "B1899": "Microphone Input Signal Circuit Open",
-    "B1900": "Driver Side Airbag Fault",
-    "B1901": "Air Bag Crash Sensor #1 Feed/Return Circuit Short To Ground",
-    "B1902": "Air Bag Crash Sensor #1 Ground Circuit Failure",
-    "B1903": "Air Bag Crash Sensor #1 Ground Circuit Short To Battery",
-    "B1904": "Air Bag Crash Sensor #2 Feed/Return Circuit Failure",
-    "B1905": "Air Bag Crash Sensor #2 Feed/Return Circuit Short To Battery",
-    "B1906": "Air Bag Crash Sensor #2 Feed/Return Circuit Short To Ground",
-    "B1907": "Air Bag Crash Sensor #2 Ground Circuit Failure",
-    "B1908": "Air Bag Crash Sensor #2 Ground Circuit Short To Battery",
-    "B1909": "Air Bag Crash Sensor #2 Ground Circuit Short To Ground",
-    "B1910": "Air Bag Diagnostic Monitor Ground Circuit Failure",
-    "B1911": "Air Bag Diagnostic Monitor Ground Circuit Short To Battery",
-    "B1912": "Air Bag Diagnostic Monitor Ground Circuit Short To Ground",
-    "B1913": "Air Bag Driver/Passenger Circuit Short To Ground",
-    "B1914": "Air Bag Crash Sensors #1 / #2 Circuit Short To Ground",
-    "B1915": "Air Bag Driver Circuit Failure",
-    "B1916": "Air Bag Driver Circuit Short To Battery",
-    "B1917": "Air Bag Memory Clear Circuit Failure",
-    "B1918": "Air Bag Memory Clear Circuit Open",
-    "B1919": "Air Bag Memory Clear Circuit Short To Battery",
-    "B1920": "Air Bag Passenger Circuit Failure",
-    "B1921": "Air Bag Diagnostic Monitor Ground Circuit Open",
-    "B1922": "Air Bag Safing Sensor Output Circuit Short To Battery",
-    "B1923": "Air Bag Memory Clear Circuit Short To Ground",
-    "B1924": "Air Bag Internal Diagnostic Monitor Fault or System Disarm Fault",
-    "B1925": "Air Bag Passenger Circuit Short To Battery",
-    "B1926": "Air Bag Passenger Pressure Switch Circuit Failure",
-    "B1927": "Passenger Side Airbag Fault",
-    "B1928": "Air Bag Safing Sensor Output Circuit Failure",
-    "B1929": "Air Bag Safing Sensor Output Circuit Open",
-    "B1930": "Air Bag Safing Sensor Output Circuit Short To Ground",
-    "B1931": "Air Bag Crash Sensor #1 Feed/Return Circuit Failure",
-    "B1932": "Air Bag Driver Circuit Open",
-    "B1933": "Air Bag Passenger Circuit Open",
-    "B1934": "Air Bag Driver Inflator Circuit Resistance Low on Squib",
-    "B1935": "Air Bag Passenger Inflator Circuit Resistance Low on Squib",
-    "B1936": "Air Bag Driver Circuit Short To Ground",
-    "B1937": "Air Bag Passenger Pressure Switch Circuit Open",
-    "B1938": "Air Bag Passenger Circuit Short To Ground",
-    "B1939": "Air Bag Passenger Pressure Switch Circuit Short To Ground",
-    "B1941": "Air Bag Crash Sensor #1 Feed/Return Circuit Open",
-    "B1942": "Air Bag Crash Sensor #2 Feed/Return Circuit Open",
-    "B1943": "Air Bag Crash Sensor #1 Ground Circuit Short To Ground",
-    "B1944": "Air Bag Crash Sensor #1 Ground Circuit Open",
-    "B1945": "Air Bag Crash Sensor #2 Ground Circuit Open",
-    "B1946": "Climate Control A/C Post Evaporator Sensor Circuit Failure",
-    "B1947": "Climate Control A/C Post Evaporator Sensor Circuit Short To Ground",
-    "B1948": "Climate Control Water Temperature Sensor Circuit Failure",
-    "B1949": "Climate Control Water Temperature Sensor Circuit Short To Ground",
-    "B1950": "Seat Rear Up/Down Potentiometer Feedback Circuit Failure",
-    "B1951": "Seat Rear Up/Down Potentiometer Feedback Circuit Open",
-    "B1952": "Seat Rear Up/Down Potentiometer Feedback Circuit Short To Battery",
-    "B1953": "Seat Rear Up/Down Potentiometer Feedback Circuit Short To Ground",
-    "B1954": "Seat Front Up/Down Potentiometer Feedback Circuit Failure",
-    "B1955": "Seat Front Up/Down Potentiometer Feedback Circuit Open",
-    "B1956": "Seat Front Up/Down Potentiometer Feedback Circuit Short To Battery",
-    "B1957": "Seat Front Up/Down Potentiometer Feedback Circuit Short To Ground",
-    "B1958": "Seat Recline Forward/Backward Potentiometer Feedback Circuit Failure",
-    "B1959": "Seat Recline Forward/Backward Potentiometer Feedback Circuit Open",
-    "B1960": "Seat Recline Forward/Backward Potentiometer Feedback Circuit Short To Battery",
-    "B1961": "Seat Recline Forward/Backward Potentiometer Feedback Circuit Short To Ground",
-    "B1962": "Seat Horizontal Forward/Rearward Potentiometer Feedback Circuit Failure",
-    "B1963": "Seat Horizontal Forward/Rearward Potentiometer Feedback Circuit Open",
-    "B1964": "Seat Horizontal Forward/Rearward Potentiometer Feedback Circuit Short To Battery",
-    "B1965": "Seat Horizontal Forward/Rearward Potentiometer Feedback Circuit Short To Ground",
-    "B1966": "A/C Post Heater Sensor Circuit Failure",
-    "B1967": "A/C Post Heater Sensor Circuit Short To Ground",
-    "B1968": "A/C Water Pump Detection Circuit Failure",
-    "B1969": "A/C Clutch Magnetic Control Circuit Failure",
-    "B1970": "Passenger Seatback Forward Switch Circuit Short to Ground",
-    "B1971": "Passenger Seatback Rearward Switch Circuit Short to Ground",
-    "B1972": "Passenger Rear Seat Up Switch Circuit Short to Battery",
-    "B1973": "Passenger Rear Seat Down Switch Circuit Short to Battery",
-    "B1974": "Passenger's Seat Recline Forward Switch Circuit Short to Battery",
-    "B1975": "Passenger's Seat Recline Back Switch Circuit Short to Battery",
-    "B1976": "Passenger's Seat Forward Switch Circuit Short to Battery",
-    "B1977": "Passenger's Front Seat Up Switch Circuit Short to Battery",
-    "B1978": "Passenger's Front Seat Down Switch Circuit Short to Battery",
-    "B1979": "Passenger Seat Rearward Switch Circuit Short to Battery",
-    "B1980": "Bulb - Outage Condition Detected",
-    "B1981": "Memory Off Switch Circuit Short to Battery",
-    "B1982": "Driver's Door Unlock Relay Circuit Failure",
-    "B1983": "Driver's Door Unlock Relay Circuit Short to Battery",
-    "B1984": "Seat Switch Lumbar Inflate Circuit Failure",
-    "B1985": "Seat Switch Lumbar Deflate Circuit Failure",
-    "B1986": "Driver's Seat Seatback Autoglide Rearward Switch Circuit Failure",
-    "B1987": "Pedal Forward / Rearward Motor Stalled",
-    "B1988": "Pedal Position Forward Switch Circuit Short to Battery",
-    "B1989": "Pedal Position Rearward Switch Circuit Short to Battery",
-    "B1990": "Pedal Forward / Rearward Potentiometer Feedback Circuit Failure",
-    "B1991": "Pedal Forward / Rearward Potentiometer Feedback Circuit Short to Battery",
-    "B1992": "Driver Side, Side mount Airbag Circuit Short to Vbatt",
-    "B1993": "Driver Sid, Side mount Airbag Circuit Short to Ground",
-    "B1994": "Driver Sid, Side mount Airbag Circuit Open",
-    "B1995": "Driver Sid, Side mount Airbag Low resistance on Squib",
-    "B1996": "Passenger Sid, Side mount Airbag Circuit Short to Vbatt",
-    "B1997": "Passenger Sid, Side mount Airbag Circuit Short to Ground",
-    "B1998": "Passenger Sid, Side mount Airbag Circuit Open",
-    "B1999": "Passenger Sid, Side mount Airbag Low resistance on Squib",
-}
-
-B2_ERRORS = {
-    "B2100": "Door Driver Key Cylinder Switch Failure",
-    "B2101": "Head Rest Switch Circuit Failure",
-    "B2102": "Antenna Circuit Short to Ground",
-    "B2103": "Antenna Not Connected",
-    "B2104": "Door Passenger Key Cylinder Switch Failure",
-    "B2105": "Throttle Position Input Out of Range Low",
-    "B2106": "Throttle Position Input Out of Range High",
-    "B2107": "Front Wiper Motor Relay Circuit Short to Vbatt",
-    "B2108": "Trunk Key Cylinder Switch Failure",
-    "B2109": "Heated Wind Shield Relay Short to Vbatt (changed from Failure 2/6/97)",
-    "B2110": "Front Wiper Motor Relay Circuit Open (changed from Failure 2/6/97)",
-    "B2111": "All Door Lock Input Short to Ground",
-    "B2112": "Door Driver Set Switch Stuck Failure",
-    "B2113": "Heated Windshield Input Short to Ground",
-    "B2114": "Front Washer Input Short to Ground",
-    "B2115": "Rear Washer Input Short to Ground",
-    "B2116": "Door Driver Reset Switch Stuck Failure",
-    "B2117": "Driver Side, Side mount Airbag Low capacitance on Squib",
-    "B2118": "Passenger Sid, Side mount Airbag Low capacitance on Squib",
-    "B2119": "Compressor Failure",
-    "B2120": "Door Passenger Set Switch Stuck Failure",
-    "B2122": "Driver Side Satellite Communication Circuit Short to Ground",
-    "B2123": "Passenger Side Satellite Communication Circuit Short to Ground",
-    "B2124": "Door Passenger Reset Switch Stuck Failure",
-    "B2128": "Central Lock Motor Failure",
-    "B2129": "Central Lock Feedback Failure",
-    "B2130": "Double Lock Timeout Failure",
-    "B2131": "Double Lock Feedback Failure",
-    "B2132": "Dimmer switch Circuit Short to Gnd",
-    "B2133": "Brake Motor Warning lamp Circuit Failure",
-    "B2134": "Brake Motor Warning lamp Circuit Short to Vbatt",
-    "B2135": "Park Brake Applied Warning Lamp Circuit Failure",
-    "B2136": "Park Brake Applied Warning Lamp Circuit Short To Battery",
-    "B2139": "Data Mismatch (receive data does not match what was expected)",
-    "B2141": "NVM Configuration Failure",
-    "B2142": "NVM TIC Failure",
-    "B2143": "NVM Memory Failure",
-    "B2144": "NVM Alarm Data Failure",
-    "B2145": "NVM RF HR Failure",
-    "B2146": "Seat Recline Motor Position Out of Range",
-    "B2148": "PWM Input Circuit Failure",
-    "B2149": "Seat Front Vertical Motor Position Out of Range",
-    "B2150": "Power Supply #1 Circuit Short to Ground",
-    "B2151": "Power Supply #2 Circuit Short to Ground",
-    "B2152": "Seat Rear Vertical Motor Position Out of Range",
-    "B2153": "Rear Echo Sensor Circuit Failure",
-    "B2154": "Front Echo Sensor Circuit Failure",
-    "B2155": "Seat Horizontal Motor Position Out of Range",
-    "B2156": "Rear Doppler Sensor Circuit Failure",
-    "B2157": "Front Doppler Sensor Circuit Failure",
-    "B2158": "Seat Recline Motor Memory Position Out of Range",
-    "B2159": "Memory #1 output Short to Ground",
-    "B2160": "Memory #1 output Short to VBatt",
-    "B2161": "Seat Front Vertical Motor Memory Position Out of Range",
-    "B2162": "Data Mismatch #2 (receive data does not match what was expected)",
-    "B2163": "Clutch Position Fault",
-    "B2164": "Seat Rear Vertical Motor Memory Position Out of Range",
-    "B2165": "Gear shift position Fault",
-    "B2166": "Gear select position Fault",
-    "B2167": "Seat Horizontal Motor Memory Position Out of Range",
-    "B2168": "Unable to confirm Unlock Condition",
-    "B2169": "Unable to confirm lock Condition",
-    "B2170": "Steering Column Lock Switch Circuit Failure",
-    "B2172": "Inertia Switch input Circuit Open",
-    "B2174": "Window Driver Rear Remote Up Switch Short to Battery",
-    "B2175": "A/C Request Signal Circuit Short to Ground",
-    "B2176": "Overdrive switch circuit short to Vbatt",
-    "B2177": "Interior Scanning Sensor Circuit Failure",
-    "B2178": "Window Driver Rear Remote Down Switch Short to Battery",
-    "B2179": "Front Wiper Select Switch 'A' Short to Ground",
-    "B2180": "Front Wiper Select Switch 'B' Short to Ground",
-    "B2181": "Front Wiper Select Switch 'C' Short to Ground",
-    "B2182": "Window Passenger Front Remote Up Switch Short to Battery",
-    "B2183": "Front Wiper Select Switch 'H' Short to Ground",
-    "B2184": "Front Wiper Select Switch 'W' Short to Ground",
-    "B2185": "Rear Wiper Select Switch 'D' Short to Ground",
-    "B2186": "Window Passenger Front Remote Down Switch Short to Battery",
-    "B2187": "Rear Wiper Select Switch 'B' Short to Ground",
-    "B2188": "Rear Wiper Select Switch 'E' Short to Ground",
-    "B2190": "Window Passenger Rear Remote Up Switch Short to Battery",
-    "B2194": "Window Passenger Rear Remote Down Switch Short to Battery",
-    "B2195": "Driver Window Up / Down Power Circuit Short to Ground",
-    "B2196": "Passenger Window Up / Down Power Circuit Short to Ground",
-    "B2197": "TV Module Error",
-    "B2198": "TrafficMaster Module Error",
-    "B2199": "VICS Module Error",
-    "B2200": "No Communication to TV Module (No Fitting of TV)",
-    "B2201": "No Communication With Traffic MasterModule",
-    "B2202": "No Communication to VICS Module (No Fitting of VICS)",
-    "B2203": "CD-ROM Error",
-    "B2204": "GPS Antenna Connection Open or Short",
-    "B2205": "GPS Receiver Error",
-    "B2206": "Gyroscope Error",
-    "B2207": "ECU ROM Checksum Error",
-    "B2208": "Communication Link to Display and Switch Module Error",
-    "B2209": "Interior Lamp Override Switch Open Circuit",
-    "B2210": "Interior Lamp Override Switch Short to Ground",
-    "B2211": "Low Coolant Lamp Output Circuit Short to Battery",
-    "B2214": "Window Passenger Front Up Switch Short to Battery",
-    "B2215": "Window Passenger Front Down Switch Short to Battery",
-    "B2219": "Window Driver Front Current Feedback Exceeded",
-    "B2220": "Window Driver Rear Current Feedback Exceeded",
-    "B2221": "Window Passenger Front Current Feedback Exceeded",
-    "B2222": "Window Passenger Rear Current Feedback Exceeded",
-    "B2223": "Mirror Driver Drive Circuit Failure",
-    "B2224": "Mirror Passenger Drive Circuit Failure",
-    "B2225": "Front Crash Sensor Mount Fault",
-    "B2226": "Front Crash Sensor Internal Fault",
-    "B2227": "Front Crash Sensor Driver Communications Fault",
-    "B2228": "Air Bag Driver Circuit Short to Ground - Loop #2",
-    "B2229": "Air Bag Passenger Circuit Short to Ground - Loop #2",
-    "B2230": "Air Bag Driver Circuit Short to Battery - Loop #2",
-    "B2231": "Air Bag Passenger Circuit Short to Battery - Loop #2",
-    "B2232": "Air Bag Driver Circuit Open - Loop #2",
-    "B2233": "Air Bag passenger Circuit Open - Loop #2",
-    "B2234": "Air Bag Driver Inflator Circuit Resistance Low on Squib - Loop #2",
-    "B2235": "Air Bag Passenger Inflator Circuit",
-    "B2236": "Weak or Defected Electric Vehicle Battery Module Fault",
-    "B2237": "Vehicle Signal indicating Park While VSS Present",
-    "B2238": "Power Cable For Power Sliding Door Broken",
-    "B2239": "Rear Cargo Door Set Switch Stuck (Short to Ground)",
-    "B2240": "Rear Cargo Door Reset Switch Stuck (Short to Ground)",
-    "B2241": "Rear Cargo Door Lock Circuit Short to Ground",
-    "B2242": "Rear Cargo Door Unlock Circuit Open",
-    "B2243": "Driver Rear Door Ajar Circuit Open",
-    "B2244": "Driver Sliding Door Ajar Circuit Short to GND",
-    "B2245": "Passenger Rear Door Ajar Circuit Open",
-    "B2246": "Passenger Sliding Door Ajar Circuit Short to GND",
-    "B2247": "EV Battery Pack Temperature Fault",
-    "B2248": "Heated Windshield Relay Coil Circuit Failure",
-    "B2249": "Head Lamp Relay Coil Short to Battery",
-    "B2250": "All Doors Unlock Relay Circuit Failure",
-    "B2251": "Parklamp Output Relay Driver Circuit Failure",
-    "B2252": "Parklamp Output Relay Dirver Short to Battery",
-    "B2300": "Seat Driver Memory Position Error",
-    "B2301": "Seat Passenger Memory Position Error",
-    "B2302": "Seat Headrest Feedback Potentiometer Circuit Failure",
-    "B2303": "Seat Headrest Feedback Potentiometer Circuit Open",
-    "B2304": "Seat Headrest Feedback Potentiometer Circuit Short to Battery",
-    "B2305": "Seat Headrest Feedback Potentiometer Circuit Short to Ground",
-    "B2306": "Seat Headrest Motor Stalled",
-    "B2310": "Mirror Driver Memory Position Error",
-    "B2311": "Mirror Passenger Memory Position Error",
-    "B2312": "Mirror Passenger Horizontal Feedback Potentiometer Circuit Failure",
-    "B2313": "Mirror Passenger Horizontal Feedback Potentiometer Circuit Open",
-    "B2314": "Mirror Passenger Horizontal Feedback Potentiometer Circuit Short to Battery",
-    "B2315": "Mirror Passenger Horizontal Feedback Potentiometer Circuit Short to Ground",
-    "B2316": "Mirror Passenger Vertical Feedback Potentiometer Circuit Failure",
-    "B2317": "Mirror Passenger Vertical Feedback Potentiometer Circuit Open",
-    "B2318": "Mirror Passenger Vertical Feedback Potentiometer Circuit Short to Battery",
-    "B2319": "Mirror Passenger Vertical Feedback Potentiometer Circuit Short to Ground",
-    "B2320": "Mirror Driver Horizontal Feedback Potentiometer Circuit Failure",
-    "B2321": "Mirror Driver Horizontal Feedback Potentiometer Circuit Open",
-    "B2322": "Mirror Driver Horizontal Feedback Potentiometer Circuit Short to Battery",
-    "B2323": "Mirror Driver Horizontal Feedback Potentiometer Circuit Short to Ground",
-    "B2324": "Mirror Driver Vertical Feedback Potentiometer Circuit Failure",
-    "B2325": "Mirror Driver Vertical Feedback Potentiometer Circuit Open",
-    "B2326": "Mirror Driver Vertical Feedback Potentiometer Circuit Short to Battery",
-    "B2327": "Mirror Driver Vertical Feedback Potentiometer Circuit Short to Ground",
-    "B2328": "Column Reach Feedback Potentiometer Circuit Failure",
-    "B2329": "Column Reach Feedback Potentiometer Circuit Open",
-    "B2330": "Column Reach Feedback Potentiometer Circuit Short to Battery",
-    "B2331": "Column Reach Feedback Potentiometer Circuit Short to Ground",
-    "B2332": "Column Tilt Feedback Potentiometer Circuit Failure",
-    "B2333": "Column Tilt Feedback Potentiometer Circuit Open",
-    "B2334": "Column Tilt Feedback Potentiometer Circuit Short to Battery",
-    "B2335": "Column Tilt Feedback Potentiometer Circuit Short to Ground",
-    "B2336": "Mirror Switch Assembly Circuit Failure",
-    "B2337": "Mirror Switch Assembly Circuit Open",
-    "B2338": "Mirror Switch Assembly Circuit Short to Battery",
-    "B2339": "Mirror Switch Assembly Circuit Short to Ground",
-    "B2340": "Column Reach Motor Stalled",
-    "B2341": "Column Tilt Motor Stalled",
-    "B2342": "Seat Switch Reference Voltage Positive Common Open Circuit",
-    "B2343": "Seat Switch Reference Voltage Positive Common Supply Low Voltage",
-    "B2344": "Seat Switch Reference Voltage Positive Common Supply Voltage Fault",
-    "B2345": "Seat Switch Reference Voltage Negative Common Open Circuit",
-    "B2346": "Mirror Switch Reference Voltage Positive Common Open Circuit",
-    "B2347": "Mirror Switch Reference Voltage Positive Common Supply Low Voltage",
-    "B2348": "Mirror Switch Reference Voltage Positive Common Supply Voltage Fault",
-    "B2349": "Mirror Switch Reference Voltage Negative Common Open Circuit",
-    "B2350": "Steering Column Switch Circuit Short to Battery",
-    "B2351": "Steering Column Switch Circuit Failure",
-    "B2352": "Driver Memory Power Switch Indicator Circuit Short to Battery",
-    "B2353": "Driver Mirror Power Driver Circuit Short Ground",
-    "B2354": "Driver Mirror Horizontal / Vertical Feedback Potentiometer Circuit Open",
-    "B2355": "Passenger Mirror Horizontal / Vertical Feedback Potentiometer Circuit Open",
-    "B2357": "Driver Window Down Current Sense Low Circuit Failure",
-    "B2362": "Remote Open/Close signal Circuit Short to Ground",
-    "B2363": "Optical Sensor System Failure",
-    "B2364": "Fuel Filler Door Circuit Open",
-    "B2365": "B-pillar Power Sliding Door Open/Close Switch Input Ckt Short to Gnd",
-    "B2366": "IP Power Sliding Door Open/Close switch Ckt Short to Gnd",
-    "B2367": "Power Sliding Door Override Switch Input Ckt Short to Gnd",
-    "B2368": "Steering Column Switch Circuit Out of Range",
-    "B2369": "Chime OUTPUT Request Ckt Short to Ground",
-    "B2373": "LED #1 Circuit Short to Battery",
-    "B2374": "Power Sliding Detent (Latch) Circuit Failure",
-    "B2380": "Heater Coolant Temp sensor circuit Short to GND",
-    "B2381": "Heater Coolant Temp sensor circuit Open",
-    "B2384": "Audio Reverse Aid Mute Input Ckt Failure",
-    "B2385": "Audio Navigation Mute Input Ckt Failure",
-    "B2401": "Audio Tape Deck Mechanism Fault",
-    "B2402": "Audio CD/DJ Thermal Shutdown Fault",
-    "B2403": "Audio CD/DJ Internal Fault",
-    "B2404": "Audio Steering Wheel Switch Circuit Fault",
-    "B2405": "Audio Single-Disc CD Player Thermal Shutdown Fault",
-    "B2406": "Audio Single-Disc CD Player Internal Fault",
-    "B2416": "Climate Control Recirculation Actuator Out of Limits",
-    "B2425": "Remote Keyless Entry Out of Synchronization",
-    "B2426": "Passenger Solar Radiation Sensor Circuit Open",
-    "B2427": "Passenger Solar Radiation Sensor Circuit Short to Ground",
-    "B2428": "A/C Post Heater Sensor #2 Circuit Failure",
-    "B2429": "A/C Post Heater Sensor #2 Circuit Short to Ground",
-    "B2431": "Transponder Programming Failed",
-    "B2432": "Drivers Seat Belt Buckle Switch Circuit Open",
-    "B2433": "Drivers Seat Belt Buckle Switch Circuit Short to Battery",
-    "B2434": "Drivers Seat Belt Buckle Switch Circuit Short to Ground",
-    "B2435": "Drivers Seat Belt Buckle Switch Resistance out of Range",
-    "B2436": "Passengers Seat Belt Buckle Switch Circuit Open",
-    "B2437": "Passengers Seat Belt Buckle Switch Circuit Short to Battery",
-    "B2438": "Passengers Seat Belt Buckle Switch Circuit Short to Ground",
-    "B2439": "Passengers Seat Belt Buckle Switch Resistance out of Range",
-    "B2440": "Passenger Sid, Side crash sensor mount fault",
-    "B2441": "Driver Sid, Side crash sensor mount fault",
-    "B2442": "Intrusion Sensor Fault",
-    "B2443": "Powertrain Performance Mode Switch Circuit failure",
-    "B2444": "Driver Side Crash Sensor Internal Fault",
-    "B2445": "Passenger Side Crash Sensor Internal Fault",
-    "B2446": "RESCU/VEMS Input Circuit Open",
-    "B2447": "RESCU/VEMS Input Circuit Short to Battery",
-    "B2448": "RESCU/VEMS Input Circuit Short to Ground",
-    "B2449": "Aux Heater Glow Plug Circuit Short to Ground",
-    "B2450": "Aux Heater Glow Plug Circuit Open",
-    "B2451": "Aux Heater Fuel Pump Circuit Short to Ground",
-    "B2452": "Aux Heater Fuel Pump Circuit Open",
-    "B2453": "Aux Heater Blower Fan Circuit Short to Ground",
-    "B2454": "Aux Heater Blower Fan Circuit Open",
-    "B2455": "Aux Heater Blower Faulted",
-    "B2456": "Aux Heater Coolant Sensor Circuit Short to Ground",
-    "B2457": "Aux Heater Coolant Sensor Circuit Open",
-    "B2458": "Aux Heater Overheat Sensor Circuit Short to Ground",
-    "B2459": "Aux Heater Overheat Sensor Circuit Open",
-    "B2460": "Aux Heater Flame Sensor Circuit Short to Ground",
-    "B2461": "Aux Heater Flame Sensor Circuit Open",
-    "B2462": "Aux Heater Flame Out Fault",
-    "B2463": "Aux Heater Overheat Fault",
-    "B2464": "Aux Heater Start Time Exceeded",
-    "B2465": "Aux Heater Start Counter Overrun/System Locked (same as below ?)",
-    "B2466": "Aux Heater Overheat Counter Overrun/System Locked",
-    "B2467": "Aux Heater Cool Down Time Exceeded (may be con to a453-5 )",
-    "B2468": "Aux Heater Coolant Pump Circuit Short to Ground",
-    "B2469": "Aux Heater Coolant Pump Circuit Open",
-    "B2470": "Interior Fan Control Circuit Short to Ground",
-    "B2471": "Interior Fan Control Circuit Open",
-    "B2472": "Fog Lamp Switch Failure",
-    "B2473": "Passenger Door Disarm Switch ckt Short to Ground",
-    "B2474": "Passenger Door Lock Switch Circuit Shorted to Ground",
-    "B2475": "Passenger Door Unlock Switch Circuit Shorted to Ground",
-    "B2476": "RADIO PRESENT SWITCH Ckt Failure",
-    "B2477": "Module Configuration Failure",
-    "B2478": "ANTI THEFT INPUT SIGNAL SHORT TO GROUND",
-    "B2479": "BRAKE PARK SWITCH CIRCUIT SHORT TO GROUND",
-    "B2480": "LF CORNER LAMP OUTPUT Ckt Short to Battery",
-    "B2481": "Convertible Top Up/Down switch Fault",
-    "B2482": "RF CORNER LAMP OUTPUT Ckt Short to Battery",
-    "B2483": "Enable Signal Open Circuit",
-    "B2484": "Disable Signal Short to Ground",
-    "B2485": "LF SIDE REPEATER LAMP OUTPUT Ckt Short to Battery",
-    "B2487": "RF SIDE REPEATER LAMP OUTPUT Ckt Short to Battery",
-    "B2489": "UNDERHOOD LAMP OUTPUT CIRCUIT Failure",
-    "B2490": "UNDERHOOD LAMP OUTPUT CIRCUIT Short to Battery",
-    "B2491": "RF PARK LAMP OUTPUT CIRCUIT Short to Battery",
-    "B2492": "Already Programmed (Test Mode DTC Only !!!)",
-    "B2493": "LF PARK LAMP OUTPUT CIRCUIT Short to Battery",
-    "B2494": "ANTI THEFT HORN OUTPUT CIRCUIT Short to Batt",
-    "B2495": "ANTI THEFT HORN OUTPUT CIRCUIT Failure",
-    "B2496": "ANTI THEFT HORN OUTPUT CIRCUIT Short to Gnd",
-    "B2499": "COURTESY LAMP OUTPUT Failure",
-    "B2500": "COURTESY LAMP OUTPUT Ckt Short to Battery",
-    "B2501": "LF LAMP LOW BEAM CIRCUIT Failure",
-    "B2502": "LF LAMP LOW BEAM CIRCUIT Short to Battery",
-    "B2503": "RF LAMP LOW BEAM CIRCUIT Failure",
-    "B2504": "RF LAMP LOW BEAM CIRCUIT Short to Battery",
-    "B2505": "LF LAMP HIGH BEAM CIRCUIT Failure",
-    "B2506": "LF LAMP HIGH BEAM CIRCUIT Short to Battery",
-    "B2507": "RF LAMP HIGH BEAM CIRCUIT Failure",
-    "B2508": "RF LAMP HIGH BEAM CIRCUIT Short to Battery",
-    "B2509": "Rear Fog Lamp Switch Circuit Failure",
-    "B2510": "Main Blower Motor Relay Circuit Short to Battery",
-    "B2511": "Horn Output Relay Circuit Short to Battery",
-    "B2512": "Front Fog Lamp Relay Ckt Short to Battery",
-    "B2513": "Blower (Fan) Circuit Failure",
-    "B2514": "Blower (Fan) Circuit Short to Vbatt",
-    "B2515": "Heater Blower Relay Circuit Failure",
-    "B2516": "Blower Control Circuit Failure",
-    "B2517": "Emergency Power Off System Faulted",
-    "B2518": "Compressor Overtemp Fault",
-    "B2519": "High Mount Stop Lamp Circuit Failure",
-    "B2520": "High Mount Stop Lamp Circuit Short to Battery",
-    "B2523": "License Lamp Circuit Failure",
-    "B2524": "License Lamp Circuit Short to Battery",
-    "B2525": "Left Rear Backup Lamp Circuit Failure",
-    "B2526": "Left Rear Backup Lamp Circuit Short to Battery",
-    "B2527": "Left Rear Stop lamp Circuit Failure",
-    "B2528": "Left Rear Stop lamp Circuit Short to Battery",
-    "B2529": "Left Rear Turn Lamp Circuit Failure",
-    "B2530": "Left Rear Turn Lamp Circuit Short to Battery",
-    "B2531": "Right Rear Backup Lamp Circuit Failure",
-    "B2532": "Right Rear Backup Lamp Circuit Short to Battery",
-    "B2533": "Right Rear Stop lamp Circuit Failure",
-    "B2534": "Right Rear Stop lamp Circuit Short to Battery",
-    "B2535": "Right Rear Turn Lamp Circuit Failure",
-    "B2536": "Right Rear Turn Lamp Circuit Short to Battery",
-    "B2539": "Aux A/C Mode Position Reference Circuit Short to Ground",
-    "B2540": "Aux A/C Mode Position Reference Circuit Short to Battery",
-    "B2543": "Aux A/C Control Switch Reference Circuit Short to Ground",
-    "B2544": "Aux A/C Control Switch Reference Circuit Short to Battery",
-    "B2545": "System Power Relay Circuit Short to Battery",
-    "B2546": "System Power Relay Circuit Failure",
-    "B2550": "LAMP DOME OUTPUT Circuit Short to Ground",
-    "B2553": "Disable Signal Output Circuit Short to Battery",
-    "B2554": "LAMP DOME OUTPUT Circuit Failure",
-    "B2555": "LAMP DOME OUTPUT Circuit Short to Battery",
-    "B2556": "Enable Signal Circuit Short to Battery",
-    "B2557": "Left Power Sliding Door Open/Close Output Circuit Short to Battery",
-    "B2558": "Right Power Sliding Door Open/Close Output Circuit Short to Battery",
-    "B2559": "Aux A/C Blower Motor Relay Circuit Short to Battery",
-    "B2560": "Aux A/C Blower Motor Relay Circuit Short to Ground",
-    "B2561": "Aux A/C Blower Speed 1 Circuit Failure",
-    "B2562": "Aux A/C Blower Speed 1 Circuit Short to Ground",
-    "B2563": "Aux A/C Blower Speed 2 Circuit Failure",
-    "B2564": "Aux A/C Blower Speed 2 Circuit Short to Ground",
-    "B2565": "Right Tail Lamp Circuit Failure",
-    "B2566": "Right Tail Lamp Circuit Short to Ground",
-    "B2567": "Reverse Mirror Output Circuit Failure",
-    "B2568": "Reverse Mirror Output Circuit Short to Ground",
-    "B2569": "Liftgate Disarm Switch Circuit Short to Ground",
-    "B2570": "Right Lamp Outage Signal Circuit Short to Ground",
-    "B2571": "Left Lamp Outage Signal Circuit Short to Ground",
-    "B2580": "Aux Blower Sense Switch Circuit Failure",
-    "B2581": "Passenger Seat Occupant Detection Circuit Short To Ground",
-    "B2582": "Passenger Seat Occupant Detection Circuit Open",
-    "B2583": "Child Seat Detection Circuit Short to Ground",
-    "B2584": "Child Seat Detection Circuit Open",
-    "B2585": "Anti Theft Input Signal Circuit Short To Battery",
-    "B2586": "Headlamp Mode Select Circuit Failure",
-    "B2587": "Passenger Seat Occupant Detection Circuit Short To Battery",
-    "B2588": "Child Seat Detection Circuit Short To Battery",
-    "B2589": "Unexpected Door Reversal During Close",
-    "B2590": "Vehicle Park/Speed Signal Circuit Failure",
-    "B2591": "Detent Signal Missing During Unlatch",
-    "B2592": "PSD Not Fully Closed (Module Commanded Successfully)",
-    "B2593": "Power Sliding Door Opened During Module Close Command",
-    "B2594": "No Movement Detected After an Unlatch During Power Open",
-    "B2595": "Anti Theft Input Signal Circuit Failure",
-    "B2596": "Headlamp Aim Output Relay Circuit Short To Battery",
-    "B2597": "Headlamp Aim Output Relay Circuit Failure",
-    "B2598": "Headlamp Relay Circuit Failure",
-    "B2599": "Tailgate Release Open Circuit",
-    "B2600": "Double Locking Door Motor Frozen",
-    "B2601": "No Latch Signal Sensed on Closing and Door Reversed",
-    "B2602": "Missing Latch Signal During Power Sliding Door Unlatch",
-    "B2603": "PSD Not Fully Closed During Self-Test",
-    "B2604": "Power Sliding Door On/Off Switch Open Circuit",
-    "B2605": "Disable Signal Open Circuit",
-    "B2606": "A/C Temperature Sensor Out of Range",
-}
-
-C0_ERRORS = {
-    "C0035": "Speed Wheel Sensor All Coherency Failure",
-    "C0040": "Right Front Wheel Speed Circuit Malfunction",
-    "C0110": "Pump Motor Circuit",
-    "C0242": "Engine Control Module Indicated Traction Control Malfunction",
-    "C0265": "EBCM Motor Relay Circuit Low When On (Chevrolet)",
-}
-
-C1_ERRORS = {
-    "C1091": "Speed Wheel Sensor All Coherency Failure",
-    "C1095": "ABS Hydraulic Pump Motor Circuit Failure",
-    "C1096": "ABS Hydraulic Pump Motor Circuit Open",
-    "C1097": "ABS Hydraulic Pump Motor Circuit Short To Ground",
-    "C1098": "ABS Hydraulic Pump Motor Circuit Short To Battery",
-    "C1100": "ABS Pump Switch Circuit Failure",
-    "C1101": "ABS Hydraulic Valve Circuit Failure",
-    "C1102": "ABS Acceleration Switch Circuit Failure",
-    "C1103": "ABS Hydraulic Brake Switch Circuit Failure",
-    "C1104": "Traction Control Active Lamp - Circuit Short to Battery",
-    "C1105": "Traction Control Disable Lamp - Circuit Short to Battery",
-    "C1106": "Traction Control Disable Switch Circuit Short to Battery",
-    "C1107": "ABS Function Enabled Input Circuit Failure",
-    "C1109": "Speed Control Actuator Assembly Cable Release Failure",
-    "C1110": "ABS Power Relay Coil Circuit Failure",
-    "C1111": "ABS Power Relay Coil Open Circuit",
-    "C1112": "ABS Power Relay Coil Short Circuit To Ground",
-    "C1113": "ABS Power Relay Coil Short Circuit To Battery",
-    "C1114": "ABS Power Relay Output Short Circuit To Ground",
-    "C1115": "ABS Power Relay Output Short Circuit To Battery",
-    "C1116": "Starter Motor Circuit Failure",
-    "C1117": "RPM Input Circuit Failure",
-    "C1123": "Vehicle Speed Sensor Input Short to Battery",
-    "C1124": "Input shaft speed signal missing/faulted",
-    "C1125": "Brake Fluid Level Sensor Input Circuit Failure",
-    "C1126": "Cruise Control Command Switch Assembly Circuit Failure",
-    "C1127": "Cruise Control Deactivator Brake Switch Circuit Failure",
-    "C1132": "Clutch position ckt short to ground",
-    "C1133": "Clutch position ckt short to battery",
-    "C1134": "Gear Shift position short to ground",
-    "C1135": "Gear Shift position short to battery",
-    "C1136": "Gear Select position short to ground",
-    "C1137": "ECU is Defective",
-    "C1138": "Gear Select position short to Battery",
-    "C1139": "Wheel Speed Sensor Center Tone Ring Missing Tooth Fault",
-    "C1140": "Hydraulic Base Brake Failure",
-    "C1141": "Wheel Speed Sensor LF Tone Ring Tooth Missing Fault",
-    "C1142": "Wheel Speed Sensor RF Tone Ring Tooth Missing Fault",
-    "C1143": "Wheel Speed Sensor LR Tone Ring Tooth Missing Fault",
-    "C1144": "Wheel Speed Sensor RR Tone Ring Tooth Missing Fault",
-    "C1145": "Speed Wheel Sensor RF Input Circuit Failure",
-    "C1146": "Speed Wheel Sensor RF Circuit Open",
-    "C1148": "Speed Wheel Sensor RF Coherency Fault",
-    "C1149": "Hydraulic Fluid Pressure/ Flow Circuit Failure",
-    "C1150": "Two Speed Rear Axle Input Switch Circuit Short to Vbatt",
-    "C1155": "Speed Wheel Sensor LF Input Circuit Failure",
-    "C1156": "Speed Wheel Sensor LF Circuit Open",
-    "C1157": "Park Brake Actuator Assembly Switch Applied Circuit Failure",
-    "C1158": "Speed Wheel Sensor LF Coherency Fault",
-    "C1159": "Hydraulic Fluid Pressure/ Flow Circuit Short to Gnd",
-    "C1161": "Air Pressure Low Circuit Short to Gnd",
-    "C1162": "Park Brake Switch # 2 Released Circuit Failure",
-    "C1163": "Park Brake Switch # 2 Applied Circuit Short to Gnd",
-    "C1164": "Park Brake Actuator Assembly Switch Circuit Failure",
-    "C1165": "Speed Wheel Sensor RR Input Circuit Failure",
-    "C1166": "Speed Wheel Sensor RR Input Open Circuit",
-    "C1167": "Park Brake Actuator Assembly Switch Released Circuit Short to Gnd",
-    "C1168": "Speed Wheel Sensor RR Coherency Fault",
-    "C1169": "ABS Fluid Dumping Exceeds Maximum Timing",
-    "C1170": "PRNDL Switch Circuit Failure",
-    "C1172": "Park Brake Switch # 1 Applied Circuit Failure",
-    "C1173": "Park Brake Switch # 1 Released Circuit Short to Gnd",
-    "C1174": "Park Brake Switch # 2 Applied Circuit Failure",
-    "C1175": "Speed Wheel Sensor LR Input Circuit Failure",
-    "C1176": "Speed Wheel Sensor LR Circuit Open",
-    "C1177": "Park Brake Actuator Assembly Switch Released Circuit Failure",
-    "C1178": "Speed Wheel Sensor LR Coherency Fault",
-    "C1179": "Speed Control Actuator Assembly Cable Slack Failure",
-    "C1180": "Park Brake Valve Solenoid #1 Sense Input Circuit Failure",
-    "C1181": "Park Brake Valve Solenoid #1 Sense Input Circuit Short to Gound",
-    "C1182": "Park Lamp Flash Relay Circuit Failure",
-    "C1183": "Park Lamp Flash Relay Circuit Short to Battery",
-    "C1184": "ABS System Is Not Operational",
-    "C1185": "ABS Power Relay Output Circuit Failure",
-    "C1186": "ABS Power Relay Output Open Circuit",
-    "C1187": "Brake Fluid Level Sensor Input Open Circuit",
-    "C1188": "Brake Fluid Level Sensor Input Short Circuit To Battery",
-    "C1189": "Brake Fluid Level Sensor Input Short Circuit To Ground",
-    "C1190": "Speed Wheel Sensor LF Input Short Circuit To Battery",
-    "C1191": "Speed Wheel Sensor LF Input Short Circuit To Ground",
-    "C1192": "Speed Wheel Sensor RF Input Short Circuit To Battery",
-    "C1193": "Speed Wheel Sensor RF Input Short Circuit To Ground",
-    "C1194": "ABS Outlet Valve Coil LF Circuit Failure",
-    "C1195": "ABS Outlet Valve Coil LF Circuit Open",
-    "C1196": "ABS Outlet Valve Coil LF Circuit Short To Battery",
-    "C1197": "ABS Outlet Valve Coil LF Circuit Short To Ground",
-    "C1198": "ABS Inlet Valve Coil LF Circuit Failure",
-    "C1199": "ABS Inlet Valve Coil LF Circuit Open",
-    "C1200": "ABS Inlet Valve Coil LF Circuit Short To Battery",
-    "C1201": "ABS Inlet Valve Coil LF Circuit Short To Ground",
-    "C1202": "ABS Outlet Valve Coil Rear Circuit Failure",
-    "C1203": "ABS Outlet Valve Coil Rear Circuit Open",
-    "C1204": "ABS Outlet Valve Coil Rear Circuit Short To Battery",
-    "C1205": "ABS Outlet Valve Coil Rear Circuit Short To Ground",
-    "C1206": "ABS Inlet Valve Coil Rear Circuit Failure",
-    "C1207": "ABS Inlet Valve Coil Rear Circuit Open",
-    "C1208": "ABS Inlet Valve Coil Rear Circuit Short To Battery",
-    "C1209": "ABS Inlet Valve Coil Rear Circuit Short To Ground",
-    "C1210": "ABS Outlet Valve Coil RF Circuit Failure",
-    "C1211": "ABS Outlet Valve Coil RF Circuit Open",
-    "C1212": "ABS Outlet Valve Coil RF Circuit Short To Battery",
-    "C1213": "ABS Outlet Valve Coil RF Circuit Short To Ground",
-    "C1214": "ABS Inlet Valve Coil RF Circuit Failure",
-    "C1215": "ABS Inlet Valve Coil RF Circuit Open",
-    "C1216": "ABS Inlet Valve Coil RF Circuit Short To Battery",
-    "C1217": "ABS Inlet Valve Coil RF Circuit Short To Ground",
-    "C1218": "Lamp ABS Warning Output Circuit Failure",
-    "C1219": "Lamp ABS Warning Output Circuit Open",
-    "C1220": "Lamp ABS Warning Output Circuit Short To Battery",
-    "C1221": "Lamp ABS Warning Output Circuit Short To Ground",
-    "C1222": "Speed Wheel Mismatch",
-    "C1223": "Lamp Brake Warning Output Circuit Failure",
-    "C1224": "Lamp Brake Warning Output Circuit Open",
-    "C1225": "Lamp Brake Warning Output Circuit Short To Battery",
-    "C1226": "Lamp Brake Warning Output Circuit Short To Ground",
-    "C1227": "Speed Wheel Sensor LR Input Short Circuit To Battery",
-    "C1228": "Speed Wheel Sensor LR Input Short Circuit To Ground",
-    "C1229": "Speed Wheel Sensor Rear Center Coherency Fault",
-    "C1230": "Speed Wheel Sensor Rear Center Input Circuit Failure",
-    "C1231": "Speed Wheel Sensor Rear Center Circuit Open",
-    "C1232": "Speed Wheel Sensor Rear Center Input Short Circuit To Battery",
-    "C1233": "Speed Wheel LF Input Signal Missing",
-    "C1234": "Speed Wheel RF Input Signal Missing",
-    "C1235": "Speed Wheel RR Input Signal Missing",
-    "C1236": "Speed Wheel LR Input Signal Missing",
-    "C1237": "Speed Wheel Rear Input Signal Missing",
-    "C1238": "ABS Hydraulic Pressure Differential Switch Input Circuit Failure",
-    "C1239": "ABS Hydraulic Pressure Differential Switch Input Open Circuit",
-    "C1240": "ABS Hydraulic Pressure Differential Switch Input Short Circuit To Battery",
-    "C1241": "ABS Hydraulic Pressure Differential Switch Input Short Circuit To Ground",
-    "C1242": "ABS Outlet Valve Coil LR Circuit Failure",
-    "C1243": "ABS Outlet Valve Coil LR Circuit Open",
-    "C1244": "ABS Outlet Valve Coil LR Circuit Short To Battery",
-    "C1245": "ABS Outlet Valve Coil LR Circuit Short To Ground",
-    "C1246": "ABS Outlet Valve Coil RR Circuit Failure",
-    "C1247": "ABS Outlet Valve Coil RR Circuit Open",
-    "C1248": "ABS Outlet Valve Coil RR Circuit Short To Battery",
-    "C1249": "ABS Outlet Valve Coil RR Circuit Short To Ground",
-    "C1250": "ABS Inlet Valve Coil LR Circuit Failure",
-    "C1251": "ABS Inlet Valve Coil LR Circuit Open",
-    "C1252": "ABS Inlet Valve Coil LR Circuit Short To Battery",
-    "C1253": "ABS Inlet Valve Coil LR Circuit Short To Ground",
-    "C1254": "ABS Inlet Valve Coil RR Circuit Failure",
-    "C1255": "ABS Inlet Valve Coil RR Circuit Open",
-    "C1256": "ABS Inlet Valve Coil RR Circuit Short To Battery",
-    "C1257": "ABS Inlet Valve Coil RR Circuit Short To Ground",
-    "C1258": "Speed Wheel LF Comparison Failure",
-    "C1259": "Speed Wheel RF Comparison Failure",
-    "C1260": "Speed Wheel RR Comparison Failure",
-    "C1261": "Speed Wheel LR Comparison Failure",
-    "C1262": "Lamp Warning Relay Circuit Failure",
-    "C1263": "Lamp Warning Relay Circuit Open",
-    "C1264": "Lamp Warning Relay Circuit Short To Battery",
-    "C1265": "Lamp Warning Relay Circuit Short To Ground",
-    "C1266": "ABS Valve Power Relay Circuit Failure",
-    "C1267": "ABS Functions Temporarily Disabled",
-    "C1268": "Motor Relay # 1 Circuit Failure",
-    "C1269": "Motor Relay # 1 Circuit Short to Battery",
-    "C1270": "Motor # 1 Input Circuit Failure",
-    "C1271": "Motor # 1 Input Circuit Short to Gnd",
-    "C1272": "Motor # 2 Input Circuit Failure",
-    "C1273": "Motor # 2 Input Circuit Short to Vbat",
-    "C1274": "Solenoid Relay # 1 Circuit Failure",
-    "C1275": "Solenoid Relay # 1 Circuit Short to Vbatt",
-    "C1276": "Park Brake Actuator Assembly Switch Applied Circuit Short to Gnd",
-    "C1277": "STEERING Wheel Angle 1and 2 Circuit Failure",
-    "C1278": "STEERING Wheel Angle 1and 2 Signal Faulted",
-    "C1279": "Yaw Rate Sensor circuit Failure",
-    "C1280": "Yaw Rate Sensor Signal Fault",
-    "C1281": "Lateral Accelerometer circuit Failure",
-    "C1282": "Lateral Accelerometer Signal Fault",
-    "C1283": "Switch Test Signal Failure",
-    "C1284": "Oil Pressure Switch Failure",
-    "C1285": "Booster Solenoid circuit Failure",
-    "C1286": "Booster Mechanical Failure",
-    "C1287": "Booster Pedal Force switch circuit Failure",
-    "C1288": "Pressure Transducer Main / Primary Input Circuit Failure",
-    "C1289": "Pressure Transducer Redundant / Secondary Input Circuit Failure",
-    "C1400": "Traction Control Valve RF Circuit Failure",
-    "C1401": "Traction Control Valve RF Circuit Open",
-    "C1402": "Traction Control Valve RF Circuit Short To Ground",
-    "C1403": "Traction Control Valve RF Circuit Short To Battery",
-    "C1404": "Traction Control Valve Rear Circuit Failure",
-    "C1405": "Traction Control Valve Rear Circuit Open",
-    "C1406": "Traction Control Valve Rear Circuit Short To Ground",
-    "C1407": "Traction Control Valve Rear Circuit Short To Battery",
-    "C1410": "Traction Control Valve LF Circuit Failure",
-    "C1411": "Traction Control Valve LF Circuit Open",
-    "C1412": "Traction Control Valve LF Circuit Short To Ground",
-    "C1413": "Traction Control Valve LF Circuit Short To Battery",
-    "C1414": "Incorrect Module Design Level",
-    "C1415": "Incorrect Module Configuration",
-    "C1416": "Damper RF Circuit Short To Battery",
-    "C1417": "Damper RF Circuit Short to Ground",
-    "C1418": "Damper RF Circuit Failure",
-    "C1419": "Damper RF Circuit Open",
-    "C1420": "Hydraulic Fluid Pressure/ Flow Circuit Short to Vbatt",
-    "C1421": "Damper LF Circuit Short To Battery",
-    "C1422": "Damper LF Circuit Short to Ground",
-    "C1423": "Damper LF Circuit Failure",
-    "C1424": "Damper LF Circuit Open",
-    "C1425": "Damper RR Circuit Short to Ground",
-    "C1426": "Damper RR Circuit Short To Battery",
-    "C1427": "Damper RR Circuit Open",
-    "C1428": "Damper RR Circuit Failure",
-    "C1429": "Input-shaft-speed input circuit failure",
-    "C1430": "Damper LR Circuit Open",
-    "C1431": "Damper LR Circuit Short To Battery",
-    "C1432": "Damper LR Circuit Short to Ground",
-    "C1433": "Damper LR Circuit Failure",
-    "C1435": "Accelerometer Rear Circuit Failure",
-    "C1436": "Accelerometer Rear Circuit Signal Is Not Sensed",
-    "C1437": "Accelerometer Rear Circuit Short To Ground",
-    "C1438": "Accelerometer Rear Circuit Short To Battery",
-    "C1439": "Vehicle Acceleration EEC-IV Circuit Failure",
-    "C1440": "Pressure Transducer Main / Primary signal Faulted",
-    "C1441": "Steering Phase A Circuit Signal Is Not Sensed",
-    "C1442": "Steering Phase B Circuit Signal Is Not Sensed",
-    "C1443": "Steering Phase A Circuit Short To Ground",
-    "C1444": "Steering Phase B Circuit Short To Ground",
-    "C1445": "Speed Vehicle Signal Circuit Failure",
-    "C1446": "Brake Switch Circuit Failure",
-    "C1447": "Traction Control Module Request Circuit Failure",
-    "C1448": "Lamp Adaptive Damping Warning Circuit Failure",
-    "C1449": "Traction Control Motor Coherency Fault",
-    "C1450": "Traction Control Motor Circuit Failure",
-    "C1451": "Traction Control Motor Circuit Open",
-    "C1452": "Traction Control Motor Circuit Short to Battery",
-    "C1453": "Traction Control Motor Circuit Short to Ground",
-    "C1454": "Front Lateral Accelerometer Circuit Failure",
-    "C1455": "Accelerometer Front Circuit Failure",
-    "C1456": "Accelerometer Front Circuit Is Not Sensed",
-    "C1457": "Accelerometer Front Circuit Short To Ground",
-    "C1458": "Accelerometer Front Circuit Short To Battery",
-    "C1459": "Adaptive Mode Switch Circuit Failure",
-    "C1460": "Vehicle Accelerometer Power Circuit Failure",
-    "C1461": "Vehicle Accelerometer Power Circuit Short to Battery",
-    "C1462": "Left Front Vertical Accelerometer Circuit Failure",
-    "C1463": "Right Front Vertical Accelerometer Circuit Failure",
-    "C1464": "Pressure Transducer Redundant / Secondary Signal Faulted",
-    "C1465": "Damper High Side Front Circuit Short To Battery",
-    "C1466": "Damper Circuit Failure",
-    "C1467": "Damper High Side Rear Circuit Short To Battery",
-    "C1468": "Damper Low Side Front Circuit Failure",
-    "C1469": "Damper Low Side Rear Circuit Failure",
-    "C1495": "Traction Control Motor Potentiometer Circuit Failure",
-    "C1496": "Traction Control Motor Potentiometer Circuit Open",
-    "C1497": "Traction Control Motor Potentiometer Circuit Short to Battery",
-    "C1498": "Traction Control Motor Potentiometer Circuit Short to Ground",
-    "C1499": "Transfer Case Contact Plate 'A' Encoder Circuit Failure",
-    "C1500": "Transfer Case Contact Plate 'B' Encoder Circuit Failure",
-    "C1501": "Transfer Case Contact Plate 'C' Encoder Circuit Failure",
-    "C1502": "Transfer Case Contact Plate 'D' Encoder Circuit Failure",
-    "C1503": "Dynamic Stability Control Left Front Valve Malfunction",
-    "C1504": "Dynamic Stability Control Right Front Valve Malfunction",
-    "C1505": "Dynamic Stability Control Left Rear Valve Malfunction",
-    "C1506": "Dynamic Stability Control Right Rear Valve Malfunction",
-    "C1507": "Traction Control of Brake Exceeds Time-Out",
-    "C1508": "Traction Control of Engine Exceeds Time-Out",
-    "C1510": "Right Front Wheel Pressure Reduction Performance Problem",
-    "C1511": "Left Front Wheel Pressure Reduction Performance Problem",
-    "C1512": "Right Rear Wheel Pressure Reduction Performance Problem",
-    "C1513": "Left rear Wheel Pressure Reduction Performance Problem",
-    "C1699": "Left Rear Sensor Circuit Short to Vbat",
-    "C1700": "Left Rear Sensor Circuit Failure",
-    "C1701": "Left Rear Sensor Circuit Fault",
-    "C1702": "RightRear Sensor Circuit Short to Vbat",
-    "C1703": "Right Rear Sensor Circuit Failure",
-    "C1704": "Right Rear Sensor Circuit Fault",
-    "C1705": "Left Rear Center Sensor Circuit Short to Vbat",
-    "C1706": "Left Rear Center Sensor Circuit Failure",
-    "C1707": "Left Rear Center Sensor Circuit Fault",
-    "C1708": "Right Rear Center Sensor Circuit Short to Vbat",
-    "C1709": "Right Rear Center Sensor Circuit Failure",
-    "C1710": "Right Rear Center Sensor Circuit Fault",
-    "C1711": "Left Front Sensor Circuit Short to Vbat",
-    "C1712": "Left Front Sensor Circuit Failure",
-    "C1713": "Left Front Sensor Circuit Fault",
-    "C1714": "Right Front Sensor Circuit Short to Vbat",
-    "C1715": "Right Front Sensor Circuit Failure",
-    "C1716": "Right Front Sensor Circuit Fault",
-    "C1717": "Left Front Center Sensor Circuit Short to Vbat",
-    "C1718": "Left Front Center Sensor Circuit Failure",
-    "C1719": "Left Front Center Sensor Circuit Fault",
-    "C1721": "Air Suspension Height Sensor Power Circuit Open",
-    "C1722": "Air Suspension Height Sensor Power Circuit Short To Battery",
-    "C1723": "Air Suspension Height Sensor Power Circuit Short To Ground",
-    "C1724": "Air Suspension Height Sensor Power Circuit Failure",
-    "C1725": "Air Suspension Front Pneumatic Failure",
-    "C1726": "Air Suspension Rear Pneumatic Failure",
-    "C1727": "Air Suspension Reservoir Pneumatic Failure",
-    "C1728": "Transfer Case unable to transition between 2H and 4H",
-    "C1729": "Transfer Case unable to transition between 4H and 4L",
-    "C1730": "Reference Voltage Out of Range (+5 v)",
-    "C1731": "Air Suspension LF Corner Up Timeout",
-    "C1732": "Air Suspension LF Corner Down Timeout",
-    "C1733": "Air Suspension RF Corner Up Timeout",
-    "C1734": "Air Suspension RF Corner Down Timeout",
-    "C1735": "Air Suspension LR Corner Up Timeout",
-    "C1736": "Air Suspension LR Corner Down Timeout",
-    "C1737": "Air Suspension RR Corner Up Timeout",
-    "C1738": "Air Suspension RR Corner Down Timeout",
-    "C1739": "Right Front Center Sensor Circuit Short to Vbat",
-    "C1740": "Right Front Center Sensor Circuit Failure",
-    "C1741": "Right Front Center Sensor Circuit Fault",
-    "C1742": "Rear Sounder Circuit Failure",
-    "C1743": "Rear Sounder Circuit Short to Vbatt",
-    "C1744": "Front Sounder Circuit Failure",
-    "C1745": "Front Sounder Circuit Short to Vbatt",
-    "C1748": "Switch input Circuit Short to Gnd",
-    "C1749": "Trailer Input Circuit Failure",
-    "C1750": "Accelerator Position Sensor Out of Range",
-    "C1751": "Vehicle Speed Sensor # 1 Output Circuit Short to Vbatt",
-    "C1752": "Vehicle Speed Sensor # 1 Output Circuit Short to Gnd",
-    "C1753": "Hydraulic Clutch Actuator Valve Signal Fault",
-    "C1754": "Hydraulic Clutch Actuator Valve Circuit Failure",
-    "C1755": "Power Limit Shutdown Fault",
-    "C1756": "Air Suspension Front Height Sensor High (SE) Signal Circuit Failure",
-    "C1757": "Air Suspension Front Height Sensor High (SE) Signal Circuit Open",
-    "C1758": "Air Suspension Front Height Sensor High (SE) Signal Circuit Short To Battery",
-    "C1759": "Air Suspension Front Height Sensor High (SE) Signal Circuit Short To Ground",
-    "C1760": "Air Suspension Rear Height Sensor High (SE) Signal Circuit Failure",
-    "C1761": "Air Suspension Rear Height Sensor High (SE) Signal Circuit Open",
-    "C1762": "Air Suspension Rear Height Sensor High (SE) Signal Circuit Short To Battery",
-    "C1763": "Air Suspension Rear Height Sensor High (SE) Signal Circuit Short To Ground",
-    "C1765": "Air Suspension Rear Height Sensor Low Signal Circuit Failure",
-    "C1766": "Air Suspension Rear Height Sensor Low Signal Circuit Open",
-    "C1767": "Air Suspension Rear Height Sensor Low Signal Circuit Short To Battery",
-    "C1768": "Air Suspension Rear Height Sensor Low Signal Circuit Short To Ground",
-    "C1770": "Air Suspension Vent Solenoid Output Circuit Failure",
-    "C1771": "Air Suspension Vent Solenoid Output Circuit Open",
-    "C1772": "Air Suspension Vent Solenoid Output Circuit Short To Battery",
-    "C1773": "Air Suspension Vent Solenoid Output Circuit Short To Ground",
-    "C1774": "Coolant Temp Out of Range",
-    "C1775": "DC-DC Converter Failure",
-    "C1776": "Heater System Failure",
-    "C1777": "Vacuum Pressure Circuit Failure",
-    "C1778": "Power Steering Failure",
-    "C1779": "Blower Switch Failure",
-    "C1780": "Temperature Select Failure",
-    "C1781": "Engine Coolant Temperature Signal Missing/Fault",
-    "C1790": "Air Suspension LR Air Spring/Shock Solenoid Output Circuit Failure",
-    "C1791": "Air Suspension LR Air Spring/Shock Solenoid Output Circuit Open",
-    "C1792": "Air Suspension LR Air Spring/Shock Solenoid Output Circuit Short To Battery",
-    "C1793": "Air Suspension LR Air Spring/Shock Solenoid Output Circuit Short To Ground",
-    "C1795": "Air Suspension RR Air Spring/Shock Solenoid Output Circuit Failure",
-    "C1796": "Air Suspension RR Air Spring/Shock Solenoid Output Circuit Open",
-    "C1797": "Air Suspension RR Air Spring/Shock Solenoid Output Circuit Short To Battery",
-    "C1798": "Air Suspension RR Air Spring/Shock Solenoid Output Circuit Short To Ground",
-    "C1800": "Air Suspension Reservoir Solenoid Circuit Failure",
-    "C1805": "Mismatched PCM and/or ABS-TC Module",
-    "C1813": "Air Suspension LR Vent Request Exceeded Max Timing",
-    "C1814": "Air Suspension RR Vent Request Exceeded Max Timing",
-    "C1818": "Air Suspension LR Air Compress Request Exceeded Max Timing",
-    "C1819": "Air Suspension RR Air Compress Request Exceeded Max Timing",
-    "C1820": "Air Suspension RF Air Compress Request Exceeded Max Timing",
-    "C1830": "Air Suspension Compressor Relay Circuit Failure",
-    "C1831": "Air Suspension Compressor Relay Circuit Open",
-    "C1832": "Air Suspension Compressor Relay Circuit Short To Battery",
-    "C1833": "Air Suspension Compressor Relay Circuit Short To Ground",
-    "C1834": "Gauge Drive Current Fault",
-    "C1835": "Current Sense Circuit Failure",
-    "C1836": "Battery Temp out of Range",
-    "C1837": "Battery Heater Circuit Failure",
-    "C1838": "Charging System Fault",
-    "C1839": "Leakage Fault",
-    "C1840": "Air Suspension Disable Switch Circuit Failure",
-    "C1841": "Air Suspension Disable Switch Circuit Open",
-    "C1842": "Air Suspension Disable Switch Circuit Short To Battery",
-    "C1843": "Air Suspension Disable Switch Circuit Short To Ground",
-    "C1844": "Air Suspension Secondary Front Inflator Solenoid Output Circuit Failure",
-    "C1845": "Air Suspension Front Inflator Solenoid Output Circuit Failure",
-    "C1846": "Air Suspension Front Inflator Solenoid Output Circuit Open",
-    "C1847": "Air Suspension Front Inflator Solenoid Output Circuit Short To Battery",
-    "C1848": "Air Suspension Front Inflator Solenoid Output Circuit Short To Ground",
-    "C1849": "Master Cylinder Pressure Out of Range",
-    "C1850": "Air Suspension Warning Lamp Circuit Failure",
-    "C1851": "Air Suspension Warning Lamp Circuit Open",
-    "C1852": "Air Suspension Warning Lamp Circuit Short To Battery",
-    "C1853": "Air Suspension Warning Lamp Circuit Short To Ground",
-    "C1854": "Motor Temperature Out of Range",
-    "C1855": "Acceleration Position Sensor Conflict",
-    "C1856": "Traction Motor Encoder circuit Failure",
-    "C1859": "PRNDL Input #2 Circuit Failure",
-    "C1860": "PRNDL Input #3 Circuit Failure",
-    "C1861": "PRNDL Input #4 Circuit Failure",
-    "C1862": "Contactor Circuit Failure",
-    "C1863": "External Charging Fault",
-    "C1864": "Battery Module Fault",
-    "C1865": "Air Suspension Rear Inflator Solenoid Output Circuit Failure",
-    "C1866": "Air Suspension Rear Inflator Solenoid Output Circuit Open",
-    "C1867": "Air Suspension Rear Inflator Solenoid Output Circuit Short To Battery",
-    "C1868": "Air Suspension Rear Inflator Solenoid Output Circuit Short To Ground",
-    "C1869": "Air Suspension Gate Solenoid Output Circuit Failure",
-    "C1870": "Air Suspension Gate Solenoid Output Circuit Open",
-    "C1871": "Air Suspension Gate Solenoid Output Circuit Short To Battery",
-    "C1872": "Air Suspension Gate Solenoid Output Circuit Short To Ground",
-    "C1873": "Air Suspension RF Air Spring Solenoid Output Circuit Failure",
-    "C1874": "Air Suspension RF Air Spring Solenoid Output Circuit Open",
-    "C1875": "Air Suspension RF Air Spring Solenoid Output Circuit Short To Battery",
-    "C1876": "Air Suspension RF Air Spring Solenoid Output Circuit Short To Ground",
-    "C1877": "Air Suspension LF Air Spring Solenoid Output Circuit Failure",
-    "C1878": "Air Suspension LF Air Spring Solenoid Output Circuit Open",
-    "C1879": "Air Suspension LF Air Spring Solenoid Output Circuit Short To Battery",
-    "C1880": "Air Suspension LF Air Spring Solenoid Output Circuit Short To Ground",
-    "C1881": "Air Suspension RF Height Sensor Circuit Failure",
-    "C1882": "Air Suspension RF Height Sensor Circuit Open",
-    "C1883": "Air Suspension RF Height Sensor Circuit Short To Battery",
-    "C1884": "Air Suspension RF Height Sensor Circuit Short To Ground",
-    "C1885": "Air Suspension RR Height Sensor Circuit Failure",
-    "C1886": "Air Suspension RR Height Sensor Circuit Open",
-    "C1887": "Air Suspension RR Height Sensor Circuit Short To Battery",
-    "C1888": "Air Suspension RR Height Sensor Circuit Short To Ground",
-    "C1889": "Air Suspension LF Height Sensor Circuit Failure",
-    "C1890": "Air Suspension LF Height Sensor Circuit Open",
-    "C1891": "Air Suspension LF Height Sensor Circuit Short To Battery",
-    "C1892": "Air Suspension LF Height Sensor Circuit Short To Ground",
-    "C1893": "Air Suspension LR Height Sensor Circuit Failure",
-    "C1894": "Air Suspension LR Height Sensor Circuit Open",
-    "C1895": "Air Suspension LR Height Sensor Circuit Short To Battery",
-    "C1896": "Air Suspension LR Height Sensor Circuit Short To Ground",
-    "C1897": "Steering VAPS II Circuit Loop Failure",
-    "C1898": "Steering VAPS II Circuit Loop Open",
-    "C1899": "Steering VAPS II Circuit Loop Short To Battery",
-    "C1900": "Steering VAPS II Circuit Loop Short To Ground",
-    "C1901": "Ride Control RR Shock Actuator Circuit Failure",
-    "C1902": "Ride Control RR Shock Actuator Circuit Open",
-    "C1903": "Ride Control RR Shock Actuator Circuit Short To Battery",
-    "C1904": "Ride Control RR Shock Actuator Circuit Short To Ground",
-    "C1905": "Ride Control LR Shock Actuator Circuit Failure",
-    "C1906": "Ride Control LR Shock Actuator Circuit Open",
-    "C1907": "Ride Control LR Shock Actuator Circuit Short To Battery",
-    "C1908": "Ride Control LR Shock Actuator Circuit Short To Ground",
-    "C1909": "Ride Control RF Shock Actuator Circuit Failure",
-    "C1910": "Ride Control RF Shock Actuator Circuit Open",
-    "C1911": "Ride Control RF Shock Actuator Circuit Short To Battery",
-    "C1912": "Ride Control RF Shock Actuator Circuit Short To Ground",
-    "C1913": "Ride Control LF Shock Actuator Circuit Failure",
-    "C1914": "Ride Control LF Shock Actuator Circuit Open",
-    "C1915": "Ride Control LF Shock Actuator Circuit Short To Battery",
-    "C1916": "Ride Control LF Shock Actuator Circuit Short To Ground",
-    "C1917": "Steering EVO Out-of-Range Fault",
-    "C1918": "Air Suspension Ride Height Select Switch Circuit Failure",
-    "C1920": "Led #1 Circuit Failure",
-    "C1921": "VAPS Solenoid Actuator Output Circuit Failure",
-    "C1922": "VAPS Solenoid Actuator Output Circuit Open",
-    "C1923": "VAPS Solenoid Actuator Output Circuit Short To Battery",
-    "C1924": "VAPS Solenoid Actuator Output Circuit Short To Ground",
-    "C1925": "VAPS Solenoid Actuator Return Circuit Failure",
-    "C1926": "VAPS Solenoid Actuator Return Circuit Open",
-    "C1927": "VAPS Solenoid Actuator Return Circuit Short To Battery",
-    "C1928": "VAPS Solenoid Actuator Return Circuit Short To Ground",
-    "C1929": "Air Suspension Front Compressor Relay Circuit Failure",
-    "C1930": "Air Suspension Front Compressor Relay Circuit Open",
-    "C1931": "Air Suspension Front Compressor Relay Circuit Short To Battery",
-    "C1932": "Air Suspension Front Compressor Relay Circuit Short To Ground",
-    "C1933": "Solenoid Current Out Of Range",
-    "C1934": "HPU (Hydraulic Pump Unit) Pressurisation Failure",
-    "C1935": "Chime Circuit Failure",
-    "C1936": "Hydraulic Pump Relay Circuit Failure",
-    "C1937": "Steering Wheel Angle Sensor Offset Failure",
-    "C1938": "Invalid Steering Wheel Angle Sensor ID",
-    "C1939": "Brake Pressure Switch Input Circuit Failure",
-    "C1940": "Brake Pressure Switch Mechanical Failure",
-    "C1942": "Unrecognized Powertrain Configuration",
-    "C1943": "Airbag Deployment Indication Input Fault",
-    "C1944": "Gauge Driver Circuit Fault",
-    "C1945": "Park Switch Indicates Park with Vehicle Moving",
-    "C1946": "Seat Track Position Switch Circuit Open",
-    "C1947": "Seat Track Position Switch Circuit Short to Ground",
-    "C1948": "Seat Track Position Switch Circuit Resistance Out of Range",
-    "C1949": "Accelerometer Sensor Circuit Open",
-    "C1950": "Accelerometer Sensor Circuit Failure",
-    "C1951": "Lateral Accelerometer Sensor Circuit Open",
-    "C1952": "Yaw Rate Sensor Circuit Open",
-    "C1953": "Master Cylinder Pressure Sensor Circuit Open",
-    "C1954": "Master Cylinder Pressure Sensor Circuit Failure",
-    "C1955": "Steering Angle Sensor Circuit Open",
-    "C1956": "Steering Angle Sensor Circuit Failure",
-    "C1957": "Dynamic Stability Control Valve RF Circuit Failure",
-    "C1958": "Dynamic Stability Control Valve LF Circuit Failure",
-    "C1959": "Lateral Accelerometer Sensor Circuit Failure",
-    "C1960": "Driver Brake Apply Circuit Fault",
-    "C1961": "Park Lamp Relay Coil Circuit Failure",
-    "C1962": "Park Lamp Relay Coil Short to Battery",
-    "C1963": "Stability Control Inhibit Warning",
-}
-
-C2_ERRORS = {
-    "C2100": "Battery Voltage Low - Circuit Voltage Below Threshold",
-}
-
-U0_ERRORS = {
-    "U0001": "High Speed CAN Communication Bus",
-    "U0073": "Control Module Communication Bus 'A' Off",
-    "U0100": "Lost Communication With ECM/PCM 'A'",
-    "U0101": "Lost Communication with TCM",
-    "U0102": "Lost Communication with Transfer Case Control Module",
-    "U0103": "Lost Communication With Gear Shift Module",
-    "U0104": "Lost Communication With Cruise Control Module",
-    "U0105": "Lost Communication With Fuel Injector Control Module",
-    "U0106": "Lost Communication With Glow Plug Control Module",
-    "U0107": "Lost Communication With Throttle Actuator Control Module ",
-    "U0108": "Lost Communication With Alternative Fuel Control Module",
-    "U0109": "Lost Communication With Fuel Pump Control Module",
-    "U010A": "Lost Communication With Exhaust Gas Recirculation Control Module 'A'",
-    "U010B": "Lost Communication With Exhaust Gas Recirculation Control Module 'B'",
-    "U010C": "Lost Communication With Turbocharger/Supercharger Control Module 'A'",
-    "U010D": "Lost Communication With Turbocharger/Supercharger Control Module 'B'",
-    "U010E": "Lost Communication With Reductant Control Module",
-    "U010F": "Lost Communication With Air Conditioning Control Module",
-    "U0110": "Lost Communication With Drive Motor Control Module",
-    "U0111": "Lost Communication With Battery Energy Control Module 'A'",
-    "U0112": "Lost Communication With Battery Energy Control Module 'B'",
-    "U0113": "Lost Communication With Emissions Critical Control Information",
-    "U0114": "Lost Communication With Four-Wheel Drive Clutch Control Module",
-    "U0115": "Lost Communication With ECM/PCM 'B'",
-    "U0116": "Lost Communication With Coolant Temperature Control Module",
-    "U0117": "Lost Communication With PTO Control Module",
-    "U0118": "Lost Communication With Fuel Additive Control Module",
-    "U0119": "Lost Communication With Fuel Cell Control Module",
-    "U011A": "Lost Communication With Exhaust Gas Sensor Module",
-    "U011B": "Lost Communication With Rocker Arm Control Module 'A'",
-    "U011C": "Lost Communication With Rocker Arm Control Module 'B'",
-    "U011D": "Lost Communication With All Wheel Drive Control Module",
-    "U011E": " U011F ISO/SAE Reserved ",
-    "U0120": "Lost Communication With Starter / Generator Control Module",
-    "U0121": "Lost Communication With Anti-Lock Brake System (ABS) Control Module",
-    "U0122": "Lost Communication With Vehicle Dynamics Control Module",
-    "U0123": "Lost Communication With Yaw Rate Sensor Module",
-    "U0124": "Lost Communication With Lateral Acceleration Sensor Module",
-    "U0125": "Lost Communication With Multi-axis Acceleration Sensor Module",
-    "U0126": "Lost Communication with Fuel Pump Control Module (FPCM)",
-    "U0127": "Lost Communication With Tire Pressure Monitor Module",
-    "U0128": "Lost Communication With Park Brake Control Module",
-    "U0129": "Lost Communication With Brake System Control Module",
-    "U012A": "ISO/SAE Reserved",
-    "U012B": "ISO/SAE Reserved",
-    "U012C": "ISO/SAE Reserved",
-    "U012D": "ISO/SAE Reserved",
-    "U012E": "ISO/SAE Reserved",
-    "U012F": "ISO/SAE Reserved",
-    "U0130": "Lost Communication With Steering Effort Control Module",
-    "U0131": "Lost Communication With Power Steering Control Module",
-    "U0132": "Lost Communication With Ride Level Control Module",
-    "U0133": "Lost Communication With Active Roll Control Module",
-    "U0134": "Lost Communication With Power Steering Control Module Rear",
-    "U0135": "Lost Communication With Differential Control ModuleFront",
-    "U0136": "Lost Communication With Differential Control ModuleRear",
-    "U0137": "Lost Communication With Trailer Brake Control Module",
-    "U0138": "Lost Communication With All Terrain Control Module",
-    "U0139": "Lost Communication With Suspension Control Module 'B'",
-    "U013A": "ISO/SAE Reserved",
-    "U013B": "ISO/SAE Reserved",
-    "U013C": "ISO/SAE Reserved",
-    "U013D": "ISO/SAE Reserved",
-    "U013E": "ISO/SAE Reserved",
-    "U013F": "ISO/SAE Reserved",
-    "U0140": "Lost Communication With Body Control Module",
-    "U0141": "Lost Communication With Body Control Module 'A'",
-    "U0142": "Lost Communication With Body Control Module 'B'",
-    "U0143": "Lost Communication With Body Control Module 'C'",
-    "U0144": "Lost Communication With Body Control Module 'D'",
-    "U0145": "Lost Communication With Body Control Module 'E'",
-    "U0146": "Lost Communication With Gateway 'A'",
-    "U0147": "Lost Communication With Gateway 'B'",
-    "U0148": "Lost Communication With Gateway 'C'",
-    "U0149": "Lost Communication With Gateway 'D'",
-    "U014A": "ISO/SAE Reserved",
-    "U014B": "ISO/SAE Reserved",
-    "U014C": "ISO/SAE Reserved",
-    "U014D": "ISO/SAE Reserved",
-    "U014E": "ISO/SAE Reserved",
-    "U014F": "ISO/SAE Reserved",
-    "U0150": "Lost Communication With Gateway 'E'",
-    "U0151": "Lost Communication With Restraints Control Module",
-    "U0152": "Lost Communication With Side Restraints Control Module Left",
-    "U0153": "Lost Communication With Side Restraints Control Module Right",
-    "U0154": "Lost Communication With Restraints Occupant Sensing Control Module",
-    "U0155": "Lost Communication With Instrument Panel Cluster (IPC) Control Module",
-    "U0156": "Lost Communication With Information Center 'A'",
-    "U0157": "Lost Communication With Information Center 'B'",
-    "U0158": "Lost Communication With Head Up Display",
-    "U0159": "Lost Communication With Parking Assist Control Module 'A'",
-    "U015A": "ISO/SAE Reserved",
-    "U015B": "ISO/SAE Reserved",
-    "U015C": "ISO/SAE Reserved",
-    "U015D": "ISO/SAE Reserved",
-    "U015E": "ISO/SAE Reserved",
-    "U015F": "ISO/SAE Reserved",
-    "U0160": "Lost Communication With Audible Alert Control Module",
-    "U0161": "Lost Communication With Compass Module",
-    "U0162": "Lost Communication With Navigation Display Module",
-    "U0163": "Lost Communication With Navigation Control Module",
-    "U0164": "Lost Communication With HVAC Control Module",
-    "U0165": "Lost Communication With Rear HVAC Control Module",
-    "U0166": "Lost Communication With Auxiliary Heater Control Module",
-    "U0167": "Lost Communication With Vehicle Immobilizer Control Module",
-    "U0168": "Lost Communication With Vehicle Security Control Module",
-    "U0169": "Lost Communication With Sunroof Control Module",
-    "U016A": "Lost Communication With Global Positioning System Module",
-    "U016B": "ISO/SAE Reserved",
-    "U016C": "ISO/SAE Reserved",
-    "U016D": "ISO/SAE Reserved",
-    "U016E": "ISO/SAE Reserved",
-    "U016F": "ISO/SAE Reserved",
-    "U0170": "Lost Communication With Restraints System Sensor A",
-    "U0171": "Lost Communication With Restraints System Sensor B",
-    "U0172": "Lost Communication With Restraints System Sensor C",
-    "U0173": "Lost Communication With Restraints System Sensor D",
-    "U0174": "Lost Communication With Restraints System Sensor E",
-    "U0175": "Lost Communication With Restraints System Sensor F",
-    "U0176": "Lost Communication With Restraints System Sensor G",
-    "U0177": "Lost Communication With Restraints System Sensor H",
-    "U0178": "Lost Communication With Restraints System Sensor I",
-    "U0179": "Lost Communication With Restraints System Sensor J",
-    "U017A": "Lost Communication With 'Restraints System Sensor K' ",
-    "U017B": "Lost Communication With 'Restraints System Sensor L'",
-    "U017C": "Lost Communication With 'Restraints System Sensor M'",
-    "U017D": "Lost Communication With 'Restraints System Sensor N'",
-    "U017E": "Lost Communication With Seatbelt Pretensioner Module 'A'",
-    "U017F": "Lost Communication With Seatbelt Pretensioner Module 'B'",
-    "U0180": "Lost Communication With Automatic Lighting Control Module",
-    "U0181": "Lost Communication With Headlamp Leveling Control Module",
-    "U0182": "Lost Communication With Front Lighting Control Module",
-    "U0183": "Lost Communication With Rear Lighting Control Module",
-    "U0184": "Lost Communication With Radio",
-    "U0185": "Lost Communication With Antenna Control Module",
-    "U0186": "Lost Communication With Audio Amplifier 'A'",
-    "U0187": "Lost Communication With Digital Disc Player/Changer Module 'A'",
-    "U0188": "Lost Communication With Digital Disc Player/Changer Module 'B'",
-    "U0189": "Lost Communication With Digital Disc Player/Changer Module 'C'",
-    "U018A": "ISO/SAE Reserved",
-    "U018B": "ISO/SAE Reserved",
-    "U018C": "ISO/SAE Reserved",
-    "U018D": "ISO/SAE Reserved",
-    "U018E": "ISO/SAE Reserved",
-    "U018F": "ISO/SAE Reserved",
-    "U0190": "Lost Communication With Digital Disc Player/Changer Module 'D'",
-    "U0191": "Lost Communication With Television",
-    "U0192": "Lost Communication With Personal Computer",
-    "U0193": "Lost Communication With 'Digital Audio Control Module A'",
-    "U0194": "Lost Communication With 'Digital Audio Control Module B'",
-    "U0195": "Lost Communication With Subscription Entertainment Receiver Module",
-    "U0196": "Lost Communication With Rear Seat Entertainment Control Module",
-    "U0197": "Lost Communication With Telephone Control Module",
-    "U0198": "Lost Communication With Telematic Control Module",
-    "U0199": "Lost Communication With 'Door Control Module A'",
-    "U019A": "through U01FF ISO/SAE Reserved",
-    "U0401": "Invalid Data Received From ECM/PCM",
-    "U0415": "Invalid Data Received – Anti-Lock Brake System (ABS) Control Module",
-    "U0422": "Invalid Data Received from Body Control Module",
-}
-
-U1_ERRORS = {
-    "U1000": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1001": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1002": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1003": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1004": "SCP (J1850) Invalid or Missing Data for EEC Programming",
-    "U1005": "SCP (J1850) Invalid or Missing Data for EEC Programming",
-    "U1006": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1007": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1008": "SCP (J1850) Invalid or Missing Data for Engine Torque",
-    "U1009": "SCP (J1850) Invalid or Missing Data for Engine Torque",
-    "U1010": "SCP (J1850) Invalid or Missing Data for Engine Air Intake",
-    "U1011": "SCP (J1850) Invalid or Missing Data for Engine Air Intake",
-    "U1012": "Invalid Internal Control Module Monitoring Data Received From Anti-Lock Brake System Control Module",
-    "U1013": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1014": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1015": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1016": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1017": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1018": "SCP (J1850) Invalid or Missing Data for Throttle",
-    "U1019": "SCP (J1850) Invalid or Missing Data for Throttle",
-    "U1020": "SCP (J1850) Invalid or Missing Data for Air Conditioning Clutch",
-    "U1021": "SCP (J1850) Invalid or Missing Data for Air Conditioning Clutch",
-    "U1022": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1023": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1024": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1025": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1026": "SCP (J1850) Invalid or Missing Data for Engine RPM",
-    "U1027": "SCP (J1850) Invalid or Missing Data for Engine RPM",
-    "U1028": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1029": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1030": "SCP (J1850) Invalid or Missing Data for Experimental #1",
-    "U1031": "SCP (J1850) Invalid or Missing Data for Experimental #1",
-    "U1032": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1033": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1034": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1035": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1036": "SCP (J1850) Invalid or Missing Data for Wheels",
-    "U1037": "SCP (J1850) Invalid or Missing Data for Wheels",
-    "U1038": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1039": "SCP (J1850) Invalid or Missing Data for Primary Id / Vehicle Speed",
-    "U1040": "Lost Communication with Electronic Brake Control Module",
-    "U1041": "SCP (J1850) Invalid or Missing Data for Vehicle Speed",
-    "U1042": "SCP (J1850) Invalid or Missing Data for Traction Control",
-    "U1043": "SCP (J1850) Invalid or Missing Data for Traction Control",
-    "U1044": "SCP (J1850) Invalid or Missing Data for Traction Motor",
-    "U1045": "SCP (J1850) Invalid or Missing Data for Traction Motor",
-    "U1046": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1047": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1048": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1049": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1050": "SCP (J1850) Invalid or Missing Data for Brakes",
-    "U1051": "SCP (J1850) Invalid or Missing Data for Brakes",
-    "U1052": "SCP (J1850) Invalid or Missing Data for Steering / Steering Wheel",
-    "U1053": "SCP (J1850) Invalid or Missing Data for Steering / Steering Wheel",
-    "U1054": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1055": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1056": "SCP (J1850) Invalid or Missing Data for Vehicle Configuration",
-    "U1057": "SCP (J1850) Invalid or Missing Data for Vehicle Configuration",
-    "U1058": "SCP (J1850) Invalid or Missing Data for Transmission / Transaxle / PRNDL",
-    "U1059": "SCP (J1850) Invalid or Missing Data for Transmission / Transaxle / PRNDL",
-    "U1060": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1061": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1062": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1063": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1064": "Lost Communication with Body Control Module",
-    "U1065": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1066": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1067": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1068": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1069": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1070": "SCP (J1850) Invalid or Missing Data for Engine Sensors",
-    "U1071": "SCP (J1850) Invalid or Missing Data for Engine Sensors",
-    "U1072": "SCP (J1850) Invalid or Missing Data for Engine Coolant",
-    "U1073": "SCP (J1850) Invalid or Missing Data for Engine Coolant",
-    "U1074": "SCP (J1850) Invalid or Missing Data for Engine Oil",
-    "U1075": "SCP (J1850) Invalid or Missing Data for Engine Oil Temp",
-    "U1076": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1077": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1078": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1079": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1080": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1081": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1082": "SCP (J1850) Invalid or Missing Data for Engine Systems Other",
-    "U1083": "SCP (J1850) Invalid or Missing Data for Engine Systems Other",
-    "U1084": "SCP (J1850) Invalid or Missing Data for Powertrain Status Request",
-    "U1085": "SCP (J1850) Invalid or Missing Data for Powertrain Status Request",
-    "U1086": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1087": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1088": "SCP (J1850) Invalid or Missing Data for Suspension",
-    "U1089": "SCP (J1850) Invalid or Missing Data for Suspension",
-    "U1090": "SCP (J1850) Invalid or Missing Data for Non-Legislated Diagnostics",
-    "U1091": "SCP (J1850) Invalid or Missing Data for Non-Legislated Diagnostics",
-    "U1092": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1093": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1094": "SCP (J1850) Invalid or Missing Data for Experimental #2",
-    "U1095": "SCP (J1850) Invalid or Missing Data for Experimental #2",
-    "U1096": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1097": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1098": "SCP (J1850) Invalid or Missing Data for Vehicle Speed Control",
-    "U1099": "SCP (J1850) Invalid or Missing Data for Vehicle Speed Control",
-    "U11E9": "Lost Communication With Active Grill Shutter",
-    "U1100": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1101": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1102": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1103": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1104": "SCP (J1850) Invalid or Missing Data for Chassis Status Request",
-    "U1105": "SCP (J1850) Invalid or Missing Data for Chassis Status Request",
-    "U1106": "SCP (J1850) Invalid or Missing Data for Legislated Diagnostics",
-    "U1107": "SCP (J1850) Invalid or Missing Data for Legislated Diagnostics",
-    "U1108": "SCP (J1850) Invalid or Missing Data for Electric Traction Drive (Inverter)",
-    "U1109": "SCP (J1850) Invalid or Missing Data for Electric Traction Drive (Inverter)",
-    "U1110": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1111": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1112": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1113": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1114": "SCP (J1850) Invalid or Missing Data for Charging System",
-    "U1115": "SCP (J1850) Invalid or Missing Data for Charging System",
-    "U1116": "SCP (J1850) Invalid or Missing Data for Electrical Energy Management",
-    "U1117": "SCP (J1850) Invalid or Missing Data for Electrical Energy Management",
-    "U1118": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1119": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1120": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1121": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1122": "SCP (J1850) Invalid or Missing Data for Odometer",
-    "U1123": "SCP (J1850) Invalid or Missing Data for Odometer",
-    "U1124": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1125": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1126": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1127": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1128": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1129": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1130": "SCP (J1850) Invalid or Missing Data for Fuel System",
-    "U1131": "SCP (J1850) Invalid or Missing Data for Fuel System",
-    "U1132": "SCP (J1850) Invalid or Missing Data for Vehicle Motion",
-    "U1133": "SCP (J1850) Invalid or Missing Data for Vehicle Motion",
-    "U1134": "SCP (J1850) Invalid or Missing Data for Ignition Switch / Starter",
-    "U1135": "SCP (J1850) Invalid or Missing Data for Ignition Switch / Starter",
-    "U1136": "SCP (J1850) Invalid or Missing Data for Telltales",
-    "U1137": "SCP (J1850) Invalid or Missing Data for Telltales",
-    "U1138": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1139": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1140": "SCP (J1850) Invalid or Missing Data for Gateway",
-    "U1141": "SCP (J1850) Invalid or Missing Data for Gateway",
-    "U1142": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1143": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1144": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1145": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1146": "SCP (J1850) Invalid or Missing Data for Vehicle Security",
-    "U1147": "SCP (J1850) Invalid or Missing Data for Vehicle Security",
-    "U1148": "SCP (J1850) Invalid or Missing Data for Audio Control",
-    "U1149": "SCP (J1850) Invalid or Missing Data for Audio Control",
-    "U1150": "SCP (J1850) Invalid or Missing Data for Audible Warnings",
-    "U1151": "SCP (J1850) Invalid or Missing Data for Audible Warnings",
-    "U1152": "SCP (J1850) Invalid or Missing Data for Experimental #3",
-    "U1153": "SCP (J1850) Invalid or Missing Data for Experimental #3",
-    "U1154": "SCP (J1850) Invalid or Missing Data for Compact Disc",
-    "U1155": "SCP (J1850) Invalid or Missing Data for Compact Disc",
-    "U1156": "SCP (J1850) Invalid or Missing Data for Digital Signal Processing",
-    "U1157": "SCP (J1850) Invalid or Missing Data for Digital Signal Processing",
-    "U1158": "SCP (J1850) Invalid or Missing Data for Antenna",
-    "U1159": "SCP (J1850) Invalid or Missing Data for Antenna",
-    "U1160": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1161": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1162": "SCP (J1850) Invalid or Missing Data for Digital Audio Tape",
-    "U1163": "SCP (J1850) Invalid or Missing Data for Digital Audio Tape",
-    "U1164": "SCP (J1850) Invalid or Missing Data for Tuner / Receiver",
-    "U1165": "SCP (J1850) Invalid or Missing Data for Tuner / Receiver",
-    "U1166": "SCP (J1850) Invalid or Missing Data for Cassette Tape",
-    "U1167": "SCP (J1850) Invalid or Missing Data for Cassette Tape",
-    "U1168": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1169": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1170": "SCP (J1850) Invalid or Missing Data for Cellular Phone / Paging System",
-    "U1171": "SCP (J1850) Invalid or Missing Data for Cellular Phone / Paging System",
-    "U1172": "SCP (J1850) Invalid or Missing Data for Remote Button Control",
-    "U1173": "SCP (J1850) Invalid or Missing Data for Remote Button Control",
-    "U1174": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1175": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1176": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1177": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1178": "SCP (J1850) Invalid or Missing Data for Climate Control (HVAC)",
-    "U1179": "SCP (J1850) Invalid or Missing Data for Climate Control (HVAC)",
-    "U1180": "SCP (J1850) Invalid or Missing Data for Personalization (Memory) Features",
-    "U1181": "SCP (J1850) Invalid or Missing Data for Personalization (Memory) Features",
-    "U1182": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1183": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1184": "SCP (J1850) Invalid or Missing Data for Window Wiper / Washer",
-    "U1185": "SCP (J1850) Invalid or Missing Data for Window Wiper / Washer",
-    "U1186": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1187": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1188": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1189": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1190": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1191": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1192": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1193": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1194": "SCP (J1850) Invalid or Missing Data for Mirrors",
-    "U1195": "SCP (J1850) Invalid or Missing Data for Mirrors",
-    "U1196": "SCP (J1850) Invalid or Missing Data for Door Locks",
-    "U1197": "SCP (J1850) Invalid or Missing Data for Door Locks",
-    "U1198": "SCP (J1850) Invalid or Missing Data for External Access (Doors)",
-    "U1199": "SCP (J1850) Invalid or Missing Data for External Access (Doors)",
-    "U1200": "SCP (J1850) Invalid or Missing Data for Seat Motion / Control",
-    "U1201": "SCP (J1850) Invalid or Missing Data for Seat Motion / Control",
-    "U1202": "SCP (J1850) Invalid or Missing Data for Windows",
-    "U1203": "SCP (J1850) Invalid or Missing Data for Windows",
-    "U1204": "SCP (J1850) Invalid or Missing Data for Steering Column",
-    "U1205": "SCP (J1850) Invalid or Missing Data for Steering Column",
-    "U1206": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1207": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1208": "SCP (J1850) Invalid or Missing Data for Seat Switches",
-    "U1209": "SCP (J1850) Invalid or Missing Data for Seat Switches",
-    "U1210": "SCP (J1850) Invalid or Missing Data for Restraints",
-    "U1211": "SCP (J1850) Invalid or Missing Data for Restraints",
-    "U1212": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1213": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1214": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1215": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1216": "SCP (J1850) Invalid or Missing Data for External Lamp Outage",
-    "U1217": "SCP (J1850) Invalid or Missing Data for External Lamp Outage",
-    "U1218": "SCP (J1850) Invalid or Missing Data for External Lamps",
-    "U1219": "SCP (J1850) Invalid or Missing Data for External Lamps",
-    "U1220": "SCP (J1850) Invalid or Missing Data for Interior Lamp Outage",
-    "U1221": "SCP (J1850) Invalid or Missing Data for Interior Lamp Outage",
-    "U1222": "SCP (J1850) Invalid or Missing Data for Interior Lamps",
-    "U1223": "SCP (J1850) Invalid or Missing Data for Interior Lamps",
-    "U1224": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1225": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1226": "SCP (J1850) Invalid or Missing Data for Body Status Request",
-    "U1227": "SCP (J1850) Invalid or Missing Data for Body Status Request",
-    "U1228": "SCP (J1850) Invalid or Missing Data for Tires",
-    "U1229": "SCP (J1850) Invalid or Missing Data for Tires",
-    "U1230": "SCP (J1850) Invalid or Missing Data for Electric Defrost",
-    "U1231": "SCP (J1850) Invalid or Missing Data for Electric Defrost",
-    "U1232": "SCP (J1850) Invalid or Missing Data for Navigation",
-    "U1233": "SCP (J1850) Invalid or Missing Data for Navigation",
-    "U1234": "SCP (J1850) Invalid or Missing Data for Displays",
-    "U1235": "SCP (J1850) Invalid or Missing Data for Displays",
-    "U1236": "SCP (J1850) Invalid or Missing Data for Memory Storage",
-    "U1237": "SCP (J1850) Invalid or Missing Data for Memory Storage",
-    "U1238": "SCP (J1850) Invalid or Missing Data for Experimental #4",
-    "U1239": "SCP (J1850) Invalid or Missing Data for Experimental #4",
-    "U1240": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1241": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1242": "SCP (J1850) Invalid or Missing Data for Exterior Environment",
-    "U1243": "SCP (J1850) Invalid or Missing Data for Exterior Environment",
-    "U1244": "SCP (J1850) Invalid or Missing Data for Interior Environment",
-    "U1245": "SCP (J1850) Invalid or Missing Data for Interior Environment",
-    "U1246": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1247": "SCP (J1850) Invalid or Missing Data for Primary Id",
-    "U1248": "SCP (J1850) Invalid or Missing Data for Time / Date",
-    "U1249": "SCP (J1850) Invalid or Missing Data for Time / Date",
-    "U1250": "SCP (J1850) Invalid or Missing Data for Vehicle Id (VIN)",
-    "U1251": "SCP (J1850) Invalid or Missing Data for Vehicle Id (VIN)",
-    "U1252": "SCP (J1850) Invalid or Missing Data for Class A Functions",
-    "U1253": "SCP (J1850) Invalid or Missing Data for Class A Functions",
-    "U1254": "SCP (J1850) Invalid or Missing Data for Network Control",
-    "U1255": "SCP (J1850) Invalid or Missing Data for Network Control",
-    "U1260": "SCP (J1850) Single Ended (+) Circuit Failure",
-    "U1261": "SCP (J1850) Single Ended (-) Circuit Failure",
-    "U1262": "SCP (J1850) Communication Bus Fault",
-    "U1308": "SCP (J1850) Invalid or Missing Data for Function Read Engine Torque",
-    "U1341": "SCP (J1850) Invalid or Missing Data for Function Read Vehicle Speed",
-    "U1430": "SCP (J1850) Invalid or Missing Data for Function Read Fuel System",
-    "U1451": "SCP (J1850) Invalid or Missing Data for Function Read Audible Warnings / Anti-Theft Module, Vehicle"
-             " Immobilized",
-    "U1612": "SCP (J1850) Lack of Acknowledgment for Primary Id",
-    "U1736": "SCP (J1850) Lack of Acknowledgment for Telltales",
-    "U1750": "SCP (J1850) Lack of Acknowledgment for Audible Warnings",
-    "U1794": "SCP (J1850) Lack of Acknowledgment for Mirrors",
-    "U1797": "SCP (J1850) Lack of Acknowledgment for Door Locks",
-    "U1798": "SCP (J1850) Lack of Acknowledgment for External Access (Doors)",
-    "U1806": "SCP (J1850) Lack of Acknowledgment for Primary Id",
-    "U1900": "CAN Communication Bus Fault",
-    "U1950": "UPB Communication Bus Fault",
-}
-
-U2_ERRORS = {
-    "U2000": "Audio Rear Control Unit is Not Responding",
-    "U2001": "Audio Tape Deck Unit is Not Responding",
-    "U2002": "Audio Bezel is Not Responding",
-    "U2003": "Audio Compact Disk / Disk Jockey Unit is Not Responding",
-    "U2004": "Audio Steering Wheel Control Unit is Not Responding",
-    "U2005": "Audio Rear Integrated Control Panel Unit is Not Responding",
-    "U2006": "Audio Remote Climate Control Unit is Not Responding",
-    "U2007": "Audio Navigation Unit is Not Responding",
-    "U2008": "Audio Phone is Not Responding",
-    "U2009": "Audio Front Control Module (ACM) is Not Responding",
-    "U2010": "Module is Not Responding (Non SCP)",
-    "U2011": "Module Transmitted Invalid Data (Non SCP)",
-    "U2012": "Communication Bus Error (Non SCP)",
-    "U2013": "Compass Module is not Responding",
-    "U2014": "Audio Subwoofer Unit is Not Responding",
-    "U2015": "Signal Link Fault (Non SCP)",
-    "U2016": "Signal Link Short to Ground (Non SCP) / From NGV Module",
-    "U2017": "Driver Side Crash Sensor Communication Fault (Non SCP)",
-    "U2018": "Passenger Side Crash Sensor Communication Fault (Non SCP)",
-    "U2019": "Audio Voice Module Not Responding",
-    "U2020": "Audio Center Amp is not responding",
-    "U2021": "Invalid /fault data received (Non SCP)",
-    "U2150": "SCP (J1850) Invalid Data from REM",
-    "U2152": "SCP (J1850) Invalid Data from GEM",
-    "U2160": "SCP (J1850) Invalid Data from IC",
-    "U2195": "SCP (J1850) Invalid Data from SCLM",
-    "U2500": "(CAN) Lack of Acknowledgement From Engine Management",
-}
+def __getattr__(name: str) -> Dict[str, str]:
+    if name.endswith("_ERRORS") and name[:-len("_ERRORS")] in TABLE_NAMES:
+        globals().update({table + "_ERRORS": codes for table, codes in load_tables().items()})
+        return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
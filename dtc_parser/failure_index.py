@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from typing import Iterable, List, Sequence
+
+from dtc_parser.codec import CODE_SPACE_SIZE, dtc_from_int, dtc_to_int
+from dtc_parser.decomposition import ELECTRICAL_CONDITIONS, FAILURE_MODES, FaultStructures, get_fault_structures
+from dtc_parser.memory import optional_structure
+from dtc_parser.normalize import normalize_dtc
+
+
+class CodeBitmap:
+    """
+    Set of DTCs as bitmap over the entire (two-byte) code space, i.e., 8 KiB per set.
+    """
+
+    def __init__(self, codes: Iterable[int] = ()):
+        """
+        :param codes: DTCs as integers
+        """
+        self.bits = bytearray(CODE_SPACE_SIZE // 8)
+        for code in codes:
+            self.bits[code >> 3] |= 1 << (code & 7)
+
+    def __contains__(self, code: int) -> bool:
+        return bool(self.bits[code >> 3] >> (code & 7) & 1)
+
+    def __len__(self) -> int:
+        return sum(bin(byte).count("1") for byte in self.bits)
+
+    def __iter__(self):
+        for i, byte in enumerate(self.bits):
+            while byte:
+                low = byte & -byte
+                yield (i << 3) | (low.bit_length() - 1)
+                byte ^= low
+
+    def __or__(self, other: "CodeBitmap") -> "CodeBitmap":
+        result = CodeBitmap()
+        result.bits = bytearray(a | b for a, b in zip(self.bits, other.bits))
+        return result
+
+    def __and__(self, other: "CodeBitmap") -> "CodeBitmap":
+        result = CodeBitmap()
+        result.bits = bytearray(a & b for a, b in zip(self.bits, other.bits))
+        return result
+
+    def contains_many(self, codes: Sequence[int]):
+        """
+        Vectorized membership test, e.g. for the codes column of a DTCBatch.
+        Uses NumPy if it is installed (returns a boolean array then), otherwise a list of bools.
+
+        :param codes: DTCs as integers
+        :return: membership per code
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            bits = self.bits
+            return [bool(bits[c >> 3] >> (c & 7) & 1) for c in codes]
+        codes = np.asarray(codes, dtype=np.uint16)
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        return ((bits[codes >> 3] >> (codes & 7).astype(np.uint8)) & 1).astype(bool)
+
+
+class FailureModeIndex:
+    """
+    Precomputed index from failure mode (and electrical condition) to the set of DTCs, stored as code bitmaps.
+    Filtering events by failure mode then is a vectorized membership test instead of substring searches.
+    """
+
+    def __init__(self, structures: FaultStructures):
+        """
+        :param structures: structured records of the supported codes
+        """
+        failure_modes: List[List[int]] = [[] for _ in FAILURE_MODES]
+        conditions: List[List[int]] = [[] for _ in ELECTRICAL_CONDITIONS]
+        for code, structure in structures.records.items():
+            key = dtc_to_int(code)
+            failure_modes[structure.failure_mode].append(key)
+            conditions[structure.electrical_condition].append(key)
+        self.failure_modes = [CodeBitmap(codes) for codes in failure_modes]
+        self.electrical_conditions = [CodeBitmap(codes) for codes in conditions]
+
+    def failure_mode(self, name: str) -> CodeBitmap:
+        """
+        Returns the DTCs with the specified failure mode.
+
+        :param name: failure mode (see decomposition.FAILURE_MODES), e.g. "circuit open"
+        :return: bitmap of the DTCs
+        """
+        return self.failure_modes[FAILURE_MODES.index(name)]
+
+    def electrical_condition(self, name: str) -> CodeBitmap:
+        """
+        Returns the DTCs with the specified electrical condition.
+
+        :param name: electrical condition (see decomposition.ELECTRICAL_CONDITIONS), e.g. "short to ground"
+        :return: bitmap of the DTCs
+        """
+        return self.electrical_conditions[ELECTRICAL_CONDITIONS.index(name)]
+
+    def codes(self, name: str) -> List[str]:
+        """
+        Returns the DTCs with the specified failure mode.
+
+        :param name: failure mode (see decomposition.FAILURE_MODES)
+        :return: list of DTCs in code order
+        """
+        return [dtc_from_int(code) for code in self.failure_mode(name)]
+
+    def has_failure_mode(self, code: str, name: str) -> bool:
+        """
+        Checks whether the specified DTC has the specified failure mode.
+
+        :param code: DTC
+        :param name: failure mode (see decomposition.FAILURE_MODES)
+        :return: whether the DTC has the failure mode
+        """
+        return dtc_to_int(normalize_dtc(code)) in self.failure_mode(name)
+
+
+@optional_structure("failure_mode_index")
+def get_failure_mode_index() -> FailureModeIndex:
+    """
+    Returns the failure mode index of all supported codes (built on first use).
+
+    :return: failure mode index
+    """
+    return FailureModeIndex(get_fault_structures())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import hashlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Optional, Tuple
+
+from dtc_parser.codec import dtc_from_int, dtc_to_int
+from dtc_parser.memory import optional_structure
+from dtc_parser.normalize import normalize_dtc
+from dtc_parser.tables import get_table_source, iter_entries
+
+# max. char per position of a DTC, used to complete prefixes to the upper bound of their range
+UPPER_BOUND_CHARS = "U3FFF"
+LOWER_BOUND_CHARS = "P0000"
+
+
+def prefix_bounds(prefix: str) -> Tuple[int, int]:
+    """
+    Determines the (inclusive) integer range of the DTCs that start with the specified prefix.
+
+    :param prefix: code prefix (up to five chars), e.g. "U01"
+    :return: (lowest, highest) DTC integer of the prefix
+    """
+    prefix = prefix.strip().upper()
+    if len(prefix) > 5:
+        raise ValueError("DTC prefix longer than five chars: " + prefix)
+    if not prefix:
+        return 0, 0xFFFF
+    lo = normalize_dtc(prefix + LOWER_BOUND_CHARS[len(prefix):])
+    hi = normalize_dtc(prefix + UPPER_BOUND_CHARS[len(prefix):])
+    return dtc_to_int(lo), dtc_to_int(hi)
+
+
+class CodeIndex:
+    """
+    Sorted index over the supported DTCs, keyed by their two-byte (SAE J2012) integer representation.
+
+    The integer representation preserves the order of the code strings within each category and every code prefix
+    corresponds to a contiguous range of integers, so range and prefix queries are answered by two bisections.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        """
+        :param entries: (DTC, fault description) tuples
+        """
+        rows = sorted((dtc_to_int(code), description) for code, description in entries)
+        self.keys = array("H", (key for key, _ in rows))
+        self.descriptions = [description for _, description in rows]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, code: str) -> bool:
+        return self.get(code) is not None
+
+    def get(self, code: str) -> Optional[str]:
+        """
+        Looks up the fault description of the specified DTC.
+
+        :param code: DTC
+        :return: fault description or None if the DTC is not supported
+        """
+        key = dtc_to_int(normalize_dtc(code))
+        i = bisect_left(self.keys, key)
+        return self.descriptions[i] if i < len(self.keys) and self.keys[i] == key else None
+
+    def _bounds(self, lo: int, hi: int) -> Tuple[int, int]:
+        return bisect_left(self.keys, lo), bisect_right(self.keys, hi)
+
+    def _slice(self, lo: int, hi: int) -> Iterator[Tuple[str, str]]:
+        start, end = self._bounds(lo, hi)
+        for i in range(start, end):
+            yield dtc_from_int(self.keys[i]), self.descriptions[i]
+
+    def range(self, lo: str, hi: str) -> Iterator[Tuple[str, str]]:
+        """
+        Iterates over the supported DTCs from lo through hi (both inclusive), e.g. range("P0100", "P01FF").
+
+        :param lo: first DTC of the range
+        :param hi: last DTC of the range
+        :return: iterator of (DTC, fault description) tuples in code order
+        """
+        return self._slice(dtc_to_int(normalize_dtc(lo)), dtc_to_int(normalize_dtc(hi)))
+
+    def prefix(self, prefix: str) -> Iterator[Tuple[str, str]]:
+        """
+        Iterates over the supported DTCs that start with the specified prefix, e.g. prefix("U01").
+
+        :param prefix: code prefix (up to five chars)
+        :return: iterator of (DTC, fault description) tuples in code order
+        """
+        return self._slice(*prefix_bounds(prefix))
+
+    def count_prefix(self, prefix: str) -> int:
+        """
+        Counts the supported DTCs that start with the specified prefix.
+
+        :param prefix: code prefix (up to five chars)
+        :return: number of matching DTCs
+        """
+        start, end = self._bounds(*prefix_bounds(prefix))
+        return end - start
+
+
+def content_hash(index: CodeIndex) -> str:
+    """
+    Computes the content hash of a set of code tables.
+
+    :param index: sorted index of all entries
+    :return: hex digest
+    """
+    digest = hashlib.sha256()
+    for key, description in zip(index.keys, index.descriptions):
+        digest.update(b"%04X" % key)
+        digest.update(description.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@optional_structure("code_index")
+def get_code_index() -> CodeIndex:
+    """
+    Returns the index over all code tables (built on first use).
+    The index of the current snapshot is reused if the table source is reloadable (see snapshot.py).
+
+    :return: code index
+    """
+    snapshot = getattr(get_table_source(), "snapshot", None)
+    return snapshot.index if snapshot is not None else CodeIndex(iter_entries())
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import csv
+import os
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+# parameter group numbers
+PGN_DM1 = 0xFECA  # active diagnostic trouble codes
+PGN_DM2 = 0xFECB  # previously active diagnostic trouble codes
+PGN_TP_CM = 0xEC00  # transport protocol - connection management
+PGN_TP_DT = 0xEB00  # transport protocol - data transfer
+
+TP_CM_RTS = 0x10
+TP_CM_BAM = 0x20
+TP_CM_ABORT = 0xFF
+
+# environment variable pointing to the user-supplied SPN data file
+SPN_TABLE_ENV = "DTC_PARSER_SPN_TABLE"
+
+# failure mode identifiers (SAE J1939-73)
+FMI_DESCRIPTIONS = {
+    0: "Data valid but above normal operational range - most severe level",
+    1: "Data valid but below normal operational range - most severe level",
+    2: "Data erratic, intermittent or incorrect",
+    3: "Voltage above normal, or shorted to high source",
+    4: "Voltage below normal, or shorted to low source",
+    5: "Current below normal or open circuit",
+    6: "Current above normal or grounded circuit",
+    7: "Mechanical system not responding or out of adjustment",
+    8: "Abnormal frequency or pulse width or period",
+    9: "Abnormal update rate",
+    10: "Abnormal rate of change",
+    11: "Root cause not known",
+    12: "Bad intelligent device or component",
+    13: "Out of calibration",
+    14: "Special instructions",
+    15: "Data valid but above normal operating range - least severe level",
+    16: "Data valid but above normal operating range - moderately severe level",
+    17: "Data valid but below normal operating range - least severe level",
+    18: "Data valid but below normal operating range - moderately severe level",
+    19: "Received network data in error",
+    20: "Data drifted high",
+    21: "Data drifted low",
+    31: "Condition exists",
+}
+
+
+class SPNTable:
+    """
+    Integer-keyed table of suspect parameter numbers (SPNs) and their descriptions.
+
+    The SPN definitions are licensed by SAE and therefore not shipped with the parser. The table is read lazily
+    from a user-supplied CSV file (columns: SPN, description) on the first lookup.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        :param path: CSV file with the SPN definitions (defaults to the file specified by DTC_PARSER_SPN_TABLE)
+        """
+        self.path = path
+        self._entries: Optional[Dict[int, str]] = None
+
+    @property
+    def entries(self) -> Dict[int, str]:
+        """
+        SPN -> description (loaded on first access).
+
+        :return: SPN table
+        """
+        if self._entries is None:
+            self._entries = self.load(self.path or os.environ.get(SPN_TABLE_ENV))
+        return self._entries
+
+    @staticmethod
+    def load(path: Optional[str]) -> Dict[int, str]:
+        """
+        Reads the SPN definitions from the specified CSV file.
+        Rows whose first column is not a number (e.g. headers) are skipped.
+
+        :param path: CSV file with the SPN definitions
+        :return: SPN -> description
+        """
+        entries: Dict[int, str] = {}
+        if not path:
+            return entries
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.reader(f):
+                if len(row) >= 2 and row[0].strip().isdigit():
+                    entries[int(row[0])] = row[1].strip()
+        return entries
+
+    def get(self, spn: int) -> str:
+        """
+        Looks up the description of the specified SPN.
+
+        :param spn: suspect parameter number
+        :return: SPN description
+        """
+        return self.entries.get(spn, "unsupported SPN")
+
+
+# default table, used if no other table is specified
+SPN_TABLE = SPNTable()
+
+
+def parse_failure_mode(fmi: int) -> str:
+    """
+    Looks up the description of the specified failure mode identifier.
+
+    :param fmi: failure mode identifier
+    :return: FMI description
+    """
+    return FMI_DESCRIPTIONS.get(fmi, "reserved FMI")
+
+
+def parse_pgn(can_id: int) -> Tuple[int, int, int]:
+    """
+    Splits a 29-bit J1939 CAN ID into PGN, destination and source address.
+
+    :param can_id: 29-bit CAN ID
+    :return: (PGN, destination address, source address)
+    """
+    pf = (can_id >> 16) & 0xFF
+    ps = (can_id >> 8) & 0xFF
+    pgn = (can_id >> 8) & 0x3FF00
+    if pf >= 0xF0:  # PDU2 -> PS is the group extension
+        return pgn | ps, 0xFF, can_id & 0xFF
+    return pgn, ps, can_id & 0xFF
+
+
+class J1939Batch:
+    """
+    Column-oriented container for J1939 DTCs (SPN, FMI, occurrence count) extracted from DM1 / DM2 messages.
+    """
+
+    def __init__(self):
+        self.spns = array("L")
+        self.fmis = array("B")
+        self.occurrences = array("B")
+        self.pgns = array("L")  # PGN_DM1 or PGN_DM2
+        self.sources = array("B")  # source address of the reporting ECU
+        self.timestamps = array("d")
+
+    def __len__(self) -> int:
+        return len(self.spns)
+
+    def append(self, spn: int, fmi: int, occurrence: int, pgn: int, source: int, timestamp: float) -> None:
+        """
+        Appends a single DTC row to the batch.
+
+        :param spn: suspect parameter number
+        :param fmi: failure mode identifier
+        :param occurrence: occurrence count
+        :param pgn: PGN of the message (DM1 / DM2)
+        :param source: source address of the reporting ECU
+        :param timestamp: timestamp of the message
+        """
+        self.spns.append(spn)
+        self.fmis.append(fmi)
+        self.occurrences.append(occurrence)
+        self.pgns.append(pgn)
+        self.sources.append(source)
+        self.timestamps.append(timestamp)
+
+    def describe(self, spn_table: Optional[SPNTable] = None) -> List[Tuple[str, str]]:
+        """
+        Resolves the SPN and FMI descriptions of each DTC in the batch.
+        Every distinct (SPN, FMI) pair is looked up only once.
+
+        :param spn_table: SPN table used for the lookup (defaults to SPN_TABLE)
+        :return: list of (SPN description, FMI description) tuples (aligned with the rows of the batch)
+        """
+        table = (spn_table or SPN_TABLE).entries
+        keys = [(spn << 5) | fmi for spn, fmi in zip(self.spns, self.fmis)]
+        descriptions = {
+            key: (table.get(key >> 5, "unsupported SPN"), parse_failure_mode(key & 0x1F)) for key in set(keys)
+        }
+        return [descriptions[key] for key in keys]
+
+
+def decode_dm(payload: bytes, batch: J1939Batch, pgn: int = PGN_DM1, source: int = 0, timestamp: float = 0.0) -> int:
+    """
+    Decodes a DM1 / DM2 payload (two lamp status bytes, four bytes per DTC).
+
+    :param payload: complete (reassembled) payload
+    :param batch: batch the DTCs are appended to
+    :param pgn: PGN of the message
+    :param source: source address of the reporting ECU
+    :param timestamp: timestamp of the message
+    :return: number of decoded DTCs
+    """
+    count = 0
+    for i in range(2, len(payload) - 3, 4):
+        b2 = payload[i + 2]
+        spn = payload[i] | (payload[i + 1] << 8) | ((b2 & 0xE0) << 11)
+        # SPN 0 is sent if no DTC is active, SPN 0x7FFFF is padding
+        if spn == 0 or spn == 0x7FFFF:
+            continue
+        batch.append(spn, b2 & 0x1F, payload[i + 3] & 0x7F, pgn, source, timestamp)
+        count += 1
+    return count
+
+
+class J1939Decoder:
+    """
+    Decodes the DM1 / DM2 messages in a stream of J1939 frames, incl. the multi-packet ones sent via the
+    transport protocol (BAM as well as RTS/CTS sessions).
+    """
+
+    def __init__(self):
+        self.batch = J1939Batch()
+        # (source, destination) -> [PGN, total size, collected data]
+        self.sessions: Dict[Tuple[int, int], list] = {}
+
+    def feed(self, can_id: int, data: bytes, timestamp: float = 0.0) -> None:
+        """
+        Processes a single CAN frame.
+
+        :param can_id: 29-bit CAN ID
+        :param data: data bytes of the frame
+        :param timestamp: timestamp of the frame
+        """
+        pgn, dest, source = parse_pgn(can_id)
+        if pgn == PGN_DM1 or pgn == PGN_DM2:
+            decode_dm(data, self.batch, pgn, source, timestamp)
+        elif pgn == PGN_TP_CM and len(data) == 8:
+            control = data[0]
+            if control == TP_CM_BAM or control == TP_CM_RTS:
+                transported_pgn = data[5] | (data[6] << 8) | (data[7] << 16)
+                if transported_pgn == PGN_DM1 or transported_pgn == PGN_DM2:
+                    self.sessions[(source, dest)] = [transported_pgn, data[1] | (data[2] << 8), bytearray()]
+            elif control == TP_CM_ABORT:
+                self.sessions.pop((source, dest), None)
+        elif pgn == PGN_TP_DT and data:
+            session = self.sessions.get((source, dest))
+            if session is None:
+                return
+            if data[0] != len(session[2]) // 7 + 1:
+                # out of sequence -> drop the incomplete message
+                del self.sessions[(source, dest)]
+                return
+            session[2] += data[1:8]
+            if len(session[2]) >= session[1]:
+                del self.sessions[(source, dest)]
+                decode_dm(bytes(session[2][:session[1]]), self.batch, session[0], source, timestamp)
+
+    def take(self) -> J1939Batch:
+        """
+        Returns the DTCs decoded so far and starts a new batch.
+
+        :return: batch of decoded DTCs
+        """
+        batch, self.batch = self.batch, J1939Batch()
+        return batch
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from itertools import repeat
+from typing import Iterable, Optional, Tuple
+
+from dtc_parser.batch import DTCBatch, PROTOCOL_KWP
+
+# positive response of the KWP2000 service ReadDiagnosticTroubleCodesByStatus (0x18)
+KWP_READ_DTC_BY_STATUS_RESPONSE = 0x58
+
+
+def decode_kwp2000_response(payload: bytes, batch: DTCBatch, source: int, timestamp: float) -> int:
+    """
+    Decodes a KWP2000 (ISO 14230) ReadDiagnosticTroubleCodesByStatus response
+    (SID, number of DTCs, two DTC bytes and one status byte per DTC).
+    The two DTC bytes use the same (SAE J2012) encoding as OBD-II, so the DTCs map onto the existing code tables.
+
+    :param payload: complete response payload (service ID first)
+    :param batch: batch the DTCs are appended to
+    :param source: address of the responding ECU
+    :param timestamp: timestamp of the response
+    :return: number of decoded DTCs
+    """
+    if len(payload) < 2:
+        return 0
+    # the number of DTCs is authoritative, trailing bytes (e.g. padding) are ignored
+    end = min(2 + 3 * payload[1], len(payload) - 2)
+    count = 0
+    for i in range(2, end, 3):
+        batch.append((payload[i] << 8) | payload[i + 1], payload[i + 2], PROTOCOL_KWP, source, timestamp)
+        count += 1
+    return count
+
+
+def unpack_kwp2000_frame(frame: bytes) -> Optional[Tuple[int, bytes]]:
+    """
+    Extracts the payload of a KWP2000 K-line frame (format byte, [target, source], [length], data, checksum).
+
+    :param frame: complete frame incl. header and checksum
+    :return: (source address, payload) or None if the frame is truncated or the checksum does not match
+    """
+    if len(frame) < 2 or (sum(frame[:-1]) & 0xFF) != frame[-1]:
+        return None
+    fmt = frame[0]
+    pos = 1
+    source = 0
+    if fmt & 0xC0:  # address information present
+        if len(frame) < 4:
+            return None
+        source = frame[2]
+        pos = 3
+    length = fmt & 0x3F
+    if length == 0:  # additional length byte
+        if len(frame) < pos + 2:
+            return None
+        length = frame[pos]
+        pos += 1
+    if pos + length != len(frame) - 1:
+        return None
+    return source, frame[pos:pos + length]
+
+
+def decode_kwp2000_frames(frames: Iterable[bytes], batch: Optional[DTCBatch] = None,
+                          timestamps: Optional[Iterable[float]] = None) -> DTCBatch:
+    """
+    Decodes the DTCs of a sequence of KWP2000 K-line frames.
+    Frames that are invalid or do not carry a ReadDiagnosticTroubleCodesByStatus response are skipped.
+
+    :param frames: K-line frames
+    :param batch: batch the DTCs are appended to (a new one is created if not specified)
+    :param timestamps: timestamps of the frames (optional)
+    :return: batch of the decoded DTCs
+    """
+    if batch is None:
+        batch = DTCBatch()
+    if timestamps is None:
+        timestamps = repeat(0.0)
+    for frame, timestamp in zip(frames, timestamps):
+        unpacked = unpack_kwp2000_frame(frame)
+        if unpacked is not None and unpacked[1] and unpacked[1][0] == KWP_READ_DTC_BY_STATUS_RESPONSE:
+            decode_kwp2000_response(unpacked[1], batch, unpacked[0], timestamp)
+    return batch
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from dtc_parser.normalize import check_dtc
+
+# directory of the bundled (and compiled) data files
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+ERROR_CODES_FILE = os.path.join(DATA_DIR, "error_codes.csv")
+# environment variable with additional data files (separated by os.pathsep) that are merged into the code tables
+EXTRA_TABLES_ENV = "DTC_PARSER_EXTRA_TABLES"
+
+# names of the code tables (see error_codes.py)
+TABLE_NAMES = (
+    "P00", "P01", "P02", "P03", "P04", "P05", "P06", "P07", "P08", "P09", "P0A", "P0B", "P0C",
+    "P1", "P2", "P3", "B0", "B1", "B2", "C0", "C1", "C2", "U0", "U1", "U2",
+)
+
+
+def table_name(code: str) -> str:
+    """
+    Determines the code table a (canonical) DTC belongs to.
+    Generic powertrain codes are split by their third char, all other codes by their first two chars.
+
+    :param code: DTC
+    :return: name of the code table, e.g. "P01" for P0112 or "B1" for B1200
+    """
+    return "P0" + code[2] if code[0] == "P" and code[1] == "0" else code[:2]
+
+
+def iter_data_file(path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Streams the entries of a data file, either a CSV file (columns: DTC, description, with optional header) or a
+    JSON object (DTC -> description). CSV files are read line by line.
+
+    :param path: .csv or .json file
+    :return: iterator of (DTC, fault description) tuples
+    """
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            yield from json.load(f).items()
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        for row in reader:
+            if len(row) >= 2 and row[0] != "code":
+                yield row[0], row[1]
+
+
+def extra_table_paths() -> List[str]:
+    """
+    Returns the user-supplied data files listed in DTC_PARSER_EXTRA_TABLES.
+
+    :return: list of data files
+    """
+    return [path for path in os.environ.get(EXTRA_TABLES_ENV, "").split(os.pathsep) if path]
+
+
+def source_hash(paths: Optional[Sequence[str]] = None) -> str:
+    """
+    Computes a hash over the contents of the data files, e.g. to check whether compiled data is up to date
+    without loading the code tables.
+
+    :param paths: data files, defaults to the bundled data file and the files of DTC_PARSER_EXTRA_TABLES
+    :return: hex digest
+    """
+    digest = hashlib.sha256()
+    for path in paths if paths is not None else [ERROR_CODES_FILE] + extra_table_paths():
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_tables(paths: Sequence[str] = (ERROR_CODES_FILE,), extra_paths: Optional[Iterable[str]] = None,
+                strict: bool = False) -> Dict[str, Dict[str, str]]:
+    """
+    Loads the code tables from the specified data files.
+    Entries of later files extend or override those of earlier ones.
+
+    The bundled files are trusted to contain canonical DTCs and are streamed without validation,
+    whereas the entries of user-supplied files are normalized (and invalid ones skipped or rejected).
+
+    :param paths: (trusted) data files
+    :param extra_paths: additional (user-supplied) data files that are merged on top,
+                        defaults to the files of DTC_PARSER_EXTRA_TABLES
+    :param strict: whether invalid DTCs in user-supplied files raise an error (otherwise they are skipped)
+    :return: table name -> (DTC -> fault description)
+    """
+    if extra_paths is None:
+        extra_paths = extra_table_paths()
+    tables: Dict[str, Dict[str, str]] = {name: {} for name in TABLE_NAMES}
+    for path in paths:
+        for code, description in iter_data_file(path):
+            tables[table_name(code)][code] = description
+    for path in extra_paths:
+        for code, description in iter_data_file(path):
+            canonical, error = check_dtc(code)
+            if error or table_name(canonical) not in tables:
+                if strict:
+                    raise ValueError("invalid DTC in %s: %r" % (path, code))
+                continue
+            tables[table_name(canonical)][canonical] = description
+    return tables
+
+
+def benchmark(repetitions: int = 5) -> Dict[str, float]:
+    """
+    Compares the time of loading the code tables from the data file with evaluating them as module of
+    dict literals (the former error_codes.py), both from source and from the cached bytecode.
+
+    :param repetitions: number of repetitions (the best one is reported)
+    :return: method -> seconds
+    """
+    import marshal
+    tables = load_tables(extra_paths=())
+    source = "".join(
+        "%s_ERRORS = {\n%s}\n" % (name, "".join("    %r: %r,\n" % entry for entry in table.items()))
+        for name, table in tables.items()
+    )
+    bytecode = marshal.dumps(compile(source, "error_codes.py", "exec"))
+
+    def best(fun) -> float:
+        times = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            fun()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    return {
+        "data file (csv)": best(lambda: load_tables(extra_paths=())),
+        "literal module (source)": best(lambda: exec(compile(source, "error_codes.py", "exec"), {})),
+        "literal module (bytecode)": best(lambda: exec(marshal.loads(bytecode), {})),
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Loads the DTC code tables from the data files')
+    parser.add_argument('--benchmark', action='store_true', help='compare the loader with the literal module')
+    parser.add_argument('--check', action='store', type=str, nargs='*', help='data files to be validated')
+    args = parser.parse_args()
+    if args.check:
+        loaded = load_tables((), extra_paths=args.check, strict=True)
+        print("...", sum(len(t) for t in loaded.values()), "valid DTCs")
+    if args.benchmark:
+        for method, seconds in benchmark().items():
+            print("%-28s %8.2f ms" % (method, seconds * 1000))
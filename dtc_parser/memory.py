@@ -0,0 +1,342 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import os
+import sys
+import warnings
+from array import array
+from collections import ChainMap
+from functools import wraps
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, TypeVar
+
+# environment variable with the max. memory (in bytes) of the optional structures
+MEMORY_BUDGET_ENV = "DTC_PARSER_MEMORY_BUDGET"
+
+# optional (derived) structures, least valuable first, i.e., in the order they are dropped when the memory budget
+# is exceeded; structures that depend on others come before them, so dropping them actually releases memory
+STRUCTURE_VALUES = (
+    "fault_families",
+    "related_codes",
+    "term_completer",
+    "code_completer",
+    "perfect_hash",
+    "reverse_index",
+    "parser_results",
+    "failure_mode_index",
+    "description_search",
+    "code_suggester",
+    "fault_structures",
+    "numeric_fields",
+    "oem_overlays",
+    "code_index",
+)
+
+# objects of these types are measured without following their references
+ATOMIC_TYPES = (str, bytes, bytearray, array, int, float, complex, bool, type(None))
+CONTAINER_TYPES = (list, tuple, set, frozenset)
+
+T = TypeVar("T")
+
+# structure name -> cached getter or cache contents (registered when the module of the structure is imported)
+OPTIONAL_STRUCTURES: Dict[str, Callable] = {}
+# max. memory of the optional structures in bytes (None = unlimited), see get_memory_budget()
+_budget: Optional[int] = None
+# whether the budget has been configured, i.e., read from DTC_PARSER_MEMORY_BUDGET or set via set_memory_budget()
+_budget_configured = False
+
+
+class TableReport(NamedTuple):
+    """
+    Memory of a single code table (in bytes).
+    """
+    name: str
+    entries: int
+    keys: int  # DTC strings
+    descriptions: int  # fault description strings
+    overhead: int  # dict (hash table)
+
+    @property
+    def total(self) -> int:
+        return self.keys + self.descriptions + self.overhead
+
+
+class StructureReport(NamedTuple):
+    """
+    Memory of an optional structure (in bytes, excluding the objects it shares with the code tables and the
+    structures measured before it).
+    """
+    name: str
+    built: bool
+    size: int
+
+
+def deep_size(obj: object, seen: Set[int]) -> int:
+    """
+    Determines the memory of an object and everything it references that has not been seen before.
+    Only containers and objects of this package are followed (not modules, functions, classes, ...).
+
+    :param obj: object to be measured
+    :param seen: IDs of the objects that are already accounted for (updated)
+    :return: size in bytes
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, ATOMIC_TYPES):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, CONTAINER_TYPES):
+            stack.extend(current)
+        elif isinstance(current, ChainMap):
+            stack.extend(current.maps)
+        elif hasattr(current, "nbytes") and hasattr(current, "flags"):
+            # sys.getsizeof() of numpy arrays only includes the buffer if they own it (not for views, e.g. of .npz data)
+            if not current.flags.owndata:
+                size += current.nbytes
+        elif type(current).__module__.startswith("dtc_parser"):
+            if hasattr(current, "__dict__"):
+                stack.append(current.__dict__)
+            for cls in type(current).__mro__:
+                for slot in getattr(cls, "__slots__", ()):
+                    if hasattr(current, slot):
+                        stack.append(getattr(current, slot))
+    return size
+
+
+def optional_structure(name: str) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """
+    Decorator for the getters of the optional structures: the structure is built once on first use (like
+    lru_cache()), registered for the memory report, and the memory budget is enforced after it has been built.
+    The getter provides cache_clear(), is_built() and refresh() (see refresh_structures()).
+
+    :param name: name of the structure (see STRUCTURE_VALUES)
+    :return: decorator
+    """
+    if name not in STRUCTURE_VALUES:
+        raise ValueError("unknown optional structure: " + name)
+
+    def decorate(getter: Callable[[], T]) -> Callable[[], T]:
+        # holds the structure (if built), replaced with a single assignment
+        cache: Dict[str, T] = {}
+
+        @wraps(getter)
+        def wrapper() -> T:
+            structure = cache.get(name)
+            if structure is None:
+                structure = cache[name] = getter()
+                # the structure is returned in any case, but only stays cached if it fits into the budget
+                if not admit(name):
+                    cache.pop(name, None)
+            return structure
+
+        def refresh() -> None:
+            # readers keep using the previous structure until the new one is built
+            if name in cache:
+                cache[name] = getter()
+
+        wrapper.cache_clear = lambda: cache.pop(name, None)
+        wrapper.is_built = lambda: name in cache
+        wrapper.refresh = refresh
+        OPTIONAL_STRUCTURES[name] = wrapper
+        return wrapper
+
+    return decorate
+
+
+def register_cache(name: str, contents: Callable[[], object], clear: Callable[[], None]) -> None:
+    """
+    Registers a cache that is not a single structure (e.g. the precomputed results of all parsers) for the memory
+    report and budget.
+
+    :param name: name of the cache (see STRUCTURE_VALUES)
+    :param contents: returns the cached objects (empty if nothing is cached)
+    :param clear: drops the cached objects
+    """
+    if name not in STRUCTURE_VALUES:
+        raise ValueError("unknown optional structure: " + name)
+
+    def getter() -> object:
+        return contents()
+
+    getter.cache_clear = clear
+    getter.is_built = lambda: bool(contents())
+    # caches are rebuilt by their owners
+    getter.refresh = None
+    OPTIONAL_STRUCTURES[name] = getter
+
+
+def is_built(name: str) -> bool:
+    """
+    Checks whether an optional structure is currently held in memory.
+
+    :param name: name of the structure
+    :return: whether it is built
+    """
+    getter = OPTIONAL_STRUCTURES.get(name)
+    return getter is not None and getter.is_built()
+
+
+def refresh_structures() -> List[str]:
+    """
+    Rebuilds the optional structures that are currently built, e.g. after the table source has been reloaded
+    (see snapshot.ReloadableTables). Each structure is replaced once its successor is complete, so readers never
+    wait for the rebuild; the most valuable ones are rebuilt first, since the others build on them.
+
+    :return: names of the rebuilt structures
+    """
+    refreshed = []
+    for name in reversed(STRUCTURE_VALUES):
+        if is_built(name) and OPTIONAL_STRUCTURES[name].refresh is not None:
+            OPTIONAL_STRUCTURES[name].refresh()
+            refreshed.append(name)
+    return refreshed
+
+
+def table_report(seen: Optional[Set[int]] = None) -> List[TableReport]:
+    """
+    Measures the in-memory code tables of the table source (see tables.py), tables of other backends
+    (e.g. SQLite) are not held in memory and therefore skipped.
+
+    :param seen: IDs of the objects that are already accounted for (updated)
+    :return: report per table
+    """
+    from dtc_parser.tables import get_table_source
+    seen = set() if seen is None else seen
+    reports = []
+    for name, table in get_table_source().items():
+        if not isinstance(table, dict):
+            continue
+        seen.add(id(table))
+        keys = sum(deep_size(code, seen) for code in table.keys())
+        descriptions = sum(deep_size(description, seen) for description in table.values())
+        reports.append(TableReport(name, len(table), keys, descriptions, sys.getsizeof(table)))
+    return reports
+
+
+def structure_report(seen: Optional[Set[int]] = None) -> List[StructureReport]:
+    """
+    Measures the optional structures that are currently built (most valuable first, since the less valuable ones
+    mostly build on them).
+
+    :param seen: IDs of the objects that are already accounted for, e.g. by table_report() (updated)
+    :return: report per structure
+    """
+    seen = set() if seen is None else seen
+    reports = []
+    for name in reversed(STRUCTURE_VALUES):
+        built = is_built(name)
+        reports.append(StructureReport(name, built, deep_size(OPTIONAL_STRUCTURES[name](), seen) if built else 0))
+    return reports
+
+
+def memory_report() -> Tuple[List[TableReport], List[StructureReport]]:
+    """
+    Measures the code tables and the optional structures.
+    Objects shared with the tables (e.g. the description strings) are only accounted for once.
+
+    :return: (table reports, structure reports)
+    """
+    seen: Set[int] = set()
+    tables = table_report(seen)
+    return tables, structure_report(seen)
+
+
+def get_memory_budget() -> Optional[int]:
+    """
+    Returns the max. memory of the optional structures. Unless it has been set via set_memory_budget(), it is read
+    from DTC_PARSER_MEMORY_BUDGET on first use (not on import); an invalid value is ignored with a warning.
+
+    :return: max. memory in bytes (None = unlimited)
+    """
+    global _budget, _budget_configured
+    if not _budget_configured:
+        value = os.environ.get(MEMORY_BUDGET_ENV, "").strip()
+        if value.isdecimal():
+            _budget = int(value)
+        elif value:
+            warnings.warn("invalid %s=%r (expected the max. memory in bytes), the memory of the optional "
+                          "structures is not capped" % (MEMORY_BUDGET_ENV, value), RuntimeWarning)
+        _budget_configured = True
+    return _budget
+
+
+def set_memory_budget(limit: Optional[int]) -> List[str]:
+    """
+    Caps the memory of the optional structures (None removes the cap) and enforces it right away.
+
+    :param limit: max. memory in bytes
+    :return: names of the dropped structures
+    """
+    global _budget, _budget_configured
+    _budget, _budget_configured = limit, True
+    return enforce_budget() if limit is not None else []
+
+
+def _structure_sizes() -> Dict[str, int]:
+    from dtc_parser.tables import table_source_loaded
+    seen: Set[int] = set()
+    # the code tables are not loaded for the measurement if another backend is used
+    if table_source_loaded():
+        table_report(seen)
+    return {report.name: report.size for report in structure_report(seen)}
+
+
+def _drop(sizes: Dict[str, int], limit: int, keep: Iterable[str]) -> List[str]:
+    total = sum(sizes.values())
+    dropped = []
+    for name in STRUCTURE_VALUES:
+        if total <= limit:
+            break
+        if name in keep or not is_built(name):
+            continue
+        OPTIONAL_STRUCTURES[name].cache_clear()
+        total -= sizes[name]
+        dropped.append(name)
+    return dropped
+
+
+def enforce_budget(limit: Optional[int] = None, keep: Iterable[str] = ()) -> List[str]:
+    """
+    Drops optional structures, least valuable first, until their memory fits into the budget.
+    Dropped structures are rebuilt when they are used again.
+
+    :param limit: max. memory in bytes (defaults to the configured budget)
+    :param keep: structures that must not be dropped
+    :return: names of the dropped structures
+    """
+    limit = get_memory_budget() if limit is None else limit
+    if limit is None:
+        return []
+    return _drop(_structure_sizes(), limit, set(keep))
+
+
+def admit(name: str) -> bool:
+    """
+    Enforces the budget after the specified structure has been built. The structure itself and the more valuable
+    ones are never dropped for it, so structures that are used alternately do not evict each other. If they do not
+    fit into the budget on their own, nothing is dropped and the new structure must not be cached
+    (it is returned uncached, i.e., rebuilt on every use, and a warning is issued).
+
+    :param name: name of the structure that has just been built
+    :return: whether the structure may stay cached
+    """
+    budget = get_memory_budget()
+    if budget is None:
+        return True
+    sizes = _structure_sizes()
+    protected = set(STRUCTURE_VALUES[STRUCTURE_VALUES.index(name):])
+    required = sum(size for structure, size in sizes.items() if structure in protected)
+    if required > budget:
+        warnings.warn("the optional structure %s does not fit into the memory budget of %d bytes (incl. the more "
+                      "valuable structures), it is not cached" % (name, budget), RuntimeWarning)
+        return False
+    _drop(sizes, budget, protected)
+    return True
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# result codes of the normalization
+OK = 0
+ERR_EMPTY = 1  # nothing left after removing whitespace and separators
+ERR_LENGTH = 2  # wrong number of chars
+ERR_MISSING_CATEGORY = 3  # four chars without category letter (and no default category)
+ERR_CATEGORY = 4  # first char is not one of P, C, B, U
+ERR_CODE_TYPE = 5  # second char is not one of 0-3
+ERR_DIGIT = 6  # one of the last three chars is not a hex digit
+
+ERROR_MESSAGES = {
+    ERR_EMPTY: "empty DTC",
+    ERR_LENGTH: "DTC has to consist of five chars",
+    ERR_MISSING_CATEGORY: "DTC lacks the category (first char)",
+    ERR_CATEGORY: "unknown category (first char), expected one of P, C, B, U",
+    ERR_CODE_TYPE: "unknown code type (second char), expected one of 0, 1, 2, 3",
+    ERR_DIGIT: "last three chars have to be hex digits",
+}
+
+# chars that are dropped from the input (whitespace and common separators)
+SEPARATORS = b" \t\r\n\v\f-_.:/"
+
+# char class bits of the lookup table
+CLASS_CATEGORY = 1
+CLASS_CODE_TYPE = 2
+CLASS_HEX = 4
+
+
+def _build_tables() -> Tuple[bytes, bytes]:
+    """
+    Precomputes the translation table (upper-casing) and the char class table for all byte values.
+
+    :return: (translation table, char class table)
+    """
+    translation = bytes(range(256)).upper()
+    classes = bytearray(256)
+    for c in b"PCBU":
+        classes[c] |= CLASS_CATEGORY
+    for c in b"0123":
+        classes[c] |= CLASS_CODE_TYPE
+    for c in b"0123456789ABCDEF":
+        classes[c] |= CLASS_HEX
+    return translation, bytes(classes)
+
+
+TRANSLATION_TABLE, CHAR_CLASSES = _build_tables()
+HEX_DIGITS = b"0123456789ABCDEF"
+
+
+class InvalidDTCError(ValueError):
+    """
+    Raised if an input cannot be normalized to a valid DTC.
+    """
+
+    def __init__(self, code: str, error: int):
+        super().__init__("%s: %r" % (ERROR_MESSAGES[error], code))
+        self.code = code
+        self.error = error
+
+
+def check_dtc(code: str, default_category: Optional[str] = None) -> Tuple[Optional[str], int]:
+    """
+    Canonicalizes the provided DTC (upper-case, without whitespace and separators) and validates it.
+    Only table lookups are used, no regular expressions.
+
+    :param code: raw DTC, e.g. " p0-112\\n"
+    :param default_category: category that is prepended to codes that lack it (e.g. "0112"), rejected if None
+    :return: (canonical DTC or None, result code)
+    """
+    raw = code.encode("latin-1", "replace").translate(TRANSLATION_TABLE, SEPARATORS)
+    n = len(raw)
+    if n == 4 and default_category is not None:
+        raw = default_category.encode("latin-1", "replace").upper() + raw
+        n = 5
+    if n != 5:
+        if n == 0:
+            return None, ERR_EMPTY
+        if n == 4 and CHAR_CLASSES[raw[0]] & CLASS_CODE_TYPE:
+            return None, ERR_MISSING_CATEGORY
+        return None, ERR_LENGTH
+    if not CHAR_CLASSES[raw[0]] & CLASS_CATEGORY:
+        return None, ERR_CATEGORY
+    if not CHAR_CLASSES[raw[1]] & CLASS_CODE_TYPE:
+        return None, ERR_CODE_TYPE
+    if raw[2:].translate(None, HEX_DIGITS):
+        return None, ERR_DIGIT
+    return raw.decode("ascii"), OK
+
+
+def normalize_dtc(code: str, default_category: Optional[str] = None) -> str:
+    """
+    Canonicalizes the provided DTC, e.g. " p0-112\\n" -> "P0112".
+
+    :param code: raw DTC
+    :param default_category: category that is prepended to codes that lack it (e.g. "0112"), rejected if None
+    :return: canonical DTC
+    """
+    canonical, error = check_dtc(code, default_category)
+    if error:
+        raise InvalidDTCError(code, error)
+    return canonical
+
+
+def normalize_many(codes: Iterable[str], default_category: Optional[str] = None) -> Tuple[List[Optional[str]], array]:
+    """
+    Canonicalizes a batch of DTCs. Every distinct input is only checked once.
+
+    :param codes: raw DTCs
+    :param default_category: category that is prepended to codes that lack it (e.g. "0112"), rejected if None
+    :return: (canonical DTCs (None for rejected ones), result codes)
+    """
+    cache: Dict[str, Tuple[Optional[str], int]] = {}
+    canonical = []
+    errors = array("B")
+    for code in codes:
+        res = cache.get(code)
+        if res is None:
+            res = cache[code] = check_dtc(code, default_category)
+        canonical.append(res[0])
+        errors.append(res[1])
+    return canonical, errors
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, NamedTuple, Sequence, Tuple
+
+from dtc_parser.codec import CODE_SPACE_SIZE, dtc_to_int
+from dtc_parser.memory import optional_structure
+from dtc_parser.search import TOKEN_TRANSLATION
+from dtc_parser.tables import iter_entries
+
+if TYPE_CHECKING:
+    import numpy as np
+
+NOT_APPLICABLE = -1
+# word preceding the number -> field
+NUMBER_PREFIXES = {
+    "bank": "bank",
+    "sensor": "sensor",
+    "ho2s": "sensor",
+    "cylinder": "cylinder",
+    "cyl": "cylinder",
+}
+
+
+class NumericFields(NamedTuple):
+    """
+    Numbers encoded in a fault description (NOT_APPLICABLE if the description does not contain the field).
+    """
+    bank: int
+    sensor: int
+    cylinder: int
+
+
+UNKNOWN_FIELDS = NumericFields(NOT_APPLICABLE, NOT_APPLICABLE, NOT_APPLICABLE)
+
+
+def extract_numeric_fields(description: str) -> NumericFields:
+    """
+    Extracts bank, sensor and cylinder number from a fault description,
+    e.g. "Heated oxygen sensor (HO2S) 2, bank 1" -> NumericFields(bank=1, sensor=2, cylinder=-1).
+
+    :param description: fault description
+    :return: numeric fields
+    """
+    fields = {"bank": NOT_APPLICABLE, "sensor": NOT_APPLICABLE, "cylinder": NOT_APPLICABLE}
+    tokens = description.lower().translate(TOKEN_TRANSLATION).split()
+    for word, number in zip(tokens, tokens[1:]):
+        field = NUMBER_PREFIXES.get(word)
+        if field is not None and number.isdigit() and fields[field] == NOT_APPLICABLE and int(number) < 128:
+            fields[field] = int(number)
+    return NumericFields(fields["bank"], fields["sensor"], fields["cylinder"])
+
+
+class NumericFieldTable:
+    """
+    Precomputed bank / sensor / cylinder numbers of all supported codes.
+    Each field is a signed byte array over the entire code space (NOT_APPLICABLE for codes without the field or
+    unsupported codes), so a batch of codes is resolved by plain array indexing.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        """
+        :param entries: (DTC, fault description) tuples
+        """
+        self.banks = array("b", [NOT_APPLICABLE]) * CODE_SPACE_SIZE
+        self.sensors = array("b", [NOT_APPLICABLE]) * CODE_SPACE_SIZE
+        self.cylinders = array("b", [NOT_APPLICABLE]) * CODE_SPACE_SIZE
+        for code, description in entries:
+            key = dtc_to_int(code)
+            self.banks[key], self.sensors[key], self.cylinders[key] = extract_numeric_fields(description)
+
+    def get(self, code: str) -> NumericFields:
+        """
+        Returns the numeric fields of the specified (canonical) code.
+
+        :param code: DTC
+        :return: numeric fields
+        """
+        key = dtc_to_int(code)
+        return NumericFields(self.banks[key], self.sensors[key], self.cylinders[key])
+
+    def columns(self, codes: Sequence[int]) -> Dict[str, "np.ndarray"]:
+        """
+        Resolves the numeric fields of a batch of codes (requires NumPy).
+
+        :param codes: DTCs as integers, e.g. the codes column of a DTCBatch
+        :return: field name -> int8 array (aligned with the codes)
+        """
+        import numpy as np
+        codes = np.asarray(codes, dtype=np.uint16)
+        return {
+            "bank": np.frombuffer(self.banks, dtype=np.int8)[codes],
+            "sensor": np.frombuffer(self.sensors, dtype=np.int8)[codes],
+            "cylinder": np.frombuffer(self.cylinders, dtype=np.int8)[codes],
+        }
+
+
+@optional_structure("numeric_fields")
+def get_numeric_field_table() -> NumericFieldTable:
+    """
+    Returns the numeric fields of all supported codes (built on first use).
+
+    :return: numeric field table
+    """
+    return NumericFieldTable(iter_entries())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import csv
+import json
+import os
+from collections import ChainMap
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from dtc_parser.memory import admit, register_cache
+from dtc_parser.normalize import check_dtc
+
+# environment variable with additional directories (separated by os.pathsep) that contain OEM overlay tables
+OEM_DIR_ENV = "DTC_PARSER_OEM_DIR"
+
+
+def load_overlay_file(path: str) -> Dict[str, str]:
+    """
+    Reads an OEM overlay table, either a CSV file (columns: DTC, description) or a JSON object (DTC -> description).
+    Rows with invalid DTCs (e.g. headers) are skipped, the DTCs are normalized.
+
+    :param path: .csv or .json file
+    :return: DTC -> fault description
+    """
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            rows = list(json.load(f).items())
+    else:
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = [tuple(row[:2]) for row in csv.reader(f) if len(row) >= 2]
+    overlay = {}
+    for code, description in rows:
+        canonical, error = check_dtc(code)
+        if not error:
+            overlay[canonical] = description.strip()
+    return overlay
+
+
+class OEMOverlays:
+    """
+    Manufacturer-specific meanings of the P1 / P3 / B1 / B2 / C1 / C2 / U1 / U2 ... codes, layered on top of the
+    generic code tables.
+
+    The overlay table of a make is only loaded when it is first requested, and lookups are resolved through a
+    ChainMap (OEM overlay -> code table), i.e., the code tables are never copied. The memory consumption therefore
+    grows with the number of makes that are actually seen.
+    """
+
+    def __init__(self, directories: Optional[Sequence[str]] = None):
+        """
+        :param directories: directories that contain the overlay tables (named <make>.csv / <make>.json),
+                            defaults to the directories of DTC_PARSER_OEM_DIR (no overlay tables are bundled)
+        """
+        if directories is None:
+            directories = [d for d in os.environ.get(OEM_DIR_ENV, "").split(os.pathsep) if d]
+        self.directories = list(directories)
+        self.overlays: Dict[str, Dict[str, str]] = {}
+        self.chains: Dict[Tuple[str, int], ChainMap] = {}
+
+    @staticmethod
+    def normalize_make(make: str) -> str:
+        """
+        Normalizes a make to the name of its overlay table, e.g. "Mercedes Benz" -> "mercedes_benz".
+
+        :param make: make
+        :return: overlay key
+        """
+        return "_".join(make.lower().replace("-", " ").split())
+
+    def overlay(self, make: str) -> Dict[str, str]:
+        """
+        Returns the overlay table of the specified make (loaded on first request).
+        Makes without an overlay table get an empty one. If the shared overlays exceed the memory budget, the
+        tables of the other makes are dropped.
+
+        :param make: make, e.g. "ford"
+        :return: DTC -> manufacturer-specific fault description
+        """
+        key = self.normalize_make(make)
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = {}
+            for directory in self.directories:
+                for extension in (".csv", ".json"):
+                    path = os.path.join(directory, key + extension)
+                    if os.path.exists(path):
+                        # tables of earlier directories take precedence
+                        overlay = {**load_overlay_file(path), **overlay}
+            self.overlays[key] = overlay
+            # the shared overlays are accounted for in the memory budget, if they do not fit, only the requested
+            # make is kept, since it is in use (dropping it as well would re-read its table on every lookup)
+            if self is OEM_OVERLAYS and not admit("oem_overlays"):
+                self.chains = {chain_key: chain for chain_key, chain in self.chains.items() if chain_key[0] == key}
+                self.overlays = {key: overlay}
+        return overlay
+
+    def chain(self, make: str, table: Mapping[str, str]) -> ChainMap:
+        """
+        Returns the layered lookup chain (OEM overlay -> code table) of the specified make and table.
+
+        :param make: make, e.g. "ford"
+        :param table: code table, e.g. error_codes.P1_ERRORS
+        :return: layered table
+        """
+        key = (self.normalize_make(make), id(table))
+        chain = self.chains.get(key)
+        # the identity check guards against the ID of a discarded table being reused
+        if chain is None or chain.maps[1] is not table:
+            chain = self.chains[key] = ChainMap(self.overlay(make), table)
+        return chain
+
+    def discard_chains(self, table_ids: Iterable[int]) -> None:
+        """
+        Drops the cached lookup chains of the specified code tables, e.g. after they have been replaced by a reload.
+        Chains that are still needed are simply rebuilt on their next request.
+
+        :param table_ids: IDs (id()) of the code tables that are no longer used
+        """
+        ids = set(table_ids)
+        for key in [key for key in list(self.chains) if key[1] in ids]:
+            self.chains.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drops all loaded overlay tables and lookup chains (reloaded on their next request).
+        Lookups that are still running keep using the previous ones.
+        """
+        self.overlays = {}
+        self.chains = {}
+
+    def loaded_makes(self) -> List[str]:
+        """
+        Returns the makes whose overlay tables are loaded.
+
+        :return: list of makes
+        """
+        return sorted(self.overlays)
+
+
+# shared instance, so every parser only loads each make once
+OEM_OVERLAYS = OEMOverlays()
+register_cache("oem_overlays", lambda: [OEM_OVERLAYS.overlays, OEM_OVERLAYS.chains] if OEM_OVERLAYS.overlays else [],
+               OEM_OVERLAYS.clear)
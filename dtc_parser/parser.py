@@ -3,9 +3,22 @@
 # @author Tim Bohne
 
 import argparse
-from typing import Dict
-
-from dtc_parser import error_codes
+import threading
+import weakref
+from typing import Dict, List, Mapping, Optional, Union
+
+from dtc_parser import j1939
+from dtc_parser.codec import dtc_to_int
+from dtc_parser.decomposition import get_fault_structures
+from dtc_parser.memory import admit, is_built, register_cache
+from dtc_parser.normalize import InvalidDTCError, normalize_dtc
+from dtc_parser.numeric_fields import extract_numeric_fields, get_numeric_field_table
+from dtc_parser.overlays import OEM_OVERLAYS, OEMOverlays
+from dtc_parser.results import ParsedDTC, build_results
+from dtc_parser.subsystems import SUBSYSTEMS, UNKNOWN_SUBSYSTEM
+from dtc_parser.suggest import get_code_suggester
+from dtc_parser.tables import get_table_source, is_table_source
+from dtc_parser.vin import make_from_vin
 
 
 class DTCParser:
@@ -13,11 +26,98 @@ class DTCParser:
     Parser for diagnostic trouble codes (DTCs) used by vehicle on-board diagnostics (OBD).
     """
 
-    def __init__(self):
+    def __init__(self, make: Optional[str] = None, overlays: OEMOverlays = OEM_OVERLAYS,
+                 tables: Optional[Mapping[str, Mapping[str, str]]] = None):
+        """
+        :param make: make of the vehicle, manufacturer-specific codes are resolved via its OEM overlay table
+        :param overlays: OEM overlay tables
+        :param tables: code tables (name -> (DTC -> fault description)), defaults to the table source (the in-memory
+                       tables unless set via tables.set_table_source()), see sqlite_backend.SQLiteCodeTables for a
+                       disk-backed alternative
+        """
+        self.tables = tables if tables is not None else get_table_source()
         self.vehicle_part = ""
         self.code_type = ""
         self.vehicle_subsystem = ""
         self.fault_description = ""
+        self.make = make
+        self.overlays = overlays
+        # make -> parser, used by parse() for vehicles of other makes
+        self.make_parsers: Dict[str, DTCParser] = {}
+        # precomputed results of the entire code space (see results()) and the table set they were built from
+        self._results: List[ParsedDTC] = []
+        self._results_source: object = None
+        self._results_lock = threading.Lock()
+
+    def manufacturer_table(self, table: Mapping[str, str]) -> Mapping[str, str]:
+        """
+        Returns the lookup table for manufacturer-specific codes, i.e., the OEM overlay of the make layered on top
+        of the specified code table (or the code table itself if no make is set).
+
+        :param table: manufacturer-specific code table
+        :return: lookup table
+        """
+        return table if self.make is None else self.overlays.chain(self.make, table)
+
+    def overlay_description(self, code: str) -> Optional[str]:
+        """
+        Returns the manufacturer-specific fault description of the make's OEM overlay table.
+
+        :param code: (canonical) DTC
+        :return: fault description or None if the code is not overridden by the overlay (or no make is set)
+        """
+        if self.make is None or code[1] == "0":
+            return None
+        return self.overlays.overlay(self.make).get(code)
+
+    def results(self) -> List[ParsedDTC]:
+        """
+        Returns the precomputed parsing results of all 65,536 DTCs, indexed by their integer representation
+        (built on first use and rebuilt when reloadable tables have swapped in a new snapshot).
+        Only one thread rebuilds them, the others keep using the previous results in the meantime. To keep the
+        rebuild off the read path, it can be triggered by the reload thread via a listener of the reloadable tables
+        (tables.listeners.append(lambda old, new: parser.results())).
+
+        :return: list of parsing results
+        """
+        source = getattr(self.tables, "snapshot", self.tables)
+        if source is not self._results_source:
+            if not self._results_lock.acquire(blocking=not self._results):
+                return self._results
+            try:
+                source = getattr(self.tables, "snapshot", self.tables)
+                if source is not self._results_source:
+                    self._results = build_results(self)
+                    self._results_source = source
+                    PARSERS_WITH_RESULTS.add(self)
+                    # the results are returned in any case, but only stay cached if they fit into the budget
+                    if not admit("parser_results"):
+                        results = self._results
+                        self.clear_results()
+                        return results
+            finally:
+                self._results_lock.release()
+        return self._results
+
+    def clear_results(self) -> None:
+        """
+        Drops the precomputed results (rebuilt on the next lookup).
+        """
+        self._results = []
+        self._results_source = None
+        PARSERS_WITH_RESULTS.discard(self)
+
+    def lookup(self, code: Union[str, int]) -> ParsedDTC:
+        """
+        Looks up the precomputed parsing result of the provided DTC (a single index into the results).
+        Meant for high-volume lookups: the first call precomputes the results of the entire code space (see results()).
+
+        :param code: DTC as 16-bit integer or string (normalized first, see normalize.normalize_dtc())
+        :return: parsing result (incl. category, type and subsystem for unsupported DTCs)
+        """
+        if isinstance(code, str):
+            code = dtc_to_int(normalize_dtc(code))
+        return self.results()[code]
 
     @staticmethod
     def parse_vehicle_part(char: str) -> str:
@@ -61,41 +161,20 @@ class DTCParser:
     def parse_vehicle_subsystem(first_char: str, third_char: str) -> str:
         """
         The third char tells which vehicle subsystem has a fault (based on the category (first char)).
-        This function returns the subsystems for powertrain codes.
+        The subsystems of all categories are looked up in a precomputed table (see subsystems.py).
 
         :param first_char: first char of the DTC
         :param third_char: third char of the DTC
         :return: parsed vehicle subsystem
         """
-        # TODO: only supporting powertrain (P) subsystems atm, should be extended when
-        #       a source for the other categories can be found
-        if first_char != "P":
-            print("we don't have information about subsystems for category", first_char)
-            return "unknown_" + first_char
-        elif third_char == "0":
-            return "fuel and air metering and auxiliary emission controls"
-        elif third_char == "1":
-            return "fuel and air metering"
-        elif third_char == "2":
-            return "fuel and air metering – injector circuit"
-        elif third_char == "3":
-            return "ignition systems or misfires"
-        elif third_char == "4":
-            return "auxiliary emission controls"
-        elif third_char == "5":
-            return "vehicle speed control, idle control systems, and auxiliary inputs"
-        elif third_char == "6":
-            return "computer and output circuit"
-        elif third_char == "7":
-            return "transmission"
-        elif third_char in ["A", "B", "C"]:
-            return "hybrid propulsion systems"
-        else:
-            print("unknown third char")
-            return "unknown_P"
+        subsystem = SUBSYSTEMS.get((first_char, third_char))
+        if subsystem is None:
+            print("unknown first / third char")
+            return UNKNOWN_SUBSYSTEM
+        return subsystem
 
     @staticmethod
-    def get_code_from_dict(code_dict: Dict, code: str) -> str:
+    def get_code_from_dict(code_dict: Mapping, code: str) -> str:
         """
         Parses the specified DTC using the specified dictionary (if supported).
 
@@ -114,31 +193,31 @@ class DTCParser:
         :return: generic powertrain fault
         """
         if code[0] == "0":
-            return self.get_code_from_dict(error_codes.P00_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P00"], prefix + code)
         elif code[0] == "1":
-            return self.get_code_from_dict(error_codes.P01_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P01"], prefix + code)
         elif code[0] == "2":
-            return self.get_code_from_dict(error_codes.P02_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P02"], prefix + code)
         elif code[0] == "3":
-            return self.get_code_from_dict(error_codes.P03_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P03"], prefix + code)
         elif code[0] == "4":
-            return self.get_code_from_dict(error_codes.P04_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P04"], prefix + code)
         elif code[0] == "5":
-            return self.get_code_from_dict(error_codes.P05_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P05"], prefix + code)
         elif code[0] == "6":
-            return self.get_code_from_dict(error_codes.P06_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P06"], prefix + code)
         elif code[0] == "7":
-            return self.get_code_from_dict(error_codes.P07_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P07"], prefix + code)
         elif code[0] == "8":
-            return self.get_code_from_dict(error_codes.P08_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P08"], prefix + code)
         elif code[0] == "9":
-            return self.get_code_from_dict(error_codes.P09_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P09"], prefix + code)
         elif code[0] == "A":
-            return self.get_code_from_dict(error_codes.P0A_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P0A"], prefix + code)
         elif code[0] == "B":
-            return self.get_code_from_dict(error_codes.P0B_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P0B"], prefix + code)
         elif code[0] == "C":
-            return self.get_code_from_dict(error_codes.P0C_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.tables["P0C"], prefix + code)
         else:
             print("invalid generic powertrain code")
             return "---"
@@ -152,11 +231,11 @@ class DTCParser:
         :return: manufacturer-specific powertrain fault
         """
         if prefix[1] == "1":
-            return self.get_code_from_dict(error_codes.P1_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.manufacturer_table(self.tables["P1"]), prefix + code)
         elif prefix[1] == "2":
-            return self.get_code_from_dict(error_codes.P2_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.manufacturer_table(self.tables["P2"]), prefix + code)
         elif prefix[1] == "3":
-            return self.get_code_from_dict(error_codes.P3_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.manufacturer_table(self.tables["P3"]), prefix + code)
         else:
             print("invalid manufacturer-specific powertrain code")
             return "---"
@@ -169,7 +248,7 @@ class DTCParser:
         :param code: last three chars (specific fault)
         :return: generic chassis fault
         """
-        return self.get_code_from_dict(error_codes.C0_ERRORS, prefix + code)
+        return self.get_code_from_dict(self.tables["C0"], prefix + code)
 
     def parse_manufacturer_specific_chassis_fault(self, prefix: str, code: str) -> str:
         """
@@ -180,9 +259,9 @@ class DTCParser:
         :return: manufacturer-specific chassis fault
         """
         if prefix[1] == "1":
-            return self.get_code_from_dict(error_codes.C1_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.manufacturer_table(self.tables["C1"]), prefix + code)
         elif prefix[1] == "2":
-            return self.get_code_from_dict(error_codes.C2_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.manufacturer_table(self.tables["C2"]), prefix + code)
         else:
             print("invalid manufacturer-specific chassis code")
             return "---"
@@ -195,7 +274,7 @@ class DTCParser:
         :param code: last three chars (specific fault)
         :return: generic body fault
         """
-        return self.get_code_from_dict(error_codes.B0_ERRORS, prefix + code)
+        return self.get_code_from_dict(self.tables["B0"], prefix + code)
 
     def parse_manufacturer_specific_body_fault(self, prefix: str, code: str) -> str:
         """
@@ -206,9 +285,9 @@ class DTCParser:
         :return: manufacturer-specific body fault
         """
         if prefix[1] == "1":
-            return self.get_code_from_dict(error_codes.B1_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.manufacturer_table(self.tables["B1"]), prefix + code)
         elif prefix[1] == "2":
-            return self.get_code_from_dict(error_codes.B2_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.manufacturer_table(self.tables["B2"]), prefix + code)
         else:
             print("invalid manufacturer-specific body code")
             return "---"
@@ -221,7 +300,7 @@ class DTCParser:
         :param code: last three chars (specific fault)
         :return: generic network fault
         """
-        return self.get_code_from_dict(error_codes.U0_ERRORS, prefix + code)
+        return self.get_code_from_dict(self.tables["U0"], prefix + code)
 
     def parse_manufacturer_specific_network_fault(self, prefix: str, code: str) -> str:
         """
@@ -232,9 +311,9 @@ class DTCParser:
         :return: manufacturer-specific network fault
         """
         if prefix[1] == "1":
-            return self.get_code_from_dict(error_codes.U1_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.manufacturer_table(self.tables["U1"]), prefix + code)
         elif prefix[1] == "2":
-            return self.get_code_from_dict(error_codes.U2_ERRORS, prefix + code)
+            return self.get_code_from_dict(self.manufacturer_table(self.tables["U2"]), prefix + code)
         else:
             print("invalid manufacturer-specific network code")
             return "---"
@@ -247,7 +326,8 @@ class DTCParser:
         :param error_code: last three chars (specific fault)
         :return: parsed fault description
         """
-        assert len(prefix) == 2 and len(error_code) == 3
+        if len(prefix) != 2 or len(error_code) != 3:
+            raise ValueError("invalid DTC: " + prefix + error_code)
 
         if prefix == "P0":
             return self.parse_generic_powertrain_fault(prefix, error_code)
@@ -273,38 +353,121 @@ class DTCParser:
         """
         Parses the provided DTC.
 
-        :param code: DTC to be parsed
+        :param code: DTC to be parsed (normalized first, see normalize.normalize_dtc())
         """
+        code = normalize_dtc(code)
         print("... parsing", code, "...")
-        assert len(code) == 5
         print("++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
         print("VEHICLE PART:\t\t", self.parse_vehicle_part(code[0]))
         print("CODE TYPE:\t\t", self.parse_code_type(code[1]))
         print("VEHICLE SUBSYSTEM:\t", self.parse_vehicle_subsystem(code[0], code[2]))
-        print("FAULT DESCRIPTION:\t",
-              self.parse_fault_description(code[0] + code[1], code[2] + code[3] + code[4]).lower())
+        fault_description = self.parse_fault_description(code[0] + code[1], code[2] + code[3] + code[4])
+        print("FAULT DESCRIPTION:\t", fault_description.lower())
+        if fault_description == "unsupported DTC":
+            print("DID YOU MEAN:\t\t", ", ".join(self.suggest_codes(code)))
         print("++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++")
 
     def parse_code_machine_readable(self, code: str) -> Dict:
         """
         Parses the provided DTC and returns the results in a machine-readable format.
 
-        :param code: DTC to be parsed
+        :param code: DTC to be parsed (normalized first, see normalize.normalize_dtc())
         :return: parsed DTC results in machine-readable format
         """
+        code = normalize_dtc(code)
         print("... parsing", code, "...")
-        assert len(code) == 5
+        fault_description = self.parse_fault_description(code[0] + code[1], code[2] + code[3] + code[4])
+        description = self.overlay_description(code)
+        if description is None and not is_table_source(self.tables):
+            # the precomputed records are built from other code tables (see tables.set_table_source()), the fields
+            # are derived from the parser's own description instead (without loading the table source)
+            description = fault_description if fault_description not in ("unsupported DTC", "---") else ""
+        if description is None:
+            fault_structure = get_fault_structures().get(code)
+            # the numeric field table is only worth building for bulk use (see batch.py), single calls extract them
+            numeric_fields = (get_numeric_field_table().get(code) if is_built("numeric_fields")
+                              else extract_numeric_fields(fault_description))
+        else:
+            # the precomputed records only cover the generic codes of the table source
+            fault_structure = get_fault_structures().structure(description)
+            numeric_fields = extract_numeric_fields(description)
         return {
             "vehicle_part": self.parse_vehicle_part(code[0]),
             "code_type": self.parse_code_type(code[1]),
             "vehicle_subsystem": self.parse_vehicle_subsystem(code[0], code[2]),
-            "fault_description": self.parse_fault_description(code[0] + code[1], code[2] + code[3] + code[4]).lower()
+            "fault_description": fault_description.lower(),
+            "fault_structure": fault_structure,
+            **numeric_fields._asdict()
         }
 
+    def parse(self, code: str, vin: Optional[str] = None) -> Dict:
+        """
+        Parses the provided DTC, resolving manufacturer-specific codes based on the make derived from the VIN.
+
+        :param code: DTC to be parsed
+        :param vin: VIN of the vehicle (the parser's make is used if not specified or the manufacturer is unknown)
+        :return: parsed DTC results in machine-readable format
+        """
+        make = make_from_vin(vin) if vin is not None else None
+        if make is None or make == self.make:
+            return self.parse_code_machine_readable(code)
+        parser = self.make_parsers.get(make)
+        if parser is None:
+            parser = self.make_parsers[make] = DTCParser(make, self.overlays, self.tables)
+        return parser.parse_code_machine_readable(code)
+
+    @staticmethod
+    def suggest_codes(code: str, k: int = 5) -> List[str]:
+        """
+        Suggests the nearest supported DTCs for an unsupported (e.g. misread or mistyped) one.
+
+        :param code: DTC (does not have to be valid)
+        :param k: max. number of suggestions
+        :return: list of supported DTCs, nearest first
+        """
+        return [suggestion for suggestion, _ in get_code_suggester().suggest(code, k)]
+
+    @staticmethod
+    def parse_j1939_fault(spn: int, fmi: int, spn_table: Optional[j1939.SPNTable] = None) -> Dict:
+        """
+        Parses a SAE J1939 DTC (as reported by DM1 / DM2 messages of heavy-duty vehicles).
+
+        :param spn: suspect parameter number
+        :param fmi: failure mode identifier
+        :param spn_table: SPN table used for the lookup (defaults to the table specified by DTC_PARSER_SPN_TABLE)
+        :return: parsed DTC results in machine-readable format
+        """
+        return {
+            "suspect_parameter": (spn_table or j1939.SPN_TABLE).get(spn).lower(),
+            "failure_mode": j1939.parse_failure_mode(fmi).lower()
+        }
+
+
+# parsers that hold precomputed results (see DTCParser.results()), accounted for in the memory budget
+PARSERS_WITH_RESULTS: "weakref.WeakSet[DTCParser]" = weakref.WeakSet()
+
+
+def clear_parser_results() -> None:
+    """
+    Drops the precomputed results of all parsers.
+    """
+    for dtc_parser in list(PARSERS_WITH_RESULTS):
+        dtc_parser.clear_results()
+
+
+register_cache("parser_results", lambda: [p._results for p in list(PARSERS_WITH_RESULTS)], clear_parser_results)
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Parser for diagnostic trouble codes (DTCs)')
     parser.add_argument('--code', action='store', type=str, help='DTC to be parsed', required=True)
+    parser.add_argument('--make', action='store', type=str,
+                        help='make of the vehicle (for manufacturer-specific codes)')
+    parser.add_argument('--vin', action='store', type=str, help='VIN of the vehicle (to derive the make)')
     args = parser.parse_args()
-    dtc_parser = DTCParser()
-    dtc_parser.parse_code(args.code)
+    dtc_parser = DTCParser(make_from_vin(args.vin) if args.vin else args.make)
+    try:
+        dtc_parser.parse_code(args.code)
+    except InvalidDTCError as e:
+        suggestions = dtc_parser.suggest_codes(args.code)
+        parser.error(str(e) + ("\ndid you mean: " + ", ".join(suggestions) if suggestions else ""))
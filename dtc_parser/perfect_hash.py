@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+from zlib import crc32
+
+from dtc_parser.loader import load_tables, source_hash
+from dtc_parser.memory import optional_structure
+from dtc_parser.parser import DTCParser
+from dtc_parser.tables import DATA_DIR, get_error_tables, iter_entries
+
+COMPILED_PERFECT_HASH = os.path.join(DATA_DIR, "perfect_hash.json")
+# average number of keys per first-level bucket
+BUCKET_SIZE = 4
+# length of the (canonical) DTC strings
+KEY_LENGTH = 5
+# lookup structures compared by benchmark()
+BENCHMARK_METHODS = ("perfect hash", "dict", "get_code_from_dict")
+
+
+class PerfectHashTable:
+    """
+    Minimal perfect hash table (hash and displace) over the supported DTC strings.
+
+    The first-level hash assigns each key to a bucket, the displacement of the bucket seeds the second-level hash
+    that yields the slot of the key. The displacements are generated offline such that every key gets its own slot
+    and there are exactly as many slots as keys. A lookup therefore consists of two hashes (CRC-32, which is
+    deterministic across processes, unlike hash()), one index and one equality check; there are no collisions
+    to be probed and no dict overhead. The keys are stored as a single byte string (five bytes per slot) instead of
+    one string object per key.
+    """
+
+    def __init__(self, displacements: array, keys: bytes, descriptions: List[str]):
+        """
+        :param displacements: second-level seed per bucket
+        :param keys: DTC per slot (concatenated)
+        :param descriptions: fault description per slot
+        """
+        self.displacements = displacements
+        self.keys = keys
+        self.descriptions = descriptions
+        self.buckets = len(displacements)
+        self.size = len(descriptions)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, code: str) -> bool:
+        return self.get(code) is not None
+
+    @classmethod
+    def generate(cls, entries: Iterable[Tuple[str, str]]) -> "PerfectHashTable":
+        """
+        Searches the displacements of a minimal perfect hash over the specified entries
+        (largest buckets first, since they are the hardest to place).
+
+        :param entries: (DTC, fault description) tuples
+        :return: perfect hash table
+        """
+        entries = dict(entries)
+        if any(len(code.encode()) != KEY_LENGTH for code in entries):
+            raise ValueError("perfect hash keys have to be canonical DTCs")
+        size = len(entries)
+        buckets: List[List[bytes]] = [[] for _ in range(max(1, size // BUCKET_SIZE))]
+        for code in entries:
+            data = code.encode()
+            buckets[crc32(data) % len(buckets)].append(data)
+        displacements = array("L", [0] * len(buckets))
+        slots: List[Optional[bytes]] = [None] * size
+        for bucket in sorted(range(len(buckets)), key=lambda b: -len(buckets[b])):
+            keys = buckets[bucket]
+            if not keys:
+                break
+            displacement = 1
+            while True:
+                positions = {crc32(data, displacement) % size for data in keys}
+                if len(positions) == len(keys) and all(slots[p] is None for p in positions):
+                    break
+                displacement += 1
+            displacements[bucket] = displacement
+            for data in keys:
+                slots[crc32(data, displacement) % size] = data
+        return cls(displacements, b"".join(slots), [entries[data.decode()] for data in slots])
+
+    def slot(self, code: str) -> int:
+        """
+        Determines the slot of the specified DTC.
+
+        :param code: (canonical) DTC
+        :return: slot, -1 if the DTC is not supported
+        """
+        data = code.encode()
+        i = crc32(data, self.displacements[crc32(data) % self.buckets]) % self.size
+        return i if self.keys[i * KEY_LENGTH:(i + 1) * KEY_LENGTH] == data else -1
+
+    def get(self, code: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Looks up the fault description of the specified DTC.
+
+        :param code: (canonical) DTC
+        :param default: returned if the DTC is not supported
+        :return: fault description
+        """
+        data = code.encode()
+        i = crc32(data, self.displacements[crc32(data) % self.buckets]) % self.size
+        return self.descriptions[i] if self.keys[i * KEY_LENGTH:(i + 1) * KEY_LENGTH] == data else default
+
+    def save(self, path: str = COMPILED_PERFECT_HASH, data_hash: str = "") -> None:
+        """
+        Persists the hash table.
+
+        :param path: .json file to be written
+        :param data_hash: hash of the data files the hash table was generated from (see loader.source_hash())
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"source_hash": data_hash, "displacements": self.displacements.tolist(),
+                       "keys": self.keys.decode(), "descriptions": self.descriptions}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str = COMPILED_PERFECT_HASH) -> Tuple["PerfectHashTable", str]:
+        """
+        Loads a persisted hash table.
+
+        :param path: .json file written by save()
+        :return: (hash table, hash of the data files it was generated from)
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return (cls(array("L", data["displacements"]), data["keys"].encode(), data["descriptions"]),
+                data.get("source_hash", ""))
+
+
+def compile_perfect_hash(path: str = COMPILED_PERFECT_HASH) -> PerfectHashTable:
+    """
+    Generates the minimal perfect hash over all supported DTCs and persists it.
+
+    :param path: .json file to be written
+    :return: perfect hash table
+    """
+    table = PerfectHashTable.generate(iter_entries())
+    table.save(path, source_hash())
+    return table
+
+
+@optional_structure("perfect_hash")
+def get_perfect_hash() -> PerfectHashTable:
+    """
+    Returns the minimal perfect hash over all supported DTCs. The compiled table is used if it is present and was
+    generated from the current data files (checked via their hash, so the code tables are not loaded), otherwise
+    it is generated from the code tables. The compiled table holds its own copy of the descriptions, i.e., it
+    replaces the code tables rather than complementing them.
+
+    :return: perfect hash table
+    """
+    if os.path.exists(COMPILED_PERFECT_HASH):
+        table, data_hash = PerfectHashTable.load(COMPILED_PERFECT_HASH)
+        if data_hash == source_hash():
+            return table
+    return PerfectHashTable.generate(iter_entries())
+
+
+def resident_memory() -> int:
+    """
+    Determines the current resident set size (RSS) of the process.
+
+    :return: RSS in bytes (the peak RSS on platforms without /proc)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        # kilobytes on Linux, bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def load_structure(method: str, path: str = COMPILED_PERFECT_HASH) -> object:
+    """
+    Loads the lookup structure of the specified benchmark method from the data files, incl. the descriptions.
+
+    :param method: one of BENCHMARK_METHODS
+    :param path: compiled perfect hash
+    :return: lookup structure
+    """
+    if method == "perfect hash":
+        return PerfectHashTable.load(path)[0]
+    if method == "dict":
+        return dict(entry for table in load_tables().values() for entry in table.items())
+    return load_tables()
+
+
+def measure_resident_memory(method: str, path: str = COMPILED_PERFECT_HASH) -> int:
+    """
+    Measures the RSS growth caused by loading the lookup structure of the specified benchmark method
+    in a fresh interpreter, so the measurements do not affect each other.
+
+    :param method: one of BENCHMARK_METHODS
+    :param path: compiled perfect hash
+    :return: RSS growth in bytes
+    """
+    script = ("import gc, sys\n"
+              "from dtc_parser.perfect_hash import load_structure, resident_memory\n"
+              "gc.collect()\n"
+              "before = resident_memory()\n"
+              "structure = load_structure(sys.argv[1], sys.argv[2])\n"
+              "gc.collect()\n"
+              "print(resident_memory() - before)\n")
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_root, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run([sys.executable, "-c", script, method, path], env=env, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True)
+    return int(result.stdout.strip())
+
+
+def benchmark(table: PerfectHashTable, repetitions: int = 5,
+              path: str = COMPILED_PERFECT_HASH) -> Dict[str, Tuple[float, int]]:
+    """
+    Compares the lookup latency (all supported codes plus as many unsupported ones) and the memory of the perfect
+    hash with a plain dict of all codes and the table dicts resolved via DTCParser.get_code_from_dict().
+    The memory is the RSS growth caused by loading each structure incl. its descriptions (see
+    measure_resident_memory()).
+
+    :param table: perfect hash table
+    :param repetitions: number of repetitions (the best one is reported)
+    :param path: compiled perfect hash (used for the memory measurement)
+    :return: method -> (ns per lookup, bytes)
+    """
+    tables = get_error_tables()
+    merged = dict(iter_entries())
+    codes = list(merged) + [code[0] + "3" + code[2:] for code in merged]
+    routed = [(tables["P0" + code[2]] if code.startswith("P0") else tables.get(code[:2], {}), code) for code in codes]
+    get_code_from_dict = DTCParser.get_code_from_dict
+    dict_get = merged.get
+    table_get = table.get
+
+    def best(fun) -> float:
+        times = []
+        for _ in range(repetitions):
+            gc.collect()
+            start = time.perf_counter()
+            fun()
+            times.append(time.perf_counter() - start)
+        return min(times) / len(codes) * 1e9
+
+    latencies = {
+        "perfect hash": best(lambda: [table_get(code) for code in codes]),
+        "dict": best(lambda: [dict_get(code) for code in codes]),
+        "get_code_from_dict": best(lambda: [get_code_from_dict(t, code) for t, code in routed]),
+    }
+    return {method: (latencies[method], measure_resident_memory(method, path)) for method in BENCHMARK_METHODS}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generates the minimal perfect hash over the supported DTCs')
+    parser.add_argument('--output', action='store', type=str, help='.json file to be written',
+                        default=COMPILED_PERFECT_HASH)
+    parser.add_argument('--benchmark', action='store_true', help='compare the lookup with the dicts')
+    args = parser.parse_args()
+    start = time.perf_counter()
+    perfect_hash = compile_perfect_hash(args.output)
+    print("... generated perfect hash over", len(perfect_hash), "codes (%d buckets) in %.2f s"
+          % (perfect_hash.buckets, time.perf_counter() - start))
+    if args.benchmark:
+        for method, (latency, memory) in benchmark(perfect_hash, path=args.output).items():
+            print("%-20s %8.1f ns / lookup %10d bytes RSS" % (method, latency, memory))
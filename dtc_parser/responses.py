@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from typing import Callable, Dict
+
+from dtc_parser.batch import DTCBatch, PROTOCOL_OBD, PROTOCOL_UDS
+from dtc_parser.kwp2000 import KWP_READ_DTC_BY_STATUS_RESPONSE, decode_kwp2000_response
+
+# positive responses of OBD-II modes 03 (stored), 07 (pending) and 0A (permanent DTCs)
+OBD_DTC_RESPONSES = (0x43, 0x47, 0x4A)
+# positive response of the UDS service ReadDTCInformation (0x19)
+UDS_READ_DTC_RESPONSE = 0x59
+# ReadDTCInformation sub-functions that answer with (DTC high, DTC mid, DTC low, status) records
+UDS_DTC_STATUS_RECORD_SUBFUNCTIONS = (0x02, 0x0A, 0x0F, 0x13, 0x15, 0x17)
+
+
+def decode_obd_response(payload: bytes, batch: DTCBatch, source: int, timestamp: float) -> int:
+    """
+    Decodes an OBD-II mode 03 / 07 / 0A response (ISO 15765-4: SID, number of DTCs, two bytes per DTC).
+
+    :param payload: complete (reassembled) response payload
+    :param batch: batch the DTCs are appended to
+    :param source: arbitration ID of the responding ECU
+    :param timestamp: timestamp of the response
+    :return: number of decoded DTCs
+    """
+    count = 0
+    for i in range(2, len(payload) - 1, 2):
+        code = (payload[i] << 8) | payload[i + 1]
+        # 0x0000 is used as padding
+        if code:
+            batch.append(code, 0, PROTOCOL_OBD, source, timestamp)
+            count += 1
+    return count
+
+
+def decode_uds_response(payload: bytes, batch: DTCBatch, source: int, timestamp: float) -> int:
+    """
+    Decodes a UDS ReadDTCInformation response that consists of DTC and status records
+    (SID, sub-function, availability mask, four bytes per DTC).
+    The first two bytes of the three-byte UDS DTC are the SAE J2012 code, the third one is the failure type.
+
+    :param payload: complete (reassembled) response payload
+    :param batch: batch the DTCs are appended to
+    :param source: arbitration ID of the responding ECU
+    :param timestamp: timestamp of the response
+    :return: number of decoded DTCs
+    """
+    if len(payload) < 3 or payload[1] not in UDS_DTC_STATUS_RECORD_SUBFUNCTIONS:
+        return 0
+    count = 0
+    for i in range(3, len(payload) - 3, 4):
+        batch.append((payload[i] << 8) | payload[i + 1], payload[i + 3], PROTOCOL_UDS, source, timestamp)
+        count += 1
+    return count
+
+
+# service ID of the positive response -> decoder
+RESPONSE_DECODERS: Dict[int, Callable[[bytes, DTCBatch, int, float], int]] = {
+    UDS_READ_DTC_RESPONSE: decode_uds_response,
+    KWP_READ_DTC_BY_STATUS_RESPONSE: decode_kwp2000_response,
+}
+for sid in OBD_DTC_RESPONSES:
+    RESPONSE_DECODERS[sid] = decode_obd_response
+
+
+def decode_response(payload: bytes, batch: DTCBatch, source: int = 0, timestamp: float = 0.0) -> int:
+    """
+    Decodes the DTCs contained in a diagnostic response based on its service ID.
+    Responses that do not carry DTCs are ignored.
+
+    :param payload: complete (reassembled) response payload
+    :param batch: batch the DTCs are appended to
+    :param source: arbitration ID of the responding ECU
+    :param timestamp: timestamp of the response
+    :return: number of decoded DTCs
+    """
+    if not payload:
+        return 0
+    decoder = RESPONSE_DECODERS.get(payload[0])
+    return decoder(payload, batch, source, timestamp) if decoder is not None else 0
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from typing import TYPE_CHECKING, List, NamedTuple
+
+from dtc_parser.codec import CATEGORIES, CODE_SPACE_SIZE, dtc_to_int
+from dtc_parser.loader import TABLE_NAMES, table_name
+
+if TYPE_CHECKING:
+    from dtc_parser.parser import DTCParser
+
+UNSUPPORTED_DESCRIPTION = "unsupported dtc"
+# description of codes outside the ranges covered by the code tables (see DTCParser.parse_fault_description())
+INVALID_DESCRIPTION = "---"
+
+
+class ParsedDTC(NamedTuple):
+    """
+    Parsing result of a single DTC (the fault description is lower-case, as in the machine-readable format).
+    """
+    vehicle_part: str
+    code_type: str
+    vehicle_subsystem: str
+    fault_description: str
+    supported: bool
+
+
+def build_results(dtc_parser: "DTCParser") -> List[ParsedDTC]:
+    """
+    Precomputes the parsing results of the entire code space (all 65,536 DTCs) for the specified parser, i.e.,
+    its code tables and make. The list is indexed by the integer representation of the DTC (see codec.py).
+
+    All codes that share the first three chars and are not supported share a single result object, so the memory
+    consumption is dominated by the list itself (8 bytes per code) and the results of the supported codes.
+
+    :param dtc_parser: parser whose results are precomputed
+    :return: list of parsing results
+    """
+    results: List[ParsedDTC] = []
+    for prefix in range(CODE_SPACE_SIZE >> 8):
+        first_char, second_char, third_char = CATEGORIES[prefix >> 6], str((prefix >> 4) & 0x3), "%X" % (prefix & 0xF)
+        description = UNSUPPORTED_DESCRIPTION
+        if table_name(first_char + second_char + third_char) not in TABLE_NAMES:
+            description = INVALID_DESCRIPTION
+        results.extend([ParsedDTC(
+            dtc_parser.parse_vehicle_part(first_char),
+            dtc_parser.parse_code_type(second_char),
+            dtc_parser.parse_vehicle_subsystem(first_char, third_char),
+            description,
+            False
+        )] * 256)
+    for name in TABLE_NAMES:
+        table = dtc_parser.tables[name]
+        if name[1] != "0":
+            table = dtc_parser.manufacturer_table(table)
+        for code, description in table.items():
+            # OEM overlays contain the codes of all tables of the make
+            if code.startswith(name):
+                key = dtc_to_int(code)
+                results[key] = results[key]._replace(fault_description=description.lower(), supported=True)
+    return results
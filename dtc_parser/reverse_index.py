@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+from dtc_parser.memory import optional_structure
+from dtc_parser.search import TOKEN_TRANSLATION
+from dtc_parser.tables import iter_entries
+
+
+def normalize_description(description: str) -> str:
+    """
+    Normalizes a fault description for matching, i.e., lower-case, punctuation removed and whitespace collapsed,
+    e.g. "Fuel shut -off valve -circuit open" -> "fuel shut off valve circuit open".
+
+    :param description: fault description
+    :return: normalized description
+    """
+    return " ".join(description.lower().translate(TOKEN_TRANSLATION).split())
+
+
+class ReverseIndex:
+    """
+    Reverse index from fault descriptions to the DTCs that carry them (the opposite direction of the code tables).
+    Since several DTCs share the same description, each description maps to a tuple of codes.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        """
+        :param entries: (DTC, fault description) tuples
+        """
+        exact: Dict[str, List[str]] = defaultdict(list)
+        normalized: Dict[str, List[str]] = defaultdict(list)
+        for code, description in entries:
+            exact[description].append(code)
+            normalized[normalize_description(description)].append(code)
+        self.exact = {description: tuple(sorted(codes)) for description, codes in exact.items()}
+        self.normalized = {description: tuple(sorted(codes)) for description, codes in normalized.items()}
+
+    def lookup(self, description: str) -> Tuple[str, ...]:
+        """
+        Looks up the DTCs with exactly the specified description.
+
+        :param description: fault description (as in the code tables)
+        :return: matching DTCs (empty if there are none)
+        """
+        return self.exact.get(description, ())
+
+    def lookup_normalized(self, description: str) -> Tuple[str, ...]:
+        """
+        Looks up the DTCs whose description matches the specified one after normalization,
+        i.e., case, punctuation and whitespace are ignored.
+
+        :param description: fault description
+        :return: matching DTCs (empty if there are none)
+        """
+        return self.normalized.get(normalize_description(description), ())
+
+    def duplicates(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Returns the (normalized) descriptions that are shared by several DTCs.
+
+        :return: normalized description -> DTCs
+        """
+        return {description: codes for description, codes in self.normalized.items() if len(codes) > 1}
+
+
+@optional_structure("reverse_index")
+def get_reverse_index() -> ReverseIndex:
+    """
+    Returns the reverse index over all code tables (built on first use).
+
+    :return: reverse index
+    """
+    return ReverseIndex(iter_entries())
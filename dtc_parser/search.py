@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import heapq
+import math
+from array import array
+from collections import Counter, defaultdict
+from operator import itemgetter
+from typing import Dict, List, Tuple
+
+from dtc_parser.codec import dtc_from_int
+from dtc_parser.index import CodeIndex, get_code_index
+from dtc_parser.memory import optional_structure
+
+# every char that is not a letter or digit separates tokens, which copes with the quirks of the descriptions,
+# e.g. "-circuit", "shut -off", "(HO2S)", "intake/left/front" or "'A'"
+TOKEN_TRANSLATION = {c: " " for c in range(128) if not chr(c).isalnum()}
+STOP_WORDS = frozenset(["and", "or", "of", "the", "with", "to", "in", "for", "on", "at"])
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits the specified text into lower-case search tokens.
+
+    :param text: text (description or query) to be tokenized
+    :return: list of tokens
+    """
+    return [t for t in text.lower().translate(TOKEN_TRANSLATION).split() if t not in STOP_WORDS]
+
+
+class DescriptionSearch:
+    """
+    Inverted index over the fault descriptions, built once.
+
+    The documents are the entries of the code index, i.e., document IDs are positions in the sorted code index.
+    Each posting list is a compact array of (ascending) document IDs with a parallel array of precomputed BM25
+    weights, so a query only sums up weights.
+    """
+
+    def __init__(self, code_index: CodeIndex):
+        """
+        :param code_index: code index whose entries are indexed
+        """
+        self.code_index = code_index
+        doc_tokens = [Counter(tokenize(description)) for description in code_index.descriptions]
+        doc_lengths = [sum(tokens.values()) for tokens in doc_tokens]
+        avg_doc_length = sum(doc_lengths) / max(len(doc_lengths), 1)
+        postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for doc_id, tokens in enumerate(doc_tokens):
+            for term, tf in tokens.items():
+                postings[term].append((doc_id, tf))
+        n = len(doc_tokens)
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        for term, entries in postings.items():
+            idf = math.log(1 + (n - len(entries) + 0.5) / (len(entries) + 0.5))
+            weights = array("f", (
+                idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * doc_lengths[doc_id] / avg_doc_length))
+                for doc_id, tf in entries
+            ))
+            self.postings[term] = (array("H", (doc_id for doc_id, _ in entries)), weights)
+        # postings ordered by weight, computed on demand for single-term queries
+        self._ranked_postings: Dict[str, List[Tuple[int, float]]] = {}
+
+    def search(self, query: str, mode: str = "and", limit: int = 10) -> List[Tuple[str, str, float]]:
+        """
+        Searches the fault descriptions.
+
+        :param query: search query, e.g. "oxygen sensor bank 2 heater"
+        :param mode: "and" (all query terms have to match) or "or" (any query term has to match)
+        :param limit: max. number of results
+        :return: list of (DTC, fault description, score) tuples, best match first
+        """
+        if mode not in ("and", "or"):
+            raise ValueError("unknown search mode: " + mode)
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        terms = [term for term in query_terms if term in self.postings]
+        if not terms or (mode == "and" and len(terms) < len(query_terms)):
+            return []
+        if len(terms) == 1:
+            return self._results(self._ranked(terms[0])[:limit])
+        # start with the shortest posting list
+        terms.sort(key=lambda t: len(self.postings[t][0]))
+        if mode == "and":
+            candidates = set(self.postings[terms[0]][0])
+            for term in terms[1:]:
+                candidates.intersection_update(self.postings[term][0])
+                if not candidates:
+                    return []
+            scores = dict.fromkeys(candidates, 0.0)
+            for term in terms:
+                for doc_id, weight in zip(*self.postings[term]):
+                    if doc_id in scores:
+                        scores[doc_id] += weight
+        else:
+            scores = dict(zip(*self.postings[terms[0]]))
+            for term in terms[1:]:
+                get = scores.get
+                for doc_id, weight in zip(*self.postings[term]):
+                    scores[doc_id] = get(doc_id, 0.0) + weight
+        return self._results(heapq.nlargest(limit, scores.items(), key=itemgetter(1)))
+
+    def _ranked(self, term: str) -> List[Tuple[int, float]]:
+        ranked = self._ranked_postings.get(term)
+        if ranked is None:
+            ranked = sorted(zip(*self.postings[term]), key=itemgetter(1), reverse=True)
+            self._ranked_postings[term] = ranked
+        return ranked
+
+    def _results(self, best: List[Tuple[int, float]]) -> List[Tuple[str, str, float]]:
+        return [
+            (dtc_from_int(self.code_index.keys[doc_id]), self.code_index.descriptions[doc_id], score)
+            for doc_id, score in best
+        ]
+
+
+@optional_structure("description_search")
+def get_description_search() -> DescriptionSearch:
+    """
+    Returns the inverted index over all fault descriptions (built on first use).
+
+    :return: description search
+    """
+    return DescriptionSearch(get_code_index())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import os
+from collections import Counter
+from typing import List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from dtc_parser.codec import dtc_from_int, dtc_to_int
+from dtc_parser.index import CodeIndex, content_hash, get_code_index
+from dtc_parser.memory import optional_structure
+from dtc_parser.normalize import normalize_dtc
+from dtc_parser.search import tokenize
+from dtc_parser.tables import DATA_DIR
+
+COMPILED_SIMILARITY = os.path.join(DATA_DIR, "similarity.npz")
+# number of rows of the similarity matrix that are computed at once
+CHUNK_SIZE = 512
+
+
+def tfidf_matrix(descriptions: List[str]) -> sparse.csr_matrix:
+    """
+    Builds the L2-normalized TF-IDF vectors of the specified descriptions.
+
+    :param descriptions: fault descriptions
+    :return: sparse matrix (one row per description, one column per term)
+    """
+    vocabulary = {}
+    rows, cols, values = [], [], []
+    for row, description in enumerate(descriptions):
+        for term, tf in Counter(tokenize(description)).items():
+            rows.append(row)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+            values.append(tf)
+    tf = sparse.csr_matrix((np.array(values, dtype=np.float32), (rows, cols)),
+                           shape=(len(descriptions), len(vocabulary)))
+    df = np.bincount(cols, minlength=len(vocabulary))
+    idf = np.log((1 + len(descriptions)) / (1 + df)).astype(np.float32) + 1
+    tfidf = tf.multiply(idf).tocsr()
+    norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms).dot(tfidf).tocsr()
+
+
+def top_k_neighbours(vectors: sparse.csr_matrix, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Determines the k most similar rows (cosine similarity) of every row, excluding the row itself.
+    The similarity matrix is computed in chunks of rows to bound the memory consumption.
+
+    :param vectors: L2-normalized row vectors
+    :param k: number of neighbours per row
+    :return: (neighbour row indices (n x k), similarities (n x k)), most similar first
+    """
+    n = vectors.shape[0]
+    k = min(k, n - 1)
+    neighbours = np.empty((n, k), dtype=np.int32)
+    scores = np.empty((n, k), dtype=np.float32)
+    transposed = vectors.T.tocsc()
+    for start in range(0, n, CHUNK_SIZE):
+        end = min(start + CHUNK_SIZE, n)
+        sim = (vectors[start:end] @ transposed).toarray()
+        sim[np.arange(end - start), np.arange(start, end)] = -1  # exclude the code itself
+        best = np.argpartition(-sim, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(sim, best, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        neighbours[start:end] = np.take_along_axis(best, order, axis=1)
+        scores[start:end] = np.take_along_axis(best_scores, order, axis=1)
+    return neighbours, scores
+
+
+class RelatedCodes:
+    """
+    Precomputed "related codes" recommendations based on the TF-IDF cosine similarity of the descriptions.
+
+    Holds the top-k neighbours of every supported code as (n x k) arrays aligned with the code index, so the codes
+    similar to X are a single array slice at query time. The arrays are compiled once (see compile()) and loaded
+    from the package data.
+    """
+
+    def __init__(self, keys: np.ndarray, neighbours: np.ndarray, scores: np.ndarray, table_hash: str = ""):
+        """
+        :param keys: sorted DTC integers (rows of the neighbour arrays)
+        :param neighbours: row indices of the top-k neighbours of each code
+        :param scores: cosine similarities of the top-k neighbours of each code
+        :param table_hash: content hash of the code tables the neighbours were computed from (see content_hash())
+        """
+        self.keys = keys
+        self.neighbours = neighbours
+        self.scores = scores
+        self.table_hash = table_hash
+
+    @classmethod
+    def build(cls, code_index: CodeIndex, k: int = 10) -> "RelatedCodes":
+        """
+        Computes the top-k neighbours of all codes of the specified index.
+
+        :param code_index: code index
+        :param k: number of neighbours per code
+        :return: related codes
+        """
+        neighbours, scores = top_k_neighbours(tfidf_matrix(code_index.descriptions), k)
+        return cls(np.frombuffer(code_index.keys, dtype=np.uint16).copy(), neighbours, scores,
+                   content_hash(code_index))
+
+    def save(self, path: str = COMPILED_SIMILARITY) -> None:
+        """
+        Persists the neighbour arrays.
+
+        :param path: .npz file to be written
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez_compressed(path, keys=self.keys, neighbours=self.neighbours, scores=self.scores,
+                            table_hash=np.array(self.table_hash))
+
+    @classmethod
+    def load(cls, path: str = COMPILED_SIMILARITY) -> "RelatedCodes":
+        """
+        Loads the persisted neighbour arrays.
+
+        :param path: .npz file written by save()
+        :return: related codes
+        """
+        with np.load(path) as data:
+            table_hash = str(data["table_hash"]) if "table_hash" in data.files else ""
+            return cls(data["keys"], data["neighbours"], data["scores"], table_hash)
+
+    def similar(self, code: str, k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Returns the codes with the most similar descriptions.
+
+        :param code: supported DTC
+        :param k: max. number of codes (defaults to all precomputed neighbours)
+        :return: list of (DTC, cosine similarity) tuples, most similar first (empty for unsupported codes)
+        """
+        key = dtc_to_int(normalize_dtc(code))
+        row = int(np.searchsorted(self.keys, key))
+        if row >= len(self.keys) or self.keys[row] != key:
+            return []
+        return [(dtc_from_int(int(self.keys[i])), float(s))
+                for i, s in zip(self.neighbours[row, :k], self.scores[row, :k])]
+
+
+def compile_similarity(path: str = COMPILED_SIMILARITY, k: int = 10) -> RelatedCodes:
+    """
+    Computes the related codes of all code tables and persists them.
+
+    :param path: .npz file to be written
+    :param k: number of neighbours per code
+    :return: related codes
+    """
+    related = RelatedCodes.build(get_code_index(), k)
+    related.save(path)
+    return related
+
+
+@optional_structure("related_codes")
+def get_related_codes() -> RelatedCodes:
+    """
+    Returns the related codes of all code tables. The compiled arrays are used if they are present and were computed
+    from the current code tables (same codes and descriptions), otherwise they are computed.
+
+    :return: related codes
+    """
+    code_index = get_code_index()
+    if os.path.exists(COMPILED_SIMILARITY):
+        related = RelatedCodes.load(COMPILED_SIMILARITY)
+        if related.table_hash == content_hash(code_index):
+            return related
+    return RelatedCodes.build(code_index)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compiles the "related codes" recommendations')
+    parser.add_argument('--output', action='store', type=str, help='.npz file to be written',
+                        default=COMPILED_SIMILARITY)
+    parser.add_argument('--k', action='store', type=int, help='number of neighbours per code', default=10)
+    args = parser.parse_args()
+    compile_similarity(args.output, args.k)
+    print("... compiled related codes to", args.output)
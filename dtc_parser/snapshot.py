@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import os
+import threading
+import time
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from dtc_parser.codec import dtc_from_int
+from dtc_parser.index import CodeIndex, content_hash
+from dtc_parser.loader import ERROR_CODES_FILE, extra_table_paths, load_tables
+from dtc_parser.memory import refresh_structures
+from dtc_parser.overlays import OEM_OVERLAYS, OEMOverlays
+from dtc_parser.tables import is_table_source, set_table_source
+
+# reload check interval of the background thread (in seconds)
+DEFAULT_RELOAD_INTERVAL = 5.0
+# number of hex digits of the content hash that make up the version of a snapshot
+VERSION_LENGTH = 12
+
+
+class TableSnapshot(NamedTuple):
+    """
+    Complete set of code tables as loaded at a certain point in time.
+    Snapshots are never modified, a reload always creates a new one. The content hash identifies the version of the
+    data, i.e., it is the same in every process that loads the same entries, and the version is its short form
+    (e.g. to be reported alongside parse results).
+    """
+    tables: Dict[str, Dict[str, str]]
+    loaded_at: float
+    content_hash: str  # SHA-256 over all (DTC, fault description) pairs, independent of the table layout
+    version: str  # leading VERSION_LENGTH hex digits of the content hash
+    index: CodeIndex  # sorted integer-keyed index of all entries (used for diffs)
+
+
+class TableDiff(NamedTuple):
+    """
+    Codes that differ between two snapshots (sorted by their integer representation).
+    """
+    added: List[str]
+    removed: List[str]
+    changed: List[str]  # fault description differs
+
+    def affected(self) -> List[str]:
+        """
+        Returns all codes whose lookup result differs, e.g. to invalidate downstream caches.
+
+        :return: added, removed and changed codes
+        """
+        return self.added + self.removed + self.changed
+
+
+def build_snapshot(tables: Dict[str, Dict[str, str]]) -> TableSnapshot:
+    """
+    Creates a snapshot of the specified code tables.
+
+    :param tables: table name -> (DTC -> fault description)
+    :return: snapshot
+    """
+    index = CodeIndex(entry for table in tables.values() for entry in table.items())
+    data_hash = content_hash(index)
+    return TableSnapshot(tables, time.time(), data_hash, data_hash[:VERSION_LENGTH], index)
+
+
+def diff(old: TableSnapshot, new: TableSnapshot) -> TableDiff:
+    """
+    Determines the added, removed and changed codes between two snapshots.
+    The sorted integer keys of both indexes are merged in a single pass, so only the descriptions of codes
+    that occur in both snapshots are compared.
+
+    :param old: previous snapshot
+    :param new: current snapshot
+    :return: differences
+    """
+    result = TableDiff([], [], [])
+    if old.content_hash == new.content_hash:
+        return result
+    old_keys, old_descriptions = old.index.keys, old.index.descriptions
+    new_keys, new_descriptions = new.index.keys, new.index.descriptions
+    i = j = 0
+    while i < len(old_keys) and j < len(new_keys):
+        if old_keys[i] == new_keys[j]:
+            if old_descriptions[i] != new_descriptions[j]:
+                result.changed.append(dtc_from_int(new_keys[j]))
+            i += 1
+            j += 1
+        elif old_keys[i] < new_keys[j]:
+            result.removed.append(dtc_from_int(old_keys[i]))
+            i += 1
+        else:
+            result.added.append(dtc_from_int(new_keys[j]))
+            j += 1
+    result.removed.extend(dtc_from_int(key) for key in old_keys[i:])
+    result.added.extend(dtc_from_int(key) for key in new_keys[j:])
+    return result
+
+
+class ReloadableTables(Mapping):
+    """
+    Code tables (name -> (DTC -> fault description)) that can be reloaded while they are in use, e.g. by a
+    long-running service after the data files have been fixed. By default, they become the table source
+    (see tables.set_table_source()), so they are used by every DTCParser created afterwards and the derived
+    structures (fault structures, numeric fields, suggestions, code index, ...) are built from them:
+
+        tables = ReloadableTables()
+        tables.start()
+        DTCParser()
+
+    A reload builds a new snapshot next to the current one and publishes it with a single reference assignment,
+    which is atomic in CPython. Readers therefore never take a lock: lookups that already hold a table of the
+    old snapshot complete on it, every later lookup uses the new one. Code that needs several consistent lookups
+    across tables can pin the current snapshot (tables.snapshot). If a reload fails, the previous snapshot
+    is kept. Data files should be replaced atomically (written to a temporary file and renamed), so a reload
+    never reads a partially written file. After a swap, the derived structures that are built are rebuilt from the
+    new snapshot by the reloading thread, readers keep using the previous ones until then.
+    """
+
+    def __init__(self, loader: Callable[[], Dict[str, Dict[str, str]]] = load_tables,
+                 sources: Optional[Sequence[str]] = None, overlays: Optional[OEMOverlays] = OEM_OVERLAYS,
+                 table_source: bool = True):
+        """
+        :param loader: builds the code tables from the data source
+        :param sources: files whose modification triggers a reload, defaults to the bundled data file and the
+                        files of DTC_PARSER_EXTRA_TABLES
+        :param overlays: OEM overlay tables whose lookup chains are released when the tables are replaced
+        :param table_source: whether the tables become the table source of the derived structures
+        """
+        self.loader = loader
+        self.sources = list(sources) if sources is not None else [ERROR_CODES_FILE] + extra_table_paths()
+        self.overlays = overlays
+        # called with (old snapshot, new snapshot) after each swap, see diff()
+        self.listeners: List[Callable[[TableSnapshot, TableSnapshot], None]] = []
+        self.last_error: Optional[Exception] = None
+        self.reloads = 0
+        self._signature = self.source_signature()
+        self.snapshot = build_snapshot(self.loader())
+        # only serializes the writers (reload thread / manual reloads), readers are not affected
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # IDs of the tables of the previous snapshot
+        self._retired: List[int] = []
+        if table_source:
+            set_table_source(self)
+
+    def __getitem__(self, name: str) -> Dict[str, str]:
+        return self.snapshot.tables[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot.tables)
+
+    def __len__(self) -> int:
+        return len(self.snapshot.tables)
+
+    def source_signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """
+        Determines the state of the source files (modification time and size).
+
+        :return: signature that changes whenever one of the source files is modified
+        """
+        signature = []
+        for path in self.sources:
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((path, -1, -1))
+        return tuple(signature)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Rebuilds the code tables if the source files have changed and swaps in the new snapshot
+        (unless its content is identical to the current one).
+
+        :param force: whether the tables are rebuilt even if the source files did not change
+        :return: whether a new snapshot has been swapped in
+        """
+        with self._reload_lock:
+            signature = self.source_signature()
+            if not force and signature == self._signature:
+                return False
+            old = self.snapshot
+            new = build_snapshot(self.loader())
+            self._signature = signature
+            if new.content_hash == old.content_hash:
+                return False
+            self.snapshot = new
+            self.reloads += 1
+            if self.overlays is not None:
+                # lookups that were still running on the old snapshot may have re-created a chain of the previous one
+                retired = [id(table) for table in old.tables.values()]
+                self.overlays.discard_chains(retired + self._retired)
+                self._retired = retired
+            if is_table_source(self):
+                refresh_structures()
+        for listener in self.listeners:
+            listener(old, new)
+        return True
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.reload()
+                self.last_error = None
+            except Exception as e:
+                # keep serving the previous snapshot
+                self.last_error = e
+
+    def start(self, interval: float = DEFAULT_RELOAD_INTERVAL) -> None:
+        """
+        Starts the background thread that checks the source files for changes.
+
+        :param interval: check interval in seconds
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name="dtc-table-reload", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compares two versions of the DTC data files')
+    parser.add_argument('--old', action='store', type=str, nargs='+', help='data files of the old version',
+                        required=True)
+    parser.add_argument('--new', action='store', type=str, nargs='+', help='data files of the new version',
+                        default=[ERROR_CODES_FILE])
+    args = parser.parse_args()
+    old_snapshot = build_snapshot(load_tables(args.old, extra_paths=()))
+    new_snapshot = build_snapshot(load_tables(args.new, extra_paths=()))
+    print("old:", len(old_snapshot.index), "codes, version", old_snapshot.version)
+    print("new:", len(new_snapshot.index), "codes, version", new_snapshot.version)
+    table_diff = diff(old_snapshot, new_snapshot)
+    for label, codes in zip(("added", "removed", "changed"), table_diff):
+        print("%s (%d):\t%s" % (label, len(codes), " ".join(codes)))
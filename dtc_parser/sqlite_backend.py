@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import argparse
+import os
+import pathlib
+import sqlite3
+import threading
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, ItemsView, Iterable, Iterator, List, Optional, Tuple
+
+from dtc_parser.codec import dtc_from_int, dtc_to_int
+from dtc_parser.loader import DATA_DIR, TABLE_NAMES, load_tables
+from dtc_parser.search import tokenize
+
+COMPILED_DATABASE = os.path.join(DATA_DIR, "error_codes.sqlite")
+# number of descriptions kept in the in-process cache
+DEFAULT_CACHE_SIZE = 512
+
+# the DTC (as 16-bit integer, see codec.py) is the rowid, i.e., lookups are a single B-tree search without
+# a separate index; the FTS5 index refers to the rows instead of storing another copy of the descriptions
+SCHEMA = (
+    "CREATE TABLE codes (id INTEGER PRIMARY KEY, description TEXT NOT NULL)",
+    "CREATE VIRTUAL TABLE descriptions USING fts5(description, content='codes', content_rowid='id')",
+)
+SELECT_DESCRIPTION = "SELECT description FROM codes WHERE id = ?"
+SELECT_RANGE = "SELECT id FROM codes WHERE id BETWEEN ? AND ? ORDER BY id"
+SELECT_ENTRIES = "SELECT id, description FROM codes WHERE id BETWEEN ? AND ? ORDER BY id"
+COUNT_RANGE = "SELECT COUNT(*) FROM codes WHERE id BETWEEN ? AND ?"
+SEARCH_DESCRIPTIONS = ("SELECT rowid, description, bm25(descriptions) FROM descriptions "
+                       "WHERE descriptions MATCH ? ORDER BY rank LIMIT ?")
+
+
+def table_range(name: str) -> Tuple[int, int]:
+    """
+    Determines the integer range of a code table, e.g. P00 -> P0000 ... P00FF.
+    Since the tables are split by the leading chars, every table is a contiguous range of the code space.
+
+    :param name: table name
+    :return: (first, last) DTC of the table as 16-bit integers
+    """
+    return dtc_to_int(name.ljust(5, "0")), dtc_to_int(name.ljust(5, "F"))
+
+
+def compile_database(path: str = COMPILED_DATABASE, entries: Optional[Iterable[Tuple[str, str]]] = None) -> None:
+    """
+    Writes the code tables to an SQLite database (incl. the FTS5 description index).
+
+    :param path: database file to be written (replaced if it exists)
+    :param entries: (DTC, fault description) tuples, defaults to the entries of the data files (see loader.py)
+    """
+    if entries is None:
+        entries = (entry for table in load_tables().values() for entry in table.items())
+    if os.path.exists(path):
+        os.remove(path)
+    connection = sqlite3.connect(path)
+    try:
+        for statement in SCHEMA:
+            connection.execute(statement)
+        connection.executemany("INSERT INTO codes VALUES (?, ?)",
+                               ((dtc_to_int(code), description) for code, description in entries))
+        connection.execute("INSERT INTO descriptions(descriptions) VALUES ('rebuild')")
+        connection.execute("INSERT INTO descriptions(descriptions) VALUES ('optimize')")
+        connection.commit()
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+
+
+class SQLiteTable(Mapping):
+    """
+    Read-only view of a single code table (DTC -> fault description) stored in an SQLite database.
+    """
+
+    def __init__(self, store: "SQLiteCodeTables", name: str):
+        """
+        :param store: database the table is stored in
+        :param name: table name, e.g. "P01"
+        """
+        self.store = store
+        self.name = name
+        self.first, self.last = table_range(name)
+
+    def __getitem__(self, code: str) -> str:
+        description = self.store.description(code) if code.startswith(self.name) else None
+        if description is None:
+            raise KeyError(code)
+        return description
+
+    def __contains__(self, code: object) -> bool:
+        return isinstance(code, str) and self.get(code) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for (key,) in self.store.connection.execute(SELECT_RANGE, (self.first, self.last)):
+            yield dtc_from_int(key)
+
+    def __len__(self) -> int:
+        return self.store.connection.execute(COUNT_RANGE, (self.first, self.last)).fetchone()[0]
+
+    def items(self) -> ItemsView:
+        # a single range query that bypasses the description cache, e.g. when the derived structures are built
+        return SQLiteItems(self)
+
+
+class SQLiteItems(ItemsView):
+    """
+    (DTC, fault description) pairs of an SQLiteTable.
+    """
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        table = self._mapping
+        for key, description in table.store.connection.execute(SELECT_ENTRIES, (table.first, table.last)):
+            yield dtc_from_int(key), description
+
+
+class SQLiteCodeTables(Mapping):
+    """
+    Storage backend that keeps the code tables in an SQLite database instead of Python dicts, for deployments
+    where memory is scarce. It is a mapping of table name -> SQLiteTable and can be passed to DTCParser:
+
+        DTCParser(tables=SQLiteCodeTables())
+
+    Lookups use parameterized statements, which SQLite compiles once per connection and then reuses from the
+    statement cache. The descriptions of the most recently used codes are kept in a small in-process LRU cache,
+    so frequently reported codes never hit the disk. Descriptions are searched via FTS5 (BM25-ranked).
+    Each thread uses its own (read-only) connection, the cache is shared.
+    """
+
+    def __init__(self, path: str = COMPILED_DATABASE, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        :param path: compiled database (see compile_database())
+        :param cache_size: number of descriptions kept in memory
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError("SQLite code tables not found, compile them via sqlite_backend.py: " + path)
+        self.path = path
+        self._local = threading.local()
+        # connections of all threads (closed by close())
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # (canonical) DTC -> fault description (None if unsupported)
+        self.description = lru_cache(maxsize=cache_size)(self._select)
+        self.tables: Dict[str, SQLiteTable] = {name: SQLiteTable(self, name) for name in TABLE_NAMES}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Returns the database connection of the current thread (opened on first use).
+
+        :return: connection
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # only used by this thread, except for close()
+            # the path is percent-encoded, so e.g. "?" or "#" in a directory name are not taken for URI delimiters
+            uri = pathlib.Path(os.path.abspath(self.path)).as_uri() + "?mode=ro"
+            connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            with self._connections_lock:
+                self._connections.append(connection)
+            self._local.connection = connection
+        return connection
+
+    def _select(self, code: str) -> Optional[str]:
+        try:
+            key = dtc_to_int(code)
+        except (ValueError, IndexError):
+            return None
+        if dtc_from_int(key) != code:
+            return None
+        row = self.connection.execute(SELECT_DESCRIPTION, (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    def __getitem__(self, name: str) -> SQLiteTable:
+        return self.tables[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tables)
+
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    def search(self, query: str, mode: str = "and", limit: int = 10) -> List[Tuple[str, str, float]]:
+        """
+        Searches the fault descriptions (same interface as search.DescriptionSearch).
+
+        :param query: search query, e.g. "oxygen sensor bank 2 heater"
+        :param mode: "and" (all query terms have to match) or "or" (any query term has to match)
+        :param limit: max. number of results
+        :return: list of (DTC, fault description, score) tuples, best match first
+        """
+        if mode not in ("and", "or"):
+            raise ValueError("unknown search mode: " + mode)
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        # the terms are quoted, so they can not be interpreted as FTS5 operators
+        match = (" OR " if mode == "or" else " ").join('"%s"' % term for term in terms)
+        rows = self.connection.execute(SEARCH_DESCRIPTIONS, (match, limit))
+        # bm25() is negative (lower is better)
+        return [(dtc_from_int(key), description, -score) for key, description, score in rows]
+
+    def close(self) -> None:
+        """
+        Closes the database connections of all threads.
+        """
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compiles the code tables into an SQLite database')
+    parser.add_argument('--output', action='store', type=str, help='.sqlite file to be written',
+                        default=COMPILED_DATABASE)
+    args = parser.parse_args()
+    compile_database(args.output)
+    print("... compiled code tables to", args.output)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from array import array
+from typing import Dict, Sequence, Tuple
+
+from dtc_parser.codec import CATEGORIES
+
+UNKNOWN_SUBSYSTEM = "---"
+
+# vehicle subsystem per third char (0-F) of each category (SAE J2012)
+POWERTRAIN_SUBSYSTEMS = (
+    "fuel and air metering and auxiliary emission controls",
+    "fuel and air metering",
+    "fuel and air metering – injector circuit",
+    "ignition systems or misfires",
+    "auxiliary emission controls",
+    "vehicle speed control, idle control systems, and auxiliary inputs",
+    "computer and output circuit",
+    "transmission",
+    "transmission",
+    "transmission",
+    "hybrid propulsion systems",
+    "hybrid propulsion systems",
+    "hybrid propulsion systems",
+    "ISO / SAE reserved",
+    "ISO / SAE reserved",
+    "ISO / SAE reserved",
+)
+# SAE J2012 does not subdivide chassis and body codes by their third char (its meaning is left to the
+# manufacturers), so each of these categories forms a single subsystem
+CHASSIS_SUBSYSTEMS = ("chassis systems",) * 16
+BODY_SUBSYSTEMS = ("body systems",) * 16
+NETWORK_SUBSYSTEMS = (
+    "network electrical",
+    "network communication",
+    "network communication",
+    "network software",
+    "network data",
+    "network data",
+) + ("ISO / SAE reserved",) * 10
+
+# vehicle subsystem per (category, third char), indexed by ((category index << 4) | third char)
+SUBSYSTEMS_BY_CHAR: Tuple[str, ...] = (POWERTRAIN_SUBSYSTEMS + CHASSIS_SUBSYSTEMS + BODY_SUBSYSTEMS
+                                       + NETWORK_SUBSYSTEMS)
+# (first char, third char) -> vehicle subsystem
+SUBSYSTEMS: Dict[Tuple[str, str], str] = {
+    (category, "%X" % digit): SUBSYSTEMS_BY_CHAR[(i << 4) | digit] for i, category in enumerate(CATEGORIES)
+    for digit in range(16)
+}
+# distinct (category, subsystem) pairs in code order, the third chars of the same subsystem (e.g. P7 - P9, or all
+# chassis / body codes) share one ID, so grouping by the ID groups by subsystem
+_SUBSYSTEM_KEYS = list(dict.fromkeys((i >> 4, subsystem) for i, subsystem in enumerate(SUBSYSTEMS_BY_CHAR)))
+# vehicle subsystem per subsystem ID (see subsystem_id())
+SUBSYSTEM_TABLE: Tuple[str, ...] = tuple(subsystem for _, subsystem in _SUBSYSTEM_KEYS)
+# subsystem ID per ((category index << 4) | third char)
+SUBSYSTEM_IDS = array("B", [_SUBSYSTEM_KEYS.index((i >> 4, subsystem))
+                            for i, subsystem in enumerate(SUBSYSTEMS_BY_CHAR)])
+
+
+def subsystem_id(code: int) -> int:
+    """
+    Determines the subsystem ID of a DTC (based on its category and third char), i.e., its index in SUBSYSTEM_TABLE.
+
+    :param code: DTC as 16-bit integer
+    :return: subsystem ID
+    """
+    return SUBSYSTEM_IDS[((code >> 10) & 0x30) | ((code >> 8) & 0xF)]
+
+
+def subsystem_ids(codes: Sequence[int]) -> array:
+    """
+    Determines the subsystem IDs of a batch of DTCs, e.g. as group-by key.
+
+    :param codes: DTCs as 16-bit integers
+    :return: array of subsystem IDs (aligned with the codes)
+    """
+    ids = SUBSYSTEM_IDS
+    return array("B", [ids[((code >> 10) & 0x30) | ((code >> 8) & 0xF)] for code in codes])
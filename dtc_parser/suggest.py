@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from collections import defaultdict
+from itertools import combinations
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+from dtc_parser.memory import optional_structure
+from dtc_parser.normalize import SEPARATORS, TRANSLATION_TABLE
+from dtc_parser.tables import iter_entries
+
+# pairs of chars that are commonly misread (e.g. from a display or a printed report)
+CONFUSABLE_PAIRS = [("O", "0"), ("D", "0"), ("Q", "0"), ("I", "1"), ("L", "1"), ("Z", "2"), ("S", "5"),
+                    ("G", "6"), ("T", "7"), ("B", "8"), ("E", "F"), ("C", "0"), ("U", "V"), ("P", "R")]
+CONFUSABLE = frozenset(CONFUSABLE_PAIRS) | frozenset((b, a) for a, b in CONFUSABLE_PAIRS)
+CONFUSABLE_PARTNERS: Dict[str, List[str]] = defaultdict(list)
+for _a, _b in sorted(CONFUSABLE):
+    CONFUSABLE_PARTNERS[_a].append(_b)
+# costs of the edit operations, a misread char is cheaper than an arbitrary typo
+CONFUSABLE_COST = 0.5
+EDIT_COST = 1.0
+# length of the (canonical) DTCs
+CODE_LENGTH = 5
+
+
+def edit_distance(a: str, b: str) -> float:
+    """
+    Weighted edit distance (insertions, deletions, substitutions and transpositions of adjacent chars),
+    where substitutions of confusable chars (e.g. O / 0, B / 8) are cheaper than other edits.
+
+    :param a: first string
+    :param b: second string
+    :return: edit distance
+    """
+    prev_prev: List[float] = []
+    prev = [float(j) for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        curr = [float(i)] + [0.0] * len(b)
+        for j in range(1, len(b) + 1):
+            if a[i - 1] == b[j - 1]:
+                sub = prev[j - 1]
+            else:
+                sub = prev[j - 1] + (CONFUSABLE_COST if (a[i - 1], b[j - 1]) in CONFUSABLE else EDIT_COST)
+            curr[j] = min(prev[j] + EDIT_COST, curr[j - 1] + EDIT_COST, sub)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                curr[j] = min(curr[j], prev_prev[j - 2] + EDIT_COST)
+        prev_prev, prev = prev, curr
+    return prev[-1]
+
+
+def deletion_variants(code: str, max_deletions: int) -> List[str]:
+    """
+    Generates all variants of the specified string with up to max_deletions deleted chars.
+
+    :param code: string
+    :param max_deletions: max. number of deleted chars
+    :return: list of variants (incl. the string itself)
+    """
+    variants = {code}
+    for n in range(1, min(max_deletions, len(code)) + 1):
+        for positions in combinations(range(len(code)), n):
+            variants.add("".join(c for i, c in enumerate(code) if i not in positions))
+    return list(variants)
+
+
+def misread_variants(code: str, max_substitutions: int = 2) -> List[str]:
+    """
+    Generates all variants of the specified code with up to max_substitutions confusable chars replaced,
+    e.g. "PO112" -> "P0112", "PO1I2", ...
+
+    :param code: code
+    :param max_substitutions: max. number of replaced chars
+    :return: list of variants (incl. the code itself)
+    """
+    variants = {code}
+    for _ in range(max_substitutions):
+        for variant in list(variants):
+            for i, c in enumerate(variant):
+                for partner in CONFUSABLE_PARTNERS.get(c, ()):
+                    variants.add(variant[:i] + partner + variant[i + 1:])
+    return list(variants)
+
+
+class CodeSuggester:
+    """
+    Suggests the nearest supported DTCs for unsupported (misread or mistyped) ones.
+
+    Uses a precomputed deletion neighbour table: every supported code is stored under all variants with up to
+    max_distance deleted chars. Two strings within max_distance edits share at least one such variant, so a query
+    only needs a few dict lookups to collect its candidates instead of comparing against all codes.
+    The candidates within one edit of the input or of a variant with one misread char are checked first, which
+    already covers all suggestions up to a distance of 1.5. The broader max_distance neighbourhood is only checked
+    if that does not yield enough suggestions. Inputs of the wrong length are never matched against the broad
+    neighbourhood: a missing or surplus char already costs one edit, so they only get suggestions that additionally
+    differ by at most one misread char (inputs that are off by more than one char get none).
+    """
+
+    def __init__(self, codes: Iterable[str], max_distance: int = 2):
+        """
+        :param codes: supported DTCs
+        :param max_distance: max. number of edits of the suggestions
+        """
+        self.max_distance = max_distance
+        neighbours: Dict[str, List[str]] = defaultdict(list)
+        self.deletions: Dict[str, FrozenSet[str]] = {}
+        for code in codes:
+            for variant in deletion_variants(code, max_distance):
+                neighbours[variant].append(code)
+            self.deletions[code] = frozenset(deletion_variants(code, 1))
+        self.neighbours = {variant: tuple(codes) for variant, codes in neighbours.items()}
+
+    def distance(self, code: str, candidate: str, deletions: FrozenSet[str]) -> float:
+        """
+        Computes edit_distance(code, candidate), avoiding the full dynamic programming for the common case of
+        equal-length strings that only differ by substitutions.
+
+        :param code: queried code
+        :param candidate: supported code
+        :param deletions: variants of the queried code with up to one deleted char
+        :return: edit distance
+        """
+        if len(code) != len(candidate):
+            return edit_distance(code, candidate)
+        mismatches = [i for i, (a, b) in enumerate(zip(code, candidate)) if a != b]
+        if any(j == i + 1 and code[i] == candidate[j] and code[j] == candidate[i]
+               for i, j in zip(mismatches, mismatches[1:])):
+            # swapped neighbours
+            return edit_distance(code, candidate)
+        distance = sum(CONFUSABLE_COST if (code[i], candidate[i]) in CONFUSABLE else EDIT_COST for i in mismatches)
+        # apart from substitutions, equal-length codes can only be matched by a deletion plus an insertion,
+        # which is possible iff both are equal after deleting one char from each
+        if distance > 2 * EDIT_COST and not deletions.isdisjoint(self.deletions[candidate]):
+            return 2 * EDIT_COST
+        return distance
+
+    def _candidates(self, variants: Iterable[str], max_deletions: int) -> Set[str]:
+        candidates = set()
+        for variant in variants:
+            for key in deletion_variants(variant, max_deletions):
+                candidates.update(self.neighbours.get(key, ()))
+        return candidates
+
+    def _score(self, code: str, candidates: Set[str]) -> List[Tuple[float, str]]:
+        deletions = frozenset(deletion_variants(code, 1))
+        scored = []
+        for candidate in candidates:
+            distance = self.distance(code, candidate, deletions)
+            if distance <= self.max_distance:
+                scored.append((distance, candidate))
+        scored.sort()
+        return scored
+
+    def _length_mismatch_candidates(self, code: str) -> Set[str]:
+        candidates: Set[str] = set()
+        if len(code) == CODE_LENGTH + 1:
+            # one surplus char: delete it, then allow one misread char
+            for variant in deletion_variants(code, 1):
+                candidates.update(v for v in misread_variants(variant, 1) if v in self.deletions)
+        elif len(code) == CODE_LENGTH - 1:
+            # one missing char: the codes that equal the input (with up to one misread char) after one deletion
+            for variant in misread_variants(code, 1):
+                candidates.update(self.neighbours.get(variant, ()))
+        return candidates
+
+    def suggest(self, code: str, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Returns the k nearest supported DTCs.
+
+        :param code: (unsupported) DTC
+        :param k: max. number of suggestions
+        :return: list of (DTC, edit distance) tuples, nearest first
+        """
+        code = code.encode("latin-1", "replace").translate(TRANSLATION_TABLE, SEPARATORS).decode("latin-1")
+        if len(code) != CODE_LENGTH:
+            scored = self._score(code, self._length_mismatch_candidates(code))
+            return [(candidate, distance) for distance, candidate in scored[:k]]
+        # supported codes that are one edit away from the input or an input with one misread char,
+        # plus those that only differ by two misread chars
+        candidates = self._candidates(misread_variants(code, 1), 1)
+        candidates.update(v for v in misread_variants(code, 2) if v in self.deletions)
+        scored = self._score(code, candidates)
+        if len(scored) < k or scored[k - 1][0] > EDIT_COST + CONFUSABLE_COST:
+            scored = self._score(code, self._candidates([code], self.max_distance))
+        return [(candidate, distance) for distance, candidate in scored[:k]]
+
+
+@optional_structure("code_suggester")
+def get_code_suggester() -> CodeSuggester:
+    """
+    Returns the suggester over all supported DTCs (built on first use).
+
+    :return: code suggester
+    """
+    return CodeSuggester(code for code, _ in iter_entries())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from functools import lru_cache
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+from dtc_parser import error_codes
+from dtc_parser.loader import DATA_DIR, TABLE_NAMES  # noqa: F401 (DATA_DIR: directory of the bundled data files)
+from dtc_parser.memory import OPTIONAL_STRUCTURES
+
+# code tables the derived structures are built from (None = the in-memory tables, see set_table_source())
+_source: Optional[Mapping[str, Mapping[str, str]]] = None
+
+
+def __getattr__(name: str) -> Dict[str, Dict[str, str]]:
+    # ERROR_TABLES: all code tables of the parser (name -> dict), resolved on first access
+    if name == "ERROR_TABLES":
+        return get_error_tables()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+@lru_cache(maxsize=None)
+def get_error_tables() -> Dict[str, Dict[str, str]]:
+    """
+    Returns all code tables of the parser (loaded on first use).
+
+    :return: table name -> (DTC -> fault description)
+    """
+    return {name: getattr(error_codes, name + "_ERRORS") for name in TABLE_NAMES}
+
+
+def set_table_source(tables: Optional[Mapping[str, Mapping[str, str]]]) -> None:
+    """
+    Sets the code tables the derived structures (fault structures, numeric fields, suggestions, code index, ...)
+    are built from, e.g. sqlite_backend.SQLiteCodeTables, so the in-memory tables are never loaded.
+    The structures that are already built are dropped and rebuilt from the new tables on their next use.
+
+    :param tables: table name -> (DTC -> fault description), None restores the in-memory tables
+    """
+    global _source
+    _source = tables
+    for getter in OPTIONAL_STRUCTURES.values():
+        getter.cache_clear()
+
+
+def get_table_source() -> Mapping[str, Mapping[str, str]]:
+    """
+    Returns the code tables the derived structures are built from.
+
+    :return: table name -> (DTC -> fault description)
+    """
+    return _source if _source is not None else get_error_tables()
+
+
+def table_source_loaded() -> bool:
+    """
+    Checks whether the table source is available without loading the in-memory tables.
+
+    :return: whether a table source is set or the in-memory tables are loaded
+    """
+    return _source is not None or get_error_tables.cache_info().currsize > 0
+
+
+def is_default_source() -> bool:
+    """
+    Checks whether the derived structures are built from the bundled tables, i.e., no other table source is set.
+
+    :return: whether the in-memory tables are the table source
+    """
+    return _source is None
+
+
+def is_table_source(tables: Mapping[str, Mapping[str, str]]) -> bool:
+    """
+    Checks whether the derived structures are built from the specified code tables
+    (without loading the in-memory tables for the check).
+
+    :param tables: code tables, e.g. of a DTCParser
+    :return: whether the tables are the table source
+    """
+    return table_source_loaded() and tables is get_table_source()
+
+
+def iter_entries() -> Iterator[Tuple[str, str]]:
+    """
+    Iterates over all supported DTCs of all code tables (of the table source, see set_table_source()).
+
+    :return: iterator of (DTC, fault description) tuples
+    """
+    for table in get_table_source().values():
+        yield from table.items()
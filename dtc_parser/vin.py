@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from functools import lru_cache
+from typing import Optional
+
+# world manufacturer identifier (first three chars of the VIN) -> OEM overlay key
+WMI_MAKES = {
+    "1FA": "ford", "1FB": "ford", "1FC": "ford", "1FD": "ford", "1FM": "ford", "1FT": "ford", "1FU": "freightliner",
+    "1FV": "freightliner", "2FA": "ford", "2FM": "ford", "2FT": "ford", "3FA": "ford", "3FE": "ford", "3FM": "ford",
+    "WF0": "ford", "1LN": "lincoln", "5LM": "lincoln",
+    "1G1": "chevrolet", "1GC": "chevrolet", "1GN": "chevrolet", "2G1": "chevrolet", "3G1": "chevrolet",
+    "1GT": "gmc", "1GK": "gmc", "1G4": "buick", "1G6": "cadillac", "1GY": "cadillac", "KL1": "chevrolet",
+    "1C3": "chrysler", "2C3": "chrysler", "1C4": "jeep", "1J4": "jeep", "1J8": "jeep", "1C6": "ram", "3C6": "ram",
+    "1B3": "dodge", "2B3": "dodge", "3D7": "dodge",
+    "WVW": "volkswagen", "WVG": "volkswagen", "WV1": "volkswagen", "WV2": "volkswagen", "3VW": "volkswagen",
+    "1VW": "volkswagen", "9BW": "volkswagen", "WAU": "audi", "WA1": "audi", "TRU": "audi", "TMB": "skoda",
+    "VSS": "seat", "WP0": "porsche", "WP1": "porsche",
+    "WBA": "bmw", "WBS": "bmw", "WBY": "bmw", "4US": "bmw", "5UX": "bmw", "WMW": "mini",
+    "WDB": "mercedes_benz", "WDC": "mercedes_benz", "WDD": "mercedes_benz", "W1K": "mercedes_benz",
+    "W1N": "mercedes_benz", "4JG": "mercedes_benz", "WDF": "mercedes_benz",
+    "W0L": "opel", "W0V": "opel",
+    "JTD": "toyota", "JTE": "toyota", "JTH": "lexus", "JTJ": "lexus", "JTK": "toyota", "JTM": "toyota",
+    "JTN": "toyota", "2T1": "toyota", "4T1": "toyota", "5TD": "toyota", "5TF": "toyota", "SB1": "toyota",
+    "JHM": "honda", "1HG": "honda", "2HG": "honda", "5J6": "honda", "JH4": "acura", "19U": "acura",
+    "JN1": "nissan", "JN8": "nissan", "1N4": "nissan", "5N1": "nissan", "3N1": "nissan", "SJN": "nissan",
+    "JM1": "mazda", "JM3": "mazda", "JF1": "subaru", "JF2": "subaru", "4S3": "subaru", "4S4": "subaru",
+    "JA3": "mitsubishi", "JA4": "mitsubishi", "JS1": "suzuki", "JS2": "suzuki",
+    "KMH": "hyundai", "5NP": "hyundai", "KM8": "hyundai", "KNA": "kia", "KND": "kia", "5XY": "kia",
+    "VF1": "renault", "VF3": "peugeot", "VF7": "citroen", "ZFA": "fiat", "ZAR": "alfa_romeo",
+    "SAL": "land_rover", "SAJ": "jaguar", "YV1": "volvo", "YV4": "volvo", "YS3": "saab", "5YJ": "tesla",
+}
+# fallback for manufacturers that use a whole range of WMIs sharing the first two chars
+WMI_PREFIX_MAKES = {
+    "JT": "toyota", "JH": "honda", "JN": "nissan", "WB": "bmw", "WD": "mercedes_benz", "WV": "volkswagen",
+    "WA": "audi", "1F": "ford", "1G": "general_motors", "KM": "hyundai", "KN": "kia", "VF": "psa",
+}
+
+
+@lru_cache(maxsize=8192)
+def make_from_wmi(wmi: str) -> Optional[str]:
+    """
+    Resolves the OEM overlay key of a world manufacturer identifier (cached, since the number of distinct WMIs is
+    small compared to the number of events).
+
+    :param wmi: world manufacturer identifier (first three chars of the VIN)
+    :return: OEM overlay key or None if the manufacturer is unknown
+    """
+    wmi = wmi.upper()
+    return WMI_MAKES.get(wmi) or WMI_PREFIX_MAKES.get(wmi[:2])
+
+
+def make_from_vin(vin: str) -> Optional[str]:
+    """
+    Resolves the OEM overlay key of a vehicle identification number.
+
+    :param vin: VIN (only the WMI, i.e., the first three chars, is evaluated)
+    :return: OEM overlay key or None if the manufacturer is unknown
+    """
+    vin = vin.strip()
+    if len(vin) < 3:
+        raise ValueError("VIN too short: " + repr(vin))
+    return make_from_wmi(vin[:3])
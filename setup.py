@@ -21,6 +21,13 @@ setup(
     ],
     python_requires='>=3.7, <3.11',
     install_requires=required,
+    extras_require={
+        'analytics': ['numpy', 'scipy'],
+    },
+    entry_points={
+        'console_scripts': ['dtc_parser=dtc_parser.__main__:main'],
+    },
     packages=find_packages(),
     include_package_data=True,
+    package_data={'dtc_parser': ['data/*']},
 )
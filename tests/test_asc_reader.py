@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from dtc_parser.asc_reader import ASCReader, ISOTPReassembler
+
+TRACE = """date Mon Oct 19 10:00:00.000 am 2026
+base hex  timestamps absolute
+internal events logged
+Begin Triggerblock Mon Oct 19 10:00:00.000 am 2026
+   0.001000 1  123             Rx   d 8 03 43 01 01 12 00 00 00
+   0.002000 1  7E8             Rx   d 8 04 43 01 01 12 55 55 55
+   0.003000 1  7E0             Tx   d 8 02 03 00 00 00 00 00 00
+   0.004000 1  7E9             Rx   r
+   0.005000 1  18DAF110x       Rx   d 8 07 59 02 FF 03 00 00 08
+   0.006000 CANFD   1 Rx        7E8                                   1 0 8  8 04 43 01 41 23 00 00 00
+   0.007000 1  7E8             Rx   d 8 10 0A 43 04 01 71 01 72
+   0.008000 1  7E8             Rx   d 8 21 01 73 02 00 AA AA AA
+base dec  timestamps absolute
+   0.009000 1  2024            Rx   d 8 04 43 01 01 05 00 00 00
+   0.010000 1  417001744x      Rx   d 8 07 59 02 FF 01 13 00 09
+   0.011000 1  7E8             Rx   d 8 04 43 01 99 99 00 00 00
+End TriggerBlock
+"""
+
+
+def write_trace(tmp_path) -> str:
+    path = tmp_path / "trace.asc"
+    path.write_text(TRACE, encoding="ascii")
+    return str(path)
+
+
+def test_isotp_single_frame():
+    assert ISOTPReassembler().feed(0x7E8, b"\x04\x43\x01\x01\x12\x55\x55\x55") == b"\x43\x01\x01\x12"
+
+
+def test_isotp_segmented_payload():
+    reassembler = ISOTPReassembler()
+    payload = bytes(range(0x40, 0x4A))
+    assert reassembler.feed(0x7E8, b"\x10\x0A" + payload[:6]) is None
+    # frames of other IDs are reassembled independently
+    assert reassembler.feed(0x7E9, b"\x02\x43\x00") == b"\x43\x00"
+    assert reassembler.feed(0x7E8, b"\x21" + payload[6:] + b"\xAA\xAA\xAA") == payload
+    assert not reassembler.pending
+
+
+def test_isotp_drops_payload_after_lost_frame():
+    reassembler = ISOTPReassembler()
+    assert reassembler.feed(0x7E8, b"\x10\x10" + bytes(6)) is None
+    assert reassembler.feed(0x7E8, b"\x22" + bytes(7)) is None
+    assert reassembler.feed(0x7E8, b"\x21" + bytes(7)) is None
+    assert not reassembler.pending
+    assert reassembler.feed(0x7E8, b"") is None
+
+
+def test_read_trace(tmp_path):
+    reader = ASCReader()
+    batch = reader.read(write_trace(tmp_path))
+    # non-diagnostic IDs, requests, remote frames and CAN FD lines are skipped; in decimal mode 2024 is 0x7E8,
+    # while 7E8 is no longer a valid ID token
+    assert batch.code_strings() == ["P0112", "P0300", "P0171", "P0172", "P0173", "P0200", "P0105", "P0113"]
+    assert list(batch.sources) == [0x7E8, 0x18DAF110] + [0x7E8] * 5 + [0x18DAF110]
+    assert list(batch.statuses) == [0, 0x08, 0, 0, 0, 0, 0, 0x09]
+    assert list(batch.timestamps) == [0.002, 0.005, 0.008, 0.008, 0.008, 0.008, 0.009, 0.010]
+    assert reader.lines_read == len(TRACE.splitlines())
+    assert reader.frames_matched == 6
+
+
+def test_iter_batches_yields_batches_of_batch_size(tmp_path):
+    reader = ASCReader(batch_size=2)
+    batches = list(reader.iter_batches(write_trace(tmp_path)))
+    # a batch is yielded once it reaches the batch size, the DTCs of a single response are never split up
+    assert [len(batch) for batch in batches] == [2, 4, 2]
+    assert [code for batch in batches for code in batch.code_strings()] == ASCReader().read(
+        write_trace(tmp_path)).code_strings()
+
+
+def test_diagnostic_id_filter(tmp_path):
+    batch = ASCReader(diagnostic_ids=[0x18DAF110]).read(write_trace(tmp_path))
+    assert batch.code_strings() == ["P0300", "P0113"]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.autocomplete import CodeCompleter, TermCompleter, get_code_completer, get_term_completer
+from dtc_parser.index import CodeIndex
+from dtc_parser.search import DescriptionSearch
+from dtc_parser.tables import get_error_tables
+
+ENTRIES = [
+    ("P0113", "Intake Air Temperature Sensor 1 Circuit High"),
+    ("P0112", "Intake Air Temperature Sensor 1 Circuit Low"),
+    ("P0171", "System Too Lean (Bank 1)"),
+    ("P0300", "Random/Multiple Cylinder Misfire Detected"),
+    ("U0100", "Lost Communication With ECM/PCM A"),
+]
+
+
+@pytest.fixture
+def code_completer():
+    return CodeCompleter(ENTRIES, top_n=2)
+
+
+@pytest.fixture
+def term_completer():
+    return TermCompleter(DescriptionSearch(CodeIndex(ENTRIES)), top_n=2, precomputed_prefix_length=1)
+
+
+def test_complete_codes(code_completer):
+    assert code_completer.complete("p01") == (("P0112", "Intake Air Temperature Sensor 1 Circuit Low"),
+                                              ("P0113", "Intake Air Temperature Sensor 1 Circuit High"))
+    assert [code for code, _ in code_completer.complete(" p-03")] == ["P0300"]
+    assert [code for code, _ in code_completer.complete("")] == ["P0112", "P0113"]
+    assert code_completer.complete("P02") == ()
+    assert code_completer.complete("P011234") == ()
+
+
+def test_count_codes(code_completer):
+    assert code_completer.count("") == 5
+    assert code_completer.count("P0") == 4
+    assert code_completer.count("p01") == 3
+    assert code_completer.count("B") == 0
+
+
+def test_complete_codes_ranked_by_weight():
+    completer = CodeCompleter(ENTRIES, top_n=3, weights={"P0171": 10.0, "P0113": 2.0})
+    assert [code for code, _ in completer.complete("P0")] == ["P0171", "P0113", "P0112"]
+    assert [code for code, _ in completer.complete("P01")] == ["P0171", "P0113", "P0112"]
+
+
+def test_code_completer_of_the_code_tables():
+    assert get_code_completer().count("P01") == len(get_error_tables()["P01"])
+    assert get_code_completer().complete("P011")[0][0] == "P0110"
+
+
+def test_complete_terms_by_frequency(term_completer):
+    # "sensor" and "temperature" occur in two descriptions, "system" in one
+    assert term_completer.complete_terms("s") == ["sensor", "system"]
+    assert term_completer.complete_terms("S", limit=1) == ["sensor"]
+    # more terms than precomputed
+    assert term_completer.complete_terms("s", limit=3) == ["sensor", "system"]
+    assert term_completer.complete_terms("te") == ["temperature"]
+    assert term_completer.complete_terms("turbo") == []
+    assert term_completer.complete_terms(" ") == []
+
+
+def test_complete_codes_of_terms(term_completer):
+    assert term_completer.complete("misf") == [("P0300", "Random/Multiple Cylinder Misfire Detected")]
+    # codes of all matching terms in code order, without duplicates
+    assert [code for code, _ in term_completer.complete("l")] == ["P0112", "P0171", "U0100"]
+    assert [code for code, _ in term_completer.complete("l", limit=2)] == ["P0112", "P0171"]
+
+
+def test_term_completer_of_the_code_tables():
+    assert "misfire" in get_term_completer().complete_terms("misf")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+pytest.importorskip("scipy")
+
+from dtc_parser import clustering  # noqa: E402 (analytics extra)
+from dtc_parser.clustering import NO_FAMILY, FaultFamilies, get_fault_families  # noqa: E402
+from dtc_parser.codec import dtc_to_int  # noqa: E402
+from dtc_parser.index import CodeIndex, content_hash, get_code_index  # noqa: E402
+from dtc_parser.similarity import RelatedCodes  # noqa: E402
+
+ENTRIES = [
+    ("P0130", "O2 Sensor Circuit Malfunction (Bank 1 Sensor 1)"),
+    ("P0150", "O2 Sensor Circuit Malfunction (Bank 2 Sensor 1)"),
+    ("P0135", "O2 Sensor Heater Circuit Malfunction (Bank 1 Sensor 1)"),
+    ("P0300", "Random/Multiple Cylinder Misfire Detected"),
+    ("P0301", "Cylinder 1 Misfire Detected"),
+    ("P0230", "Fuel Pump Primary Circuit Malfunction"),
+]
+
+
+@pytest.fixture
+def code_index():
+    return CodeIndex(ENTRIES)
+
+
+@pytest.fixture
+def families(code_index):
+    return FaultFamilies.build(code_index, RelatedCodes.build(code_index, k=3))
+
+
+def test_families(families):
+    assert len(families) == 3
+    assert families.members(families.family_of("P0130")) == ["P0130", "P0135", "P0150"]
+    assert families.members(families.family_of("p0300")) == ["P0300", "P0301"]
+    assert families.members(families.family_of("P0230")) == ["P0230"]
+    assert families.family_of("P0131") == NO_FAMILY
+    assert "misfire" in families.names[families.family_of("P0301")]
+    codes = [dtc_to_int(code) for code in ("P0150", "P0131", "P0301")]
+    assert families.family_of_many(codes).tolist() == [families.family_of("P0130"), NO_FAMILY,
+                                                       families.family_of("P0300")]
+
+
+def test_threshold_and_prefix_constraint(code_index):
+    related = RelatedCodes.build(code_index, k=3)
+    # the misfire codes are less similar than the oxygen sensor codes
+    assert len(FaultFamilies.build(code_index, related, threshold=0.7)) == 4
+    # weak links only within the same three-char prefix
+    assert len(FaultFamilies.build(code_index, related, threshold=0.1)) == 3
+    assert len(FaultFamilies.build(code_index, related, threshold=0.1, prefix_length=2)) == 1
+
+
+def test_stale_compiled_families_are_rebuilt(families, tmp_path, monkeypatch):
+    path = str(tmp_path / "families.npz")
+    families.save(path)
+    assert FaultFamilies.load(path).table_hash == families.table_hash
+    monkeypatch.setattr(clustering, "COMPILED_FAMILIES", path)
+    get_fault_families.cache_clear()
+    try:
+        rebuilt = get_fault_families()
+        assert rebuilt.table_hash == content_hash(get_code_index())
+        assert rebuilt.family_of("P0112") != NO_FAMILY
+    finally:
+        get_fault_families.cache_clear()
+
+
+def test_shipped_families_match_the_code_tables():
+    assert FaultFamilies.load().table_hash == content_hash(get_code_index())
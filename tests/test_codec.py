@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.codec import CODE_SPACE_SIZE, dtc_from_bytes, dtc_from_int, dtc_to_int
+
+
+def test_round_trip_of_entire_code_space():
+    for value in range(CODE_SPACE_SIZE):
+        assert dtc_to_int(dtc_from_int(value)) == value
+
+
+@pytest.mark.parametrize("high, low, code", [
+    (0x01, 0x12, "P0112"),
+    (0x41, 0x23, "C0123"),
+    (0x9A, 0xBC, "B1ABC"),
+    (0xF0, 0x00, "U3000"),
+])
+def test_dtc_from_bytes(high, low, code):
+    assert dtc_from_bytes(high, low) == code
+    assert dtc_to_int(code) == (high << 8) | low
+
+
+def test_dtc_to_int_rejects_code_type_out_of_range():
+    with pytest.raises(ValueError):
+        dtc_to_int("P4112")
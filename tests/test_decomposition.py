@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser import decomposition
+from dtc_parser.decomposition import (EC_LOW, EC_NONE, EC_OPEN, FM_CIRCUIT, FM_COMMUNICATION, FM_LOW, FM_OPEN,
+                                      FM_STUCK, FaultStructures, decompose, get_fault_structures)
+from dtc_parser.loader import source_hash
+from dtc_parser.tables import iter_entries
+
+ENTRIES = [
+    ("P0112", "Intake Air Temperature Sensor 1 Circuit Low"),
+    ("P0113", "Intake Air Temperature Sensor 1 Circuit High"),
+    ("P0405", "EGR Valve Stuck Open"),
+]
+
+
+@pytest.fixture
+def structures():
+    return FaultStructures.build(ENTRIES)
+
+
+@pytest.mark.parametrize("description, expected", [
+    # the phrase that ends last determines the failure mode, not the first one in FAILURE_PHRASES
+    ("Powertrain Performance Mode Switch Circuit failure", ("powertrain performance mode", "switch", FM_CIRCUIT,
+                                                            EC_NONE)),
+    # phrases directly preceding it qualify the failure instead of being part of the component
+    ("Throttle Position Sensor Performance Circuit Low", ("throttle position sensor", "", FM_LOW, EC_LOW)),
+    ("Heated oxygen sensor (HO2S) 1, bank 1, heater control -circuit low", ("heated oxygen sensor (ho2s)",
+                                                                             "heater control", FM_LOW, EC_LOW)),
+    ("EGR Valve Stuck Open", ("egr", "valve", FM_STUCK, EC_NONE)),
+    ("Lost Communication With ECM/PCM A", ("ecm/pcm a", "", FM_COMMUNICATION, EC_NONE)),
+    ("Cylinder 4 injector circuit open", ("cylinder injector", "", FM_OPEN, EC_OPEN)),
+    # components that only consist of location words are kept
+    ("Right Front Sensor Circuit Failure", ("right front sensor", "", FM_CIRCUIT, EC_NONE)),
+])
+def test_decompose(description, expected):
+    assert decompose(description) == expected
+
+
+def test_records(structures):
+    assert structures.describe(structures.get("P0112")) == {
+        "component": "intake air temperature sensor", "sub_component": "", "failure_mode": "circuit low",
+        "electrical_condition": "low"}
+    # both codes share the component
+    assert structures.get("P0112").component == structures.get("P0113").component
+    assert structures.get("P0300") == decomposition.UNKNOWN_STRUCTURE
+
+
+def test_structure_does_not_modify_the_vocabulary(structures):
+    vocabulary = list(structures.vocabulary)
+    assert structures.structure("Intake Air Temperature Sensor 2 Circuit Low") == structures.get("P0112")
+    # unknown components are mapped to none
+    assert structures.structure("Cylinder 4 injector circuit open")[:2] == (0, 0)
+    assert structures.vocabulary == vocabulary
+
+
+def test_save_and_load(structures, tmp_path):
+    path = str(tmp_path / "fault_structures.json")
+    structures.save(path, "hash")
+    loaded, data_hash = FaultStructures.load(path)
+    assert data_hash == "hash"
+    assert loaded.vocabulary == structures.vocabulary
+    assert loaded.records == structures.records
+
+
+def test_stale_compiled_records_are_rebuilt(structures, tmp_path, monkeypatch):
+    path = str(tmp_path / "fault_structures.json")
+    structures.save(path, "stale")
+    monkeypatch.setattr(decomposition, "COMPILED_FAULT_STRUCTURES", path)
+    get_fault_structures.cache_clear()
+    try:
+        assert len(get_fault_structures().records) == len(list(iter_entries()))
+    finally:
+        get_fault_structures.cache_clear()
+
+
+def test_shipped_records_match_the_data_files():
+    loaded, data_hash = FaultStructures.load()
+    assert data_hash == source_hash()
+    assert loaded.records == FaultStructures.build(iter_entries()).records
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.codec import dtc_to_int
+from dtc_parser.decomposition import FM_LOW, FaultStructures, get_fault_structures
+from dtc_parser.failure_index import CodeBitmap, FailureModeIndex, get_failure_mode_index
+
+ENTRIES = [
+    ("P0112", "Intake Air Temperature Sensor 1 Circuit Low"),
+    ("P0113", "Intake Air Temperature Sensor 1 Circuit High"),
+    ("P0117", "Engine Coolant Temperature Sensor 1 Circuit Low"),
+    ("P0405", "EGR Valve Stuck Open"),
+    ("C0040", "Right Front Wheel Speed Sensor Circuit Short to Ground"),
+]
+
+
+@pytest.fixture
+def index():
+    return FailureModeIndex(FaultStructures.build(ENTRIES))
+
+
+def test_code_bitmap():
+    bitmap = CodeBitmap([0x0112, 0x0000, 0xFFFF, 0x0112])
+    assert len(bitmap) == 3
+    assert list(bitmap) == [0x0000, 0x0112, 0xFFFF]
+    assert 0x0112 in bitmap and 0x0113 not in bitmap
+    assert list(bitmap | CodeBitmap([0x0113])) == [0x0000, 0x0112, 0x0113, 0xFFFF]
+    assert list(bitmap & CodeBitmap([0x0112, 0x0113])) == [0x0112]
+    assert list(bitmap.contains_many([0x0112, 0x0113, 0xFFFF])) == [True, False, True]
+
+
+def test_codes_by_failure_mode(index):
+    assert index.codes("circuit low") == ["P0112", "P0117"]
+    assert index.codes("stuck") == ["P0405"]
+    assert index.codes("short to ground") == ["C0040"]
+    assert index.codes("misfire") == []
+    with pytest.raises(ValueError):
+        index.codes("broken")
+
+
+def test_has_failure_mode(index):
+    assert index.has_failure_mode("p0-112", "circuit low")
+    assert not index.has_failure_mode("P0113", "circuit low")
+    assert not index.has_failure_mode("P0300", "circuit low")
+
+
+def test_electrical_condition(index):
+    assert list(index.electrical_condition("high")) == [dtc_to_int("P0113")]
+    assert list(index.electrical_condition("short to ground")) == [dtc_to_int("C0040")]
+    assert len(index.electrical_condition("none")) == 1
+
+
+def test_failure_mode_index_of_the_code_tables():
+    index = get_failure_mode_index()
+    assert index.has_failure_mode("P0112", "circuit low")
+    structures = get_fault_structures()
+    assert len(index.failure_mode("circuit low")) == sum(
+        structure.failure_mode == FM_LOW for structure in structures.records.values())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.index import CodeIndex, get_code_index, prefix_bounds
+from dtc_parser.tables import get_error_tables
+
+ENTRIES = [
+    ("U0100", "Lost Communication With ECM/PCM A"),
+    ("P0112", "Intake Air Temperature Sensor 1 Circuit Low"),
+    ("P0100", "Mass or Volume Air Flow Circuit Malfunction"),
+    ("P01FF", "Generic P01FF"),
+    ("P0200", "Injector Circuit Malfunction"),
+    ("C0123", "Brake Pedal Switch Circuit"),
+]
+
+
+@pytest.fixture
+def index():
+    return CodeIndex(ENTRIES)
+
+
+def test_prefix_bounds():
+    assert prefix_bounds("") == (0, 0xFFFF)
+    assert prefix_bounds("P") == (0x0000, 0x3FFF)
+    assert prefix_bounds("u01") == (0xC100, 0xC1FF)
+    assert prefix_bounds("P0112") == (0x0112, 0x0112)
+    with pytest.raises(ValueError):
+        prefix_bounds("P01120")
+
+
+def test_get(index):
+    assert len(index) == 6
+    assert index.get("p0112") == "Intake Air Temperature Sensor 1 Circuit Low"
+    assert index.get("P0113") is None
+    assert "U0100" in index
+    assert "U0101" not in index
+
+
+def test_range(index):
+    assert [code for code, _ in index.range("P0100", "P01FF")] == ["P0100", "P0112", "P01FF"]
+    assert [code for code, _ in index.range("P0101", "P0200")] == ["P0112", "P01FF", "P0200"]
+    # ranges across categories follow the integer order (P < C < B < U)
+    assert [code for code, _ in index.range("P0200", "U0100")] == ["P0200", "C0123", "U0100"]
+    assert list(index.range("P0300", "P03FF")) == []
+
+
+def test_prefix(index):
+    assert list(index.prefix("P01")) == [("P0100", "Mass or Volume Air Flow Circuit Malfunction"),
+                                         ("P0112", "Intake Air Temperature Sensor 1 Circuit Low"),
+                                         ("P01FF", "Generic P01FF")]
+    assert [code for code, _ in index.prefix("")] == ["P0100", "P0112", "P01FF", "P0200", "C0123", "U0100"]
+    assert index.count_prefix("P0") == 4
+    assert index.count_prefix("B") == 0
+
+
+def test_code_index_of_the_code_tables():
+    table = get_error_tables()["P01"]
+    assert [code for code, _ in get_code_index().prefix("P01")] == sorted(table)
+    assert get_code_index().count_prefix("P01") == len(table)
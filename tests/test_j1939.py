@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.j1939 import PGN_DM1, PGN_DM2, J1939Batch, J1939Decoder, SPNTable, decode_dm, parse_pgn
+from dtc_parser.parser import DTCParser
+
+
+def dm_payload(*dtcs) -> bytes:
+    # two lamp status bytes, then SPN (19 bits), FMI (5 bits) and occurrence count per DTC
+    payload = bytearray(b"\x04\xFF")
+    for spn, fmi, occurrence in dtcs:
+        payload += bytes([spn & 0xFF, (spn >> 8) & 0xFF, ((spn >> 11) & 0xE0) | fmi, occurrence])
+    return bytes(payload)
+
+
+@pytest.fixture
+def spn_table(tmp_path):
+    path = tmp_path / "spns.csv"
+    path.write_text("SPN,description\n100,Engine Oil Pressure\n110,Engine Coolant Temperature\n", encoding="utf-8")
+    return SPNTable(str(path))
+
+
+def test_parse_pgn():
+    assert parse_pgn(0x18FECA00) == (PGN_DM1, 0xFF, 0x00)
+    assert parse_pgn(0x18EC0317) == (0xEC00, 0x03, 0x17)
+
+
+def test_decode_dm():
+    batch = J1939Batch()
+    payload = dm_payload((100, 1, 3), (0x7FFFF, 31, 127), (520192, 4, 1))
+    assert decode_dm(payload, batch, PGN_DM2, 0x17, 2.0) == 2
+    assert list(batch.spns) == [100, 520192]
+    assert list(batch.fmis) == [1, 4]
+    assert list(batch.occurrences) == [3, 1]
+    assert list(batch.pgns) == [PGN_DM2] * 2
+    assert list(batch.sources) == [0x17] * 2
+    # no active DTC
+    assert decode_dm(dm_payload((0, 0, 0)), batch) == 0
+
+
+def test_j1939_decoder_single_frame_and_bam():
+    decoder = J1939Decoder()
+    decoder.feed(0x18FECA00, dm_payload((100, 1, 3)))
+    payload = dm_payload((110, 0, 1), (190, 2, 5))
+    decoder.feed(0x18ECFF00, bytes([0x20, len(payload), 0x00, 2, 0xFF, 0xCA, 0xFE, 0x00]))
+    decoder.feed(0x18EBFF00, b"\x01" + payload[:7])
+    assert len(decoder.batch) == 1
+    decoder.feed(0x18EBFF00, b"\x02" + payload[7:] + b"\xFF" * 4)
+    batch = decoder.take()
+    assert list(batch.spns) == [100, 110, 190]
+    assert list(batch.fmis) == [1, 0, 2]
+    assert len(decoder.batch) == 0
+    assert not decoder.sessions
+
+
+def test_j1939_decoder_rts_and_out_of_sequence_transfer():
+    decoder = J1939Decoder()
+    payload = dm_payload((110, 0, 1), (190, 2, 5))
+    rts = bytes([0x10, len(payload), 0x00, 2, 0xFF, 0xCB, 0xFE, 0x00])
+    decoder.feed(0x18EC0300, rts)
+    decoder.feed(0x18EB0300, b"\x02" + payload[7:] + b"\xFF" * 4)
+    assert not decoder.sessions
+    decoder.feed(0x18EC0300, rts)
+    decoder.feed(0x18EB0300, b"\x01" + payload[:7])
+    decoder.feed(0x18EB0300, b"\x02" + payload[7:] + b"\xFF" * 4)
+    batch = decoder.take()
+    assert list(batch.spns) == [110, 190]
+    assert list(batch.pgns) == [PGN_DM2] * 2
+
+
+def test_spn_table_and_descriptions(spn_table):
+    assert spn_table.get(100) == "Engine Oil Pressure"
+    assert spn_table.get(190) == "unsupported SPN"
+    batch = J1939Batch()
+    decode_dm(dm_payload((100, 1, 3), (190, 8, 1), (100, 1, 4)), batch)
+    oil_pressure = ("Engine Oil Pressure", "Data valid but below normal operational range - most severe level")
+    unsupported = ("unsupported SPN", "Abnormal frequency or pulse width or period")
+    assert batch.describe(spn_table) == [oil_pressure, unsupported, oil_pressure]
+    assert DTCParser.parse_j1939_fault(110, 3, spn_table) == {
+        "suspect_parameter": "engine coolant temperature",
+        "failure_mode": "voltage above normal, or shorted to high source"
+    }
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from dtc_parser.batch import PROTOCOL_KWP, DTCBatch
+from dtc_parser.kwp2000 import decode_kwp2000_frames, decode_kwp2000_response, unpack_kwp2000_frame
+from dtc_parser.responses import decode_response
+
+
+def kwp_frame(payload: bytes, target: int = 0xF1, source: int = 0x10) -> bytes:
+    # format byte with address information and the length in its lower six bits, followed by the checksum
+    frame = bytes([0x80 | len(payload), target, source]) + payload
+    return frame + bytes([sum(frame) & 0xFF])
+
+
+def test_decode_kwp2000_response():
+    batch = DTCBatch()
+    # trailing padding is ignored
+    assert decode_kwp2000_response(b"\x58\x02\x01\x12\x08\x03\x00\x24\x00", batch, 0x10, 1.0) == 2
+    assert batch.code_strings() == ["P0112", "P0300"]
+    assert list(batch.statuses) == [0x08, 0x24]
+    assert list(batch.protocols) == [PROTOCOL_KWP] * 2
+    # the number of DTCs exceeds the payload
+    assert decode_kwp2000_response(b"\x58\x02\x01\x12\x08", batch, 0x10, 1.0) == 1
+    assert decode_kwp2000_response(b"\x58", batch, 0x10, 1.0) == 0
+
+
+def test_decode_response_dispatches_kwp2000():
+    batch = DTCBatch()
+    assert decode_response(b"\x58\x01\x01\x71\x24", batch) == 1
+    assert batch.code_strings() == ["P0171"]
+    assert list(batch.protocols) == [PROTOCOL_KWP]
+
+
+def test_unpack_kwp2000_frame():
+    payload = b"\x58\x01\x01\x12\x08"
+    assert unpack_kwp2000_frame(kwp_frame(payload)) == (0x10, payload)
+    # additional length byte
+    frame = bytes([0x80, 0xF1, 0x10, len(payload)]) + payload
+    assert unpack_kwp2000_frame(frame + bytes([sum(frame) & 0xFF])) == (0x10, payload)
+    # without address information
+    frame = bytes([len(payload)]) + payload
+    assert unpack_kwp2000_frame(frame + bytes([sum(frame) & 0xFF])) == (0, payload)
+
+
+def test_unpack_kwp2000_frame_rejects_invalid_frames():
+    frame = kwp_frame(b"\x58\x01\x01\x12\x08")
+    assert unpack_kwp2000_frame(frame[:-1] + bytes([frame[-1] ^ 0xFF])) is None
+    assert unpack_kwp2000_frame(frame[:-2] + bytes([sum(frame[:-2]) & 0xFF])) is None
+    assert unpack_kwp2000_frame(b"") is None
+    assert unpack_kwp2000_frame(b"\x00") is None
+    # truncated frames whose checksum happens to match
+    assert unpack_kwp2000_frame(b"\x80\x80") is None
+    assert unpack_kwp2000_frame(b"\x80\x01\x81") is None
+    assert unpack_kwp2000_frame(b"\xC0\x10\xF1\xC1") is None
+
+
+def test_decode_kwp2000_frames():
+    frames = [
+        kwp_frame(b"\x58\x02\x01\x12\x08\x03\x00\x24"),
+        kwp_frame(b"\x7F\x18\x12"),
+        b"\x80\x80",
+        kwp_frame(b"\x58\x01\x41\x23\x20", source=0x11),
+    ]
+    batch = decode_kwp2000_frames(frames, timestamps=[1.0, 2.0, 3.0, 4.0])
+    assert batch.code_strings() == ["P0112", "P0300", "C0123"]
+    assert list(batch.statuses) == [0x08, 0x24, 0x20]
+    assert list(batch.sources) == [0x10, 0x10, 0x11]
+    assert list(batch.timestamps) == [1.0, 1.0, 4.0]
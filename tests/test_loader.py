@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import os
+
+import pytest
+
+from dtc_parser.loader import (EXTRA_TABLES_ENV, TABLE_NAMES, extra_table_paths, iter_data_file, load_tables,
+                               source_hash, table_name)
+from dtc_parser.tables import get_error_tables
+
+
+@pytest.fixture
+def base(tmp_path):
+    path = tmp_path / "base.csv"
+    path.write_text("code,description\n"
+                    "P0112,Intake Air Temperature Sensor 1 Circuit Low\n"
+                    "P0113,Intake Air Temperature Sensor 1 Circuit High\n"
+                    "B1200,Climate Control Pushbutton Circuit Failure\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def extra(tmp_path):
+    path = tmp_path / "extra.csv"
+    path.write_text("p0-113,Overridden\n"
+                    "P0A80,Replace Hybrid Battery Pack\n"
+                    "P4000,Unknown table\n"
+                    "X1234,Invalid\n", encoding="utf-8")
+    return str(path)
+
+
+def test_table_name():
+    assert table_name("P0112") == "P01"
+    assert table_name("P0A80") == "P0A"
+    assert table_name("P1101") == "P1"
+    assert table_name("B1200") == "B1"
+
+
+def test_iter_data_file(base, tmp_path):
+    assert list(iter_data_file(base))[0] == ("P0112", "Intake Air Temperature Sensor 1 Circuit Low")
+    assert len(list(iter_data_file(base))) == 3
+    path = tmp_path / "codes.json"
+    path.write_text('{"U0100": "Lost Communication With ECM/PCM A"}', encoding="utf-8")
+    assert list(iter_data_file(str(path))) == [("U0100", "Lost Communication With ECM/PCM A")]
+
+
+def test_load_tables(base):
+    tables = load_tables([base], extra_paths=[])
+    assert set(tables) == set(TABLE_NAMES)
+    assert tables["P01"] == {"P0112": "Intake Air Temperature Sensor 1 Circuit Low",
+                             "P0113": "Intake Air Temperature Sensor 1 Circuit High"}
+    assert tables["B1"] == {"B1200": "Climate Control Pushbutton Circuit Failure"}
+
+
+def test_extra_tables_are_normalized_and_merged_on_top(base, extra):
+    tables = load_tables([base], extra_paths=[extra])
+    assert tables["P01"]["P0113"] == "Overridden"
+    assert tables["P01"]["P0112"] == "Intake Air Temperature Sensor 1 Circuit Low"
+    assert tables["P0A"] == {"P0A80": "Replace Hybrid Battery Pack"}
+    # invalid DTCs and codes without table are skipped
+    assert sum(len(table) for table in tables.values()) == 4
+
+
+def test_strict_loading_rejects_invalid_codes(base, extra):
+    with pytest.raises(ValueError, match="P4000"):
+        load_tables([base], extra_paths=[extra], strict=True)
+
+
+def test_extra_tables_of_the_environment(base, extra, monkeypatch):
+    monkeypatch.setenv(EXTRA_TABLES_ENV, os.pathsep + extra)
+    assert extra_table_paths() == [extra]
+    assert load_tables([base])["P01"]["P0113"] == "Overridden"
+    assert source_hash() != source_hash([base])
+    assert source_hash([base, extra]) == source_hash([base, extra])
+    assert source_hash([base, extra]) != source_hash([extra, base])
+
+
+def test_bundled_tables():
+    assert load_tables(extra_paths=[]) == get_error_tables()
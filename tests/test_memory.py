@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser import memory
+from dtc_parser.index import get_code_index
+from dtc_parser.memory import (MEMORY_BUDGET_ENV, OPTIONAL_STRUCTURES, get_memory_budget, is_built, memory_report,
+                               set_memory_budget)
+from dtc_parser.perfect_hash import get_perfect_hash
+
+
+@pytest.fixture
+def structures():
+    for getter in OPTIONAL_STRUCTURES.values():
+        getter.cache_clear()
+    yield
+    set_memory_budget(None)
+    for getter in OPTIONAL_STRUCTURES.values():
+        getter.cache_clear()
+
+
+def sizes():
+    # excluding the objects shared with the code tables, as accounted for by the budget
+    return {report.name: report.size for report in memory_report()[1]}
+
+
+def test_budget_drops_less_valuable_structures(structures):
+    get_code_index()
+    get_perfect_hash()
+    measured = sizes()
+    assert set_memory_budget(measured["code_index"] + measured["perfect_hash"] // 2) == ["perfect_hash"]
+    assert is_built("code_index")
+    assert not is_built("perfect_hash")
+
+
+def test_structure_that_does_not_fit_is_returned_uncached(structures):
+    get_code_index()
+    get_perfect_hash()
+    measured = sizes()
+    set_memory_budget(measured["code_index"] + measured["perfect_hash"] // 2)
+    with pytest.warns(RuntimeWarning, match="perfect_hash"):
+        table = get_perfect_hash()
+    assert table.get("P0112") == "Intake Air Temperature Sensor 1 Circuit Low"
+    # the more valuable structure is not evicted for it
+    assert is_built("code_index")
+    assert not is_built("perfect_hash")
+    set_memory_budget(measured["code_index"] + measured["perfect_hash"] * 2)
+    assert get_perfect_hash() is get_perfect_hash()
+    assert is_built("code_index")
+
+
+@pytest.fixture
+def unconfigured_budget(monkeypatch):
+    # the budget is read from the environment on first use
+    monkeypatch.setattr(memory, "_budget", None)
+    monkeypatch.setattr(memory, "_budget_configured", False)
+    return monkeypatch
+
+
+def test_budget_is_read_from_the_environment_on_first_use(unconfigured_budget):
+    unconfigured_budget.setenv(MEMORY_BUDGET_ENV, " 1048576 ")
+    assert get_memory_budget() == 1048576
+    # set_memory_budget() takes precedence
+    unconfigured_budget.setenv(MEMORY_BUDGET_ENV, "1")
+    set_memory_budget(None)
+    assert get_memory_budget() is None
+
+
+def test_invalid_budget_in_the_environment_is_ignored(unconfigured_budget):
+    unconfigured_budget.setenv(MEMORY_BUDGET_ENV, "512MB")
+    with pytest.warns(RuntimeWarning, match=MEMORY_BUDGET_ENV):
+        assert get_memory_budget() is None
+    # the optional structures are still cached
+    assert memory.admit("code_index")
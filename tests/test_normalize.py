@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.normalize import (ERR_CATEGORY, ERR_CODE_TYPE, ERR_DIGIT, ERR_EMPTY, ERR_LENGTH, ERR_MISSING_CATEGORY,
+                                  OK, InvalidDTCError, check_dtc, normalize_dtc, normalize_many)
+
+
+@pytest.mark.parametrize("raw, default_category, expected", [
+    ("P0112", None, ("P0112", OK)),
+    (" p0-112\n", None, ("P0112", OK)),
+    ("u0_1.0:0", None, ("U0100", OK)),
+    ("0112", "p", ("P0112", OK)),
+    ("", None, (None, ERR_EMPTY)),
+    (" - ", None, (None, ERR_EMPTY)),
+    ("P01", None, (None, ERR_LENGTH)),
+    ("P01120", None, (None, ERR_LENGTH)),
+    ("0112", None, (None, ERR_MISSING_CATEGORY)),
+    ("X0112", None, (None, ERR_CATEGORY)),
+    ("P4112", None, (None, ERR_CODE_TYPE)),
+    ("P011G", None, (None, ERR_DIGIT)),
+    ("P0ü12", None, (None, ERR_DIGIT)),
+])
+def test_check_dtc(raw, default_category, expected):
+    assert check_dtc(raw, default_category) == expected
+
+
+def test_normalize_dtc_raises_with_error_code():
+    assert normalize_dtc("b1-200") == "B1200"
+    with pytest.raises(InvalidDTCError) as e:
+        normalize_dtc("P01")
+    assert e.value.error == ERR_LENGTH
+    assert e.value.code == "P01"
+
+
+def test_normalize_many():
+    canonical, errors = normalize_many(["p0112", "P01", "p0112", "0300"], default_category="P")
+    assert canonical == ["P0112", None, "P0112", "P0300"]
+    assert list(errors) == [OK, ERR_LENGTH, OK, OK]
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.decomposition import get_fault_structures
+from dtc_parser.memory import set_memory_budget
+from dtc_parser.overlays import OEM_OVERLAYS, OEMOverlays, load_overlay_file
+from dtc_parser.parser import DTCParser
+
+
+@pytest.fixture
+def oem_dir(tmp_path):
+    (tmp_path / "ford.csv").write_text("code,description\n"
+                                       "P1101,Cylinder 4 injector circuit open\n"
+                                       "B1A00,Seat belt pretensioner driver circuit\n"
+                                       "P0112,ignored generic code\n", encoding="utf-8")
+    (tmp_path / "mercedes_benz.json").write_text('{"p1-234": "Camshaft actuator circuit"}', encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def overlays(oem_dir):
+    return OEMOverlays([str(oem_dir)])
+
+
+def test_load_overlay_file(oem_dir):
+    assert load_overlay_file(str(oem_dir / "ford.csv")) == {"P1101": "Cylinder 4 injector circuit open",
+                                                          "B1A00": "Seat belt pretensioner driver circuit",
+                                                          "P0112": "ignored generic code"}
+    assert load_overlay_file(str(oem_dir / "mercedes_benz.json")) == {"P1234": "Camshaft actuator circuit"}
+
+
+def test_overlays_are_loaded_on_first_request(overlays, tmp_path):
+    assert overlays.loaded_makes() == []
+    assert overlays.overlay("Mercedes-Benz") == {"P1234": "Camshaft actuator circuit"}
+    assert overlays.overlay("toyota") == {}
+    assert overlays.loaded_makes() == ["mercedes_benz", "toyota"]
+    # tables of earlier directories take precedence
+    (tmp_path / "override").mkdir()
+    (tmp_path / "override" / "ford.csv").write_text("P1101,Overridden\n", encoding="utf-8")
+    layered = OEMOverlays([str(tmp_path / "override"), str(tmp_path)])
+    assert layered.overlay("ford")["P1101"] == "Overridden"
+    assert layered.overlay("ford")["B1A00"] == "Seat belt pretensioner driver circuit"
+
+
+def test_chain(overlays):
+    table = {"P1101": "generic", "P1102": "generic"}
+    chain = overlays.chain("Ford", table)
+    assert chain["P1101"] == "Cylinder 4 injector circuit open"
+    assert chain["P1102"] == "generic"
+    assert overlays.chain("ford", table) is chain
+    overlays.discard_chains([id(table)])
+    assert overlays.chain("ford", table) is not chain
+
+
+def test_parser_with_make(overlays):
+    dtc_parser = DTCParser("Ford", overlays)
+    assert dtc_parser.parse_fault_description("P1", "101") == "Cylinder 4 injector circuit open"
+    assert dtc_parser.parse_fault_description("B1", "A00") == "Seat belt pretensioner driver circuit"
+    # generic codes are not overridden
+    assert dtc_parser.parse_fault_description("P0", "112") == "Intake Air Temperature Sensor 1 Circuit Low"
+
+
+def test_machine_readable_fields_of_overlay_descriptions(overlays):
+    parsed = DTCParser("Ford", overlays).parse_code_machine_readable("p1101")
+    assert parsed["fault_description"] == "cylinder 4 injector circuit open"
+    assert parsed["cylinder"] == 4
+    assert parsed["fault_structure"] == get_fault_structures().structure("Cylinder 4 injector circuit open")
+    generic = DTCParser().parse_code_machine_readable("P0112")
+    assert generic["sensor"] == 1
+    assert generic["cylinder"] == -1
+
+
+def test_active_make_is_kept_if_the_overlays_exceed_the_budget(oem_dir, monkeypatch):
+    monkeypatch.setattr(OEM_OVERLAYS, "directories", [str(oem_dir)])
+    OEM_OVERLAYS.clear()
+    set_memory_budget(1)
+    try:
+        with pytest.warns(RuntimeWarning, match="oem_overlays"):
+            ford = OEM_OVERLAYS.overlay("ford")
+        # the table in use is not re-read on the next lookup
+        assert OEM_OVERLAYS.overlay("ford") is ford
+        with pytest.warns(RuntimeWarning, match="oem_overlays"):
+            OEM_OVERLAYS.overlay("mercedes_benz")
+        assert OEM_OVERLAYS.loaded_makes() == ["mercedes_benz"]
+    finally:
+        set_memory_budget(None)
+        OEM_OVERLAYS.clear()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser import perfect_hash
+from dtc_parser.loader import source_hash
+from dtc_parser.perfect_hash import PerfectHashTable, get_perfect_hash
+from dtc_parser.tables import iter_entries
+
+ENTRIES = [
+    ("P0112", "Intake Air Temperature Sensor 1 Circuit Low"),
+    ("P0113", "Intake Air Temperature Sensor 1 Circuit High"),
+    ("P0300", "Random/Multiple Cylinder Misfire Detected"),
+    ("C0035", "Left Front Wheel Speed Sensor Circuit"),
+    ("B1200", "Climate Control Pushbutton Circuit Failure"),
+    ("U0100", "Lost Communication With ECM/PCM A"),
+]
+
+
+@pytest.fixture
+def table():
+    return PerfectHashTable.generate(ENTRIES)
+
+
+def test_generate(table):
+    # minimal, i.e., one slot per key
+    assert len(table) == len(ENTRIES)
+    assert sorted(table.slot(code) for code, _ in ENTRIES) == list(range(len(ENTRIES)))
+    with pytest.raises(ValueError):
+        PerfectHashTable.generate([("P011", "too short")])
+
+
+def test_get(table):
+    for code, description in ENTRIES:
+        assert table.get(code) == description
+        assert code in table
+    assert table.get("P0114") is None
+    assert table.get("P0114", "unsupported DTC") == "unsupported DTC"
+    assert table.slot("U0101") == -1
+    assert "p0112" not in table
+
+
+def test_save_and_load(table, tmp_path):
+    path = str(tmp_path / "perfect_hash.json")
+    table.save(path, "hash")
+    loaded, data_hash = PerfectHashTable.load(path)
+    assert data_hash == "hash"
+    assert [loaded.get(code) for code, _ in ENTRIES] == [description for _, description in ENTRIES]
+
+
+def test_stale_compiled_table_is_regenerated(table, tmp_path, monkeypatch):
+    path = str(tmp_path / "perfect_hash.json")
+    table.save(path, "stale")
+    monkeypatch.setattr(perfect_hash, "COMPILED_PERFECT_HASH", path)
+    get_perfect_hash.cache_clear()
+    try:
+        regenerated = get_perfect_hash()
+        assert len(regenerated) == len(list(iter_entries()))
+        assert regenerated.get("P0171") == "System Too Lean"
+    finally:
+        get_perfect_hash.cache_clear()
+
+
+def test_shipped_table_matches_the_data_files():
+    loaded, data_hash = PerfectHashTable.load()
+    assert data_hash == source_hash()
+    assert all(loaded.get(code) == description for code, description in iter_entries())
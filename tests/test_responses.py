@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+from dtc_parser.batch import PROTOCOL_OBD, PROTOCOL_UDS, DTCBatch
+from dtc_parser.responses import decode_obd_response, decode_response, decode_uds_response
+
+
+def test_decode_obd_response_skips_padding():
+    batch = DTCBatch()
+    assert decode_obd_response(b"\x43\x02\x01\x12\x00\x00\x41\x23", batch, 0x7E8, 1.5) == 2
+    assert batch.code_strings() == ["P0112", "C0123"]
+    assert list(batch.protocols) == [PROTOCOL_OBD] * 2
+    assert list(batch.sources) == [0x7E8] * 2
+    assert list(batch.timestamps) == [1.5] * 2
+
+
+def test_decode_uds_response():
+    batch = DTCBatch()
+    payload = b"\x59\x02\xFF" + b"\x01\x12\x00\x08" + b"\xC1\x23\x45\x09"
+    assert decode_uds_response(payload, batch, 0x7E8, 0.0) == 2
+    assert batch.code_strings() == ["P0112", "U0123"]
+    assert list(batch.statuses) == [0x08, 0x09]
+    assert list(batch.protocols) == [PROTOCOL_UDS] * 2
+
+
+def test_decode_uds_response_ignores_other_sub_functions():
+    batch = DTCBatch()
+    assert decode_uds_response(b"\x59\x01\xFF\x01\x00\x05", batch, 0, 0.0) == 0
+    assert decode_uds_response(b"\x59", batch, 0, 0.0) == 0
+    assert len(batch) == 0
+
+
+def test_decode_response_dispatches_on_service_id():
+    batch = DTCBatch()
+    assert decode_response(b"\x47\x01\x03\x00", batch) == 1
+    assert decode_response(b"\x59\x02\xFF\x01\x12\x00\x08", batch) == 1
+    assert decode_response(b"\x7F\x19\x31", batch) == 0
+    assert decode_response(b"", batch) == 0
+    assert batch.code_strings() == ["P0300", "P0112"]
+    assert list(batch.protocols) == [PROTOCOL_OBD, PROTOCOL_UDS]
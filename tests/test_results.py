@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.codec import CODE_SPACE_SIZE, dtc_from_int
+from dtc_parser.overlays import OEMOverlays
+from dtc_parser.parser import DTCParser
+
+
+def assert_results_match_per_call_parsing(dtc_parser: DTCParser):
+    for value in range(CODE_SPACE_SIZE):
+        code = dtc_from_int(value)
+        description = dtc_parser.parse_fault_description(code[:2], code[2:])
+        result = dtc_parser.lookup(value)
+        assert result.vehicle_part == dtc_parser.parse_vehicle_part(code[0]), code
+        assert result.code_type == dtc_parser.parse_code_type(code[1]), code
+        assert result.vehicle_subsystem == dtc_parser.parse_vehicle_subsystem(code[0], code[2]), code
+        assert result.fault_description == description.lower(), code
+        assert result.supported == (description not in ("unsupported DTC", "---")), code
+        assert dtc_parser.lookup(code) is result
+
+
+@pytest.fixture
+def overlays(tmp_path):
+    (tmp_path / "ford.csv").write_text("code,description\n"
+                                       "P1101,Cylinder 4 injector circuit open\n"
+                                       "B1A00,Seat belt pretensioner driver circuit\n"
+                                       "P0112,ignored generic code\n", encoding="utf-8")
+    return OEMOverlays([str(tmp_path)])
+
+
+def test_results_match_per_call_parsing():
+    assert_results_match_per_call_parsing(DTCParser())
+
+
+def test_results_of_make_match_per_call_parsing(overlays):
+    dtc_parser = DTCParser("Ford", overlays)
+    assert_results_match_per_call_parsing(dtc_parser)
+    assert dtc_parser.lookup("P1101").fault_description == "cylinder 4 injector circuit open"
+    assert dtc_parser.lookup("B1A00").supported
+    assert dtc_parser.lookup("P0112").fault_description == "intake air temperature sensor 1 circuit low"
+
+
+def test_results_are_rebuilt_after_clear():
+    dtc_parser = DTCParser()
+    results = dtc_parser.results()
+    dtc_parser.clear_results()
+    assert dtc_parser.results() is not results
+    assert dtc_parser.results() == results
+
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.reverse_index import ReverseIndex, get_reverse_index, normalize_description
+
+ENTRIES = [
+    ("P0457", "Evaporative Emission Control System Leak Detected (fuel cap loose/off)"),
+    ("P1457", "Evaporative Emission Control System Leak Detected (fuel cap loose/off)"),
+    ("P0460", "Fuel Level Sensor Circuit Malfunction"),
+    ("P0461", "Fuel level sensor -circuit malfunction"),
+    ("P0300", "Random/Multiple Cylinder Misfire Detected"),
+]
+
+
+@pytest.fixture
+def reverse_index():
+    return ReverseIndex(ENTRIES)
+
+
+def test_normalize_description():
+    assert normalize_description("Fuel shut -off valve -circuit  open") == "fuel shut off valve circuit open"
+
+
+def test_lookup(reverse_index):
+    assert reverse_index.lookup("Evaporative Emission Control System Leak Detected (fuel cap loose/off)") == (
+        "P0457", "P1457")
+    assert reverse_index.lookup("Fuel Level Sensor Circuit Malfunction") == ("P0460",)
+    assert reverse_index.lookup("fuel level sensor circuit malfunction") == ()
+
+
+def test_lookup_normalized(reverse_index):
+    assert reverse_index.lookup_normalized("FUEL LEVEL SENSOR - CIRCUIT MALFUNCTION") == ("P0460", "P0461")
+    assert reverse_index.lookup_normalized("random multiple cylinder misfire detected") == ("P0300",)
+    assert reverse_index.lookup_normalized("unknown") == ()
+
+
+def test_duplicates(reverse_index):
+    assert reverse_index.duplicates() == {
+        "evaporative emission control system leak detected fuel cap loose off": ("P0457", "P1457"),
+        "fuel level sensor circuit malfunction": ("P0460", "P0461"),
+    }
+
+
+def test_reverse_index_of_the_code_tables():
+    assert "P0112" in get_reverse_index().lookup_normalized("intake air temperature sensor 1 circuit low")
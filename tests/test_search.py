@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.index import CodeIndex
+from dtc_parser.search import DescriptionSearch, get_description_search, tokenize
+
+ENTRIES = [
+    ("P0130", "O2 Sensor Circuit Malfunction (Bank 1 Sensor 1)"),
+    ("P0135", "O2 Sensor Heater Circuit Malfunction (Bank 1 Sensor 1)"),
+    ("P0155", "O2 Sensor Heater Circuit Malfunction (Bank 2 Sensor 1)"),
+    ("P0300", "Random/Multiple Cylinder Misfire Detected"),
+    ("P0301", "Cylinder 1 Misfire Detected"),
+    ("P0201", "Injector Circuit Malfunction - Cylinder 1"),
+]
+
+
+@pytest.fixture
+def search():
+    return DescriptionSearch(CodeIndex(ENTRIES))
+
+
+def test_tokenize():
+    assert tokenize("Random/Multiple Cylinder Misfire (HO2S) and the -Circuit") == [
+        "random", "multiple", "cylinder", "misfire", "ho2s", "circuit"]
+
+
+def test_and_search(search):
+    assert [code for code, _, _ in search.search("heater bank 2")] == ["P0155"]
+    assert {code for code, _, _ in search.search("o2 SENSOR heater")} == {"P0135", "P0155"}
+    # all terms have to match, also the unknown ones
+    assert search.search("heater cylinder") == []
+    assert search.search("heater turbocharger") == []
+    assert search.search("the and") == []
+
+
+def test_or_search_ranks_by_bm25(search):
+    results = search.search("cylinder 1 misfire", mode="or")
+    codes = [code for code, _, _ in results]
+    # the short description that matches all terms ranks first, descriptions matching a single term last
+    assert codes[0] == "P0301"
+    assert set(codes) == {"P0130", "P0135", "P0155", "P0300", "P0301", "P0201"}
+    scores = [score for _, _, score in results]
+    assert scores == sorted(scores, reverse=True)
+    assert search.search("turbocharger misfire", mode="or")[0][0] in ("P0300", "P0301")
+
+
+def test_single_term_search_and_limit(search):
+    results = search.search("misfire", limit=1)
+    assert len(results) == 1
+    # the shorter description has the higher weight
+    assert results[0][:2] == ("P0301", "Cylinder 1 Misfire Detected")
+    with pytest.raises(ValueError):
+        search.search("misfire", mode="xor")
+
+
+def test_search_over_the_code_tables():
+    codes = [code for code, _, _ in get_description_search().search("intake air temperature sensor 1 circuit low")]
+    assert "P0112" in codes
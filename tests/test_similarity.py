@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+pytest.importorskip("scipy")
+
+from dtc_parser import similarity  # noqa: E402 (analytics extra)
+from dtc_parser.index import CodeIndex, content_hash, get_code_index  # noqa: E402
+from dtc_parser.similarity import RelatedCodes, get_related_codes  # noqa: E402
+
+ENTRIES = [
+    ("P0130", "O2 Sensor Circuit Malfunction (Bank 1 Sensor 1)"),
+    ("P0150", "O2 Sensor Circuit Malfunction (Bank 2 Sensor 1)"),
+    ("P0135", "O2 Sensor Heater Circuit Malfunction (Bank 1 Sensor 1)"),
+    ("P0300", "Random/Multiple Cylinder Misfire Detected"),
+    ("P0301", "Cylinder 1 Misfire Detected"),
+]
+
+
+@pytest.fixture
+def related():
+    return RelatedCodes.build(CodeIndex(ENTRIES), k=2)
+
+
+def test_similar(related):
+    assert [code for code, _ in related.similar("P0130")] == ["P0135", "P0150"]
+    assert [code for code, _ in related.similar("p0301", k=1)] == ["P0300"]
+    scores = [score for _, score in related.similar("P0135")]
+    assert scores == sorted(scores, reverse=True)
+    assert 0 < scores[0] < 1
+    assert related.similar("P0400") == []
+
+
+def test_save_and_load(related, tmp_path):
+    path = str(tmp_path / "similarity.npz")
+    related.save(path)
+    loaded = RelatedCodes.load(path)
+    assert loaded.table_hash == content_hash(CodeIndex(ENTRIES))
+    assert loaded.similar("P0130") == related.similar("P0130")
+
+
+def test_stale_compiled_neighbours_are_rebuilt(related, tmp_path, monkeypatch):
+    path = str(tmp_path / "similarity.npz")
+    related.save(path)
+    monkeypatch.setattr(similarity, "COMPILED_SIMILARITY", path)
+    get_related_codes.cache_clear()
+    try:
+        rebuilt = get_related_codes()
+        assert rebuilt.table_hash == content_hash(get_code_index())
+        assert len(rebuilt.keys) == len(get_code_index())
+    finally:
+        get_related_codes.cache_clear()
+
+
+def test_shipped_neighbours_match_the_code_tables():
+    assert RelatedCodes.load().table_hash == content_hash(get_code_index())
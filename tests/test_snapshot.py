@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.loader import load_tables
+from dtc_parser.parser import DTCParser
+from dtc_parser.snapshot import VERSION_LENGTH, ReloadableTables, build_snapshot, diff
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "codes.csv"
+    path.write_text("v1", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def versions():
+    versions = {"v1": load_tables()}
+    versions["v2"] = {name: dict(table) for name, table in versions["v1"].items()}
+    versions["v2"]["P01"]["P0112"] = "Intake Air Temperature Sensor 1 Circuit Low Input"
+    return versions
+
+
+def test_reload_swaps_in_changed_tables(source, versions):
+    tables = ReloadableTables(lambda: versions[source.read_text(encoding="utf-8")], [str(source)],
+                              overlays=None, table_source=False)
+    dtc_parser = DTCParser(tables=tables)
+    assert dtc_parser.lookup("P0112").fault_description == "intake air temperature sensor 1 circuit low"
+    assert not tables.reload()
+    pinned = tables.snapshot
+    source.write_text("v2", encoding="utf-8")
+    assert tables.reload(force=True)
+    assert dtc_parser.lookup("P0112").fault_description == "intake air temperature sensor 1 circuit low input"
+    # a pinned snapshot is never modified
+    assert pinned.tables["P01"]["P0112"] == "Intake Air Temperature Sensor 1 Circuit Low"
+    # identical content is not swapped in
+    assert not tables.reload(force=True)
+    assert tables.reloads == 1
+
+
+def test_failed_reload_keeps_the_previous_snapshot(source, versions):
+    tables = ReloadableTables(lambda: versions[source.read_text(encoding="utf-8")], [str(source)],
+                              overlays=None, table_source=False)
+    snapshot = tables.snapshot
+    source.write_text("broken", encoding="utf-8")
+    with pytest.raises(KeyError):
+        tables.reload(force=True)
+    assert tables.snapshot is snapshot
+    assert tables["P01"]["P0112"] == "Intake Air Temperature Sensor 1 Circuit Low"
+
+
+def test_snapshot_diff():
+    old = {"P01": {"P0112": "a", "P0113": "b"}, "C0": {"C0123": "c"}}
+    new = {"P01": {"P0112": "a", "P0113": "changed"}, "C0": {"C0124": "d"}}
+    result = diff(build_snapshot(old), build_snapshot(new))
+    assert result.added == ["C0124"]
+    assert result.removed == ["C0123"]
+    assert result.changed == ["P0113"]
+    assert result.affected() == ["C0124", "C0123", "P0113"]
+    assert diff(build_snapshot(old), build_snapshot(old)) == ([], [], [])
+
+
+def test_snapshot_version():
+    tables = {"P01": {"P0112": "a", "P0113": "b"}, "C0": {"C0123": "c"}}
+    snapshot = build_snapshot(tables)
+    assert len(snapshot.version) == VERSION_LENGTH
+    assert snapshot.content_hash.startswith(snapshot.version)
+    # the version only depends on the entries, not on the table layout or the time of loading
+    assert build_snapshot({"all": {**tables["P01"], **tables["C0"]}}).version == snapshot.version
+    assert build_snapshot({"P01": {"P0112": "a"}}).version != snapshot.version
+
+
+def test_reload_listeners_receive_the_diff(source, versions):
+    tables = ReloadableTables(lambda: versions[source.read_text(encoding="utf-8")], [str(source)],
+                              overlays=None, table_source=False)
+    diffs = []
+    tables.listeners.append(lambda old, new: diffs.append((diff(old, new), old.version, new.version)))
+    version = tables.snapshot.version
+    source.write_text("v2", encoding="utf-8")
+    assert tables.reload(force=True)
+    assert diffs == [(([], [], ["P0112"]), version, tables.snapshot.version)]
+    assert tables.snapshot.version != version
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dtc_parser.parser import DTCParser
+from dtc_parser.sqlite_backend import SQLiteCodeTables, compile_database
+
+ENTRIES = [
+    ("P0112", "Intake Air Temperature Sensor 1 Circuit Low"),
+    ("P0300", "Random/Multiple Cylinder Misfire Detected"),
+    ("P1101", "Mass Air Flow Sensor Out of Self-Test Range"),
+    ("C0123", "Brake Pedal Switch Circuit"),
+]
+
+
+@pytest.fixture
+def sqlite_tables(tmp_path):
+    path = str(tmp_path / "codes.sqlite")
+    compile_database(path, ENTRIES)
+    tables = SQLiteCodeTables(path)
+    yield tables
+    tables.close()
+
+
+def test_sqlite_tables_mirror_the_entries(sqlite_tables):
+    assert dict(sqlite_tables["P01"].items()) == {"P0112": ENTRIES[0][1]}
+    assert "P0300" in sqlite_tables["P03"]
+    assert "P0301" not in sqlite_tables["P03"]
+    assert sqlite_tables["C0"]["C0123"] == ENTRIES[3][1]
+    assert [code for code, _, _ in sqlite_tables.search("misfire cylinder")] == ["P0300"]
+
+
+def test_sqlite_tables_serve_multiple_threads(sqlite_tables):
+    dtc_parser = DTCParser(tables=sqlite_tables)
+    codes = [code for code, _ in ENTRIES] * 50
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        descriptions = list(executor.map(lambda code: dtc_parser.parse_fault_description(code[:2], code[2:]), codes))
+    assert descriptions == [description for _, description in ENTRIES] * 50
+    assert sqlite_tables.description("P0112") == ENTRIES[0][1]
+
+
+def test_database_path_with_uri_delimiters(tmp_path):
+    path = str(tmp_path / "codes?mode=rwc#1 %20" / "codes.sqlite")
+    os.makedirs(os.path.dirname(path))
+    compile_database(path, ENTRIES)
+    tables = SQLiteCodeTables(path)
+    try:
+        assert tables["P01"]["P0112"] == ENTRIES[0][1]
+    finally:
+        tables.close()
+
+
+def test_machine_readable_fields_do_not_load_the_in_memory_tables(sqlite_tables):
+    # run in a fresh interpreter, since the in-memory tables of this one might have been loaded by other tests
+    script = ("from dtc_parser.parser import DTCParser\n"
+              "from dtc_parser.sqlite_backend import SQLiteCodeTables\n"
+              "from dtc_parser.tables import get_error_tables\n"
+              "parsed = DTCParser(tables=SQLiteCodeTables(%r)).parse_code_machine_readable('P0112')\n"
+              "assert parsed['sensor'] == 1 and parsed['fault_structure'].failure_mode > 0, parsed\n"
+              "assert get_error_tables.cache_info().currsize == 0\n" % sqlite_tables.path)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.codec import CODE_SPACE_SIZE, dtc_from_int, dtc_to_int
+from dtc_parser.parser import DTCParser
+from dtc_parser.subsystems import SUBSYSTEM_TABLE, SUBSYSTEMS, UNKNOWN_SUBSYSTEM, subsystem_id, subsystem_ids
+
+
+@pytest.mark.parametrize("first_char, third_char, subsystem", [
+    ("P", "0", "fuel and air metering and auxiliary emission controls"),
+    ("P", "3", "ignition systems or misfires"),
+    ("P", "7", "transmission"),
+    ("P", "8", "transmission"),
+    ("P", "9", "transmission"),
+    ("P", "A", "hybrid propulsion systems"),
+    ("P", "C", "hybrid propulsion systems"),
+    ("P", "D", "ISO / SAE reserved"),
+    ("P", "F", "ISO / SAE reserved"),
+    ("C", "0", "chassis systems"),
+    ("C", "F", "chassis systems"),
+    ("B", "2", "body systems"),
+    ("U", "0", "network electrical"),
+    ("U", "2", "network communication"),
+    ("U", "5", "network data"),
+    ("U", "6", "ISO / SAE reserved"),
+])
+def test_vehicle_subsystems(first_char, third_char, subsystem):
+    assert SUBSYSTEMS[(first_char, third_char)] == subsystem
+    assert DTCParser.parse_vehicle_subsystem(first_char, third_char) == subsystem
+
+
+def test_unknown_subsystem():
+    assert DTCParser.parse_vehicle_subsystem("X", "0") == UNKNOWN_SUBSYSTEM
+    assert DTCParser.parse_vehicle_subsystem("P", "G") == UNKNOWN_SUBSYSTEM
+
+
+def test_subsystem_ids_match_the_subsystems():
+    for code in range(CODE_SPACE_SIZE):
+        dtc = dtc_from_int(code)
+        assert SUBSYSTEM_TABLE[subsystem_id(code)] == SUBSYSTEMS[(dtc[0], dtc[2])], dtc
+
+
+def test_third_chars_of_the_same_subsystem_share_an_id():
+    assert subsystem_id(dtc_to_int("P0700")) == subsystem_id(dtc_to_int("P0900")) == subsystem_id(dtc_to_int("P2800"))
+    assert subsystem_id(dtc_to_int("P0A00")) == subsystem_id(dtc_to_int("P0C00"))
+    # chassis and body codes form a single group each
+    assert len({subsystem_id(dtc_to_int("C%d%X00" % (t, digit))) for t in range(4) for digit in range(16)}) == 1
+    assert len({subsystem_id(dtc_to_int("B%d%X00" % (t, digit))) for t in range(4) for digit in range(16)}) == 1
+    # reserved codes of different categories are not merged
+    assert subsystem_id(dtc_to_int("P0D00")) != subsystem_id(dtc_to_int("U0600"))
+    assert subsystem_id(dtc_to_int("P0100")) != subsystem_id(dtc_to_int("P0200"))
+
+
+def test_subsystem_ids_of_a_batch():
+    codes = [dtc_to_int(code) for code in ("P0112", "C0035", "B1200", "U0100", "P0812")]
+    assert list(subsystem_ids(codes)) == [subsystem_id(code) for code in codes]
+    assert [SUBSYSTEM_TABLE[i] for i in subsystem_ids(codes)] == [
+        "fuel and air metering", "chassis systems", "body systems", "network communication", "transmission"]
+    assert list(subsystem_ids([])) == []
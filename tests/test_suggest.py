@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.parser import DTCParser
+from dtc_parser.suggest import CodeSuggester, deletion_variants, edit_distance, misread_variants
+
+CODES = ["P0112", "P0113", "P0122", "P1112", "P0012", "P0300", "U0100"]
+
+
+@pytest.fixture
+def suggester():
+    return CodeSuggester(CODES)
+
+
+@pytest.mark.parametrize("a, b, distance", [
+    ("P0112", "P0112", 0.0),
+    ("PO112", "P0112", 0.5),  # misread char
+    ("P0112", "P0113", 1.0),
+    ("P0121", "P0112", 1.0),  # swapped neighbours
+    ("P112", "P0112", 1.0),
+    ("PO1I2", "P0112", 1.0),
+    ("P0300", "U0100", 2.0),
+])
+def test_edit_distance(a, b, distance):
+    assert edit_distance(a, b) == distance
+    assert edit_distance(b, a) == distance
+
+
+def test_variants():
+    assert sorted(deletion_variants("P01", 1)) == ["01", "P0", "P01", "P1"]
+    assert len(deletion_variants("P0123", 2)) == 1 + 5 + 10
+    assert sorted(misread_variants("PO", 1)) == ["P0", "PO", "RO"]
+
+
+def test_suggestions_are_ranked_by_distance(suggester):
+    assert suggester.suggest("P0112", 1) == [("P0112", 0.0)]
+    # misread chars rank before arbitrary typos, ties are ordered by code
+    assert suggester.suggest("PO112") == [("P0112", 0.5), ("P1112", 1.0), ("P0012", 1.5), ("P0113", 1.5),
+                                          ("P0122", 1.5)]
+    assert suggester.suggest("p0-114", 2) == [("P0112", 1.0), ("P0113", 1.0)]
+    # swapped neighbours count as a single edit
+    assert suggester.suggest("P0121", 2) == [("P0112", 1.0), ("P0122", 1.0)]
+    assert suggester.suggest("C0300") == [("P0300", 1.0), ("U0100", 2.0)]
+    assert suggester.suggest("B1234") == []
+
+
+def test_wrong_length_suggestions(suggester):
+    # one missing / surplus char, optionally plus one misread char
+    assert suggester.suggest("P112") == [("P0112", 1.0), ("P1112", 1.0)]
+    assert suggester.suggest("PO13") == [("P0113", 1.5)]
+    assert suggester.suggest("P01122") == [("P0112", 1.0), ("P0122", 1.0)]
+    assert suggester.suggest("PO1122") == [("P0112", 1.5), ("P0122", 1.5)]
+    # a second edit on top of the missing char is not considered
+    assert suggester.suggest("P113") == [("P0113", 1.0)]
+    assert suggester.suggest("P12") == []
+    assert suggester.suggest("P011223") == []
+    assert suggester.suggest("") == []
+
+
+def test_suggestions_over_the_code_tables():
+    assert DTCParser.suggest_codes("PO112", 1) == ["P0112"]
+    assert DTCParser.suggest_codes("P112", 1) == ["P0112"]
+    assert all(len(code) == 5 for code in DTCParser.suggest_codes("P01122"))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# @author Tim Bohne
+
+import pytest
+
+from dtc_parser.overlays import OEMOverlays
+from dtc_parser.parser import DTCParser
+from dtc_parser.vin import make_from_vin, make_from_wmi
+
+
+@pytest.fixture
+def overlays(tmp_path):
+    (tmp_path / "ford.csv").write_text("P1101,Cylinder 4 injector circuit open\n", encoding="utf-8")
+    (tmp_path / "toyota.csv").write_text("P1101,Toyota specific fault\n", encoding="utf-8")
+    return OEMOverlays([str(tmp_path)])
+
+
+@pytest.mark.parametrize("vin, make", [
+    ("1FTFW1ET5DFC10312", "ford"),
+    (" wdd2050461f123456 ", "mercedes_benz"),
+    # fallback via the first two chars of the WMI
+    ("JTZ12345678901234", "toyota"),
+    ("1GX12345678901234", "general_motors"),
+    ("ZZZ12345678901234", None),
+    ("1FT", "ford"),
+])
+def test_make_from_vin(vin, make):
+    assert make_from_vin(vin) == make
+
+
+def test_make_from_vin_rejects_short_vins():
+    with pytest.raises(ValueError):
+        make_from_vin(" 1F ")
+
+
+def test_make_from_wmi():
+    assert make_from_wmi("wba") == "bmw"
+    assert make_from_wmi("WB9") == "bmw"
+
+
+def test_parse_with_vin(overlays):
+    dtc_parser = DTCParser(overlays=overlays)
+    assert dtc_parser.parse("P1101", vin="1FTFW1ET5DFC10312")["fault_description"] == (
+        "cylinder 4 injector circuit open")
+    assert dtc_parser.parse("P1101", vin="JTDKB20U793123456")["fault_description"] == "toyota specific fault"
+    # one parser per make is kept
+    assert sorted(dtc_parser.make_parsers) == ["ford", "toyota"]
+    assert dtc_parser.make_parsers["ford"].tables is dtc_parser.tables
+
+
+def test_parse_falls_back_to_the_make_of_the_parser(overlays):
+    generic = DTCParser(overlays=overlays).parse_code_machine_readable("P1101")
+    # no VIN or unknown manufacturer
+    assert DTCParser(overlays=overlays).parse("P1101") == generic
+    assert DTCParser(overlays=overlays).parse("P1101", vin="ZZZ12345678901234") == generic
+    ford = DTCParser("ford", overlays)
+    assert ford.parse("P1101", vin="ZZZ12345678901234")["fault_description"] == "cylinder 4 injector circuit open"
+    assert ford.make_parsers == {}